@@ -0,0 +1,475 @@
+"""
+Fake Upstream Services for Offline Benchmarks and Load Tests
+File: backend/benchmarks/fake_upstreams.py
+
+PURPOSE:
+- Local stand-ins for every external API the pipeline calls, so the full
+  dashboard pipeline can be benchmarked and load-tested without keys or network:
+    GET  /v2/insights                                   (Qloo)
+    POST /v1beta/models/{model}:generateContent         (Gemini)
+    POST /v1beta/models/{model}:streamGenerateContent   (Gemini, server-sent events)
+    GET  /youtube/v3/search                             (YouTube Data API)
+    POST /v1/images:annotate                            (Vision AI)
+- Payloads follow the shapes the tools parse; Gemini answers JSON prompts with
+  JSON matching the schema embedded in the prompt
+- Per-service fault injection: latency (+ jitter), error rate and 429 rate
+  (with Retry-After), changeable at runtime via POST /_fake/faults
+- Request and injected-fault counters at GET /_fake/stats
+
+USAGE:
+    python benchmarks/fake_upstreams.py --port 8900 --latency-ms 150 --error-rate 0.02 --rate-limit-rate 0.01
+    python benchmarks/fake_upstreams.py --port 8900 --fault gemini:latency_ms=900,error_rate=0.1
+
+    # In-process (tests, benchmarks): route a tool's client straight to the app
+    upstreams = FakeUpstreams()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=upstreams.app))
+    gemini = SimpleGeminiTool("fake-key", http_client=client, base_url=upstream_base_urls("http://fake")["gemini"])
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from typing import Dict, Any, Optional, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+SERVICES = ["qloo", "gemini", "youtube", "vision"]
+
+# Marker the Gemini tool puts before the JSON schema in structured prompts
+SCHEMA_MARKER = "matches this exact schema:"
+
+# Artist tags sent by the Qloo tool are genres (see HERITAGE_MUSIC_TAGS)
+ARTISTS_BY_TAG = {
+    "classical": ["Giuseppe Verdi", "Wolfgang Amadeus Mozart", "Ludwig van Beethoven", "Giacomo Puccini",
+                  "Frédéric Chopin", "Antonín Dvořák", "Aaron Copland", "George Gershwin"],
+    "folk": ["The Clancy Brothers", "John McCormack", "Pete Seeger", "The Weavers", "Burl Ives"],
+    "jazz": ["Duke Ellington", "Ella Fitzgerald", "Louis Armstrong", "Benny Goodman"]
+}
+
+PLACE_STYLES = ["Trattoria", "Family Kitchen", "Corner Diner", "Bakery & Café", "Supper Club", "Market Hall"]
+
+SENTENCES = [
+    "Back in the 1950s, families gathered around the radio in the evening to enjoy music, stories and laughter together.",
+    "Neighborhood bakeries filled the streets with the smell of fresh bread, and children often stopped by after school.",
+    "Sunday afternoons were a time for long walks, visits with relatives and big home-cooked dinners at the kitchen table.",
+    "Dance halls were busy on Saturday nights, with big bands playing the popular songs everyone knew by heart.",
+    "Many homes kept a garden where tomatoes, beans and flowers grew all summer long for the whole family to share."
+]
+
+QUESTIONS = [
+    "What songs were popular at family gatherings back then?",
+    "Which foods were always served at holiday dinners?",
+    "What did people enjoy doing on warm summer evenings?",
+    "Which radio programs did families listen to together?",
+    "What games did children play in the neighborhood?"
+]
+
+VISION_LABELS = [("Smile", 0.96), ("Family", 0.93), ("Gathering", 0.88), ("Room", 0.84), ("Happy", 0.82),
+                 ("Vintage clothing", 0.77), ("Meal", 0.71), ("Celebration", 0.69)]
+
+VISION_OBJECTS = [("Person", 0.94), ("Person", 0.92), ("Table", 0.81), ("Chair", 0.74)]
+
+
+class FaultProfile:
+    """Latency and failure injection for one fake service"""
+
+    FIELDS = ["latency_ms", "jitter_ms", "error_rate", "rate_limit_rate", "retry_after_s", "error_status"]
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after_s: float = 1.0, error_status: int = 503):
+        """
+        Args:
+            latency_ms: Delay before every response (before the first chunk when streaming)
+            jitter_ms: Extra uniform random delay in [0, jitter_ms]
+            error_rate: Share of requests answered with error_status
+            rate_limit_rate: Share of requests answered with 429 + Retry-After
+            retry_after_s: Retry-After value on injected 429s
+            error_status: Status code for injected errors
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after_s = retry_after_s
+        self.error_status = error_status
+
+    def update(self, **changes: Any) -> None:
+        for name, value in changes.items():
+            if name not in self.FIELDS:
+                raise ValueError(f"Unknown fault setting: {name}")
+            setattr(self, name, int(value) if name == "error_status" else float(value))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+class FakeUpstreams:
+    """
+    FastAPI app serving the Qloo, Gemini, YouTube and Vision stand-ins.
+
+    Attributes:
+        faults: FaultProfile per service ("qloo", "gemini", "youtube", "vision")
+        stats: Request and injected-fault counters per service
+        app: The ASGI app (serve with uvicorn or httpx.ASGITransport)
+    """
+
+    def __init__(self, faults: Optional[Dict[str, FaultProfile]] = None, seed: Optional[int] = None,
+                 stream_chunk_chars: int = 60, stream_chunk_delay_ms: float = 20.0):
+        self.faults = {service: FaultProfile() for service in SERVICES}
+        self.faults.update(faults or {})
+        self.random = random.Random(seed)
+        self.stream_chunk_chars = stream_chunk_chars
+        self.stream_chunk_delay_s = stream_chunk_delay_ms / 1000
+        self.stats = {service: {"requests": 0, "errors_injected": 0, "rate_limited": 0} for service in SERVICES}
+        self.app = self._create_app()
+
+    def _create_app(self) -> FastAPI:
+        app = FastAPI(title="Fake Upstreams", docs_url=None, redoc_url=None)
+
+        @app.get("/v2/insights")
+        async def qloo_insights(request: Request):
+            fault = await self._inject("qloo")
+            if fault:
+                return fault
+            return JSONResponse(self.qloo_response(dict(request.query_params)))
+
+        @app.post("/v1beta/models/{model_call}")
+        async def gemini_generate(model_call: str, request: Request):
+            model, _, method = model_call.partition(":")
+            if method not in ("generateContent", "streamGenerateContent"):
+                return JSONResponse({"error": {"code": 404, "message": f"Unknown method {method}"}}, status_code=404)
+
+            fault = await self._inject("gemini")
+            if fault:
+                return fault
+
+            payload = await request.json()
+            text = self.gemini_text(payload)
+            if method == "generateContent":
+                return JSONResponse(self.gemini_response(text, model))
+            return StreamingResponse(self._gemini_events(text, model), media_type="text/event-stream")
+
+        @app.get("/youtube/v3/search")
+        async def youtube_search(request: Request):
+            fault = await self._inject("youtube")
+            if fault:
+                return fault
+            return JSONResponse(self.youtube_response(dict(request.query_params)))
+
+        @app.post("/v1/images:annotate")
+        async def vision_annotate(request: Request):
+            fault = await self._inject("vision")
+            if fault:
+                return fault
+            payload = await request.json()
+            return JSONResponse(self.vision_response(len(payload.get("requests", [])) or 1))
+
+        @app.get("/_fake/stats")
+        async def fake_stats():
+            return {"stats": self.stats, "faults": {name: fault.to_dict() for name, fault in self.faults.items()}}
+
+        @app.post("/_fake/faults")
+        async def fake_faults(request: Request):
+            changes = await request.json()
+            try:
+                for service, settings in changes.items():
+                    if service not in self.faults:
+                        raise ValueError(f"Unknown service: {service}")
+                    self.faults[service].update(**settings)
+            except (ValueError, TypeError) as e:
+                return JSONResponse({"error": str(e)}, status_code=400)
+            return {name: fault.to_dict() for name, fault in self.faults.items()}
+
+        return app
+
+    async def _inject(self, service: str) -> Optional[JSONResponse]:
+        """Apply the service's latency, then maybe answer with an injected 429 or error"""
+
+        fault = self.faults[service]
+        stats = self.stats[service]
+        stats["requests"] += 1
+
+        delay_ms = fault.latency_ms + (self.random.uniform(0, fault.jitter_ms) if fault.jitter_ms else 0)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        roll = self.random.random()
+        if roll < fault.rate_limit_rate:
+            stats["rate_limited"] += 1
+            return JSONResponse(
+                {"error": {"code": 429, "message": "Quota exceeded (injected)", "status": "RESOURCE_EXHAUSTED"}},
+                status_code=429, headers={"Retry-After": f"{fault.retry_after_s:g}"}
+            )
+        if roll < fault.rate_limit_rate + fault.error_rate:
+            stats["errors_injected"] += 1
+            return JSONResponse({"error": {"code": fault.error_status, "message": "Injected upstream failure"}},
+                                status_code=fault.error_status)
+        return None
+
+    # ----- Payloads -----
+
+    def qloo_response(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Insights results for an artist or place query"""
+
+        entity_type = params.get("filter.type", "urn:entity:artist")
+        tags = params.get("signal.interests.tags", "")
+        take = int(params.get("take", 10))
+
+        if entity_type == "urn:entity:place":
+            cuisine = tags.rsplit(":", 1)[-1].replace("_", " ").title() or "American"
+            names = [f"{cuisine} {style}" for style in PLACE_STYLES]
+        else:
+            genre = next((name for name in ARTISTS_BY_TAG if name in tags.lower()), "classical")
+            names = ARTISTS_BY_TAG[genre]
+
+        entities = [
+            {
+                "name": name,
+                "entity_id": stable_id(entity_type, name),
+                "type": entity_type,
+                "popularity": round(0.95 - index * 0.04, 2),
+                "tags": [{"id": tags, "type": "urn:tag"}] if tags else [],
+                "properties": {"short_description": f"{name}, a favorite from the 1940s-1950s"}
+            }
+            for index, name in enumerate(names)
+        ][:take]
+
+        return {"success": True, "results": entities, "duration": 12}
+
+    def gemini_text(self, payload: Dict[str, Any]) -> str:
+        """Response text: JSON for the schema embedded in the prompt, else warm plain text"""
+
+        prompt = "".join(part.get("text", "") for content in payload.get("contents", [])
+                         for part in content.get("parts", []))
+        schema = extract_schema(prompt)
+        seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+
+        if schema is None:
+            return " ".join(SENTENCES[(seed + offset) % len(SENTENCES)] for offset in range(3))
+        return json.dumps(fill_schema(schema, seed))
+
+    def gemini_response(self, text: str, model: str) -> Dict[str, Any]:
+        return {
+            "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP", "index": 0}],
+            "usageMetadata": {"candidatesTokenCount": len(text.split())},
+            "modelVersion": model
+        }
+
+    async def _gemini_events(self, text: str, model: str):
+        """Server-sent events, one chunk of text per event"""
+
+        size = self.stream_chunk_chars
+        for start in range(0, len(text), size):
+            if start and self.stream_chunk_delay_s:
+                await asyncio.sleep(self.stream_chunk_delay_s)
+            event = self.gemini_response(text[start:start + size], model)
+            yield f"data: {json.dumps(event)}\r\n\r\n"
+
+    def youtube_response(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Creative Commons search results for the query"""
+
+        query = params.get("q", "classical music")
+        max_results = int(params.get("maxResults", 5))
+        title = query.replace(" audio", "").title()
+
+        items = [
+            {
+                "kind": "youtube#searchResult",
+                "id": {"kind": "youtube#video", "videoId": stable_id("youtube", query, index)[:11]},
+                "snippet": {
+                    "title": f"{title} - Part {index + 1} (Creative Commons)",
+                    "channelTitle": "Public Domain Archive",
+                    "description": f"Creative Commons recording: {title.lower()}",
+                    "liveBroadcastContent": "none"
+                }
+            }
+            for index in range(max_results)
+        ]
+
+        return {"kind": "youtube#searchListResponse", "pageInfo": {"totalResults": 1000, "resultsPerPage": max_results},
+                "items": items}
+
+    def vision_response(self, images: int) -> Dict[str, Any]:
+        """Label, object, face, safe-search and color annotations for each image"""
+
+        response = {
+            "labelAnnotations": [{"description": label, "score": score, "topicality": score}
+                                 for label, score in VISION_LABELS],
+            "localizedObjectAnnotations": [{"name": name, "score": score} for name, score in VISION_OBJECTS],
+            "faceAnnotations": [{"joyLikelihood": "VERY_LIKELY", "detectionConfidence": 0.9} for _ in range(2)],
+            "safeSearchAnnotation": {"adult": "VERY_UNLIKELY", "violence": "VERY_UNLIKELY", "racy": "UNLIKELY"},
+            "imagePropertiesAnnotation": {"dominantColors": {"colors": [
+                {"color": {"red": 201, "green": 176, "blue": 140}, "score": 0.42, "pixelFraction": 0.31}
+            ]}}
+        }
+        return {"responses": [response for _ in range(images)]}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {service: dict(counts) for service, counts in self.stats.items()}
+
+
+def stable_id(*parts: Any) -> str:
+    """Deterministic URL-safe identifier for fake entities and videos"""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return digest[:24]
+
+
+def extract_schema(prompt: str) -> Optional[Any]:
+    """JSON schema the prompt asks for (after SCHEMA_MARKER), or None for plain-text prompts"""
+
+    marker = prompt.find(SCHEMA_MARKER)
+    if marker == -1:
+        return None
+
+    start = prompt.find("{", marker)
+    if start == -1:
+        return None
+
+    try:
+        schema, _ = json.JSONDecoder().raw_decode(prompt[start:])
+        return schema
+    except json.JSONDecodeError:
+        return None
+
+
+def fill_schema(schema: Any, seed: int, key: str = "") -> Any:
+    """Values matching a Gemini example schema ({"field": "string", "list": ["string", ...]})"""
+
+    if isinstance(schema, dict):
+        return {name: fill_schema(value, seed + index, name) for index, (name, value) in enumerate(schema.items())}
+    if isinstance(schema, list):
+        return [fill_schema(item, seed + index, key) for index, item in enumerate(schema)]
+    if "starter" in key or "question" in key:
+        return QUESTIONS[seed % len(QUESTIONS)]
+    if schema in ("number", "integer"):
+        return seed % 10
+    if schema == "boolean":
+        return True
+    return " ".join(SENTENCES[(seed + offset) % len(SENTENCES)] for offset in range(2))
+
+
+def upstream_base_urls(root: str) -> Dict[str, str]:
+    """Tool base URLs (initialize_all_tools(base_urls=...)) for fake upstreams served at root"""
+
+    root = root.rstrip("/")
+    return {
+        "qloo": root,
+        "gemini": f"{root}/v1beta",
+        "youtube": f"{root}/youtube/v3/search",
+        "vision": f"{root}/v1"
+    }
+
+
+class LoopbackServer:
+    """
+    Serve an ASGI app on a loopback port with uvicorn inside the running event loop.
+
+    Usage:
+        async with LoopbackServer(app, lifespan="on") as server:
+            response = await client.get(f"{server.url}/api/status")
+    """
+
+    def __init__(self, app: Any, host: str = "127.0.0.1", port: int = 0, lifespan: str = "off"):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.lifespan = lifespan
+        self.server = None
+        self.task = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def __aenter__(self) -> "LoopbackServer":
+        import uvicorn
+
+        config = uvicorn.Config(self.app, host=self.host, port=self.port, log_level="warning",
+                                access_log=False, lifespan=self.lifespan)
+        self.server = uvicorn.Server(config)
+        self.task = asyncio.create_task(self.server.serve())
+        while not self.server.started:
+            if self.task.done():
+                self.task.result()
+            await asyncio.sleep(0.01)
+        self.port = self.server.servers[0].sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.server.should_exit = True
+        await self.task
+
+
+class FakeUpstreamServer(LoopbackServer):
+    """
+    Serve FakeUpstreams on a loopback port.
+
+    Usage:
+        async with FakeUpstreamServer(FakeUpstreams()) as server:
+            base_urls = upstream_base_urls(server.url)
+    """
+
+    def __init__(self, upstreams: FakeUpstreams, host: str = "127.0.0.1", port: int = 0):
+        super().__init__(upstreams.app, host=host, port=port)
+        self.upstreams = upstreams
+
+
+def parse_fault_overrides(values: List[str]) -> Dict[str, Dict[str, str]]:
+    """--fault service:name=value,name=value → {service: {name: value}}"""
+
+    overrides = {}
+    for value in values:
+        service, _, settings = value.partition(":")
+        if service not in SERVICES:
+            raise ValueError(f"Unknown service in --fault: {service}")
+        overrides[service] = dict(setting.split("=", 1) for setting in settings.split(",") if setting)
+    return overrides
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake Qloo, Gemini, YouTube and Vision APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random delay in [0, jitter]")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--fault", action="append", default=[],
+                        help="Per-service override, e.g. gemini:latency_ms=900,error_rate=0.1")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    faults = {}
+    for service in SERVICES:
+        faults[service] = FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate,
+                                       args.rate_limit_rate, args.retry_after)
+    for service, settings in parse_fault_overrides(args.fault).items():
+        faults[service].update(**settings)
+
+    upstreams = FakeUpstreams(faults, seed=args.seed)
+    root = f"http://{args.host}:{args.port}"
+
+    print(f"🧪 Fake upstreams on {root} (stats: {root}/_fake/stats)")
+    print("   Point the backend at them with:")
+    print("   export QLOO_API_KEY=fake GOOGLE_CLOUD_API_KEY=fake YOUTUBE_API_KEY=fake")
+    for service, url in upstream_base_urls(root).items():
+        print(f"   export {service.upper()}_BASE_URL={url}")
+
+    import uvicorn
+    uvicorn.run(upstreams.app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+# Export the main helpers
+__all__ = ["FakeUpstreams", "FaultProfile", "FakeUpstreamServer", "LoopbackServer", "upstream_base_urls",
+           "parse_fault_overrides", "SERVICES"]
+
+
+if __name__ == "__main__":
+    main()
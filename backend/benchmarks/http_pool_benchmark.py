@@ -0,0 +1,169 @@
+"""
+HTTP Connection Pool Benchmark
+File: backend/benchmarks/http_pool_benchmark.py
+
+PURPOSE:
+- Compare a fresh httpx.AsyncClient per call (the old behaviour) with the
+  shared pooled clients from HTTPClientRegistry
+- Runs the per-dashboard upstream call mix (2 Qloo insights calls, then
+  3 concurrent Gemini generateContent calls) against a local stand-in server
+- The stand-in counts TCP connections and adds a configurable delay to the
+  first response on every new connection to model TCP + TLS handshake cost
+
+USAGE:
+    python benchmarks/http_pool_benchmark.py --dashboards 20 --handshake-ms 60 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.http_clients import HTTPClientRegistry
+from multi_tool_agent.tools.qloo_tools import QlooInsightsAPI
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool
+
+QLOO_RESPONSE = {"results": [{"name": "Giuseppe Verdi"}, {"name": "Giacomo Puccini"}]}
+GEMINI_RESPONSE = {"candidates": [{"content": {"parts": [{"text": "Remember those Sunday dinners?"}]}}]}
+
+
+class StandInServer:
+    """Minimal keep-alive HTTP/1.1 server answering Qloo and Gemini routes"""
+
+    def __init__(self, handshake_ms: float, latency_ms: float):
+        self.handshake_s = handshake_ms / 1000
+        self.latency_s = latency_ms / 1000
+        self.connections = 0
+        self.requests = 0
+        self.server = None
+        self.port = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{self.port}"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        first_request = True
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body_length = int(headers.get("content-length", 0))
+                if body_length:
+                    await reader.readexactly(body_length)
+
+                self.requests += 1
+                if first_request:
+                    await asyncio.sleep(self.handshake_s)
+                    first_request = False
+                await asyncio.sleep(self.latency_s)
+
+                path = request_line.split()[1].decode("latin-1")
+                payload = QLOO_RESPONSE if path.startswith("/v2/insights") else GEMINI_RESPONSE
+                body = json.dumps(payload).encode("utf-8")
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_dashboard_calls(qloo: QlooInsightsAPI, gemini: SimpleGeminiTool, index: int) -> None:
+    """Upstream call mix of one dashboard (distinct params so nothing is coalesced)"""
+
+    await qloo.get_safe_classical_music("Italian-American", take=10 + index)
+    await qloo.get_tag_based_insights("urn:entity:place", "urn:tag:genre:place:restaurant:italian", take=10 + index)
+    await asyncio.gather(
+        gemini.generate_content(f"Music description {index}"),
+        gemini.generate_content(f"Photo description {index}"),
+        gemini.generate_content(f"Nostalgia newsletter {index}")
+    )
+
+
+async def run_mode(mode: str, dashboards: int, handshake_ms: float, latency_ms: float) -> Dict[str, Any]:
+    server = StandInServer(handshake_ms, latency_ms)
+    base_url = await server.start()
+
+    registry = HTTPClientRegistry() if mode == "pooled" else None
+    qloo = QlooInsightsAPI("benchmark-key", base_url=base_url,
+                           http_client=registry.get("qloo") if registry else None)
+    gemini = SimpleGeminiTool("benchmark-key", http_client=registry.get("gemini") if registry else None,
+                              base_url=f"{base_url}/v1beta")
+
+    started = time.perf_counter()
+    for index in range(dashboards):
+        await run_dashboard_calls(qloo, gemini, index)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if registry:
+        await registry.aclose()
+    await server.stop()
+
+    return {
+        "mode": mode,
+        "dashboards": dashboards,
+        "requests": server.requests,
+        "connections": server.connections,
+        "connections_per_dashboard": round(server.connections / dashboards, 2),
+        "total_ms": round(elapsed_ms, 1),
+        "ms_per_dashboard": round(elapsed_ms / dashboards, 1)
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = [await run_mode(mode, args.dashboards, args.handshake_ms, args.latency_ms)
+               for mode in ["per_call", "pooled"]]
+
+    print(f"\n🔌 HTTP pool benchmark: {args.dashboards} dashboards, "
+          f"handshake {args.handshake_ms}ms, latency {args.latency_ms}ms")
+    for result in results:
+        print(f"   {result['mode']:>8}: {result['ms_per_dashboard']:>7.1f} ms/dashboard, "
+              f"{result['connections_per_dashboard']:.2f} connections/dashboard "
+              f"({result['requests']} requests)")
+
+    per_call, pooled = results
+    saved_handshakes = per_call["connections_per_dashboard"] - pooled["connections_per_dashboard"]
+    saved_ms = per_call["ms_per_dashboard"] - pooled["ms_per_dashboard"]
+    print(f"✅ Pooled clients save {saved_handshakes:.2f} handshakes and {saved_ms:.1f} ms per dashboard")
+
+    if args.json:
+        print(json.dumps({"results": results, "saved_handshakes_per_dashboard": round(saved_handshakes, 2),
+                          "saved_ms_per_dashboard": round(saved_ms, 1)}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call HTTP clients")
+    parser.add_argument("--dashboards", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=60.0,
+                        help="Delay added to the first response on each new connection")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay added to every response")
+    parser.add_argument("--json", action="store_true", help="Also print results as JSON")
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,442 @@
+"""
+Dashboard Load Generator
+File: backend/benchmarks/load_generator.py
+
+PURPOSE:
+- Answer "how many caregivers can one worker serve?" by driving POST /api/dashboard
+  on main:app with many concurrent virtual caregivers
+- Targets: in-process through ASGI (default), a loopback uvicorn server started
+  here, or any running server (--url)
+- In-process and loopback targets run against the local stand-in upstreams
+  (benchmarks/fake_upstreams.py) with realistic latencies, an in-memory state
+  store, cache databases in a temporary directory and precompute turned off
+- Patients are drawn from the DemoPatientManager profiles
+- Scenarios:
+    steady        N caregivers ramped up over --ramp-s, each requesting a dashboard,
+                  thinking (--think-ms, exponential) and repeating for --duration-s
+    morning-burst the facility-wide refresh at shift start: every caregiver in the
+                  facility opens the dashboard within --burst-window-s
+- Report: requests/sec, latency p50/p95/p99/max, error rate and fallback rate
+  (dashboards with any degraded or fallback-generated section)
+
+USAGE:
+    python benchmarks/load_generator.py --scenario steady --users 20 --ramp-s 10 --duration-s 60
+    python benchmarks/load_generator.py --scenario morning-burst --facility-size 120 --burst-window-s 30
+    python benchmarks/load_generator.py --target loopback --fault gemini:latency_ms=2500,error_rate=0.05
+    python benchmarks/load_generator.py --url http://127.0.0.1:8000 --users 10 --duration-s 30
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.fake_upstreams import (
+    FakeUpstreams, FaultProfile, FakeUpstreamServer, LoopbackServer, upstream_base_urls, parse_fault_overrides
+)
+from benchmarks.pipeline_benchmark import percentile
+from config.settings import Config
+from patient_data.demo_patient_manager import DemoPatientManager
+
+TARGET_ASGI = "asgi"
+TARGET_LOOPBACK = "loopback"
+TARGET_URL = "url"
+
+SCENARIO_STEADY = "steady"
+SCENARIO_MORNING_BURST = "morning-burst"
+
+# Stand-in upstream latency (ms, jitter adds up to 30%) unless overridden with --fault
+STAND_IN_LATENCY_MS = {
+    "qloo": 150.0,
+    "gemini": 1200.0,
+    "youtube": 200.0,
+    "vision": 300.0
+}
+
+# Keys whose string values name how a section was produced
+_GENERATION_KEYS = ("method", "generated_by", "source", "analysis_method", "generation_method")
+
+
+def fallback_sections(dashboard: Dict[str, Any]) -> List[str]:
+    """Dashboard sections served from a fallback (degraded nodes or fallback-generated content)"""
+
+    sections = set(dashboard.get("metadata", {}).get("degraded_sections") or [])
+
+    def mentions_fallback(value: Any) -> bool:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key == "fallback_used" and item is True:
+                    return True
+                if isinstance(item, str) and key.endswith(_GENERATION_KEYS) and "fallback" in item.lower():
+                    return True
+                if mentions_fallback(item):
+                    return True
+        elif isinstance(value, list):
+            return any(mentions_fallback(item) for item in value)
+        return False
+
+    for name, section in (dashboard.get("content") or {}).items():
+        if mentions_fallback(section):
+            sections.add(name)
+
+    return sorted(sections)
+
+
+class LoadRecorder:
+    """Latency, status and fallback counts of every request in a run"""
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.status_codes: Counter = Counter()
+        self.fallback_sections: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.fallbacks = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def record(self, latency_ms: float, status_code: Optional[int] = None,
+               dashboard: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        self.in_flight -= 1
+        self.latencies_ms.append(latency_ms)
+        if status_code is not None:
+            self.status_codes[status_code] += 1
+
+        if error:
+            self.errors[error] += 1
+        elif status_code != 200 or dashboard is None or dashboard.get("success") is False:
+            self.errors[f"http_{status_code}" if status_code != 200 else "pipeline_failed"] += 1
+        else:
+            sections = fallback_sections(dashboard)
+            if sections:
+                self.fallbacks += 1
+                self.fallback_sections.update(sections)
+
+    def report(self) -> Dict[str, Any]:
+        elapsed_s = (self.finished or time.perf_counter()) - self.started
+        requests = len(self.latencies_ms)
+        errors = sum(self.errors.values())
+        succeeded = requests - errors
+        latencies = self.latencies_ms or [0.0]
+
+        return {
+            "requests": requests,
+            "succeeded": succeeded,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "fallback_rate": round(self.fallbacks / succeeded, 4) if succeeded else 0.0,
+            "duration_s": round(elapsed_s, 2),
+            "requests_per_second": round(requests / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(latencies, 0.50), 1),
+                "p95": round(percentile(latencies, 0.95), 1),
+                "p99": round(percentile(latencies, 0.99), 1),
+                "max": round(max(latencies), 1),
+                "mean": round(statistics.mean(latencies), 1)
+            },
+            "peak_in_flight": self.peak_in_flight,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "error_types": dict(self.errors),
+            "fallback_sections": dict(self.fallback_sections)
+        }
+
+
+async def request_dashboard(client: httpx.AsyncClient, recorder: LoadRecorder, patient_id: str,
+                            session_id: str) -> None:
+    recorder.request_started()
+    started = time.perf_counter()
+    try:
+        response = await client.post("/api/dashboard", json={"patient_id": patient_id, "session_id": session_id})
+    except httpx.HTTPError as e:
+        recorder.record((time.perf_counter() - started) * 1000, error=type(e).__name__)
+        return
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    try:
+        dashboard = response.json()
+    except ValueError:
+        dashboard = None
+    recorder.record(latency_ms, response.status_code, dashboard)
+
+
+def think_time_s(rng: random.Random, think_ms: float) -> float:
+    """Exponentially distributed pause between a caregiver's requests"""
+    return rng.expovariate(1000 / think_ms) if think_ms > 0 else 0.0
+
+
+async def run_steady(client: httpx.AsyncClient, patient_ids: List[str], users: int = 10, ramp_s: float = 5.0,
+                     duration_s: float = 30.0, think_ms: float = 1000.0, seed: Optional[int] = None) -> LoadRecorder:
+    """
+    Constant population of caregivers, started evenly over the ramp.
+
+    Each caregiver requests a dashboard, thinks, and repeats until duration_s
+    has passed since the first one started; requests in flight are completed.
+    """
+
+    recorder = LoadRecorder()
+    stop_at = recorder.started + duration_s
+
+    async def caregiver(index: int) -> None:
+        rng = random.Random(None if seed is None else seed + index)
+        await asyncio.sleep(ramp_s * index / users)
+        while time.perf_counter() < stop_at:
+            await request_dashboard(client, recorder, rng.choice(patient_ids), f"caregiver-{index}")
+            await asyncio.sleep(min(think_time_s(rng, think_ms), max(0.0, stop_at - time.perf_counter())))
+
+    await asyncio.gather(*(caregiver(index) for index in range(users)))
+    recorder.finished = time.perf_counter()
+    return recorder
+
+
+async def run_morning_burst(client: httpx.AsyncClient, patient_ids: List[str], facility_size: int = 60,
+                            burst_window_s: float = 10.0, refreshes: int = 1, think_ms: float = 2000.0,
+                            seed: Optional[int] = None) -> LoadRecorder:
+    """
+    Facility-wide refresh spike at shift start.
+
+    Every caregiver opens the dashboard at a random moment inside the burst
+    window (arrivals are front-loaded: most tablets wake in the first third),
+    then refreshes refreshes-1 more times after thinking.
+    """
+
+    recorder = LoadRecorder()
+    rng = random.Random(seed)
+    arrivals = sorted(burst_window_s * rng.betavariate(1.2, 3.0) for _ in range(facility_size))
+
+    async def caregiver(index: int, arrival_s: float) -> None:
+        caregiver_rng = random.Random(None if seed is None else seed + index)
+        patient_id = patient_ids[index % len(patient_ids)]
+        await asyncio.sleep(arrival_s)
+        for refresh in range(refreshes):
+            if refresh:
+                await asyncio.sleep(think_time_s(caregiver_rng, think_ms))
+            await request_dashboard(client, recorder, patient_id, f"caregiver-{index}")
+
+    await asyncio.gather(*(caregiver(index, arrival) for index, arrival in enumerate(arrivals)))
+    recorder.finished = time.perf_counter()
+    return recorder
+
+
+@contextlib.contextmanager
+def stand_in_settings(base_urls: Dict[str, str], state_dir: str, caches: bool = True,
+                      rate_limits: bool = True):
+    """
+    Point the in-process app at the stand-in upstreams for the duration of a run.
+
+    Config is read at startup, so class attributes are overridden (and restored)
+    rather than environment variables.
+    """
+
+    overrides = {
+        "QLOO_BASE_URL": base_urls["qloo"],
+        "GEMINI_BASE_URL": base_urls["gemini"],
+        "YOUTUBE_BASE_URL": base_urls["youtube"],
+        "VISION_BASE_URL": base_urls["vision"],
+        "PRECOMPUTE_ENABLED": False,
+        "QLOO_PREFETCH_ENABLED": False,
+        "CASSETTE_MODE": "",
+        "STATE_STORE_BACKEND": "memory",
+        "RATE_LIMIT_ENABLED": rate_limits,
+        "QLOO_CACHE_ENABLED": caches,
+        "GEMINI_CACHE_ENABLED": caches,
+        "YOUTUBE_CACHE_ENABLED": caches,
+        "QLOO_CACHE_DB_PATH": os.path.join(state_dir, "qloo_cache.sqlite3"),
+        "GEMINI_CACHE_DB_PATH": os.path.join(state_dir, "gemini_cache.sqlite3"),
+        "YOUTUBE_CACHE_DB_PATH": os.path.join(state_dir, "youtube_cache.sqlite3"),
+        "PRECOMPUTE_DB_PATH": os.path.join(state_dir, "precomputed.sqlite3"),
+        "TRACING_EXPORT_PATH": ""
+    }
+    keys = {"QLOO_API_KEY": "stand-in", "YOUTUBE_API_KEY": "stand-in", "GOOGLE_CLOUD_API_KEY": "stand-in",
+            "GEMINI_API_KEY": "stand-in"}
+
+    saved_config = {name: getattr(Config, name) for name in overrides}
+    saved_env = {name: os.environ.get(name) for name in keys}
+    for name, value in overrides.items():
+        setattr(Config, name, value)
+    os.environ.update(keys)
+    try:
+        yield
+    finally:
+        for name, value in saved_config.items():
+            setattr(Config, name, value)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextlib.asynccontextmanager
+async def dashboard_client(target: str = TARGET_ASGI, url: Optional[str] = None,
+                           faults: Optional[Dict[str, FaultProfile]] = None, caches: bool = True,
+                           rate_limits: bool = True, max_connections: int = 100,
+                           timeout_s: float = 120.0) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    HTTP client for the target, with main:app and stand-in upstreams running if needed.
+
+    Args:
+        target: asgi (in-process), loopback (uvicorn on 127.0.0.1) or url (already running)
+        url: Base URL of a running server (target url)
+        faults: Stand-in upstream fault profiles (default: STAND_IN_LATENCY_MS with jitter)
+        caches: Keep the Qloo/Gemini/YouTube/dashboard caches enabled
+        rate_limits: Keep per-upstream rate limiting enabled
+    """
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    timeout = httpx.Timeout(timeout_s)
+
+    if target == TARGET_URL:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=timeout) as client:
+            yield client
+        return
+
+    if faults is None:
+        faults = {service: FaultProfile(latency_ms=latency_ms, jitter_ms=latency_ms * 0.3)
+                  for service, latency_ms in STAND_IN_LATENCY_MS.items()}
+
+    # Imported here so the CLI's logging and Config overrides apply first
+    import main as app_module
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        async with FakeUpstreamServer(FakeUpstreams(faults)) as upstream_server:
+            with stand_in_settings(upstream_base_urls(upstream_server.url), state_dir, caches, rate_limits):
+                app_module.dashboard_cache.enabled = caches and Config.DASHBOARD_CACHE_ENABLED
+                app_module.dashboard_cache.clear()
+                try:
+                    if target == TARGET_ASGI:
+                        async with app_module.app.router.lifespan_context(app_module.app):
+                            transport = httpx.ASGITransport(app=app_module.app)
+                            async with httpx.AsyncClient(transport=transport, base_url="http://careconnect",
+                                                         timeout=timeout) as client:
+                                yield client
+                    else:
+                        async with LoopbackServer(app_module.app, lifespan="on") as server:
+                            async with httpx.AsyncClient(base_url=server.url, limits=limits,
+                                                         timeout=timeout) as client:
+                                yield client
+                finally:
+                    app_module.dashboard_cache.enabled = Config.DASHBOARD_CACHE_ENABLED
+
+
+async def run_load_test(scenario: str = SCENARIO_STEADY, target: str = TARGET_ASGI, url: Optional[str] = None,
+                        faults: Optional[Dict[str, FaultProfile]] = None, caches: bool = True,
+                        rate_limits: bool = True, patient_ids: Optional[List[str]] = None,
+                        **scenario_options: Any) -> Dict[str, Any]:
+    """
+    Run one scenario and return its report.
+
+    Args:
+        scenario: steady or morning-burst
+        patient_ids: Demo patients to draw from (default: all DemoPatientManager profiles)
+        **scenario_options: Arguments of run_steady / run_morning_burst
+    """
+
+    patient_ids = patient_ids or [profile["patient_id"] for profile in DemoPatientManager().get_all_patients()]
+    max_connections = max(100, scenario_options.get("users", 0), scenario_options.get("facility_size", 0))
+
+    async with dashboard_client(target, url, faults, caches, rate_limits, max_connections) as client:
+        if scenario == SCENARIO_STEADY:
+            recorder = await run_steady(client, patient_ids, **scenario_options)
+        elif scenario == SCENARIO_MORNING_BURST:
+            recorder = await run_morning_burst(client, patient_ids, **scenario_options)
+        else:
+            raise ValueError(f"Unknown scenario: {scenario}")
+
+    return {
+        "scenario": scenario,
+        "target": url if target == TARGET_URL else target,
+        "settings": {**scenario_options, "caches": caches, "rate_limits": rate_limits,
+                     "patients": len(patient_ids)},
+        **recorder.report()
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    latency = report["latency_ms"]
+    print(f"\n📈 {report['scenario']} against {report['target']}: {report['requests']} requests "
+          f"in {report['duration_s']}s (peak {report['peak_in_flight']} in flight)")
+    print(f"   Throughput: {report['requests_per_second']} req/s")
+    print(f"   Latency ms: p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}")
+    print(f"   Errors: {report['error_rate']:.1%} {report['error_types'] or ''}")
+    print(f"   Fallback rate: {report['fallback_rate']:.1%} {report['fallback_sections'] or ''}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test /api/dashboard with concurrent caregivers")
+    parser.add_argument("--scenario", choices=[SCENARIO_STEADY, SCENARIO_MORNING_BURST], default=SCENARIO_STEADY)
+    parser.add_argument("--target", choices=[TARGET_ASGI, TARGET_LOOPBACK], default=TARGET_ASGI)
+    parser.add_argument("--url", help="Load-test an already running server instead (stand-ins not started)")
+    parser.add_argument("--users", type=int, default=10, help="steady: concurrent caregivers")
+    parser.add_argument("--ramp-s", type=float, default=5.0, help="steady: seconds to start all caregivers")
+    parser.add_argument("--duration-s", type=float, default=30.0, help="steady: seconds to keep sending")
+    parser.add_argument("--think-ms", type=float, default=None,
+                        help="Mean pause between a caregiver's requests (steady 1000, burst 2000)")
+    parser.add_argument("--facility-size", type=int, default=60, help="morning-burst: caregivers in the facility")
+    parser.add_argument("--burst-window-s", type=float, default=10.0, help="morning-burst: arrival window")
+    parser.add_argument("--refreshes", type=int, default=1, help="morning-burst: dashboards per caregiver")
+    parser.add_argument("--fault", action="append", default=[],
+                        help="Stand-in override, e.g. gemini:latency_ms=2500,error_rate=0.05")
+    parser.add_argument("--no-caches", action="store_true", help="Disable Qloo/Gemini/YouTube/dashboard caches")
+    parser.add_argument("--no-rate-limits", action="store_true", help="Disable per-upstream rate limiting")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Also print the report as JSON")
+    args = parser.parse_args()
+
+    # Pipeline warnings under load (rate-limit waits, fallbacks) would bury the report
+    logging.basicConfig(level=logging.CRITICAL)
+    logging.disable(logging.ERROR)
+
+    faults = {service: FaultProfile(latency_ms=latency_ms, jitter_ms=latency_ms * 0.3)
+              for service, latency_ms in STAND_IN_LATENCY_MS.items()}
+    for service, settings in parse_fault_overrides(args.fault).items():
+        faults[service].update(**settings)
+
+    if args.scenario == SCENARIO_STEADY:
+        scenario_options = {"users": args.users, "ramp_s": args.ramp_s, "duration_s": args.duration_s,
+                            "think_ms": 1000.0 if args.think_ms is None else args.think_ms}
+    else:
+        scenario_options = {"facility_size": args.facility_size, "burst_window_s": args.burst_window_s,
+                            "refreshes": args.refreshes,
+                            "think_ms": 2000.0 if args.think_ms is None else args.think_ms}
+
+    report = asyncio.run(run_load_test(
+        scenario=args.scenario,
+        target=TARGET_URL if args.url else args.target,
+        url=args.url,
+        faults=faults,
+        caches=not args.no_caches,
+        rate_limits=not args.no_rate_limits,
+        seed=args.seed,
+        **scenario_options
+    ))
+    print_report(report)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+
+# Export the main helpers
+__all__ = ["run_load_test", "run_steady", "run_morning_burst", "dashboard_client", "LoadRecorder",
+           "fallback_sections", "SCENARIO_STEADY", "SCENARIO_MORNING_BURST"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+"""
+Pipeline Micro-Benchmark Suite
+File: backend/benchmarks/pipeline_benchmark.py
+
+PURPOSE:
+- Time SequentialAgent.run and every agent node in isolation (Agent 1 ... Agent 6)
+  with stub tools: the real tool classes backed by the in-process fake upstreams
+  (benchmarks/fake_upstreams.py), served from a cassette after the first call so
+  upstream stand-ins add almost nothing to the numbers
+- Per stage: wall time (p50/p95), event-loop blocking time (total and longest
+  stall, sampled by a ticker task), tracemalloc peak and net allocations
+- Isolated stages replay the inputs captured from a full warm-up run, so each
+  agent sees exactly what it would see inside the pipeline
+- Timing and allocation passes are separate (tracemalloc slows everything down)
+- Results are written as JSON; a stored baseline is compared stage by stage and
+  the run fails (exit code 1) when a stage regresses past the threshold
+
+USAGE:
+    python benchmarks/pipeline_benchmark.py --iterations 30
+    python benchmarks/pipeline_benchmark.py --update-baseline
+    python benchmarks/pipeline_benchmark.py --threshold 0.25 --output /tmp/pipeline_run.json
+    python benchmarks/pipeline_benchmark.py --cassette data/cassettes/upstreams.jsonl.gz
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.fake_upstreams import FakeUpstreams, upstream_base_urls
+from config.settings import Config
+from config.theme_config import simplified_theme_manager
+from multi_tool_agent.cassette import Cassette, MODE_AUTO, MODE_REPLAY
+from multi_tool_agent.sequential_agent import SequentialAgent
+from multi_tool_agent.state_store import InMemoryStateStore
+from multi_tool_agent.tools.qloo_tools import QlooInsightsAPI
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool, StreamingGeminiTool
+from multi_tool_agent.tools.youtube_tools import YouTubeAPI
+from multi_tool_agent.tools.vision_ai_tools import VisionAIAnalyzer
+from multi_tool_agent.agents.information_consolidator_agent import InformationConsolidatorAgent
+from multi_tool_agent.agents.simple_photo_analysis_agent import SimplePhotoAnalysisAgent
+from multi_tool_agent.agents.qloo_cultural_analysis_agent import QlooCulturalAnalysisAgent
+from multi_tool_agent.agents.music_curation_agent import MusicCurationAgent
+from multi_tool_agent.agents.recipe_selection_agent import RecipeSelectionAgent
+from multi_tool_agent.agents.photo_description_agent import PhotoDescriptionAgent
+from multi_tool_agent.agents.nostalgia_news_generator import NostalgiaNewsGenerator
+from multi_tool_agent.agents.combined_content_generator import CombinedContentGenerator
+from multi_tool_agent.agents.dashboard_synthesizer import DashboardSynthesizer
+from patient_data.demo_patient_manager import DemoPatientManager
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines",
+                                     "pipeline_benchmark.json")
+
+# Stage name of the full pipeline run (agent stages use their node ids)
+PIPELINE_STAGE = "pipeline"
+
+# Metrics compared against the baseline, with the absolute change a stage must
+# also exceed to count as a regression (sub-millisecond stages are mostly noise)
+REGRESSION_METRICS = {
+    "wall_ms_p50": 1.0,
+    "blocking_ms": 1.0,
+    "peak_kb": 64.0
+}
+
+
+class LoopBlockMonitor:
+    """
+    Measures how long the event loop is held by synchronous work.
+
+    A ticker task asks to wake every interval; whenever it wakes late by more
+    than the tolerance, the loop was blocked for (roughly) that long.
+    """
+
+    def __init__(self, interval_s: float = 0.001, tolerance_s: float = 0.001):
+        self.interval_s = interval_s
+        self.tolerance_s = tolerance_s
+        self.blocked_s = 0.0
+        self.max_block_s = 0.0
+        self.stalls = 0
+        self._task: Optional[asyncio.Task] = None
+        self._tick_started = 0.0
+
+    def _check(self) -> None:
+        late_s = time.perf_counter() - self._tick_started - self.interval_s
+        if late_s > self.tolerance_s:
+            self.blocked_s += late_s
+            self.max_block_s = max(self.max_block_s, late_s)
+            self.stalls += 1
+
+    async def _tick(self) -> None:
+        while True:
+            self._tick_started = time.perf_counter()
+            await asyncio.sleep(self.interval_s)
+            self._check()
+
+    async def __aenter__(self) -> "LoopBlockMonitor":
+        self._task = asyncio.create_task(self._tick())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # A stall right before exit has not been seen by the ticker yet
+        self._check()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+def percentile(values: List[float], quantile: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(quantile * len(ordered)) - 1))]
+
+
+class PipelineBench:
+    """
+    The dashboard pipeline wired to stub tools, plus a runner for each stage.
+
+    Agents keep their current-theme and recent-music state in a private
+    in-memory store, so benchmark runs never affect the service's rotation.
+    """
+
+    def __init__(self, upstreams: FakeUpstreams, cassette: Cassette,
+                 patient_id: str = "demo_patient", theme_id: str = "family",
+                 combined: bool = True, streaming: bool = True):
+        self.upstreams = upstreams
+        self.cassette = cassette
+        self.theme_id = theme_id
+        self.dashboard_date = date(2024, 6, 1)
+        self.settings = {"patient_id": patient_id, "theme_id": theme_id, "combined": combined,
+                         "streaming": streaming}
+
+        self.patient_profile = DemoPatientManager().get_patient(patient_id)
+        if not self.patient_profile:
+            raise ValueError(f"Demo patient {patient_id} not found")
+
+        base_urls = upstream_base_urls("http://fake-upstreams")
+        inner = httpx.ASGITransport(app=upstreams.app) if cassette.mode != MODE_REPLAY else None
+        self.clients = {
+            name: httpx.AsyncClient(transport=cassette.transport(name, inner))
+            for name in ["qloo", "gemini", "youtube", "vision"]
+        }
+
+        gemini_class = StreamingGeminiTool if streaming else SimpleGeminiTool
+        gemini = gemini_class("benchmark-key", http_client=self.clients["gemini"], base_url=base_urls["gemini"])
+        qloo = QlooInsightsAPI("benchmark-key", http_client=self.clients["qloo"], base_url=base_urls["qloo"])
+        youtube = YouTubeAPI("benchmark-key", http_client=self.clients["youtube"], base_url=base_urls["youtube"])
+        vision = VisionAIAnalyzer("benchmark-key", http_client=self.clients["vision"], base_url=base_urls["vision"])
+
+        state_store = InMemoryStateStore()
+        agent1 = InformationConsolidatorAgent(theme_manager=simplified_theme_manager, state_store=state_store)
+        agent4a = MusicCurationAgent(youtube_tool=youtube, gemini_tool=gemini, state_store=state_store)
+        agent4c = PhotoDescriptionAgent(gemini_tool=gemini)
+        agent5 = NostalgiaNewsGenerator(gemini_tool=gemini)
+        agent6 = DashboardSynthesizer(state_store=state_store)
+
+        self.sequential_agent = SequentialAgent(
+            agent1=agent1,
+            agent2=SimplePhotoAnalysisAgent(vision_tool=vision),
+            agent3=QlooCulturalAnalysisAgent(qloo_tool=qloo),
+            agent4a=agent4a,
+            agent4b=RecipeSelectionAgent(),
+            agent4c=agent4c,
+            agent4d=CombinedContentGenerator(gemini_tool=gemini, photo_agent=agent4c,
+                                             nostalgia_agent=agent5) if combined else None,
+            agent5=agent5,
+            agent6=agent6
+        )
+        self.stage_inputs: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def graph(self):
+        return self.sequential_agent.graph
+
+    async def run_pipeline(self) -> Dict[str, Any]:
+        return await self.sequential_agent.run(
+            patient_profile=self.patient_profile,
+            request_type="dashboard",
+            session_id="benchmark",
+            theme_id=self.theme_id,
+            dashboard_date=self.dashboard_date
+        )
+
+    async def warm_up(self) -> Dict[str, Any]:
+        """Run the full pipeline once and capture every node's inputs"""
+
+        dashboard = await self.run_pipeline()
+        # The benchmark is the graph's only caller, so the newest run is this one
+        outputs = self.graph.recent_runs[-1].outputs
+        self.stage_inputs = {
+            name: {dependency: outputs[dependency] for dependency in node.depends_on}
+            for name, node in self.graph.nodes.items()
+        }
+        return dashboard
+
+    def stage_names(self) -> List[str]:
+        return [PIPELINE_STAGE] + self.graph.topological_order()
+
+    def stage_label(self, stage: str) -> str:
+        return "SequentialAgent.run" if stage == PIPELINE_STAGE else self.graph.nodes[stage].label
+
+    def stage_runner(self, stage: str) -> Callable[[], Awaitable[Any]]:
+        """Coroutine factory running one stage (fresh copy of its captured inputs each time)"""
+
+        if stage == PIPELINE_STAGE:
+            return self.run_pipeline
+
+        node = self.graph.nodes[stage]
+        node_runner = self.sequential_agent._node_runners[stage]
+        request_context = {
+            "patient_profile": self.patient_profile,
+            "request_type": "dashboard",
+            "session_id": "benchmark",
+            "feedback_data": None,
+            "theme_id": self.theme_id,
+            "dashboard_date": self.dashboard_date,
+            "on_partial": None
+        }
+
+        async def run_stage() -> Any:
+            return await node_runner(node, copy.deepcopy(self.stage_inputs[stage]), request_context)
+
+        return run_stage
+
+    async def aclose(self) -> None:
+        for client in self.clients.values():
+            await client.aclose()
+
+
+async def measure_stage(run_stage: Callable[[], Awaitable[Any]], iterations: int,
+                        trace_allocations: bool = True) -> Dict[str, Any]:
+    """
+    Time one stage, then (separately) trace its allocations.
+
+    Returns:
+        wall time p50/p95/max, event-loop blocking per run (median) and the longest
+        stall, plus tracemalloc peak and net retained blocks/bytes of one run
+    """
+
+    wall_ms: List[float] = []
+    blocking_ms: List[float] = []
+    max_block_ms = 0.0
+
+    for _ in range(iterations):
+        async with LoopBlockMonitor() as monitor:
+            started = time.perf_counter()
+            await run_stage()
+            wall_ms.append((time.perf_counter() - started) * 1000)
+        blocking_ms.append(monitor.blocked_s * 1000)
+        max_block_ms = max(max_block_ms, monitor.max_block_s * 1000)
+
+    result = {
+        "iterations": iterations,
+        "wall_ms_p50": round(statistics.median(wall_ms), 3),
+        "wall_ms_p95": round(percentile(wall_ms, 0.95), 3),
+        "wall_ms_max": round(max(wall_ms), 3),
+        "blocking_ms": round(statistics.median(blocking_ms), 3),
+        "max_block_ms": round(max_block_ms, 3)
+    }
+
+    if trace_allocations:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline_bytes = tracemalloc.get_traced_memory()[0]
+            await run_stage()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        differences = after.compare_to(before, "lineno")
+        result.update({
+            "peak_kb": round((peak_bytes - baseline_bytes) / 1024, 1),
+            "allocated_blocks": sum(stat.count_diff for stat in differences if stat.count_diff > 0),
+            "net_kb": round(sum(stat.size_diff for stat in differences) / 1024, 1)
+        })
+
+    return result
+
+
+async def run_benchmark(iterations: int = 20, cassette_path: Optional[str] = None,
+                        stages: Optional[List[str]] = None, trace_allocations: bool = True,
+                        **bench_options: Any) -> Dict[str, Any]:
+    """
+    Benchmark the full pipeline and each agent stage.
+
+    Args:
+        iterations: Timed runs per stage
+        cassette_path: Replay this recorded cassette instead of the fake upstreams
+        stages: Only these stages (default: pipeline + every node)
+        trace_allocations: Also run the tracemalloc pass
+        **bench_options: patient_id, theme_id, combined, streaming
+
+    Returns:
+        JSON-serializable results keyed by stage
+    """
+
+    with tempfile.TemporaryDirectory() as cassette_dir:
+        if cassette_path:
+            cassette = Cassette(cassette_path, mode=MODE_REPLAY, replay_latency=False)
+        else:
+            cassette = Cassette(os.path.join(cassette_dir, "benchmark.jsonl"), mode=MODE_AUTO, replay_latency=False)
+
+        bench = PipelineBench(FakeUpstreams(seed=1), cassette, **bench_options)
+        try:
+            dashboard = await bench.warm_up()
+            results = {}
+            for stage in stages or bench.stage_names():
+                results[stage] = {
+                    "label": bench.stage_label(stage),
+                    **await measure_stage(bench.stage_runner(stage), iterations, trace_allocations)
+                }
+        finally:
+            await bench.aclose()
+
+    return {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {**bench.settings, "iterations": iterations, "cassette": cassette_path},
+        "degraded_sections": dashboard.get("metadata", {}).get("degraded_sections", []),
+        "upstream_requests": cassette.get_stats(),
+        "stages": results
+    }
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    Stage metrics that regressed past the threshold.
+
+    A metric regresses when it grows by more than threshold (relative) AND by
+    more than its absolute floor in REGRESSION_METRICS.
+    """
+
+    regressions = []
+    for stage, metrics in current.get("stages", {}).items():
+        baseline_metrics = baseline.get("stages", {}).get(stage)
+        if not baseline_metrics:
+            continue
+
+        for metric, floor in REGRESSION_METRICS.items():
+            if metric not in metrics or metric not in baseline_metrics:
+                continue
+            before, after = baseline_metrics[metric], metrics[metric]
+            if after - before > floor and after > before * (1 + threshold):
+                regressions.append({
+                    "stage": stage,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": round(after / before - 1, 3) if before else None
+                })
+
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(path: str, results: Dict[str, Any]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    settings = results["settings"]
+    print(f"\n⏱️ Pipeline benchmark: {settings['iterations']} iterations per stage, "
+          f"theme {settings['theme_id']}, combined={settings['combined']}, streaming={settings['streaming']}")
+    print(f"   {'stage':<8} {'p50 ms':>9} {'p95 ms':>9} {'block ms':>9} {'max blk':>8} {'peak KB':>9} {'blocks':>8}")
+    for stage, metrics in results["stages"].items():
+        print(f"   {stage:<8} {metrics['wall_ms_p50']:>9.2f} {metrics['wall_ms_p95']:>9.2f} "
+              f"{metrics['blocking_ms']:>9.2f} {metrics['max_block_ms']:>8.2f} "
+              f"{metrics.get('peak_kb', 0):>9.1f} {metrics.get('allocated_blocks', 0):>8}")
+    if results["degraded_sections"]:
+        print(f"⚠️ Degraded sections during warm-up: {', '.join(results['degraded_sections'])}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-agent timing and allocation benchmark for the dashboard pipeline")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--stage", action="append", dest="stages", help="Only benchmark this stage (repeatable)")
+    parser.add_argument("--patient-id", default="demo_patient")
+    parser.add_argument("--theme-id", default="family")
+    parser.add_argument("--combined", action=argparse.BooleanOptionalAction,
+                        default=Config.GEMINI_COMBINED_GENERATION_ENABLED, help="Include Agent 4D")
+    parser.add_argument("--streaming", action=argparse.BooleanOptionalAction,
+                        default=Config.GEMINI_STREAMING_ENABLED, help="Use the streaming Gemini tool")
+    parser.add_argument("--cassette", help="Replay a recorded cassette instead of the fake upstreams")
+    parser.add_argument("--no-allocations", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relative growth of a stage metric that fails the run")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+
+    results = asyncio.run(run_benchmark(
+        iterations=args.iterations,
+        cassette_path=args.cassette,
+        stages=args.stages,
+        trace_allocations=not args.no_allocations,
+        patient_id=args.patient_id,
+        theme_id=args.theme_id,
+        combined=args.combined,
+        streaming=args.streaming
+    ))
+    print_report(results)
+
+    if args.output:
+        save_results(args.output, results)
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline or baseline is None:
+        save_results(args.baseline, results)
+        print(f"💾 Baseline written to {args.baseline}")
+        return 0
+
+    if baseline.get("settings", {}).get("combined") != results["settings"]["combined"] or \
+            baseline.get("settings", {}).get("streaming") != results["settings"]["streaming"]:
+        print("⚠️ Baseline was recorded with different combined/streaming settings")
+
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) past {args.threshold:.0%} vs {args.baseline}:")
+        for regression in regressions:
+            print(f"   {regression['stage']} {regression['metric']}: "
+                  f"{regression['baseline']} → {regression['current']}")
+        return 1
+
+    print(f"✅ No stage regressed past {args.threshold:.0%} vs {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -278,6 +278,24 @@ def get_age_demographic_for_qloo(birth_year: int, current_year: int = None) -> s
     except Exception:
         return "55_and_older"
 
+def get_qloo_age_demographics(current_year: int = None) -> List[str]:
+    """
+    Distinct Qloo age demographics covering every AGE_BASED_NOSTALGIA age range.
+    
+    Returns:
+        Qloo age demographic strings (used to prefetch Qloo insights)
+    """
+    if current_year is None:
+        current_year = datetime.now().year
+    
+    demographics = []
+    for generation in AGE_BASED_NOSTALGIA.values():
+        for age in generation["age_range"]:
+            demographic = get_age_demographic_for_qloo(current_year - age, current_year)
+            if demographic not in demographics:
+                demographics.append(demographic)
+    return demographics
+
 def get_formative_decades(birth_year: int) -> List[int]:
     """
     Get the decades that were formative for someone (teens/young adult years).
@@ -478,6 +496,7 @@ __all__ = [
     "safe_get_heritage_tags", 
     "get_interest_tags",
     "get_age_demographic_for_qloo",
+    "get_qloo_age_demographics",
     "get_generation_from_birth_year",
     "get_formative_decades",
     "validate_anonymized_mapping_system"
@@ -23,6 +23,133 @@ class Config:
     GOOGLE_CLOUD_API_KEY = os.getenv("GOOGLE_CLOUD_API_KEY")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", os.getenv("GOOGLE_CLOUD_API_KEY"))
     
+    # Upstream base-URL overrides, e.g. benchmarks/fake_upstreams.py (empty = real API)
+    QLOO_BASE_URL = os.getenv("QLOO_BASE_URL", "")
+    GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "")
+    YOUTUBE_BASE_URL = os.getenv("YOUTUBE_BASE_URL", "")
+    VISION_BASE_URL = os.getenv("VISION_BASE_URL", "")
+    
+    # Pipeline latency budget for /api/dashboard in ms (0 = no budget)
+    DASHBOARD_LATENCY_BUDGET_MS = float(os.getenv("DASHBOARD_LATENCY_BUDGET_MS", 8000))
+    # Smallest per-request latency_budget_ms accepted (below it every agent would fall back)
+    DASHBOARD_MIN_LATENCY_BUDGET_MS = float(os.getenv("DASHBOARD_MIN_LATENCY_BUDGET_MS", 500))
+    
+    # Full-dashboard result cache (entries expire at local midnight)
+    DASHBOARD_CACHE_ENABLED = os.getenv("DASHBOARD_CACHE_ENABLED", "True").lower() == "true"
+    DASHBOARD_CACHE_MAX_BYTES = int(os.getenv("DASHBOARD_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+    
+    # Batch dashboard generation
+    BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", 4))
+    BATCH_MAX_PATIENTS = int(os.getenv("BATCH_MAX_PATIENTS", 200))
+    
+    # Off-peak pre-generation of next-day dashboards into a persistent store. Off by default:
+    # each run calls Gemini, Qloo and YouTube for every demo profile x PRECOMPUTE_THEMES_AHEAD themes
+    PRECOMPUTE_ENABLED = os.getenv("PRECOMPUTE_ENABLED", "False").lower() == "true"
+    PRECOMPUTE_HOUR = int(os.getenv("PRECOMPUTE_HOUR", 22))  # Local hour the nightly run starts
+    PRECOMPUTE_DAYS_AHEAD = int(os.getenv("PRECOMPUTE_DAYS_AHEAD", 1))
+    PRECOMPUTE_THEMES_AHEAD = int(os.getenv("PRECOMPUTE_THEMES_AHEAD", 1))  # Next N themes in rotation (0 = every theme)
+    PRECOMPUTE_CONCURRENCY = int(os.getenv("PRECOMPUTE_CONCURRENCY", 2))
+    PRECOMPUTE_DB_PATH = os.getenv(
+        "PRECOMPUTE_DB_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "precomputed_dashboards.sqlite3")
+    )
+    
+    # Theme rotation / recent music state: memory (per worker) or sqlite (shared by all workers)
+    STATE_STORE_BACKEND = os.getenv("STATE_STORE_BACKEND", "memory")
+    STATE_STORE_DB_PATH = os.getenv(
+        "STATE_STORE_DB_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "state.sqlite3")
+    )
+    
+    # Shared keep-alive HTTP client pools for Qloo, Gemini, YouTube and Vision
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "False").lower() == "true"  # Needs the h2 package
+    
+    # Record/replay cassette for all upstream traffic: record, replay or auto (empty = off)
+    CASSETTE_MODE = os.getenv("CASSETTE_MODE", "")
+    CASSETTE_PATH = os.getenv(
+        "CASSETTE_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cassettes", "upstreams.jsonl.gz")
+    )
+    CASSETTE_REPLAY_LATENCY = os.getenv("CASSETTE_REPLAY_LATENCY", "True").lower() == "true"
+    CASSETTE_LATENCY_SCALE = float(os.getenv("CASSETTE_LATENCY_SCALE", 1.0))
+    
+    # Deadline for each concurrent Qloo call in Agent 3 (0 = HTTP timeout only)
+    QLOO_CALL_DEADLINE_SECONDS = float(os.getenv("QLOO_CALL_DEADLINE_SECONDS", 20.0))
+    
+    # Upstream rate limits (token bucket per upstream, 0 RPM = no pacing) and jittered retries on 429/5xx
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+    QLOO_RATE_LIMIT_RPM = float(os.getenv("QLOO_RATE_LIMIT_RPM", 60))
+    QLOO_RATE_LIMIT_BURST = int(os.getenv("QLOO_RATE_LIMIT_BURST", 10))
+    GEMINI_RATE_LIMIT_RPM = float(os.getenv("GEMINI_RATE_LIMIT_RPM", 15))
+    GEMINI_RATE_LIMIT_BURST = int(os.getenv("GEMINI_RATE_LIMIT_BURST", 5))
+    YOUTUBE_RATE_LIMIT_RPM = float(os.getenv("YOUTUBE_RATE_LIMIT_RPM", 100))
+    YOUTUBE_RATE_LIMIT_BURST = int(os.getenv("YOUTUBE_RATE_LIMIT_BURST", 10))
+    VISION_RATE_LIMIT_RPM = float(os.getenv("VISION_RATE_LIMIT_RPM", 60))
+    VISION_RATE_LIMIT_BURST = int(os.getenv("VISION_RATE_LIMIT_BURST", 5))
+    RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", 3))
+    RETRY_BASE_DELAY_SECONDS = float(os.getenv("RETRY_BASE_DELAY_SECONDS", 0.5))
+    RETRY_MAX_DELAY_SECONDS = float(os.getenv("RETRY_MAX_DELAY_SECONDS", 8.0))
+    RETRY_BUDGET_SECONDS = float(os.getenv("RETRY_BUDGET_SECONDS", 15.0))  # Per call, also capped by node deadlines
+    
+    # Circuit breakers per upstream: fail fast to fallback content while an upstream is down
+    CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "True").lower() == "true"
+    CIRCUIT_BREAKER_FAILURE_RATE = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", 0.5))
+    CIRCUIT_BREAKER_MINIMUM_CALLS = int(os.getenv("CIRCUIT_BREAKER_MINIMUM_CALLS", 5))
+    CIRCUIT_BREAKER_WINDOW_SIZE = int(os.getenv("CIRCUIT_BREAKER_WINDOW_SIZE", 20))
+    CIRCUIT_BREAKER_OPEN_SECONDS = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", 30.0))
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_CALLS", 1))
+    
+    # Qloo insights cache: in-process LRU + optional SQLite tier (empty path = memory only)
+    QLOO_CACHE_ENABLED = os.getenv("QLOO_CACHE_ENABLED", "True").lower() == "true"
+    QLOO_CACHE_TTL_SECONDS = float(os.getenv("QLOO_CACHE_TTL_SECONDS", 24 * 3600))
+    QLOO_CACHE_MAX_BYTES = int(os.getenv("QLOO_CACHE_MAX_BYTES", 4 * 1024 * 1024))
+    QLOO_CACHE_DB_PATH = os.getenv(
+        "QLOO_CACHE_DB_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "qloo_insights_cache.sqlite3")
+    )
+    
+    # Qloo insights prefetch at startup and every interval (keep the interval below the cache TTL)
+    QLOO_PREFETCH_ENABLED = os.getenv("QLOO_PREFETCH_ENABLED", "True").lower() == "true"
+    QLOO_PREFETCH_INTERVAL_SECONDS = float(os.getenv("QLOO_PREFETCH_INTERVAL_SECONDS", 6 * 3600))
+    QLOO_PREFETCH_CONCURRENCY = int(os.getenv("QLOO_PREFETCH_CONCURRENCY", 4))
+    # Agent 3 sends 55_and_older; empty = every Qloo age band of AGE_BASED_NOSTALGIA
+    QLOO_PREFETCH_AGE_GROUPS = os.getenv("QLOO_PREFETCH_AGE_GROUPS", "55_and_older")
+    
+    # Gemini response cache: TTL per tool method (0 = do not cache that method)
+    GEMINI_CACHE_ENABLED = os.getenv("GEMINI_CACHE_ENABLED", "True").lower() == "true"
+    GEMINI_CACHE_MAX_BYTES = int(os.getenv("GEMINI_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+    GEMINI_CACHE_CONTENT_TTL_SECONDS = float(os.getenv("GEMINI_CACHE_CONTENT_TTL_SECONDS", 7 * 24 * 3600))
+    GEMINI_CACHE_STRUCTURED_TTL_SECONDS = float(os.getenv("GEMINI_CACHE_STRUCTURED_TTL_SECONDS", 24 * 3600))
+    GEMINI_CACHE_NEWSLETTER_TTL_SECONDS = float(os.getenv("GEMINI_CACHE_NEWSLETTER_TTL_SECONDS", 24 * 3600))
+    GEMINI_CACHE_DASHBOARD_TTL_SECONDS = float(os.getenv("GEMINI_CACHE_DASHBOARD_TTL_SECONDS", 24 * 3600))
+    GEMINI_CACHE_DB_PATH = os.getenv(
+        "GEMINI_CACHE_DB_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "gemini_response_cache.sqlite3")
+    )
+    
+    # streamGenerateContent for streamed dashboards (Nostalgia News renders section by section)
+    GEMINI_STREAMING_ENABLED = os.getenv("GEMINI_STREAMING_ENABLED", "True").lower() == "true"
+    
+    # One Gemini call for the photo and Nostalgia News text (Agents 4C/5 keep their own calls as fallback)
+    GEMINI_COMBINED_GENERATION_ENABLED = os.getenv("GEMINI_COMBINED_GENERATION_ENABLED", "True").lower() == "true"
+    
+    # Persistent YouTube search cache (each search.list call costs 100 quota units)
+    YOUTUBE_CACHE_ENABLED = os.getenv("YOUTUBE_CACHE_ENABLED", "True").lower() == "true"
+    YOUTUBE_CACHE_TTL_SECONDS = float(os.getenv("YOUTUBE_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+    YOUTUBE_CACHE_STALE_SECONDS = float(os.getenv("YOUTUBE_CACHE_STALE_SECONDS", 24 * 3600))  # Served while refreshing
+    YOUTUBE_CACHE_MAX_ENTRIES = int(os.getenv("YOUTUBE_CACHE_MAX_ENTRIES", 5000))
+    YOUTUBE_CACHE_DB_PATH = os.getenv(
+        "YOUTUBE_CACHE_DB_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "youtube_search_cache.sqlite3")
+    )
+    
+    # Tracing: rolling latency window per agent/upstream and optional OTLP/JSON file export
+    TRACING_WINDOW_SIZE = int(os.getenv("TRACING_WINDOW_SIZE", 1024))
+    TRACING_EXPORT_PATH = os.getenv("TRACING_EXPORT_PATH", "")  # e.g. data/traces.jsonl (empty = disabled)
+    
     # Database (if needed)
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./careconnect.db")
     
@@ -49,10 +176,16 @@ class Config:
         return {
             "port": cls.PORT,
             "debug": cls.DEBUG,
+            "dashboard_latency_budget_ms": cls.DASHBOARD_LATENCY_BUDGET_MS,
+            "dashboard_min_latency_budget_ms": cls.DASHBOARD_MIN_LATENCY_BUDGET_MS,
             "api_keys_configured": {
                 "qloo": bool(cls.QLOO_API_KEY),
                 "youtube": bool(cls.YOUTUBE_API_KEY),
                 "google_cloud": bool(cls.GOOGLE_CLOUD_API_KEY),
                 "gemini": bool(cls.GEMINI_API_KEY)
+            },
+            "upstream_base_url_overrides": {
+                name: url for name, url in [("qloo", cls.QLOO_BASE_URL), ("gemini", cls.GEMINI_BASE_URL),
+                                            ("youtube", cls.YOUTUBE_BASE_URL), ("vision", cls.VISION_BASE_URL)] if url
             }
         }
\ No newline at end of file
@@ -3,7 +3,7 @@ Dynamic Theme Manager n
 File: backend/config/theme_config.py
 
 - TRUE ROTATION: Themes cycle in order, never repeat consecutively
-- Persistent theme tracking across refreshes
+- Persistent theme tracking across refreshes (rotation index lives in the state store)
 - Guaranteed variety for users
 - Simple, predictable rotation
 """
@@ -17,6 +17,8 @@ from typing import Dict, Any, Optional, List
 import logging
 from pathlib import Path
 
+from multi_tool_agent.state_store import StateStore, default_state_store, STATE_THEME_ROTATION
+
 logger = logging.getLogger(__name__)
 
 class SimplifiedThemeManager:
@@ -30,10 +32,10 @@ class SimplifiedThemeManager:
     - Clean data structure for pipeline
     """
     
-    def __init__(self):
+    def __init__(self, state_store: Optional[StateStore] = None):
         self.themes_data = self._load_themes_config()
         self.themes_list = self.themes_data.get("themes", [])
-        self.state_file = os.path.join(os.path.dirname(__file__), "theme_state.json")
+        self.state_store = state_store or default_state_store
         
         logger.info(f"🎯 Dynamic Theme Manager initialized with ROTATION")
         logger.info(f"📁 Loaded {len(self.themes_list)} themes from themes.json")
@@ -64,37 +66,74 @@ class SimplifiedThemeManager:
         logger.warning("🔄 Using fallback themes")
         return self._get_fallback_themes()
     
+    def use_state_store(self, state_store: StateStore) -> None:
+        """Keep the rotation state in another store (e.g. SQLite shared by all workers)"""
+        self.state_store = state_store
+    
+    async def aget_daily_theme(self, session_id: Optional[str] = None, force_refresh: bool = True) -> Dict[str, Any]:
+        """get_daily_theme() for the event loop (rotation I/O runs off the loop for blocking stores)"""
+        return await self.state_store.run_io(self.get_daily_theme, session_id, force_refresh)
+    
     def _load_theme_state(self) -> Dict[str, Any]:
-        """Load current rotation state from persistent storage"""
+        """Load current rotation state from the state store"""
         try:
-            if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    logger.info(f"📖 Loaded theme state: index {state.get('current_index', 0)}")
-                    return state
+            state = self.state_store.get(STATE_THEME_ROTATION)
+            if state:
+                logger.info(f"📖 Loaded theme state: index {state.get('current_index', 0)}")
+                return state
         except Exception as e:
             logger.warning(f"⚠️ Could not load theme state: {e}")
         
         # Default state
         return {"current_index": 0, "total_themes": len(self.themes_list)}
     
+    def _rotation_state(self, current_index: int) -> Dict[str, Any]:
+        return {
+            "current_index": current_index,
+            "total_themes": len(self.themes_list),
+            "last_updated": datetime.now().isoformat()
+        }
+    
     def _save_theme_state(self, current_index: int):
-        """Save current rotation state to persistent storage"""
+        """Save current rotation state to the state store"""
         try:
-            state = {
-                "current_index": current_index,
-                "total_themes": len(self.themes_list),
-                "last_updated": datetime.now().isoformat()
-            }
-            
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-                
+            self.state_store.put(STATE_THEME_ROTATION, self._rotation_state(current_index))
             logger.info(f"💾 Saved theme state: index {current_index}")
             
         except Exception as e:
             logger.error(f"❌ Could not save theme state: {e}")
     
+    def _advance_rotation(self) -> int:
+        """
+        Select the current theme index and move the rotation on in one atomic
+        update (concurrent requests and workers never get the same index)
+        
+        Returns:
+            Index of the selected theme
+        """
+        selected = {}
+        
+        def advance(state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            current_index = (state or {}).get("current_index", 0)
+            
+            # Ensure index is valid (handle case where themes.json changed)
+            if current_index >= len(self.themes_list):
+                logger.info(f"🔄 Reset theme index to 0 (was {current_index})")
+                current_index = 0
+            
+            selected["index"] = current_index
+            return self._rotation_state((current_index + 1) % len(self.themes_list))
+        
+        try:
+            self.state_store.update(STATE_THEME_ROTATION, advance)
+        except Exception as e:
+            # Serve the current theme without advancing rather than failing the request
+            logger.error(f"❌ Could not advance theme rotation: {e}")
+            current_index = self._load_theme_state().get("current_index", 0)
+            return current_index if current_index < len(self.themes_list) else 0
+
+        return selected["index"]
+    
     def _get_fallback_themes(self) -> Dict[str, Any]:
         """Clean fallback themes for demo reliability"""
         
@@ -209,25 +248,24 @@ class SimplifiedThemeManager:
             logger.error("❌ No themes available")
             return self._create_fallback_theme_response()
         
-        # Load current rotation state
-        state = self._load_theme_state()
-        current_index = state.get("current_index", 0)
-        
-        # Ensure index is valid (handle case where themes.json changed)
-        if current_index >= len(self.themes_list):
-            current_index = 0
-            logger.info(f"🔄 Reset theme index to 0 (was {state.get('current_index')})")
+        if force_refresh:
+            # ROTATION LOGIC: Select the current theme and move to the next one atomically
+            current_index = self._advance_rotation()
+            logger.info(f"🔄 ROTATION: Theme {current_index} → Next will be "
+                        f"{(current_index + 1) % len(self.themes_list)}")
+        else:
+            # Load current rotation state
+            state = self._load_theme_state()
+            current_index = state.get("current_index", 0)
+            
+            # Ensure index is valid (handle case where themes.json changed)
+            if current_index >= len(self.themes_list):
+                current_index = 0
+                logger.info(f"🔄 Reset theme index to 0 (was {state.get('current_index')})")
         
         # Get current theme
         selected_theme = self.themes_list[current_index]
         
-        if force_refresh:
-            # ROTATION LOGIC: Move to next theme
-            next_index = (current_index + 1) % len(self.themes_list)
-            self._save_theme_state(next_index)
-            
-            logger.info(f"🔄 ROTATION: Theme {current_index} → Next will be {next_index}")
-        
         # Get photo filename for UI
         photo_filename = self._get_photo_filename(selected_theme)
         
@@ -293,6 +331,49 @@ class SimplifiedThemeManager:
         logger.info(f"📷 Theme '{theme_name}' (ID: {theme_id}) → Photo '{filename}'")
         return filename
     
+    def get_upcoming_themes(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Themes in the order the rotation will select them, starting with the next one
+        
+        Args:
+            count: How many themes to return (default: one full rotation)
+        """
+        if not self.themes_list:
+            return []
+        
+        state = self._load_theme_state()
+        current_index = state.get("current_index", 0)
+        if current_index >= len(self.themes_list):
+            current_index = 0
+        
+        total = len(self.themes_list)
+        count = total if not count else min(count, total)
+        return [self.themes_list[(current_index + offset) % total] for offset in range(count)]
+    
+    def get_theme_selection(self, theme_id: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Same response shape as get_daily_theme() for a specific theme, without
+        touching the rotation state (used for pre-generating dashboards)
+        """
+        
+        selected_theme = self.get_theme_by_id(theme_id)
+        if selected_theme is None:
+            return self._create_fallback_theme_response()
+        
+        theme_index = self.themes_list.index(selected_theme)
+        return {
+            "theme_of_the_day": selected_theme,
+            "photo_filename": self._get_photo_filename(selected_theme),
+            "selection_metadata": {
+                "date": datetime.now().isoformat(),
+                "theme_index": theme_index,
+                "next_theme_index": (theme_index + 1) % len(self.themes_list),
+                "total_themes_available": len(self.themes_list),
+                "selection_method": "pinned",
+                "refresh_enabled": False
+            }
+        }
+    
     def get_next_theme_preview(self) -> Optional[str]:
         """Get the name of the next theme in rotation (for debugging)"""
         if not self.themes_list:
@@ -6,12 +6,16 @@ File: backend/main.py
 
 import logging
 import uvicorn
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import Dict, Any, Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Dict, Any, Optional, List, AsyncIterator
+import asyncio
+import json
+import math
 import os
-from datetime import datetime
+import time
+from datetime import datetime, date
 
 # FIXED: Import configuration with correct case
 from config.settings import Config
@@ -21,7 +25,25 @@ from patient_data.demo_patient_manager import DemoPatientManager
 from config.theme_config import simplified_theme_manager
 
 # Import the updated sequential agent and all individual agents
-from multi_tool_agent.sequential_agent import SequentialAgent
+from multi_tool_agent.sequential_agent import SequentialAgent, build_dashboard_graph
+from multi_tool_agent.dashboard_cache import DashboardCache, dashboard_cache_inputs, is_complete_dashboard
+from multi_tool_agent.caching import canonical_hash
+from multi_tool_agent.single_flight import SingleFlight, shared_call_scope, get_single_flight_stats
+from multi_tool_agent.precompute import PrecomputedDashboardStore, PrecomputeScheduler
+from multi_tool_agent.tracing import tracer
+from multi_tool_agent.http_clients import HTTPClientRegistry
+from multi_tool_agent.cassette import Cassette
+from multi_tool_agent.state_store import create_state_store
+from multi_tool_agent.rate_limiting import UpstreamLimiter, get_rate_limit_stats
+from multi_tool_agent.circuit_breaker import CircuitBreaker, get_circuit_breaker_stats
+from multi_tool_agent.youtube_cache import YouTubeSearchCache
+from multi_tool_agent.qloo_cache import QlooInsightsCache
+from multi_tool_agent.qloo_prefetch import QlooPrefetcher
+from multi_tool_agent.gemini_cache import (
+    GeminiResponseCache, METHOD_GENERATE_CONTENT, METHOD_STRUCTURED_JSON, METHOD_NEWSLETTER,
+    METHOD_DASHBOARD_CONTENT
+)
+from config.cultural_mappings import get_qloo_age_demographics
 from multi_tool_agent.agents.information_consolidator_agent import InformationConsolidatorAgent
 from multi_tool_agent.agents.simple_photo_analysis_agent import SimplePhotoAnalysisAgent
 from multi_tool_agent.agents.qloo_cultural_analysis_agent import QlooCulturalAnalysisAgent
@@ -29,6 +51,7 @@ from multi_tool_agent.agents.music_curation_agent import MusicCurationAgent
 from multi_tool_agent.agents.recipe_selection_agent import RecipeSelectionAgent
 from multi_tool_agent.agents.photo_description_agent import PhotoDescriptionAgent
 from multi_tool_agent.agents.nostalgia_news_generator import NostalgiaNewsGenerator
+from multi_tool_agent.agents.combined_content_generator import CombinedContentGenerator
 from multi_tool_agent.agents.dashboard_synthesizer import DashboardSynthesizer
 
 # Import tools for initialization
@@ -61,12 +84,29 @@ app.add_middleware(
 sequential_agent = None
 demo_manager = None
 tools = None
+http_clients = None
+rate_limiters = None
+circuit_breakers = None
+youtube_search_cache = None
+qloo_insights_cache = None
+qloo_prefetcher = None
+gemini_response_cache = None
+dashboard_cache = DashboardCache(
+    max_bytes=Config.DASHBOARD_CACHE_MAX_BYTES,
+    enabled=Config.DASHBOARD_CACHE_ENABLED
+)
+pipeline_flight = SingleFlight("dashboard_pipeline", should_remember=is_complete_dashboard)
+precompute_store = None
+precompute_scheduler = None
+state_store = None
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the enhanced CareConnect API with 6-agent pipeline"""
     
-    global sequential_agent, demo_manager, tools
+    global sequential_agent, demo_manager, tools, http_clients, youtube_search_cache, qloo_insights_cache
+    global qloo_prefetcher, gemini_response_cache, rate_limiters, circuit_breakers
+    global precompute_store, precompute_scheduler, state_store
     
     try:
         logger.info("🚀 Starting Enhanced CareConnect API with Nostalgia News")
@@ -77,14 +117,120 @@ async def startup_event():
         config_status = Config.get_status()
         logger.info(f"📊 Configuration: {config_status}")
         
+        # Per-agent / per-upstream latency tracing
+        tracer.configure(window_size=Config.TRACING_WINDOW_SIZE, export_path=Config.TRACING_EXPORT_PATH)
+        
+        # Theme rotation and recent-music state (no per-request file writes)
+        state_store = create_state_store(Config.STATE_STORE_BACKEND, Config.STATE_STORE_DB_PATH)
+        simplified_theme_manager.use_state_store(state_store)
+        logger.info(f"🗃️ State store: {Config.STATE_STORE_BACKEND}")
+        
         # Initialize demo patient manager
         demo_manager = DemoPatientManager()
         logger.info("✅ Demo Patient Manager initialized")
         logger.info(f"📊 Loaded {len(demo_manager.get_all_patients())} demo patients")
         
+        # Shared keep-alive connection pools for the external APIs
+        # (optionally recording or replaying upstream traffic for repeatable profiling)
+        cassette = None
+        if Config.CASSETTE_MODE:
+            cassette = Cassette(
+                Config.CASSETTE_PATH,
+                mode=Config.CASSETTE_MODE,
+                replay_latency=Config.CASSETTE_REPLAY_LATENCY,
+                latency_scale=Config.CASSETTE_LATENCY_SCALE
+            )
+            logger.info(f"📼 Upstream cassette in {Config.CASSETTE_MODE} mode: {Config.CASSETTE_PATH}")
+        http_clients = HTTPClientRegistry(
+            max_connections=Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+            http2=Config.HTTP2_ENABLED,
+            cassette=cassette
+        )
+        
+        # Per-upstream request pacing with jittered retries on 429/5xx
+        if Config.RATE_LIMIT_ENABLED:
+            rate_limiters = {
+                name: UpstreamLimiter(
+                    name,
+                    requests_per_minute=rpm,
+                    burst=burst,
+                    max_attempts=Config.RETRY_MAX_ATTEMPTS,
+                    base_delay_s=Config.RETRY_BASE_DELAY_SECONDS,
+                    max_delay_s=Config.RETRY_MAX_DELAY_SECONDS,
+                    retry_budget_s=Config.RETRY_BUDGET_SECONDS
+                )
+                for name, rpm, burst in [
+                    ("qloo", Config.QLOO_RATE_LIMIT_RPM, Config.QLOO_RATE_LIMIT_BURST),
+                    ("gemini", Config.GEMINI_RATE_LIMIT_RPM, Config.GEMINI_RATE_LIMIT_BURST),
+                    ("youtube", Config.YOUTUBE_RATE_LIMIT_RPM, Config.YOUTUBE_RATE_LIMIT_BURST),
+                    ("vision", Config.VISION_RATE_LIMIT_RPM, Config.VISION_RATE_LIMIT_BURST)
+                ]
+            }
+        
+        # Per-upstream circuit breakers (an outage degrades to fallbacks in milliseconds)
+        if Config.CIRCUIT_BREAKER_ENABLED:
+            circuit_breakers = {
+                name: CircuitBreaker(
+                    name,
+                    failure_rate_threshold=Config.CIRCUIT_BREAKER_FAILURE_RATE,
+                    minimum_calls=Config.CIRCUIT_BREAKER_MINIMUM_CALLS,
+                    window_size=Config.CIRCUIT_BREAKER_WINDOW_SIZE,
+                    open_seconds=Config.CIRCUIT_BREAKER_OPEN_SECONDS,
+                    half_open_max_calls=Config.CIRCUIT_BREAKER_HALF_OPEN_CALLS
+                )
+                for name in ["qloo", "gemini", "youtube", "vision"]
+            }
+        
+        # Persistent YouTube search cache (survives restarts, saves search quota)
+        youtube_search_cache = YouTubeSearchCache(
+            Config.YOUTUBE_CACHE_DB_PATH,
+            ttl_seconds=Config.YOUTUBE_CACHE_TTL_SECONDS,
+            stale_seconds=Config.YOUTUBE_CACHE_STALE_SECONDS,
+            max_entries=Config.YOUTUBE_CACHE_MAX_ENTRIES,
+            enabled=Config.YOUTUBE_CACHE_ENABLED
+        )
+        
+        # Qloo insights cache (heritage maps to a handful of tag sets)
+        qloo_insights_cache = QlooInsightsCache(
+            ttl_seconds=Config.QLOO_CACHE_TTL_SECONDS,
+            max_bytes=Config.QLOO_CACHE_MAX_BYTES,
+            db_path=Config.QLOO_CACHE_DB_PATH or None,
+            enabled=Config.QLOO_CACHE_ENABLED
+        )
+        
+        # Gemini response cache (prompts repeat across patients and days)
+        gemini_response_cache = GeminiResponseCache(
+            ttls={
+                METHOD_GENERATE_CONTENT: Config.GEMINI_CACHE_CONTENT_TTL_SECONDS,
+                METHOD_STRUCTURED_JSON: Config.GEMINI_CACHE_STRUCTURED_TTL_SECONDS,
+                METHOD_NEWSLETTER: Config.GEMINI_CACHE_NEWSLETTER_TTL_SECONDS,
+                METHOD_DASHBOARD_CONTENT: Config.GEMINI_CACHE_DASHBOARD_TTL_SECONDS
+            },
+            max_bytes=Config.GEMINI_CACHE_MAX_BYTES,
+            db_path=Config.GEMINI_CACHE_DB_PATH or None,
+            enabled=Config.GEMINI_CACHE_ENABLED
+        )
+        
         # Initialize tools with safe fallbacks
         logger.info("🛠️ Initializing tools...")
-        tools = initialize_all_tools()
+        tools = initialize_all_tools(
+            http_clients=http_clients,
+            youtube_search_cache=youtube_search_cache,
+            qloo_call_deadline_s=Config.QLOO_CALL_DEADLINE_SECONDS,
+            qloo_insights_cache=qloo_insights_cache,
+            gemini_response_cache=gemini_response_cache,
+            gemini_streaming=Config.GEMINI_STREAMING_ENABLED,
+            rate_limiters=rate_limiters,
+            circuit_breakers=circuit_breakers,
+            base_urls={
+                "qloo": Config.QLOO_BASE_URL,
+                "gemini": Config.GEMINI_BASE_URL,
+                "youtube": Config.YOUTUBE_BASE_URL,
+                "vision": Config.VISION_BASE_URL
+            }
+        )
         
         # Log tool status
         available_tools = [name for name, tool in tools.items() if tool is not None]
@@ -94,7 +240,7 @@ async def startup_event():
         logger.info("🤖 Initializing agents...")
         
         # Agent 1: Information Consolidator with theme manager
-        agent1 = InformationConsolidatorAgent(theme_manager=simplified_theme_manager)
+        agent1 = InformationConsolidatorAgent(theme_manager=simplified_theme_manager, state_store=state_store)
         logger.info("✅ Agent 1 (Information Consolidator) initialized")
         
         # Agent 2: Simple Photo Analysis
@@ -108,7 +254,8 @@ async def startup_event():
         # Agent 4A: Music Curation
         agent4a = MusicCurationAgent(
             youtube_tool=tools.get("youtube_tool"),
-            gemini_tool=tools.get("gemini_tool")
+            gemini_tool=tools.get("gemini_tool"),
+            state_store=state_store
         )
         logger.info("✅ Agent 4A (Music Curation) initialized")
         
@@ -124,27 +271,60 @@ async def startup_event():
         agent5 = NostalgiaNewsGenerator(gemini_tool=tools.get("gemini_tool"))
         logger.info("✅ Agent 5 (Nostalgia News Generator) initialized - STAR FEATURE!")
         
+        # Agent 4D: Combined Content Generation (one Gemini call for 4C and 5)
+        agent4d = None
+        if Config.GEMINI_COMBINED_GENERATION_ENABLED and tools.get("gemini_tool"):
+            agent4d = CombinedContentGenerator(
+                gemini_tool=tools.get("gemini_tool"),
+                photo_agent=agent4c,
+                nostalgia_agent=agent5
+            )
+            logger.info("✅ Agent 4D (Combined Content Generation) initialized")
+        
         # Agent 6: Dashboard Synthesizer
-        agent6 = DashboardSynthesizer()
+        agent6 = DashboardSynthesizer(state_store=state_store)
         logger.info("✅ Agent 6 (Dashboard Synthesizer) initialized")
         
-        # Initialize sequential agent with all components
-        sequential_agent = SequentialAgent(
-            agent1=agent1,
-            agent2=agent2,
-            agent3=agent3,
-            agent4a=agent4a,
-            agent4b=agent4b,
-            agent4c=agent4c,
-            agent5=agent5,
-            agent6=agent6
+        # Declare the pipeline graph: each agent lists the upstream outputs it consumes
+        pipeline_graph = build_dashboard_graph(
+            agent1=agent1, agent2=agent2, agent3=agent3,
+            agent4a=agent4a, agent4b=agent4b, agent4c=agent4c,
+            agent5=agent5, agent6=agent6, agent4d=agent4d
         )
         
+        # Initialize sequential agent with the dependency graph
+        sequential_agent = SequentialAgent(graph=pipeline_graph)
+        
         logger.info("✅ Sequential agent initialized with 6-agent pipeline")
         logger.info("🤖 Pipeline Status: 6/6 agents ready")
         logger.info("🌟 Star Feature: nostalgia_news_generator")
         logger.info("📰 Ready for Nostalgia News generation!")
         
+        # Warm the Qloo insights cache now and keep it warm on a schedule
+        if Config.QLOO_PREFETCH_ENABLED and tools.get("qloo_tool") and qloo_insights_cache.enabled:
+            age_groups = [group.strip() for group in Config.QLOO_PREFETCH_AGE_GROUPS.split(",") if group.strip()]
+            qloo_prefetcher = QlooPrefetcher(
+                tools["qloo_tool"],
+                age_groups=age_groups or get_qloo_age_demographics(),
+                concurrency=Config.QLOO_PREFETCH_CONCURRENCY,
+                interval_seconds=Config.QLOO_PREFETCH_INTERVAL_SECONDS
+            )
+            qloo_prefetcher.start()
+        
+        # Off-peak pre-generation of next-day dashboards
+        if Config.PRECOMPUTE_ENABLED:
+            precompute_store = PrecomputedDashboardStore(Config.PRECOMPUTE_DB_PATH)
+            precompute_scheduler = PrecomputeScheduler(
+                store=precompute_store,
+                generate=precompute_dashboard,
+                profiles_provider=demo_manager.get_all_patients,
+                themes_provider=lambda: simplified_theme_manager.get_upcoming_themes(Config.PRECOMPUTE_THEMES_AHEAD),
+                run_hour=Config.PRECOMPUTE_HOUR,
+                days_ahead=Config.PRECOMPUTE_DAYS_AHEAD,
+                concurrency=Config.PRECOMPUTE_CONCURRENCY
+            )
+            precompute_scheduler.start()
+        
         logger.info("🎉 Enhanced CareConnect API startup completed successfully!")
         
     except Exception as e:
@@ -154,6 +334,294 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background work"""
+    
+    if precompute_scheduler:
+        await precompute_scheduler.stop()
+        logger.info("🌙 Precompute scheduler stopped")
+    
+    if qloo_prefetcher:
+        await qloo_prefetcher.stop()
+    
+    if http_clients:
+        await http_clients.aclose()
+    
+    if youtube_search_cache:
+        youtube_search_cache.close()
+    
+    if qloo_insights_cache:
+        qloo_insights_cache.close()
+    
+    if gemini_response_cache:
+        gemini_response_cache.close()
+    
+    if state_store:
+        state_store.close()
+    
+    tracer.close()
+
+
+def resolve_dashboard_request(request: Dict[str, Any],
+                              defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Extract pipeline arguments from a dashboard request body.
+    
+    Args:
+        request: Request body (or one batch item)
+        defaults: Fallback values for session_id/feedback/latency_budget_ms (batch-level settings)
+    
+    Raises:
+        HTTPException: Missing/unknown patient or invalid latency budget
+    """
+    
+    defaults = defaults or {}
+    
+    # Extract request data
+    session_id = request.get("session_id", defaults.get("session_id", "default"))
+    feedback_data = request.get("feedback", defaults.get("feedback", {}))
+    
+    # Latency budget: per-request override, else the configured default (0 = no budget)
+    latency_budget_ms = request.get("latency_budget_ms", defaults.get("latency_budget_ms"))
+    if latency_budget_ms is None:
+        latency_budget_ms = Config.DASHBOARD_LATENCY_BUDGET_MS or None
+    else:
+        try:
+            latency_budget_ms = float(latency_budget_ms)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="'latency_budget_ms' must be a number")
+        if not math.isfinite(latency_budget_ms) or latency_budget_ms < Config.DASHBOARD_MIN_LATENCY_BUDGET_MS:
+            raise HTTPException(status_code=400, detail=f"'latency_budget_ms' must be a finite number of at least "
+                                                        f"{Config.DASHBOARD_MIN_LATENCY_BUDGET_MS:.0f}")
+    
+    # FIXED: Accept patient_profile directly from request OR fallback to demo lookup
+    patient_profile = request.get("patient_profile")
+    
+    if not patient_profile:
+        # Fallback: try to get from demo manager if patient_id provided
+        patient_id = request.get("patient_id")
+        if patient_id and demo_manager:
+            patient_profile = demo_manager.get_patient(patient_id)
+            if not patient_profile:
+                raise HTTPException(status_code=404, detail=f"Patient {patient_id} not found")
+        else:
+            raise HTTPException(status_code=400, detail="Either 'patient_profile' or 'patient_id' must be provided")
+    
+    return {
+        "patient_profile": patient_profile,
+        "session_id": session_id,
+        "feedback_data": feedback_data,
+        "latency_budget_ms": latency_budget_ms
+    }
+
+async def select_dashboard_theme(session_id: str = "default") -> str:
+    """
+    Advance the theme rotation once for this request and return the selected theme id.
+    
+    Every request (cache hit, single-flight follower or fresh run) moves the
+    rotation exactly once; the pipeline is then pinned to this theme so the
+    dashboard always matches the key it is cached and coalesced under.
+    """
+    
+    selection = await simplified_theme_manager.aget_daily_theme(session_id)
+    return selection.get("theme_of_the_day", {}).get("id", "memory_lane")
+
+async def lookup_cached_dashboard(patient_profile: Dict[str, Any],
+                            session_id: str = "default",
+                            feedback_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Select this request's theme, then check the dashboard cache and the
+    precomputed store for it.
+    
+    Precomputed hits are copied into the in-memory cache. Requests carrying
+    feedback bypass both.
+    
+    Returns:
+        {"theme_id": ..., "cache_key": key or None, "dashboard": cached dashboard or None}
+    """
+    
+    theme_id = await select_dashboard_theme(session_id)
+    
+    cache_key = None
+    cached_dashboard = None
+    if not feedback_data:
+        cache_key = dashboard_cache.make_key(patient_profile, theme_id)
+        
+        cache_status = "hit"
+        cached_dashboard = dashboard_cache.get(cache_key)
+        if cached_dashboard is None and precompute_store:
+            cached_dashboard = await precompute_store.aget(cache_key)
+            if cached_dashboard is not None:
+                cache_status = "precomputed"
+                dashboard_cache.put(cache_key, cached_dashboard)
+        
+        if cached_dashboard is not None:
+            cached_dashboard.setdefault("pipeline_metadata", {})["dashboard_cache"] = cache_status
+    
+    return {"theme_id": theme_id, "cache_key": cache_key, "dashboard": cached_dashboard}
+
+def store_dashboard(cache_key: Optional[str], result: Dict[str, Any]) -> None:
+    """Cache a freshly generated dashboard and mark it as a cache miss"""
+    
+    if cache_key and dashboard_cache.enabled and result.get("success", True):
+        dashboard_cache.put(cache_key, result)
+        result.setdefault("pipeline_metadata", {})["dashboard_cache"] = "miss"
+
+async def run_dashboard_pipeline(patient_profile: Dict[str, Any],
+                                 session_id: str = "default",
+                                 feedback_data: Optional[Dict[str, Any]] = None,
+                                 latency_budget_ms: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Run the pipeline behind the dashboard cache and single-flight coalescing.
+    
+    Concurrent requests with the same canonical inputs and selected theme
+    share one pipeline execution.
+    """
+    
+    cached = await lookup_cached_dashboard(patient_profile, session_id, feedback_data)
+    if cached["dashboard"] is not None:
+        return cached["dashboard"]
+    
+    async def execute_pipeline() -> Dict[str, Any]:
+        result = await sequential_agent.run(
+            patient_profile=patient_profile,
+            request_type="dashboard",
+            session_id=session_id,
+            feedback_data=feedback_data,
+            latency_budget_ms=latency_budget_ms,
+            theme_id=cached["theme_id"]
+        )
+        store_dashboard(cached["cache_key"], result)
+        return result
+    
+    flight_key = canonical_hash({
+        "dashboard": dashboard_cache_inputs(patient_profile, cached["theme_id"]),
+        "feedback": feedback_data or {},
+        "latency_budget_ms": latency_budget_ms
+    })
+    return await pipeline_flight.do(flight_key, execute_pipeline)
+
+async def precompute_dashboard(patient_profile: Dict[str, Any], theme_id: str, day: date) -> Dict[str, Any]:
+    """Run the full pipeline (no latency budget) for a pinned theme and day"""
+    
+    return await sequential_agent.run(
+        patient_profile=patient_profile,
+        request_type="dashboard",
+        session_id="precompute",
+        theme_id=theme_id,
+        dashboard_date=day
+    )
+
+async def stream_dashboard_events(patient_profile: Dict[str, Any],
+                                  session_id: str = "default",
+                                  feedback_data: Optional[Dict[str, Any]] = None,
+                                  latency_budget_ms: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Dashboard events in production order: sections first, then the final envelope.
+    
+    A cached dashboard is replayed section by section so clients handle both paths the same way.
+    """
+    
+    cached = await lookup_cached_dashboard(patient_profile, session_id, feedback_data)
+    dashboard = cached["dashboard"]
+    
+    if dashboard is not None:
+        content = dashboard.get("content", {})
+        yield {"event": "section", "section": "theme", "data": dashboard.get("patient_info", {}), "degraded": False}
+        for section in ["recipe", "photo", "music", "nostalgia_news"]:
+            yield {"event": "section", "section": section, "data": content.get(section, {}), "degraded": False}
+        yield {"event": "dashboard", "data": dashboard}
+        return
+    
+    async for event in sequential_agent.run_stream(
+        patient_profile=patient_profile,
+        request_type="dashboard",
+        session_id=session_id,
+        feedback_data=feedback_data,
+        latency_budget_ms=latency_budget_ms,
+        theme_id=cached["theme_id"]
+    ):
+        if event["event"] == "dashboard":
+            store_dashboard(cached["cache_key"], event["data"])
+        yield event
+
+async def run_dashboard_batch(items: List[Dict[str, Any]],
+                              defaults: Dict[str, Any],
+                              max_concurrency: int) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Generate dashboards for many patients, yielding each result as it completes.
+    
+    All patients run inside one shared-call scope, so each distinct Qloo,
+    YouTube or Gemini request (same parameters, e.g. heritage tag and age
+    group) is executed once per batch no matter how many residents share it.
+    Failed or empty responses are not reused; the next patient retries them.
+    """
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    started = time.perf_counter()
+    
+    async def run_one(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {"event": "patient", "index": index}
+        if isinstance(item, dict) and item.get("patient_id"):
+            entry["patient_id"] = item["patient_id"]
+        
+        try:
+            # Accept {"patient_profile": ...}, {"patient_id": ...} or a bare anonymized profile
+            if isinstance(item, dict) and not item.get("patient_profile") and not item.get("patient_id"):
+                item = {"patient_profile": item}
+            pipeline_args = resolve_dashboard_request(item, defaults)
+        except HTTPException as e:
+            return {**entry, "success": False, "status_code": e.status_code, "error": e.detail}
+        
+        async with semaphore:
+            try:
+                result = await run_dashboard_pipeline(**pipeline_args)
+            except Exception as e:
+                logger.error(f"❌ Batch item {index} failed: {e}")
+                return {**entry, "success": False, "status_code": 500, "error": str(e)}
+        
+        if result.get("success", True):
+            return {**entry, "success": True, "dashboard": result}
+        return {**entry, "success": False, "status_code": 500, "error": result.get("error", "Pipeline execution failed")}
+    
+    with shared_call_scope() as call_scope:
+        tasks = [asyncio.create_task(run_one(index, item)) for index, item in enumerate(items)]
+    
+    succeeded = 0
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            entry = await next_result
+            succeeded += 1 if entry["success"] else 0
+            yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+    
+    distinct_calls: Dict[str, int] = {}
+    for scope_key in call_scope:
+        group = scope_key.split(":", 1)[0]
+        distinct_calls[group] = distinct_calls.get(group, 0) + 1
+    
+    yield {
+        "event": "batch_complete",
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "max_concurrency": max_concurrency,
+        "distinct_calls": distinct_calls,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+
+def format_stream_event(event: Dict[str, Any], sse: bool) -> str:
+    """Serialize a dashboard event as an SSE frame or an NDJSON line"""
+    
+    if not sse:
+        return json.dumps(event, default=str) + "\n"
+    
+    name = event.get("section", event["event"]) if event["event"] == "section" else event["event"]
+    return f"event: {name}\ndata: {json.dumps(event, default=str)}\n\n"
+
 @app.post("/api/dashboard")
 async def generate_dashboard(request: Dict[str, Any]):
     """Generate personalized dashboard for patient"""
@@ -164,35 +632,16 @@ async def generate_dashboard(request: Dict[str, Any]):
     try:
         logger.info("📋 Dashboard generation request received")
         
-        # Extract request data
-        session_id = request.get("session_id", "default")
-        feedback_data = request.get("feedback", {})
-        
-        # FIXED: Accept patient_profile directly from request OR fallback to demo lookup
-        patient_profile = request.get("patient_profile")
-        
-        if not patient_profile:
-            # Fallback: try to get from demo manager if patient_id provided
-            patient_id = request.get("patient_id")
-            if patient_id and demo_manager:
-                patient_profile = demo_manager.get_patient(patient_id)
-                if not patient_profile:
-                    raise HTTPException(status_code=404, detail=f"Patient {patient_id} not found")
-            else:
-                raise HTTPException(status_code=400, detail="Either 'patient_profile' or 'patient_id' must be provided")
+        pipeline_args = resolve_dashboard_request(request)
+        patient_profile = pipeline_args["patient_profile"]
         
         logger.info(f"👤 Generating dashboard for: {patient_profile.get('first_name', 'Unknown')}")
         
         # Run the sequential agent pipeline
         logger.info("🚀 Starting 6-agent pipeline with Nostalgia News")
-        logger.info("📋 Pipeline: Info → Photo → Qloo → Content(4A/4B/4C) → Nostalgia News → Dashboard")
+        logger.info("📋 Pipeline: Info → (Photo ∥ Qloo) → Content(4A/4B/4C) → Nostalgia News → Dashboard")
         
-        result = await sequential_agent.run(
-            patient_profile=patient_profile,
-            request_type="dashboard",
-            session_id=session_id,
-            feedback_data=feedback_data
-        )
+        result = await run_dashboard_pipeline(**pipeline_args)
         
         if result.get("success", True):
             logger.info("✅ Dashboard generated successfully with Nostalgia News!")
@@ -209,6 +658,101 @@ async def generate_dashboard(request: Dict[str, Any]):
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.post("/api/dashboard/stream")
+async def stream_dashboard(request: Dict[str, Any], http_request: Request):
+    """
+    Stream the dashboard as sections complete.
+    
+    Emits theme, recipe, photo, music and nostalgia_news (each with the same
+    shape as in the final dashboard) as soon as they are produced, then the
+    full dashboard envelope. With a streaming Gemini tool, "partial" events
+    carry each Nostalgia News section while the model is still writing.
+    Server-Sent Events when the client accepts text/event-stream, NDJSON otherwise.
+    """
+    
+    if not sequential_agent:
+        raise HTTPException(status_code=503, detail="Sequential agent not initialized")
+    
+    logger.info("📡 Streaming dashboard request received")
+    pipeline_args = resolve_dashboard_request(request)
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    
+    async def body():
+        try:
+            async for event in stream_dashboard_events(**pipeline_args):
+                yield format_stream_event(event, sse)
+        except Exception as e:
+            logger.error(f"❌ Dashboard stream failed: {e}")
+            yield format_stream_event({"event": "error", "data": {"success": False, "error": str(e)}}, sse)
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/dashboards/batch")
+async def generate_dashboard_batch(request: Dict[str, Any]):
+    """
+    Generate dashboards for a list of anonymized profiles.
+    
+    Body: {"patients": [{"patient_profile": {...}} | {"patient_id": "..."} | {...profile...}],
+           "max_concurrency": 4, "latency_budget_ms": ..., "session_id": ...}
+    
+    Streams one NDJSON line per patient as it completes (with its index in the
+    request), then a batch_complete summary line.
+    """
+    
+    if not sequential_agent:
+        raise HTTPException(status_code=503, detail="Sequential agent not initialized")
+    
+    items = request.get("patients", request.get("profiles"))
+    if not isinstance(items, list) or not items:
+        raise HTTPException(status_code=400, detail="'patients' must be a non-empty list")
+    if len(items) > Config.BATCH_MAX_PATIENTS:
+        raise HTTPException(status_code=400, detail=f"At most {Config.BATCH_MAX_PATIENTS} patients per batch")
+    
+    try:
+        max_concurrency = int(request.get("max_concurrency", Config.BATCH_MAX_CONCURRENCY))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="'max_concurrency' must be an integer")
+    max_concurrency = max(1, min(max_concurrency, Config.BATCH_MAX_CONCURRENCY))
+    
+    defaults = {key: request[key] for key in ["session_id", "feedback", "latency_budget_ms"] if key in request}
+    
+    logger.info(f"📦 Batch dashboard request: {len(items)} patients, concurrency {max_concurrency}")
+    
+    async def body():
+        async for entry in run_dashboard_batch(items, defaults, max_concurrency):
+            yield format_stream_event(entry, sse=False)
+    
+    return StreamingResponse(body(), media_type="application/x-ndjson",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.post("/api/precompute/run")
+async def run_precompute(background_tasks: BackgroundTasks, request: Optional[Dict[str, Any]] = None):
+    """
+    Start a pre-generation run now instead of waiting for the nightly schedule.
+    
+    Body (optional): {"date": "YYYY-MM-DD"} - day to generate for (default: tomorrow)
+    """
+    
+    if not precompute_scheduler:
+        raise HTTPException(status_code=503, detail="Dashboard pre-generation is disabled")
+    
+    day = None
+    if request and request.get("date"):
+        try:
+            day = date.fromisoformat(request["date"])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="'date' must be YYYY-MM-DD")
+    
+    if precompute_scheduler.running:
+        return {"status": "already_running", "precompute": precompute_scheduler.get_status()}
+    
+    background_tasks.add_task(precompute_scheduler.run_once, day)
+    return {"status": "started", "target_date": day.isoformat() if day else None}
+
 @app.get("/demo/patients")
 async def get_demo_patients():
     """Get list of demo patients"""
@@ -239,15 +783,36 @@ async def api_status():
     agent_status = sequential_agent.get_agent_status() if sequential_agent else {}
     config_status = Config.get_status()
     
+    # Cold Qloo cache: dashboards work, but pay live Qloo latency until warm
+    if not sequential_agent:
+        readiness = "initializing"
+    elif qloo_prefetcher and qloo_prefetcher.warming:
+        readiness = "warming"
+    else:
+        readiness = "ready"
+    
     return {
         "api_version": "2.0.0",
-        "status": "ready" if sequential_agent else "initializing",
+        "status": readiness,
         "timestamp": datetime.now().isoformat(),
         "pipeline": agent_status,
         "configuration": config_status,
         "tools": {
             name: tool is not None for name, tool in (tools.items() if tools else {})
         },
+        "dashboard_cache": dashboard_cache.get_stats(),
+        "state_store": state_store.get_stats() if state_store else {"enabled": False},
+        "single_flight": get_single_flight_stats(),
+        "tracing": tracer.get_stats(),
+        "http_clients": http_clients.get_stats() if http_clients else {},
+        "cassette": http_clients.cassette.get_stats() if http_clients and http_clients.cassette else {"enabled": False},
+        "rate_limits": get_rate_limit_stats() if rate_limiters else {"enabled": False},
+        "circuit_breakers": get_circuit_breaker_stats() if circuit_breakers else {"enabled": False},
+        "youtube_cache": youtube_search_cache.get_stats() if youtube_search_cache else {"enabled": False},
+        "qloo_cache": qloo_insights_cache.get_stats() if qloo_insights_cache else {"enabled": False},
+        "qloo_prefetch": qloo_prefetcher.get_status() if qloo_prefetcher else {"enabled": False},
+        "gemini_cache": gemini_response_cache.get_stats() if gemini_response_cache else {"enabled": False},
+        "precompute": precompute_scheduler.get_status() if precompute_scheduler else {"enabled": False},
         "star_feature": {
             "name": "Nostalgia News Generator",
             "status": "ready" if agent_status.get("star_feature") == "nostalgia_news_generator" else "not_ready",
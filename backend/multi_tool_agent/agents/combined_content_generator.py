@@ -0,0 +1,175 @@
+"""
+Agent 4D: Combined Content Generator
+File: backend/multi_tool_agent/agents/combined_content_generator.py
+
+Features:
+- One Gemini call for the photo description, the photo conversation starters
+  and all Nostalgia News sections (instead of three or four per dashboard)
+- Reuses the photo and newsletter inputs Agents 4C and 5 would prompt with
+- Splits the response into per-agent sections; Agents 4C and 5 validate them
+  and fall back to their own Gemini calls when a section is missing
+- Streams Nostalgia News sections to the caller as they complete (streaming Gemini tool)
+- PII compliant (anonymized inputs only)
+"""
+
+import logging
+from typing import Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# Flat response schema: photo sections + newsletter sections
+COMBINED_CONTENT_SCHEMA = {
+    "photo_description": "string",
+    "photo_conversation_starters": ["string", "string", "string"],
+    "memory_spotlight": "string",
+    "era_highlights": "string",
+    "heritage_traditions": "string",
+    "conversation_starters": ["string", "string", "string"]
+}
+
+NOSTALGIA_SECTIONS = ["memory_spotlight", "era_highlights", "heritage_traditions", "conversation_starters"]
+
+
+class CombinedContentGenerator:
+    """
+    Agent 4D: single structured Gemini generation for Agents 4C and 5.
+
+    Output:
+        {"combined_content": {"photo": {...} | None, "nostalgia_news": {...} | None}, "metadata": {...}}
+        or {"combined_content": None, ...} when the call failed (agents use their own calls)
+    """
+
+    def __init__(self, gemini_tool=None, photo_agent=None, nostalgia_agent=None):
+        self.gemini_tool = gemini_tool
+        self.photo_agent = photo_agent
+        self.nostalgia_agent = nostalgia_agent
+
+        logger.info("🧩 Agent 4D: Combined Content Generator initialized")
+        logger.info(f"🧠 Gemini tool available: {self.gemini_tool is not None}")
+
+    async def run(self, enhanced_profile: Dict[str, Any],
+                  agent4a_output: Dict[str, Any],
+                  agent4b_output: Dict[str, Any],
+                  on_partial_section: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+        """
+        Generate the photo and Nostalgia News sections in one call.
+
+        Args:
+            enhanced_profile: Content-agent profile (Agent 1 output + Qloo intelligence)
+            agent4a_output: Music selection (artist and piece feed the newsletter)
+            agent4b_output: Recipe selection
+            on_partial_section: Called as (section, value) for each newsletter section
+                                as it streams in (streaming Gemini tool only)
+        """
+
+        logger.info("🧩 Agent 4D: Generating combined photo + Nostalgia News content")
+
+        if not self.gemini_tool or not self.photo_agent or not self.nostalgia_agent:
+            logger.info("🤖 Combined generation unavailable, agents will use their own calls")
+            return self._empty_result("unavailable")
+
+        try:
+            patient_info = enhanced_profile.get("patient_info", {})
+            photo_context = self.photo_agent.get_combined_generation_context(enhanced_profile)
+            news_context = self.nostalgia_agent.get_combined_generation_context(
+                enhanced_profile, agent4a_output, agent4b_output
+            )
+
+            prompt = self._create_combined_prompt(
+                photo_context, news_context, patient_info.get("age_group", "senior")
+            )
+
+            streaming = {}
+            if on_partial_section and getattr(self.gemini_tool, "supports_streaming", False):
+                streaming["on_section"] = lambda name, value: (
+                    on_partial_section(name, value) if name in NOSTALGIA_SECTIONS else None
+                )
+
+            result = await self.gemini_tool.generate_dashboard_content(prompt, COMBINED_CONTENT_SCHEMA, **streaming)
+
+            if not result:
+                logger.warning("⚠️ Combined generation returned no content, agents will use their own calls")
+                return self._empty_result("no_content")
+
+            combined_content = self._split_result(result, photo_context["image_name"])
+            sections = [name for name, value in combined_content.items() if value]
+            logger.info(f"✅ Combined generation produced sections: {', '.join(sections) or 'none'}")
+
+            return {
+                "combined_content": combined_content,
+                "metadata": {
+                    "agent": "4D_combined_content_generator",
+                    "gemini_calls": 1,
+                    "sections": sections,
+                    "pii_compliant": True
+                }
+            }
+
+        except Exception as e:
+            logger.warning(f"⚠️ Combined generation failed: {e}")
+            return self._empty_result("error")
+
+    def _create_combined_prompt(self, photo_context: Dict[str, Any], news_context: Dict[str, Any],
+                                age_group: str) -> str:
+        """One prompt carrying the photo and newsletter inputs (PII-COMPLIANT)"""
+
+        qloo_artists = photo_context.get("qloo_artists") or []
+
+        return f"""
+        Create dementia care content for today's {news_context['theme_name']} dashboard: a photo
+        description with conversation starters, and a nostalgia newsletter.
+
+        ANONYMIZED Patient Background (NO PERSONAL INFORMATION):
+        - Theme: {news_context['theme_name']} (THIS IS THE MAIN FOCUS)
+        - Cultural Heritage: {news_context['heritage']} background
+        - Age group: {age_group}
+        - Era: 1940s-1950s
+        - Cultural artists they might know: {', '.join(qloo_artists[:3]) if qloo_artists else 'None available'}
+        - Today's music: {news_context['music_artist']} - {news_context['music_piece']}
+        - Today's recipe: {news_context['recipe_name']}
+
+        Photo Description: {photo_context['visual_description']}
+        Original photo conversation starters: {', '.join(photo_context['original_starters'])}
+
+        Sections:
+        - photo_description: the photo described in simple, warm words for caregivers to read aloud
+        - photo_conversation_starters: 3 starters about the photo
+        - memory_spotlight, era_highlights, heritage_traditions: newsletter sections about the theme
+        - conversation_starters: 3 newsletter questions about the theme
+        """
+
+    def _split_result(self, result: Dict[str, Any], image_name: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Split the flat response into the Agent 4C and Agent 5 sections"""
+
+        photo = None
+        description = result.get("photo_description")
+        starters = result.get("photo_conversation_starters")
+        if isinstance(description, str) and description and isinstance(starters, list):
+            photo = {
+                "image_name": image_name,
+                "description": description,
+                "conversation_starters": [str(starter) for starter in starters]
+            }
+
+        nostalgia_news = None
+        if all(result.get(section) for section in NOSTALGIA_SECTIONS):
+            nostalgia_news = {section: result[section] for section in NOSTALGIA_SECTIONS}
+
+        return {"photo": photo, "nostalgia_news": nostalgia_news}
+
+    def _empty_result(self, reason: str) -> Dict[str, Any]:
+        """No combined content: Agents 4C and 5 make their own Gemini calls"""
+
+        return {
+            "combined_content": None,
+            "metadata": {
+                "agent": "4D_combined_content_generator",
+                "gemini_calls": 0 if reason == "unavailable" else 1,
+                "fallback_reason": reason,
+                "pii_compliant": True
+            }
+        }
+
+
+# Export the main class
+__all__ = ["CombinedContentGenerator", "COMBINED_CONTENT_SCHEMA"]
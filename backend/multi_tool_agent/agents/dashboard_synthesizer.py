@@ -13,11 +13,11 @@ Agent 8: Dashboard Synthesizer
 """
 
 import logging
-import json
-import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from ..state_store import StateStore, default_state_store, STATE_RECENT_MUSIC
+
 logger = logging.getLogger(__name__)
 
 class DashboardSynthesizer:
@@ -25,11 +25,9 @@ class DashboardSynthesizer:
     Agent 6: PII-COMPLIANT Dashboard Synthesizer - Perfect Data Flow from Agent 5 (NO NAMES)
     """
     
-    def __init__(self):
-        self.recent_music_file = os.path.join(
-            os.path.dirname(__file__), 
-            "..", "..", "config", "recent_music.json"
-        )
+    def __init__(self, state_store: Optional[StateStore] = None):
+        # Recent music selection (read by Agent 4A)
+        self.state_store = state_store or default_state_store
         logger.info("🎨 Agent 6: PII-Compliant Dashboard Synthesizer initialized")
     
     async def run(self, enhanced_profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -86,43 +84,18 @@ class DashboardSynthesizer:
                 logger.warning("   No nostalgia news data received")
             
             # Save recent music (no PII)
-            self._save_recent_music(music_content)
+            await self.state_store.run_io(self._save_recent_music, music_content)
             
             # FIXED: Use nostalgia news exactly as received from Agent 5
             final_nostalgia_news = nostalgia_news_raw if nostalgia_news_raw else self._create_emergency_nostalgia()
             
             # FIXED: Create final dashboard with anonymized patient info - NO NAME FIELD
             final_dashboard = {
-                "patient_info": {
-                    # FIXED: NO name field at all - completely removed
-                    "cultural_heritage": cultural_heritage,
-                    "age_group": age_group,  # FIXED: Only age_group, no specific age
-                    "daily_theme": theme,
-                    # Metadata for PII compliance
-                    "anonymized": True,
-                    "pii_compliant": True
-                },
+                "patient_info": self.build_patient_info(cultural_heritage, age_group, theme),
                 "content": {
-                    "music": {
-                        "artist": music_content.get("artist", ""),
-                        "piece_title": music_content.get("piece_title", ""),
-                        "youtube_url": music_content.get("youtube_url"),
-                        "youtube_embed": music_content.get("youtube_embed"),
-                        "conversation_starters": music_content.get("conversation_starters", []),
-                        "fun_fact": music_content.get("fun_fact", "")
-                    },
-                    "recipe": {
-                        "name": recipe_content.get("name", ""),
-                        "ingredients": recipe_content.get("ingredients", []),
-                        "instructions": recipe_content.get("instructions", []),
-                        "conversation_starters": recipe_content.get("conversation_starters", [])
-                    },
-                    "photo": {
-                        "filename": photo_content.get("filename", ""),
-                        "description": photo_content.get("description", ""),
-                        "cultural_context": photo_content.get("cultural_context", ""),
-                        "conversation_starters": photo_content.get("conversation_starters", [])
-                    },
+                    "music": self.build_music_section(music_content),
+                    "recipe": self.build_recipe_section(recipe_content),
+                    "photo": self.build_photo_section(photo_content),
                     # CRITICAL: Direct passthrough from Agent 5 (no modification)
                     "nostalgia_news": final_nostalgia_news
                 },
@@ -180,6 +153,53 @@ class DashboardSynthesizer:
             logger.error(traceback.format_exc())
             return self._emergency_fallback(enhanced_profile)
     
+    # ===== SECTION BUILDERS (shared with the streaming endpoint) =====
+    
+    @staticmethod
+    def build_patient_info(cultural_heritage: str, age_group: str, theme: str) -> Dict[str, Any]:
+        """Anonymized patient_info block - NO name field"""
+        return {
+            # FIXED: NO name field at all - completely removed
+            "cultural_heritage": cultural_heritage,
+            "age_group": age_group,  # FIXED: Only age_group, no specific age
+            "daily_theme": theme,
+            # Metadata for PII compliance
+            "anonymized": True,
+            "pii_compliant": True
+        }
+    
+    @staticmethod
+    def build_music_section(music_content: Dict[str, Any]) -> Dict[str, Any]:
+        """content.music block from Agent 4A's music_content"""
+        return {
+            "artist": music_content.get("artist", ""),
+            "piece_title": music_content.get("piece_title", ""),
+            "youtube_url": music_content.get("youtube_url"),
+            "youtube_embed": music_content.get("youtube_embed"),
+            "conversation_starters": music_content.get("conversation_starters", []),
+            "fun_fact": music_content.get("fun_fact", "")
+        }
+    
+    @staticmethod
+    def build_recipe_section(recipe_content: Dict[str, Any]) -> Dict[str, Any]:
+        """content.recipe block from Agent 4B's recipe_content"""
+        return {
+            "name": recipe_content.get("name", ""),
+            "ingredients": recipe_content.get("ingredients", []),
+            "instructions": recipe_content.get("instructions", []),
+            "conversation_starters": recipe_content.get("conversation_starters", [])
+        }
+    
+    @staticmethod
+    def build_photo_section(photo_content: Dict[str, Any]) -> Dict[str, Any]:
+        """content.photo block from the mapped photo content"""
+        return {
+            "filename": photo_content.get("filename", ""),
+            "description": photo_content.get("description", ""),
+            "cultural_context": photo_content.get("cultural_context", ""),
+            "conversation_starters": photo_content.get("conversation_starters", [])
+        }
+    
     def _detect_pii_in_profile(self, patient_info: Dict[str, Any]) -> List[str]:
         """
         Detect PII fields in patient info
@@ -296,8 +316,6 @@ class DashboardSynthesizer:
             if not music_content or not music_content.get("artist"):
                 return
             
-            os.makedirs(os.path.dirname(self.recent_music_file), exist_ok=True)
-            
             recent_music_data = {
                 "artist": music_content.get("artist", ""),
                 "piece_title": music_content.get("piece_title", ""),
@@ -305,9 +323,8 @@ class DashboardSynthesizer:
                 "pii_compliant": True
             }
             
-            with open(self.recent_music_file, 'w', encoding='utf-8') as f:
-                json.dump(recent_music_data, f, indent=2)
-                
+            self.state_store.put(STATE_RECENT_MUSIC, recent_music_data)
+            
             logger.info(f"💾 Saved recent music (PII-compliant): {recent_music_data['artist']} - {recent_music_data['piece_title']}")
             
         except Exception as e:
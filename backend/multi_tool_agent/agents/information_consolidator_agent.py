@@ -5,17 +5,17 @@ File: backend/multi_tool_agent/agents/information_consolidator_agent.py
 FEATURES:
 - PII validation and safety checks
 - Theme manager integration 
-- Theme file writing capability
+- Current theme recorded in the shared state store
 - Safe fallbacks for all API methods
 """
 
 import logging
-import json
-import os
-from datetime import datetime
+from datetime import datetime, date
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from ..state_store import StateStore, default_state_store, STATE_CURRENT_THEME
+
 logger = logging.getLogger(__name__)
 
 class InformationConsolidatorAgent:
@@ -25,19 +25,16 @@ class InformationConsolidatorAgent:
     FEATURES:
     - Validates and anonymizes patient data (removes PII)
     - Integrates with theme manager
-    - Writes theme state to file for other agents
+    - Records the current theme in the state store for other agents
     - Safe fallbacks for all operations
     """
     
-    def __init__(self, theme_manager=None):
+    def __init__(self, theme_manager=None, state_store: Optional[StateStore] = None):
         self.theme_manager = theme_manager
         self.logger = logger
         
-        # Path to current theme state file
-        self.theme_file_path = os.path.join(
-            os.path.dirname(__file__), 
-            "..", "..", "config", "current_theme.json"
-        )
+        # Current theme state shared with other agents and workers
+        self.state_store = state_store or default_state_store
         
         logger.info("✅ Information Consolidator initialized with PII safety and theme integration")
     
@@ -45,9 +42,16 @@ class InformationConsolidatorAgent:
                   patient_profile: Dict[str, Any],
                   request_type: str = "dashboard",
                   session_id: Optional[str] = None,
-                  feedback_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                  feedback_data: Optional[Dict[str, Any]] = None,
+                  theme_id: Optional[str] = None,
+                  dashboard_date: Optional[date] = None) -> Dict[str, Any]:
         """
         Main processing method with PII safety and theme integration
+        
+        Args:
+            theme_id: Use this theme instead of advancing the rotation (already selected
+                      by the request path, or pinned for pre-generation)
+            dashboard_date: Day the dashboard is for (defaults to today)
         """
         
         logger.info("📋 Starting information consolidation with PII safety")
@@ -59,9 +63,10 @@ class InformationConsolidatorAgent:
             # Handle feedback processing
             feedback_summary = self._process_feedback(feedback_data)
             
-            # Get theme data and write to file
-            theme_data = self._select_theme_with_photo(session_id)
-            self._write_theme_state_file(theme_data, session_id)
+            # Get theme data and record it (a dashboard for another day is not the live selection)
+            theme_data = await self._select_theme_with_photo(session_id, theme_id)
+            if dashboard_date is None:
+                await self.state_store.run_io(self._write_theme_state_file, theme_data, session_id)
             
             # Create consolidated profile
             consolidated_profile = {
@@ -72,6 +77,7 @@ class InformationConsolidatorAgent:
                     "session_id": session_id or "default",
                     "request_type": request_type,
                     "timestamp": datetime.now().isoformat(),
+                    "dashboard_date": (dashboard_date or date.today()).isoformat(),
                     "step": "information_consolidation"
                 },
                 "pipeline_state": {
@@ -88,7 +94,7 @@ class InformationConsolidatorAgent:
             
         except Exception as e:
             logger.error(f"❌ Consolidation failed: {e}")
-            return self._create_fallback_profile(patient_profile, request_type, session_id)
+            return await self.state_store.run_io(self._create_fallback_profile, patient_profile, request_type, session_id)
     
     def process_patient_data(self, patient_profile: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -267,13 +273,17 @@ class InformationConsolidatorAgent:
                 types.append(content_type)
         return types
     
-    def _select_theme_with_photo(self, session_id: Optional[str] = None) -> Dict[str, Any]:
-        """Select theme and extract photo_filename for other agents"""
+    async def _select_theme_with_photo(self, session_id: Optional[str] = None,
+                                 theme_id: Optional[str] = None) -> Dict[str, Any]:
+        """Select theme (or use the pinned theme_id) and extract photo_filename for other agents"""
         
         try:
             if self.theme_manager:
                 # Get complete theme data from theme manager
-                theme_data = self.theme_manager.get_daily_theme(session_id)
+                if theme_id:
+                    theme_data = self.theme_manager.get_theme_selection(theme_id, session_id)
+                else:
+                    theme_data = await self.theme_manager.aget_daily_theme(session_id)
                 selected_theme = theme_data.get("theme_of_the_day", {})
                 photo_filename = theme_data.get("photo_filename", "")
                 
@@ -314,13 +324,9 @@ class InformationConsolidatorAgent:
         }
     
     def _write_theme_state_file(self, theme_data: Dict[str, Any], session_id: Optional[str]) -> None:
-        """Write current theme state to JSON file for other agents to read"""
+        """Record current theme state in the state store for other agents to read"""
         
         try:
-            # Ensure config directory exists
-            config_dir = os.path.dirname(self.theme_file_path)
-            os.makedirs(config_dir, exist_ok=True)
-            
             # Create theme state structure
             theme_state = {
                 "theme_id": theme_data.get("id", "memory_lane"),
@@ -335,18 +341,16 @@ class InformationConsolidatorAgent:
                 "source": theme_data.get("source", "unknown")
             }
             
-            # Write to file with safe fallback
-            with open(self.theme_file_path, 'w', encoding='utf-8') as f:
-                json.dump(theme_state, f, indent=2, ensure_ascii=False)
+            # Store with safe fallback
+            self.state_store.put(STATE_CURRENT_THEME, theme_state)
             
-            logger.info(f"📝 Theme state written to file:")
+            logger.info(f"📝 Theme state recorded:")
             logger.info(f"   Theme: {theme_state['theme_name']} (ID: {theme_state['theme_id']})")
             logger.info(f"   Photo: {theme_state['photo_filename']}")
-            logger.info(f"   File: {self.theme_file_path}")
             
         except Exception as e:
-            logger.error(f"❌ Failed to write theme state file: {e}")
-            # Don't let theme file writing failure break the pipeline
+            logger.error(f"❌ Failed to record theme state: {e}")
+            # Don't let theme state failures break the pipeline
             pass
     
     def _create_fallback_profile(self, patient_profile: Dict[str, Any], 
@@ -356,7 +360,7 @@ class InformationConsolidatorAgent:
         
         logger.warning("🔄 Creating fallback consolidated profile")
         
-        # Still try to write theme file even in fallback mode
+        # Still try to record the theme even in fallback mode
         fallback_theme = self._get_fallback_theme()
         self._write_theme_state_file(fallback_theme, session_id)
         
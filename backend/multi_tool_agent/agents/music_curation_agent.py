@@ -3,7 +3,7 @@ Agent 4: Music Curation Agent
 File: backend/multi_tool_agent/agents/music_curation_agent.py
 
 Features:
-- Reads recent_music.json to avoid repeating selections
+- Reads the recent music selection from the state store to avoid repeating it
 - Excludes recent artist/piece from next selection
 - Maintains all existing fallback mechanisms
 - Ensures artist and piece always match (atomic selection)
@@ -11,11 +11,11 @@ Features:
 
 import logging
 import random
-import json
-import os
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from ..state_store import StateStore, default_state_store, STATE_RECENT_MUSIC
+
 logger = logging.getLogger(__name__)
 
 class MusicCurationAgent:
@@ -23,21 +23,18 @@ class MusicCurationAgent:
     Agent 4A: Music Curation Agent with Recent Selection Avoidance
     
     NEW FEATURES:
-    - Reads recent_music.json to avoid duplicates
+    - Reads the recent selection (state store) to avoid duplicates
     - Excludes recent artist/piece from selection pool
     - Maintains atomic artist/piece selection
     - Enhanced fallback mechanisms
     """
     
-    def __init__(self, youtube_tool=None, gemini_tool=None):
+    def __init__(self, youtube_tool=None, gemini_tool=None, state_store: Optional[StateStore] = None):
         self.youtube_tool = youtube_tool
         self.gemini_tool = gemini_tool
         
-        # Path to recent music tracking file
-        self.recent_music_file = os.path.join(
-            os.path.dirname(__file__), 
-            "..", "..", "config", "recent_music.json"
-        )
+        # Recent music selection (written by Agent 6)
+        self.state_store = state_store or default_state_store
         
         # Classical composers database with heritage mapping
         self.classical_database = [
@@ -148,17 +145,15 @@ class MusicCurationAgent:
         """Load recent music selection to avoid repetition"""
         
         try:
-            if os.path.exists(self.recent_music_file):
-                with open(self.recent_music_file, 'r', encoding='utf-8') as f:
-                    recent_data = json.load(f)
-                    
+            recent_data = self.state_store.get(STATE_RECENT_MUSIC)
+            if recent_data:
                 recent_artist = recent_data.get('artist', '')
                 recent_piece = recent_data.get('piece_title', '')
                 
                 logger.info(f"📖 Previous selection: {recent_artist} - {recent_piece}")
                 return recent_data
             else:
-                logger.info("📖 No recent music file found - first time selection")
+                logger.info("📖 No recent music selection found - first time selection")
                 return {}
                 
         except Exception as e:
@@ -173,7 +168,7 @@ class MusicCurationAgent:
             logger.info("🎵 Agent 4A: Starting music curation with repetition avoidance")
             
             # Load recent selection to avoid repetition
-            recent_music = self._load_recent_music()
+            recent_music = await self.state_store.run_io(self._load_recent_music)
             recent_artist = recent_music.get("artist", "").lower()
             recent_piece = recent_music.get("piece_title", "").lower()
             
@@ -7,17 +7,21 @@ Features:
 - PII-compliant 
 - Returns sections format that Agent 8 and frontend expect
 - Newsletter-style content appropriate for caregivers to read aloud
+- Accepts the combined dashboard generation's sections (per-agent calls are the fallback)
+- Reports newsletter sections as they stream in when the Gemini tool supports streaming
 """
 
 import logging
 import json
 import random
 from datetime import datetime, date
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+NEWSLETTER_SECTIONS = ["memory_spotlight", "era_highlights", "heritage_traditions", "conversation_starters"]
+
 class NostalgiaNewsGenerator:
     """
     Agent 5: RESTORED WORKING Nostalgia News Generator - Original Structure + PII Fixes
@@ -106,13 +110,15 @@ class NostalgiaNewsGenerator:
         try:
             patient_info = agent1_output.get("patient_info", {})
             theme_info = agent1_output.get("theme_info", {})
+            dashboard_date = self._get_dashboard_date(agent1_output)
             
             return {
                 "first_name": "Friend",  # PII-COMPLIANT: Always use "Friend"
                 "heritage": patient_info.get("cultural_heritage", "American").lower(),
                 "theme_id": theme_info.get("id", "travel"),
                 "theme_name": theme_info.get("name", "Travel"),
-                "current_date": datetime.now().strftime("%B %d"),
+                "current_date": dashboard_date.strftime("%B %d"),
+                "full_date": dashboard_date.strftime("%B %d, %Y"),
                 "birth_year": patient_info.get("birth_year", 1945)
             }
         except Exception as e:
@@ -126,6 +132,15 @@ class NostalgiaNewsGenerator:
                 "birth_year": 1945
             }
     
+    def _get_dashboard_date(self, agent1_output: Dict[str, Any]) -> date:
+        """Day the dashboard is for (pre-generated dashboards are dated ahead)"""
+        
+        dashboard_date = agent1_output.get("session_metadata", {}).get("dashboard_date")
+        try:
+            return date.fromisoformat(dashboard_date) if dashboard_date else date.today()
+        except (TypeError, ValueError):
+            return date.today()
+    
     def _extract_content_data(self, agent4a_output: Dict[str, Any], 
                              agent4b_output: Dict[str, Any],
                              agent4c_output: Dict[str, Any]) -> Dict[str, Any]:
@@ -148,7 +163,18 @@ class NostalgiaNewsGenerator:
                 "recipe_name": "Comfort Food"
             }
     
-    async def _generate_with_gemini(self, profile_data: Dict[str, Any], content_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def get_combined_generation_context(self, agent1_output: Dict[str, Any],
+                                        agent4a_output: Dict[str, Any],
+                                        agent4b_output: Dict[str, Any]) -> Dict[str, Any]:
+        """Newsletter inputs for the combined dashboard generation (same as the per-agent prompts)"""
+        
+        return {
+            **self._extract_profile_data(agent1_output),
+            **self._extract_content_data(agent4a_output, agent4b_output, {})
+        }
+    
+    async def _generate_with_gemini(self, profile_data: Dict[str, Any], content_data: Dict[str, Any],
+                                    on_partial_section: Optional[Callable[[str, Any], None]] = None) -> Optional[Dict[str, Any]]:
         """Generate using Gemini with NEWSLETTER TONE guidance (PII-COMPLIANT)"""
         
         # Check if Gemini tool has the newsletter method
@@ -189,7 +215,14 @@ class NostalgiaNewsGenerator:
                     "conversation_starters": ["string", "string", "string"]
                 }
                 
-                gemini_result = await self.gemini_tool.generate_nostalgia_newsletter(prompt, json_schema)
+                # Streaming tools report each section as soon as it is complete
+                streaming = {}
+                if on_partial_section and getattr(self.gemini_tool, "supports_streaming", False):
+                    streaming["on_section"] = lambda name, value: (
+                        on_partial_section(name, value) if name in NEWSLETTER_SECTIONS else None
+                    )
+                
+                gemini_result = await self.gemini_tool.generate_nostalgia_newsletter(prompt, json_schema, **streaming)
                 
                 if gemini_result and self._validate_gemini_result(gemini_result):
                     logger.info("✅ Gemini newsletter generation successful!")
@@ -259,9 +292,7 @@ class NostalgiaNewsGenerator:
     def _validate_gemini_result(self, result: Dict[str, Any]) -> bool:
         """Validate Gemini generated content has all required sections"""
         
-        required_sections = ["memory_spotlight", "era_highlights", "heritage_traditions", "conversation_starters"]
-        
-        for section in required_sections:
+        for section in NEWSLETTER_SECTIONS:
             if section not in result:
                 logger.warning(f"⚠️ Missing section: {section}")
                 return False
@@ -318,7 +349,7 @@ class NostalgiaNewsGenerator:
         final_response = {
             "title": f"Nostalgia News – {profile_data['current_date']}",
             "subtitle": f"{profile_data['theme_name']} Edition",
-            "date": datetime.now().strftime("%B %d, %Y"),
+            "date": profile_data.get("full_date", datetime.now().strftime("%B %d, %Y")),
             
             # THIS IS THE KEY - Agent 6 and frontend expect FLAT content structure
             "sections": {
@@ -383,9 +414,16 @@ class NostalgiaNewsGenerator:
                   agent3_output: Dict[str, Any],
                   agent4a_output: Dict[str, Any],
                   agent4b_output: Dict[str, Any],
-                  agent4c_output: Dict[str, Any]) -> Dict[str, Any]:
+                  agent4c_output: Dict[str, Any],
+                  combined_content: Optional[Dict[str, Any]] = None,
+                  on_partial_section: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
         """
         Generate nostalgia news with ORIGINAL WORKING FLAT STRUCTURE + PII COMPLIANCE
+        
+        combined_content: Result of the combined dashboard generation; valid
+        newsletter sections there are used instead of a separate Gemini call
+        on_partial_section: Called as (section, value) while the newsletter streams in
+        (provisional; the returned nostalgia_news is authoritative)
         """
         
         logger.info("📰 Agent 5: Generating ORIGINAL FLAT STRUCTURE + PII-COMPLIANT Nostalgia News")
@@ -401,10 +439,15 @@ class NostalgiaNewsGenerator:
             generated_content = None
             source = "fallback"
             
-            if self.gemini_tool:
+            combined_sections = (combined_content or {}).get("nostalgia_news")
+            if combined_sections and self._validate_gemini_result(combined_sections):
+                generated_content = combined_sections
+                source = "gemini_combined"
+                logger.info("✅ Using combined Gemini newsletter sections")
+            elif self.gemini_tool:
                 logger.info("🧠 Attempting Gemini newsletter generation...")
                 
-                generated_content = await self._generate_with_gemini(profile_data, content_data)
+                generated_content = await self._generate_with_gemini(profile_data, content_data, on_partial_section)
                 
                 if generated_content:
                     source = "gemini_newsletter"
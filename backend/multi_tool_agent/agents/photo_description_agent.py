@@ -5,6 +5,7 @@ File: backend/multi_tool_agent/agents/photo_description_agent.py
 Features:
 - PII compliant
 - Uses Google Vision AI description + LLM to modify for audience
+- Accepts the combined dashboard generation's photo sections (per-agent calls are the fallback)
 """
 
 import asyncio
@@ -125,20 +126,15 @@ class PhotoDescriptionAgent:
             logger.info(f"🎯 Selecting photo - Theme: {theme_name}, Heritage: {cultural_heritage}, Age Group: {age_group}")
             
             # Step 1: Find photo that matches today's theme
-            selected_photo = self._find_photo_by_theme(theme_id)
-            
-            if not selected_photo:
-                logger.warning(f"⚠️ No photo found for theme '{theme_id}', using fallback")
-                # Use first available photo as fallback
-                fallback_photos = self._get_fallback_photos()
-                selected_photo = fallback_photos[0]
+            selected_photo = self.select_photo(theme_id)
             
             photo_name = selected_photo.get("image_name", "unknown.png")
             logger.info(f"✅ Selected photo: {photo_name}")
             
             # Step 2: Enhance with cultural context AND generate dementia-friendly description
             enhanced_photo_data = await self._enhance_with_cultural_context(
-                selected_photo, patient_info, theme_info, qloo_intelligence
+                selected_photo, patient_info, theme_info, qloo_intelligence,
+                combined_photo=(enhanced_profile.get("combined_content") or {}).get("photo")
             )
             
             # Step 3: Format final output - FIXED TO RETURN FLAT STRUCTURE
@@ -148,6 +144,31 @@ class PhotoDescriptionAgent:
             logger.error(f"❌ Photo description failed: {e}")
             return await self._get_emergency_fallback(enhanced_profile)
     
+    def select_photo(self, theme_id: str) -> Dict[str, Any]:
+        """Photo for the theme, or the first fallback photo if none matches"""
+        
+        selected_photo = self._find_photo_by_theme(theme_id)
+        
+        if not selected_photo:
+            logger.warning(f"⚠️ No photo found for theme '{theme_id}', using fallback")
+            # Use first available photo as fallback
+            selected_photo = self._get_fallback_photos()[0]
+        
+        return selected_photo
+    
+    def get_combined_generation_context(self, enhanced_profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Photo inputs for the combined dashboard generation (same as the per-agent prompts)"""
+        
+        theme_info = enhanced_profile.get("theme_info", {})
+        photo = self.select_photo(theme_info.get("id", "family"))
+        
+        return {
+            "image_name": photo.get("image_name", "unknown.png"),
+            "visual_description": photo.get("google_vision_description", "A meaningful photograph"),
+            "original_starters": photo.get("conversation_starters", []),
+            "qloo_artists": self._extract_qloo_artists(enhanced_profile.get("qloo_intelligence", {}))
+        }
+    
     def _find_photo_by_theme(self, theme_id: str) -> Optional[Dict[str, Any]]:
         """Find photo that matches the given theme"""
         
@@ -168,8 +189,14 @@ class PhotoDescriptionAgent:
         return None
     
     async def _enhance_with_cultural_context(self, photo_data: Dict[str, Any], patient_info: Dict[str, Any], 
-                                           theme_info: Dict[str, Any], qloo_intelligence: Dict[str, Any]) -> Dict[str, Any]:
-        """Use Gemini AI to enhance photo conversation with cultural context AND generate PII-compliant dementia-friendly description"""
+                                           theme_info: Dict[str, Any], qloo_intelligence: Dict[str, Any],
+                                           combined_photo: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Use Gemini AI to enhance photo conversation with cultural context AND generate PII-compliant dementia-friendly description
+        
+        A valid combined_photo (from the combined dashboard generation) is used
+        directly; otherwise the two per-agent Gemini calls run as before.
+        """
         
         # FIXED: Extract only anonymized data (no PII)
         cultural_heritage = patient_info.get("cultural_heritage", "American")
@@ -182,6 +209,9 @@ class PhotoDescriptionAgent:
         # Process results
         enhanced_data = photo_data.copy()
         
+        if self._apply_combined_photo(enhanced_data, combined_photo, cultural_heritage):
+            return enhanced_data
+        
         if not self.gemini_tool:
             logger.info("🤖 No Gemini tool available, using JSON fallback descriptions")
             # Use JSON fallback description
@@ -249,6 +279,33 @@ class PhotoDescriptionAgent:
             enhanced_data["cultural_enhancement"] = False
             return enhanced_data
     
+    def _apply_combined_photo(self, enhanced_data: Dict[str, Any], combined_photo: Optional[Dict[str, Any]],
+                              cultural_heritage: str) -> bool:
+        """Use the combined generation's description and starters if they are for this photo and usable"""
+        
+        if not combined_photo:
+            return False
+        
+        if combined_photo.get("image_name") != enhanced_data.get("image_name"):
+            logger.warning("⚠️ Combined photo content is for a different photo, using per-agent generation")
+            return False
+        
+        description = combined_photo.get("description")
+        starters = self._parse_gemini_conversation_starters("\n".join(combined_photo.get("conversation_starters") or []))
+        
+        if not description or not starters:
+            logger.warning("⚠️ Combined photo content incomplete, using per-agent generation")
+            return False
+        
+        enhanced_data["dementia_friendly_description"] = description
+        enhanced_data["description_enhanced"] = True
+        enhanced_data["description_source"] = "gemini_combined_pii_compliant"
+        enhanced_data["enhanced_conversation_starters"] = starters
+        enhanced_data["cultural_enhancement"] = True
+        enhanced_data["enhancement_heritage"] = cultural_heritage
+        logger.info(f"✅ Using combined Gemini photo description and starters for {cultural_heritage} heritage")
+        return True
+    
     def _get_fallback_description(self, photo_data: Dict[str, Any]) -> str:
         """Get dementia-friendly description from JSON data, with emergency fallback"""
         
@@ -86,6 +86,7 @@ class QlooCulturalAnalysisAgent:
                     "age_group": age_group,
                     "successful_calls": successful_calls,
                     "total_results": total_results,
+                    "timed_out_calls": cultural_results.get("timed_out_calls", []),
                     "daily_seed": daily_seed,
                     "timestamp": datetime.now().isoformat(),
                     "pii_compliant": True
@@ -0,0 +1,570 @@
+"""
+Caching Primitives - Canonical Keys and Byte-Bounded LRU
+File: backend/multi_tool_agent/caching.py
+
+Features:
+- Canonical SHA-256 keys from JSON-serializable parameters (order-independent)
+- In-process LRU bounded by total serialized size in bytes
+- Per-entry expiry (absolute timestamps) and hit/miss/eviction counters
+- Helper for "expires at local midnight" TTLs used by daily content
+- Persistent SQLite key/value store (JSON values, absolute expiry, optional
+  max-entries LRU eviction) for results that should survive restarts; writes
+  and LRU touches are committed in batches by a writer thread
+- Stale-while-revalidate wrapper: fresh hits, stale hits refreshed in the
+  background, misses fetched once
+- Two-tier cache: byte-bounded LRU in front of an optional SQLite store
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable, Set
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_json(payload: Any) -> str:
+    """Serialize a payload with sorted keys and no whitespace so equal inputs match"""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def canonical_hash(payload: Any) -> str:
+    """SHA-256 hex digest of the canonical JSON form of a payload"""
+    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+def seconds_until_local_midnight(now: Optional[datetime] = None) -> float:
+    """Seconds from now until the next local midnight"""
+    now = now or datetime.now()
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max((midnight - now).total_seconds(), 0.0)
+
+
+def end_of_day_timestamp(day: date) -> float:
+    """Unix timestamp of local midnight at the end of the given day"""
+    return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+
+
+class ByteBoundedLRU:
+    """
+    LRU cache of JSON-serializable values bounded by total size in bytes.
+
+    Values are stored serialized, so every get() returns a fresh copy and the
+    size accounting is exact. Entries carry an absolute expiry timestamp.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "cache"):
+        self.max_bytes = max_bytes
+        self.name = name
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on miss/expiry"""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        data, expires_at = entry
+        if expires_at <= time.time():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(data)
+
+    def put(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        """Store a value; returns False if it is larger than the whole cache"""
+
+        if ttl_seconds <= 0:
+            return False
+
+        data = json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+        if len(data) > self.max_bytes:
+            logger.warning(f"⚠️ {self.name}: entry of {len(data)} bytes exceeds cache size, not cached")
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (data, time.time() + ttl_seconds)
+        self.current_bytes += len(data)
+
+        while self.current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+        return True
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single entry if present"""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        data, _ = self._entries.pop(key)
+        self.current_bytes -= len(data)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for status endpoints"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+class SQLiteKVStore:
+    """
+    Persistent key/value store of JSON-serializable values in one SQLite file.
+
+    Each entry carries an absolute expiry timestamp; expired entries read as
+    misses and are removed by purge_expired(). With max_entries set, writes
+    evict the least recently used entries beyond the limit.
+
+    Writes never touch the disk on the caller's thread: put() and delete()
+    queue the change and a writer thread commits everything queued so far in
+    one transaction. Queued values are served from memory until committed, so
+    readers always see their own writes. Reads record their access time in
+    memory and the writer applies those LRU touches with the next batch.
+    Event-loop callers read through aget(), which runs the query in a worker
+    thread; get() is for code that already runs off the loop.
+    """
+
+    def __init__(self, path: str, table: str = "entries", name: str = "sqlite_store",
+                 max_entries: Optional[int] = None):
+        self.path = path
+        self.table = table
+        self.name = name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.commits = 0
+        self._lock = threading.Lock()  # Guards the connection
+        self._queue_lock = threading.Condition()  # Guards the queued writes below
+        self._pending: Dict[str, Optional[Tuple[str, float, float]]] = {}  # key -> (value, created_at, expires_at), None = delete
+        self._touched: Dict[str, float] = {}
+        self._queued_seq = 0  # Bumped by every queued write
+        self._committed_seq = 0  # Last queued write known to be on disk
+        self._closing = False
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Stores created before LRU eviction existed lack accessed_at
+            columns = [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+            if "accessed_at" not in columns:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table} (accessed_at)")
+            self._conn.commit()
+            self.entries = self._count_unexpired()  # Refreshed after every commit, served by get_stats()
+
+        self._writer = threading.Thread(target=self._write_loop, name=f"{name}-writer", daemon=True)
+        self._writer.start()
+
+        logger.info(f"🗃️ {name}: SQLite store at {path}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None on miss/expiry (blocking; see aget)"""
+
+        found, row = self._pending_row(key)
+        if not found:
+            with self._lock:
+                row = self._conn.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        return self._read_result(key, row)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() for the event loop: queued values come from memory, disk reads run in a worker thread"""
+
+        found, row = self._pending_row(key)
+        if not found:
+            return await asyncio.to_thread(self.get, key)
+        return self._read_result(key, row)
+
+    def _pending_row(self, key: str) -> Tuple[bool, Optional[Tuple[str, float]]]:
+        """(True, row) when key has a queued write, (False, None) when the disk has the latest value"""
+        with self._queue_lock:
+            if key not in self._pending:
+                return False, None
+            entry = self._pending[key]
+        return True, (entry[0], entry[2]) if entry is not None else None
+
+    def _read_result(self, key: str, row: Optional[Tuple[str, float]]) -> Optional[Any]:
+        if row is None or row[1] <= time.time():
+            self.misses += 1
+            return None
+
+        if self.max_entries:
+            with self._queue_lock:
+                self._touched[key] = time.time()
+
+        self.hits += 1
+        return json.loads(row[0])
+
+    def contains(self, key: str) -> bool:
+        """True if an unexpired entry exists (does not count as a hit or miss)"""
+
+        found, row = self._pending_row(key)
+        if not found:
+            with self._lock:
+                row = self._conn.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        return row is not None and row[1] > time.time()
+
+    def put(self, key: str, value: Any, expires_at: float) -> bool:
+        """Queue a value to be stored until the absolute expires_at timestamp"""
+
+        if expires_at <= time.time():
+            return False
+
+        data = json.dumps(value, ensure_ascii=False, default=str)
+        self._enqueue(key, (data, time.time(), expires_at))
+        self.writes += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        """Queue the removal of a single entry"""
+        self._enqueue(key, None)
+
+    def _enqueue(self, key: str, entry: Optional[Tuple[str, float, float]]) -> None:
+        with self._queue_lock:
+            if self._closing:
+                raise RuntimeError(f"{self.name} is closed")
+            self._pending[key] = entry
+            self._touched.pop(key, None)
+            self._queued_seq += 1
+            self._queue_lock.notify_all()
+
+    def _write_loop(self) -> None:
+        """Writer thread: commit queued writes and touches, one transaction per batch"""
+
+        while True:
+            with self._queue_lock:
+                while self._queued_seq == self._committed_seq and not self._closing:
+                    self._queue_lock.wait()
+                if self._queued_seq == self._committed_seq and not self._touched:
+                    return
+                batch = dict(self._pending)
+                touched, self._touched = self._touched, {}
+                target = self._queued_seq
+
+            try:
+                self._commit_batch(batch, touched)
+            except sqlite3.Error as e:
+                logger.error(f"❌ {self.name}: failed to write {len(batch)} queued entries: {e}")
+
+            with self._queue_lock:
+                # A newer value queued during the commit stays pending for the next batch
+                for key, entry in batch.items():
+                    if key in self._pending and self._pending[key] is entry:
+                        del self._pending[key]
+                self._committed_seq = target
+                self._queue_lock.notify_all()
+
+    def _commit_batch(self, batch: Dict[str, Optional[Tuple[str, float, float]]], touched: Dict[str, float]) -> None:
+        with self._lock:
+            try:
+                deleted = [(key,) for key, entry in batch.items() if entry is None]
+                if deleted:
+                    self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", deleted)
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, created_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(key, entry[0], entry[1], entry[2], entry[1]) for key, entry in batch.items() if entry is not None]
+                )
+                if touched:
+                    self._conn.executemany(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                                           [(accessed_at, key) for key, accessed_at in touched.items()])
+                if self.max_entries:
+                    self._evict_over_limit()
+                self._conn.commit()
+                self.commits += 1
+                self.entries = self._count_unexpired()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+
+    def _evict_over_limit(self) -> None:
+        """Drop expired entries, then least recently used ones beyond max_entries (lock held)"""
+        self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)", (excess,)
+            )
+            self.evictions += excess
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every write queued so far is committed; False on timeout"""
+        with self._queue_lock:
+            target = self._queued_seq
+            return self._queue_lock.wait_for(lambda: self._committed_seq >= target, timeout)
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns how many were removed (blocking)"""
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            self.entries = self._count_unexpired()
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of unexpired committed entries (blocking; get_stats() serves the count from the last commit)"""
+        with self._lock:
+            self.entries = self._count_unexpired()
+        return self.entries
+
+    def _count_unexpired(self) -> int:
+        """Unexpired committed entries (lock held)"""
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE expires_at > ?", (time.time(),)
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        """Commit queued writes, stop the writer and close the connection"""
+        with self._queue_lock:
+            self._closing = True
+            self._queue_lock.notify_all()
+        self._writer.join()
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for status endpoints (no disk access, so it is safe on the event loop)"""
+        lookups = self.hits + self.misses
+        with self._queue_lock:
+            pending = len(self._pending)
+        return {
+            "path": self.path,
+            "entries": self.entries,
+            "pending_writes": pending,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "commits": self.commits,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions
+        }
+
+
+class TwoTierCache:
+    """
+    In-process LRU in front of an optional persistent SQLite store.
+
+    Reads try memory first, then disk; disk hits are promoted to memory with
+    their remaining TTL. Writes go to both tiers (the disk tier commits them
+    in the background). Event-loop callers read through aget().
+    """
+
+    def __init__(self, max_bytes: int, db_path: Optional[str] = None, table: str = "entries",
+                 name: str = "two_tier_cache"):
+        self.name = name
+        self.memory = ByteBoundedLRU(max_bytes, name=name)
+        self.disk = SQLiteKVStore(db_path, table=table, name=name) if db_path else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value (a fresh copy) or None (blocking on a memory miss; see aget)"""
+
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        return self._disk_result(key, self.disk.get(key) if self.disk is not None else None)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() for the event loop: disk reads run in a worker thread"""
+
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        return self._disk_result(key, await self.disk.aget(key) if self.disk is not None else None)
+
+    def _disk_result(self, key: str, entry: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """Count a memory miss and promote a disk hit to memory"""
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self.memory.put(key, entry["value"], entry["expires_at"] - time.time())
+        return entry["value"]
+
+    def put(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        """Store a value in both tiers"""
+
+        stored = self.memory.put(key, value, ttl_seconds)
+        if self.disk is not None and ttl_seconds > 0:
+            expires_at = time.time() + ttl_seconds
+            stored = self.disk.put(key, {"value": value, "expires_at": expires_at}, expires_at) or stored
+        return stored
+
+    def flush(self) -> None:
+        """Wait until queued disk writes are committed"""
+        if self.disk is not None:
+            self.disk.flush()
+
+    def close(self) -> None:
+        """Close the persistent tier"""
+        if self.disk is not None:
+            self.disk.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tier counters for status endpoints"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "memory": self.memory.get_stats(),
+            "disk": self.disk.get_stats() if self.disk is not None else None
+        }
+
+
+class StaleWhileRevalidateCache:
+    """
+    Fetch-through cache with a fresh TTL and a stale-serving window.
+
+    - Fresh entry (younger than ttl_seconds): returned as a hit
+    - Stale entry (within stale_seconds after that): returned immediately and
+      refreshed once in the background
+    - Missing/expired entry: fetched, stored if should_store(result) allows it
+
+    Entries live in a SQLiteKVStore so they survive restarts.
+    """
+
+    def __init__(self, store: SQLiteKVStore, ttl_seconds: float, stale_seconds: float = 0.0,
+                 name: str = "swr_cache"):
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.name = name
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self._refreshing: Set[str] = set()
+        self._background: Set[asyncio.Task] = set()
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]],
+                           should_store: Callable[[Any], bool] = lambda result: result is not None) -> Any:
+        """Cached value for key, fetching (and storing) it when missing"""
+
+        entry = await self.store.aget(key)
+        if entry is not None:
+            if entry["fresh_until"] > time.time():
+                self.hits += 1
+                return entry["value"]
+
+            self.stale_hits += 1
+            self._refresh_in_background(key, fetch, should_store)
+            return entry["value"]
+
+        self.misses += 1
+        result = await fetch()
+        self._store(key, result, should_store)
+        return result
+
+    def _store(self, key: str, result: Any, should_store: Callable[[Any], bool]) -> None:
+        if should_store(result):
+            fresh_until = time.time() + self.ttl_seconds
+            self.store.put(key, {"value": result, "fresh_until": fresh_until}, fresh_until + self.stale_seconds)
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Awaitable[Any]],
+                               should_store: Callable[[Any], bool]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                self._store(key, await fetch(), should_store)
+                self.refreshes += 1
+            except Exception as e:
+                self.refresh_failures += 1
+                logger.warning(f"⚠️ {self.name}: background refresh failed: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for status endpoints"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+            "background_refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "entries": self.store.entries,
+            "max_entries": self.store.max_entries,
+            "evictions": self.store.evictions
+        }
+
+
+# Export the main helpers
+__all__ = ["ByteBoundedLRU", "SQLiteKVStore", "TwoTierCache", "StaleWhileRevalidateCache", "canonical_json", "canonical_hash",
+           "seconds_until_local_midnight", "end_of_day_timestamp"]
@@ -0,0 +1,278 @@
+"""
+Record/Replay Cassettes for External Tool Traffic
+File: backend/multi_tool_agent/cassette.py
+
+Profiling the pipeline against live Qloo, Gemini, YouTube and Vision is not
+repeatable: latency and content change from run to run. A cassette captures a
+day's upstream responses once and serves them back later, optionally with
+the latency they had when recorded.
+
+Features:
+- httpx transport attached to the pooled clients (HTTPClientRegistry(cassette=...))
+- Modes: record (forward + capture), replay (serve only; misses fail like a
+  transport error so tools use their fallbacks), auto (replay hits, record misses)
+- Request fingerprint: method, URL and JSON body; API keys are never part of
+  it and never written (requests only carry heritage and age_group)
+- Compact cassette file: JSON lines, gzip-compressed when the path ends in .gz
+- Replay instantly or with the recorded time-to-first-byte and total latency
+- Repeated requests replay their recordings in order, cycling
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Dict, Any, Optional, List
+from urllib.parse import urlencode
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .caching import canonical_hash
+
+logger = logging.getLogger(__name__)
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+MODE_AUTO = "auto"
+CASSETTE_MODES = [MODE_RECORD, MODE_REPLAY, MODE_AUTO]
+
+# Query parameters and response headers that are never recorded
+REDACTED_PARAMS = {"key", "api_key", "access_token"}
+RECORDED_HEADERS = ["content-type", "retry-after"]
+
+
+class CassetteMiss(httpx.TransportError if httpx else Exception):
+    """Replay mode found no recording for a request"""
+
+
+def request_fingerprint(request: "httpx.Request") -> str:
+    """Stable hash of method, URL (without secrets) and JSON body"""
+
+    params = sorted((name, value) for name, value in request.url.params.multi_items()
+                    if name not in REDACTED_PARAMS)
+    body: Any = None
+    content = request.content
+    if content:
+        try:
+            body = json.loads(content)
+        except ValueError:
+            body = canonical_hash(content.decode("latin-1"))
+
+    return canonical_hash({
+        "method": request.method,
+        "url": f"{request.url.scheme}://{request.url.host}{request.url.path}",
+        "params": params,
+        "body": body
+    })
+
+
+def _redacted_url(request: "httpx.Request") -> str:
+    params = [(name, value) for name, value in request.url.params.multi_items() if name not in REDACTED_PARAMS]
+    return f"{request.url.path}?{urlencode(params)}" if params else request.url.path
+
+
+class _ReplayStream(httpx.AsyncByteStream if httpx else object):
+    """Response body delivered after the remaining recorded latency"""
+
+    def __init__(self, body: bytes, delay_s: float):
+        self.body = body
+        self.delay_s = delay_s
+
+    async def __aiter__(self):
+        if self.delay_s > 0:
+            await asyncio.sleep(self.delay_s)
+        yield self.body
+
+
+class Cassette:
+    """
+    Recorded upstream responses keyed by request fingerprint.
+
+    Usage:
+        cassette = Cassette("data/cassettes/upstreams.jsonl.gz", mode="record")
+        registry = HTTPClientRegistry(cassette=cassette)
+        ...
+        cassette.save()
+    """
+
+    def __init__(self, path: str, mode: str = MODE_REPLAY, replay_latency: bool = True,
+                 latency_scale: float = 1.0):
+        """
+        Args:
+            path: Cassette file (.jsonl or .jsonl.gz)
+            mode: record, replay or auto
+            replay_latency: Sleep for the recorded latency when replaying
+            latency_scale: Multiplier on recorded latency (e.g. 0.5 = twice as fast)
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode} (expected one of {', '.join(CASSETTE_MODES)})")
+
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._unsaved = 0
+        self.stats = {"recorded": 0, "replayed": 0, "misses": 0}
+
+        if mode != MODE_RECORD and os.path.exists(path):
+            self.load()
+
+    def load(self) -> None:
+        """Read recordings from the cassette file"""
+
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.entries.setdefault(entry["fingerprint"], []).append(entry)
+
+        logger.info(f"📼 Loaded cassette {self.path}: {sum(len(v) for v in self.entries.values())} recordings")
+
+    def save(self) -> None:
+        """Write every recording to the cassette file (atomic replace)"""
+
+        if not self._unsaved:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temporary_path = f"{self.path}.tmp"
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(temporary_path, "wt", encoding="utf-8") as f:
+            for recordings in self.entries.values():
+                for entry in recordings:
+                    f.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n")
+        os.replace(temporary_path, self.path)
+
+        logger.info(f"📼 Saved cassette {self.path} ({self._unsaved} new recordings)")
+        self._unsaved = 0
+
+    def transport(self, upstream: str, inner: Optional["httpx.AsyncBaseTransport"] = None) -> "CassetteTransport":
+        """Transport for one upstream's client (inner sends recorded requests for real)"""
+        return CassetteTransport(self, upstream, inner)
+
+    def find(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Next recording for a fingerprint (cycling through repeats), or None"""
+
+        recordings = self.entries.get(fingerprint)
+        if not recordings:
+            return None
+
+        cursor = self._cursors.get(fingerprint, 0)
+        self._cursors[fingerprint] = cursor + 1
+        return recordings[cursor % len(recordings)]
+
+    def record(self, upstream: str, request: "httpx.Request", response: "httpx.Response", body: bytes,
+               first_byte_ms: float, latency_ms: float) -> None:
+        try:
+            text, encoding = body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(body).decode("ascii"), "base64"
+
+        fingerprint = request_fingerprint(request)
+        self.entries.setdefault(fingerprint, []).append({
+            "fingerprint": fingerprint,
+            "upstream": upstream,
+            "method": request.method,
+            "url": _redacted_url(request),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "body": text,
+            "encoding": encoding,
+            "first_byte_ms": round(first_byte_ms, 1),
+            "latency_ms": round(latency_ms, 1),
+            "recorded_at": time.time()
+        })
+        self.stats["recorded"] += 1
+        self._unsaved += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Mode and counters for /api/status"""
+        return {
+            "path": self.path,
+            "mode": self.mode,
+            "replay_latency": self.replay_latency,
+            "recordings": sum(len(recordings) for recordings in self.entries.values()),
+            **self.stats
+        }
+
+
+class CassetteTransport(httpx.AsyncBaseTransport if httpx else object):
+    """httpx transport that records or replays one upstream's traffic"""
+
+    def __init__(self, cassette: Cassette, upstream: str, inner: Optional["httpx.AsyncBaseTransport"] = None):
+        self.cassette = cassette
+        self.upstream = upstream
+        self.inner = inner
+
+    async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+        cassette = self.cassette
+
+        if cassette.mode != MODE_RECORD:
+            entry = cassette.find(request_fingerprint(request))
+            if entry is not None:
+                cassette.stats["replayed"] += 1
+                return await self._replay(entry, request)
+            if cassette.mode == MODE_REPLAY or self.inner is None:
+                cassette.stats["misses"] += 1
+                raise CassetteMiss(f"No {self.upstream} recording for {request.method} {_redacted_url(request)}",
+                                   request=request)
+
+        return await self._record(request)
+
+    async def _replay(self, entry: Dict[str, Any], request: "httpx.Request") -> "httpx.Response":
+        body = entry["body"].encode("utf-8") if entry["encoding"] == "utf-8" else base64.b64decode(entry["body"])
+
+        first_byte_s = rest_s = 0.0
+        if self.cassette.replay_latency:
+            scale = self.cassette.latency_scale / 1000
+            first_byte_s = entry["first_byte_ms"] * scale
+            rest_s = max(0.0, entry["latency_ms"] * scale - first_byte_s)
+        if first_byte_s > 0:
+            await asyncio.sleep(first_byte_s)
+
+        return httpx.Response(entry["status"], headers=entry["headers"], stream=_ReplayStream(body, rest_s),
+                              request=request)
+
+    async def _record(self, request: "httpx.Request") -> "httpx.Response":
+        """Forward the request, buffer the body and store it (streamed bodies are buffered too)"""
+
+        if self.inner is None:
+            raise CassetteMiss(f"No transport to record {self.upstream} traffic", request=request)
+
+        started = time.perf_counter()
+        raw = await self.inner.handle_async_request(request)
+        first_byte_ms = (time.perf_counter() - started) * 1000
+
+        # Read through an httpx.Response so Content-Encoding is decoded before recording
+        response = httpx.Response(raw.status_code, headers=raw.headers, stream=raw.stream, request=request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        self.cassette.record(self.upstream, request, response, body, first_byte_ms, latency_ms)
+        headers = [(name, value) for name, value in response.headers.multi_items()
+                   if name.lower() not in ("content-encoding", "transfer-encoding", "content-length")]
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+
+
+# Export the main helpers
+__all__ = ["Cassette", "CassetteTransport", "CassetteMiss", "request_fingerprint", "CASSETTE_MODES",
+           "MODE_RECORD", "MODE_REPLAY", "MODE_AUTO"]
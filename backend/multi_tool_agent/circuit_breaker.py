@@ -0,0 +1,243 @@
+"""
+Upstream Circuit Breakers
+File: backend/multi_tool_agent/circuit_breaker.py
+
+When Qloo or Gemini is down, every dashboard would otherwise wait out the
+full 60-90 second HTTP timeout before using its fallback. A breaker per
+upstream notices the failure rate and short-circuits calls while the
+upstream is unhealthy, so the tools go straight to their fallback content.
+
+States:
+- closed: calls pass; outcomes are recorded in a rolling window
+- open: calls fail fast with CircuitOpenError for open_seconds
+- half_open: a few probe calls pass; success closes the breaker, failure reopens it
+
+Failures are 429/5xx responses, transport errors and timeouts. Other
+responses (including 4xx) count as successes. A cancelled call records no
+outcome, except in guarded_request() when the request deadline cancelled
+an HTTP request that was in flight: the upstream hung. Time lost to rate
+limiter pacing, retry backoff or waiting on another caller is never the
+upstream's fault.
+"""
+
+import asyncio
+import collections
+import logging
+import time
+from typing import Dict, Any, Callable, Awaitable, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .rate_limiting import limited_request, remaining_deadline, RateLimitExceeded, RETRYABLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Timers may fire this early; a cancellation this close to the deadline is the deadline's
+DEADLINE_TOLERANCE_S = 0.005
+
+# All breakers by upstream name, for status reporting
+_breakers: Dict[str, "CircuitBreaker"] = {}
+
+
+class CircuitOpenError(Exception):
+    """Call short-circuited because the upstream's breaker is open"""
+
+    def __init__(self, upstream: str, retry_in_s: float):
+        super().__init__(f"{upstream} circuit open, next probe in {retry_in_s:.1f}s")
+        self.upstream = upstream
+        self.retry_in_s = retry_in_s
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one upstream.
+
+    Usage:
+        breaker = CircuitBreaker("qloo", failure_rate_threshold=0.5)
+        response = await breaker.call(lambda: client.get(url))
+    """
+
+    def __init__(self, name: str, failure_rate_threshold: float = 0.5, minimum_calls: int = 5,
+                 window_size: int = 20, open_seconds: float = 30.0, half_open_max_calls: int = 1):
+        """
+        Args:
+            name: Upstream name for logs and metrics
+            failure_rate_threshold: Failure share of the window that opens the breaker
+            minimum_calls: Calls needed in the window before the rate is trusted
+            window_size: Most recent outcomes considered while closed
+            open_seconds: Time to fail fast before probing again
+            half_open_max_calls: Concurrent probe calls allowed while half open
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = max(1, minimum_calls)
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.outcomes = collections.deque(maxlen=max(self.minimum_calls, window_size))
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.stats = {
+            "calls": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "times_opened": 0,
+            "last_opened": None
+        }
+        _breakers[name] = self
+
+    @property
+    def state(self) -> str:
+        """Current state (an open breaker turns half open once open_seconds have passed)"""
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = STATE_HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info(f"🟡 {self.name} circuit half open, probing")
+        return self._state
+
+    def failure_rate(self) -> float:
+        return sum(1 for ok in self.outcomes if not ok) / len(self.outcomes) if self.outcomes else 0.0
+
+    def allow_request(self) -> bool:
+        """Whether a call may go out now (reserves a probe slot while half open)"""
+
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.stats["calls"] += 1
+        if self._state == STATE_HALF_OPEN:
+            logger.info(f"🟢 {self.name} circuit closed after a successful probe")
+            self._state = STATE_CLOSED
+            self.outcomes.clear()
+            self._probes_in_flight = 0
+        self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        self.stats["calls"] += 1
+        self.stats["failures"] += 1
+        if self._state == STATE_HALF_OPEN:
+            self._open("probe failed")
+            return
+        self.outcomes.append(False)
+        if len(self.outcomes) >= self.minimum_calls and self.failure_rate() >= self.failure_rate_threshold:
+            self._open(f"failure rate {self.failure_rate():.0%} over {len(self.outcomes)} calls")
+
+    def release(self) -> None:
+        """Give back a probe slot without recording an outcome"""
+        if self._state == STATE_HALF_OPEN and self._probes_in_flight:
+            self._probes_in_flight -= 1
+
+    def _open(self, reason: str) -> None:
+        logger.warning(f"🔴 {self.name} circuit opened ({reason}), failing fast for {self.open_seconds:.0f}s")
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self.outcomes.clear()
+        self.stats["times_opened"] += 1
+        self.stats["last_opened"] = time.time()
+
+    def _retry_in(self) -> float:
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    async def call(self, send: Callable[[], Awaitable["httpx.Response"]]) -> "httpx.Response":
+        """
+        Send a request through the breaker.
+
+        Raises:
+            CircuitOpenError: The breaker is open (or half open with probes in flight)
+        """
+
+        if not self.allow_request():
+            self.stats["short_circuited"] += 1
+            raise CircuitOpenError(self.name, self._retry_in())
+
+        try:
+            response = await send()
+        except RateLimitExceeded:
+            self.release()
+            raise
+        except asyncio.CancelledError:
+            # Client disconnects and failed siblings cancel calls too; that says nothing about the upstream
+            self.release()
+            raise
+        except (httpx.TransportError, asyncio.TimeoutError):
+            self.record_failure()
+            raise
+        except Exception:
+            self.release()
+            raise
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            self.record_failure()
+        else:
+            self.record_success()
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """State and counters for /api/status"""
+        state = self.state
+        return {
+            "state": state,
+            "failure_rate": round(self.failure_rate(), 3),
+            "window_calls": len(self.outcomes),
+            "failure_rate_threshold": self.failure_rate_threshold,
+            "retry_in_s": round(self._retry_in(), 1) if state == STATE_OPEN else None,
+            **self.stats
+        }
+
+
+async def guarded_request(breaker: Optional[CircuitBreaker], limiter: Optional[Any],
+                          send: Callable[[], Awaitable["httpx.Response"]]) -> "httpx.Response":
+    """
+    Send through the circuit breaker, then the rate limiter (either may be None).
+
+    The breaker sees one outcome per call, after the limiter's retries. A call
+    cancelled by its deadline while an HTTP request was in flight counts as
+    a failure (a hung upstream); other cancellations record nothing.
+    """
+    if breaker is None:
+        return await limited_request(limiter, send)
+
+    in_flight = False
+
+    async def tracked_send() -> "httpx.Response":
+        nonlocal in_flight
+        in_flight = True
+        try:
+            response = await send()
+        except Exception:
+            in_flight = False
+            raise
+        in_flight = False
+        return response
+
+    try:
+        return await breaker.call(lambda: limited_request(limiter, tracked_send))
+    except asyncio.CancelledError:
+        remaining = remaining_deadline()
+        if in_flight and remaining is not None and remaining <= DEADLINE_TOLERANCE_S:
+            breaker.record_failure()
+        raise
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every breaker created in this process"""
+    return {name: breaker.get_stats() for name, breaker in _breakers.items()}
+
+
+# Export the main helpers
+__all__ = ["CircuitBreaker", "CircuitOpenError", "guarded_request", "get_circuit_breaker_stats",
+           "STATE_CLOSED", "STATE_OPEN", "STATE_HALF_OPEN"]
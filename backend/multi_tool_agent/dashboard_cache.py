@@ -0,0 +1,120 @@
+"""
+Dashboard Result Cache - Full Pipeline Output Keyed by Anonymized Inputs
+File: backend/multi_tool_agent/dashboard_cache.py
+
+The dashboard only depends on low-cardinality anonymized fields:
+cultural_heritage, age_group, interests, the rotated theme id and the date.
+Caching the final dashboard under a canonical hash of those fields lets two
+caregivers refreshing the same dashboard share one pipeline execution.
+
+Features:
+- Canonical key from anonymized profile fields + theme id + local date
+- Entries expire at local midnight (daily content)
+- LRU eviction bounded by serialized size in bytes
+- Hit/miss counters for /api/status
+"""
+
+import logging
+from datetime import date
+from typing import Dict, Any, Optional, List
+
+from .caching import ByteBoundedLRU, canonical_hash, seconds_until_local_midnight
+
+logger = logging.getLogger(__name__)
+
+
+def dashboard_cache_inputs(patient_profile: Dict[str, Any], theme_id: str,
+                           day: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Anonymized inputs the dashboard depends on, normalized for hashing.
+
+    Args:
+        patient_profile: Anonymized patient profile (no PII)
+        theme_id: Id of the theme the pipeline will select
+        day: Local date of the dashboard (defaults to today)
+    """
+
+    interests = patient_profile.get("interests", [])
+    if not isinstance(interests, list):
+        interests = []
+
+    return {
+        "cultural_heritage": str(patient_profile.get("cultural_heritage", "American") or "American").strip(),
+        "age_group": str(patient_profile.get("age_group", "senior") or "senior").strip(),
+        "interests": [interest.strip() for interest in interests if isinstance(interest, str)],
+        "theme_id": theme_id,
+        "date": (day or date.today()).isoformat()
+    }
+
+
+def dashboard_cache_key(patient_profile: Dict[str, Any], theme_id: str,
+                        day: Optional[date] = None) -> str:
+    """Canonical hash of the anonymized dashboard inputs"""
+    return canonical_hash(dashboard_cache_inputs(patient_profile, theme_id, day))
+
+
+def is_complete_dashboard(dashboard: Optional[Dict[str, Any]]) -> bool:
+    """True for a successful dashboard without fallback-substituted sections"""
+    if not dashboard or dashboard.get("success") is False:
+        return False
+    return not dashboard.get("metadata", {}).get("degraded_sections")
+
+
+class DashboardCache:
+    """
+    In-process cache of complete dashboards.
+
+    Only fully generated dashboards are stored: results with degraded sections
+    (fallbacks after timeouts or errors) are never cached, so a slow upstream
+    does not pin a degraded dashboard for the rest of the day.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, enabled: bool = True):
+        self.enabled = enabled
+        self.lru = ByteBoundedLRU(max_bytes, name="dashboard_cache")
+        self.skipped_degraded = 0
+        logger.info(f"🗄️ Dashboard cache initialized (enabled={enabled}, max_bytes={max_bytes})")
+
+    def make_key(self, patient_profile: Dict[str, Any], theme_id: str,
+                 day: Optional[date] = None) -> str:
+        """Cache key for a profile/theme/day combination"""
+        return dashboard_cache_key(patient_profile, theme_id, day)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached dashboard (a fresh copy) or None"""
+        if not self.enabled:
+            return None
+
+        dashboard = self.lru.get(key)
+        if dashboard is not None:
+            logger.info(f"⚡ Dashboard cache hit ({key[:12]})")
+        return dashboard
+
+    def put(self, key: str, dashboard: Dict[str, Any]) -> bool:
+        """Cache a successful, non-degraded dashboard until local midnight"""
+        if not self.enabled or not dashboard or dashboard.get("success") is False:
+            return False
+
+        if not is_complete_dashboard(dashboard):
+            self.skipped_degraded += 1
+            degraded_sections: List[str] = dashboard.get("metadata", {}).get("degraded_sections", [])
+            logger.info(f"⏭️ Not caching degraded dashboard ({', '.join(degraded_sections)})")
+            return False
+
+        return self.lru.put(key, dashboard, seconds_until_local_midnight())
+
+    def clear(self) -> None:
+        """Drop all cached dashboards"""
+        self.lru.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size for /api/status"""
+        return {
+            "enabled": self.enabled,
+            **self.lru.get_stats(),
+            "skipped_degraded": self.skipped_degraded
+        }
+
+
+# Export the main class
+__all__ = ["DashboardCache", "dashboard_cache_key", "dashboard_cache_inputs", "is_complete_dashboard"]
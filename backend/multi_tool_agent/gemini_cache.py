@@ -0,0 +1,138 @@
+"""
+Gemini Response Cache - Content-Addressed Cache of Generated Text
+File: backend/multi_tool_agent/gemini_cache.py
+
+The Gemini prompts are built only from anonymized, low-cardinality inputs
+(theme name, heritage, music artist, recipe name), so identical prompts repeat
+often. Each hit saves a 1-5 second generateContent call and its API cost.
+
+Features:
+- Key = hash of the full prompt (whitespace-normalized), model name and generationConfig
+- Byte-bounded in-process LRU plus an optional SQLite store
+- Per-method TTLs (plain text, structured JSON, newsletter, combined dashboard)
+- Only successfully parsed results are cached
+- Callers can ask for fresh text (skips the read, refreshes the entry)
+- Per-method hit counters for /api/status
+"""
+
+import logging
+from typing import Dict, Any, Optional
+
+from .caching import TwoTierCache, canonical_hash
+
+logger = logging.getLogger(__name__)
+
+METHOD_GENERATE_CONTENT = "generate_content"
+METHOD_STRUCTURED_JSON = "generate_structured_json"
+METHOD_NEWSLETTER = "generate_nostalgia_newsletter"
+METHOD_DASHBOARD_CONTENT = "generate_dashboard_content"
+
+
+def _normalize_prompt(text: str) -> str:
+    return " ".join(str(text).split())
+
+
+def gemini_cache_key(model: str, payload: Dict[str, Any]) -> str:
+    """Content address of a generateContent request: prompt text, model and generationConfig"""
+    prompts = [
+        _normalize_prompt(part.get("text", ""))
+        for content in payload.get("contents", [])
+        for part in content.get("parts", [])
+    ]
+    return canonical_hash({
+        "model": model,
+        "prompts": prompts,
+        "generationConfig": payload.get("generationConfig", {})
+    })
+
+
+class GeminiResponseCache:
+    """
+    Memory + optional SQLite cache for Gemini results, with a TTL per tool method.
+
+    Usage:
+        cache = GeminiResponseCache(ttls={"generate_content": 7 * 86400})
+        result = cache.get("generate_content", key)
+        if result is None:
+            result = await generate(...)
+            cache.put("generate_content", key, result)
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl_seconds: float = 24 * 3600,
+                 max_bytes: int = 8 * 1024 * 1024, db_path: Optional[str] = None, enabled: bool = True):
+        """
+        Args:
+            ttls: TTL in seconds per method name (0 = never cache that method)
+            default_ttl_seconds: TTL for methods not listed in ttls
+            max_bytes: Size bound of the in-process tier
+            db_path: SQLite file for the persistent tier (None/empty = memory only)
+            enabled: False turns the cache into a no-op
+        """
+        self.enabled = enabled
+        self.ttls = dict(ttls or {})
+        self.default_ttl_seconds = default_ttl_seconds
+        self.tiers = TwoTierCache(max_bytes, db_path=db_path if enabled else None,
+                                  table="gemini_responses", name="gemini_response_cache")
+        self.method_stats: Dict[str, Dict[str, int]] = {}
+        logger.info(f"🧠 Gemini response cache initialized (enabled={enabled}, "
+                    f"persistent={self.tiers.disk is not None})")
+
+    def ttl_for(self, method: str) -> float:
+        """TTL in seconds for a tool method"""
+        return self.ttls.get(method, self.default_ttl_seconds)
+
+    def get(self, method: str, key: str) -> Optional[Any]:
+        """Cached result for a method/key, or None"""
+        if not self.enabled or self.ttl_for(method) <= 0:
+            return None
+
+        result = self.tiers.get(key)
+        self._count(method, "hits" if result is not None else "misses")
+        return result
+
+    async def aget(self, method: str, key: str) -> Optional[Any]:
+        """get() for the event loop (disk reads run in a worker thread)"""
+        if not self.enabled or self.ttl_for(method) <= 0:
+            return None
+
+        result = await self.tiers.aget(key)
+        self._count(method, "hits" if result is not None else "misses")
+        return result
+
+    def put(self, method: str, key: str, result: Any) -> bool:
+        """Store a successful result with the method's TTL"""
+        if not self.enabled or result is None or self.ttl_for(method) <= 0:
+            return False
+        return self.tiers.put(key, result, self.ttl_for(method))
+
+    def record_fresh(self, method: str) -> None:
+        """Count a request that bypassed the cache read"""
+        self._count(method, "fresh_requests")
+
+    def _count(self, method: str, counter: str) -> None:
+        stats = self.method_stats.setdefault(method, {"hits": 0, "misses": 0, "fresh_requests": 0})
+        stats[counter] += 1
+
+    def close(self) -> None:
+        """Close the persistent tier"""
+        self.tiers.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-method and per-tier counters for /api/status"""
+        if not self.enabled:
+            return {"enabled": False}
+
+        return {
+            "enabled": True,
+            "ttls": {method: self.ttl_for(method)
+                     for method in [METHOD_GENERATE_CONTENT, METHOD_STRUCTURED_JSON,
+                                    METHOD_NEWSLETTER, METHOD_DASHBOARD_CONTENT]},
+            "methods": self.method_stats,
+            **self.tiers.get_stats()
+        }
+
+
+# Export the main helpers
+__all__ = ["GeminiResponseCache", "gemini_cache_key",
+           "METHOD_GENERATE_CONTENT", "METHOD_STRUCTURED_JSON", "METHOD_NEWSLETTER",
+           "METHOD_DASHBOARD_CONTENT"]
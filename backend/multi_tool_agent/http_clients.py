@@ -0,0 +1,148 @@
+"""
+Shared HTTP Clients - App-Scoped Connection Pools for External Tools
+File: backend/multi_tool_agent/http_clients.py
+
+Opening a new httpx.AsyncClient per call pays a fresh TCP + TLS handshake to
+Qloo, Gemini, YouTube and Vision on every request. The registry keeps one pooled
+client per upstream for the lifetime of the app.
+
+Features:
+- One httpx.AsyncClient per upstream name, created lazily and reused
+- Keep-alive pools with configurable limits and expiry
+- Optional HTTP/2 (needs the h2 package; falls back to HTTP/1.1 without it)
+- Created in the FastAPI startup hook, closed on shutdown
+- pooled_client() helper so tools work with or without an injected client
+- Optional record/replay cassette attached to every pooled client
+"""
+
+import contextlib
+import logging
+from typing import Dict, Any, Optional, AsyncIterator
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (only needed for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientRegistry:
+    """
+    App-scoped registry of pooled async HTTP clients.
+
+    Usage:
+        registry = HTTPClientRegistry(max_connections=100, http2=True)
+        qloo_client = registry.get("qloo")
+        ...
+        await registry.aclose()
+    """
+
+    def __init__(self,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30.0,
+                 http2: bool = False,
+                 timeout: float = 30.0,
+                 cassette: Optional[Any] = None):
+        """
+        Args:
+            max_connections: Upper bound on open connections per upstream
+            max_keepalive_connections: Idle connections kept open per upstream
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Negotiate HTTP/2 where the server supports it
+            timeout: Default timeout (tools pass their own per request)
+            cassette: Optional Cassette recording or replaying every client's traffic
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("⚠️ HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+            http2 = False
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        self.cassette = cassette
+        self._clients: Dict[str, "httpx.AsyncClient"] = {}
+        self._requests: Dict[str, int] = {}
+        logger.info(f"🔌 HTTP client registry initialized (max_connections={max_connections}, "
+                    f"keepalive={max_keepalive_connections}, http2={http2})")
+
+    def get(self, name: str) -> Optional["httpx.AsyncClient"]:
+        """Pooled client for an upstream (created on first use)"""
+        if httpx is None:
+            return None
+
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            )
+            transport = None
+            if self.cassette is not None:
+                transport = self.cassette.transport(name, httpx.AsyncHTTPTransport(http2=self.http2, limits=limits))
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=limits,
+                transport=transport,
+                event_hooks={"request": [self._count_request(name)]}
+            )
+            self._clients[name] = client
+            self._requests.setdefault(name, 0)
+        return client
+
+    def _count_request(self, name: str):
+        async def hook(request: "httpx.Request") -> None:
+            self._requests[name] += 1
+        return hook
+
+    async def aclose(self) -> None:
+        """Close every pooled client (app shutdown)"""
+        for name, client in self._clients.items():
+            if not client.is_closed:
+                await client.aclose()
+        if self.cassette is not None:
+            self.cassette.save()
+        logger.info(f"🔌 Closed {len(self._clients)} pooled HTTP clients")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool settings and per-upstream request counts for /api/status"""
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "clients": {
+                name: {"requests": self._requests.get(name, 0), "closed": client.is_closed}
+                for name, client in self._clients.items()
+            }
+        }
+
+
+@contextlib.asynccontextmanager
+async def pooled_client(client: Optional["httpx.AsyncClient"] = None) -> AsyncIterator["httpx.AsyncClient"]:
+    """
+    Yield the injected pooled client, or a temporary client closed afterwards.
+
+    Tools pass their timeout on each request, so both cases behave the same.
+    """
+    if client is not None and not client.is_closed:
+        yield client
+        return
+
+    async with httpx.AsyncClient() as temporary_client:
+        yield temporary_client
+
+
+# Export the main helpers
+__all__ = ["HTTPClientRegistry", "pooled_client", "HTTP2_AVAILABLE"]
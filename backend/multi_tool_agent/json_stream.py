@@ -0,0 +1,102 @@
+"""
+Incremental JSON Sections - Top-Level Members of a Streamed JSON Object
+File: backend/multi_tool_agent/json_stream.py
+
+Structured Gemini responses are flat JSON objects ({"memory_spotlight": "...",
+"era_highlights": "...", ...}). When the response is streamed, each top-level
+member can be used as soon as its value is complete, long before the closing
+brace arrives.
+
+Features:
+- Feed arbitrary text chunks (splits inside strings/escapes are fine)
+- Skips text before the first "{" (e.g. a ```json fence)
+- Returns (name, value) for every member completed by the chunk
+- Strings, numbers, lists and nested objects as member values
+"""
+
+import json
+import logging
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONSections:
+    """
+    Scanner that reports top-level members of a JSON object as they complete.
+
+    Usage:
+        sections = IncrementalJSONSections()
+        async for chunk in stream:
+            for name, value in sections.feed(chunk):
+                render(name, value)
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.completed: List[str] = []
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: Optional[int] = None
+        self._closed = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add a chunk; returns the members it completed, in order"""
+
+        self.buffer += chunk
+        members = []
+
+        while self._position < len(self.buffer) and not self._closed:
+            char = self.buffer[self._position]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._depth == 0:
+                # Text before the object (markdown fence, preamble)
+                if char == "{":
+                    self._depth = 1
+                    self._member_start = self._position + 1
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 1:
+                    members.extend(self._complete_member(self._position))
+                    self._closed = True
+                self._depth = max(0, self._depth - 1)
+            elif char == "," and self._depth == 1:
+                members.extend(self._complete_member(self._position))
+                self._member_start = self._position + 1
+
+            self._position += 1
+
+        return members
+
+    def _complete_member(self, end: int) -> List[Tuple[str, Any]]:
+        if self._member_start is None:
+            return []
+
+        text = self.buffer[self._member_start:end].strip()
+        if not text:
+            return []
+
+        try:
+            member = json.loads("{" + text + "}")
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping unparseable streamed member: {e}")
+            return []
+
+        self.completed.extend(member.keys())
+        return list(member.items())
+
+
+# Export the main class
+__all__ = ["IncrementalJSONSections"]
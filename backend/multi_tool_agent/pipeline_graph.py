@@ -0,0 +1,311 @@
+"""
+Pipeline Graph - Dependency-Driven Agent Scheduler
+File: backend/multi_tool_agent/pipeline_graph.py
+
+Features:
+- Each agent is a node that declares which upstream outputs it consumes
+- A node starts as soon as all of its declared inputs are ready
+- Independent nodes (e.g. photo analysis and Qloo) overlap automatically
+- Records per-node start/finish times relative to pipeline start
+- Optional latency budget split into per-node deadlines; overdue nodes are
+  cancelled and replaced by their fallback
+- Node deadlines also cap upstream rate-limit waits and retries (deadline_scope)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Any, Optional, List, Callable, Awaitable
+
+from .rate_limiting import deadline_scope
+
+logger = logging.getLogger(__name__)
+
+# Node status values reported in timings
+NODE_COMPLETED = "completed"
+NODE_FALLBACK = "fallback"
+NODE_FAILED = "failed"
+
+
+class PipelineNodeError(Exception):
+    """Raised when a node fails and no fallback output is available"""
+
+    def __init__(self, node_name: str, message: str):
+        super().__init__(message)
+        self.node_name = node_name
+
+
+class PipelineNode:
+    """
+    A single agent in the pipeline graph.
+
+    Args:
+        name: Unique node id (e.g. "agent3")
+        agent: Agent instance executed by the node runner
+        depends_on: Names of upstream nodes whose outputs this node consumes
+        label: Human-readable name used in logs and error messages
+        budget_weight: Relative share of the latency budget this node may use
+    """
+
+    def __init__(self, name: str, agent: Any, depends_on: Optional[List[str]] = None,
+                 label: Optional[str] = None, budget_weight: float = 1.0):
+        self.name = name
+        self.agent = agent
+        self.depends_on = list(depends_on or [])
+        self.label = label or name
+        self.budget_weight = budget_weight
+
+
+class PipelineRun:
+    """Outputs and timings of one graph execution"""
+
+    def __init__(self):
+        self.outputs: Dict[str, Any] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self.total_ms: float = 0.0
+        self.budget_ms: Optional[float] = None
+
+    def nodes_with_status(self, status: str) -> List[str]:
+        """Names of nodes that finished with the given status"""
+        return [name for name, timing in self.timings.items() if timing.get("status") == status]
+
+    def timed_out_nodes(self) -> List[str]:
+        """Names of nodes cancelled because they ran past their deadline"""
+        return [name for name, timing in self.timings.items() if timing.get("timed_out")]
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Serializable summary for dashboard pipeline_metadata"""
+        return {
+            "total_ms": round(self.total_ms, 1),
+            "budget_ms": self.budget_ms,
+            "node_timings": self.timings,
+            "fallback_nodes": self.nodes_with_status(NODE_FALLBACK),
+            "timed_out_nodes": self.timed_out_nodes()
+        }
+
+
+# run_node(node, inputs) -> output; a falsy output or exception counts as failure
+NodeRunner = Callable[[PipelineNode, Dict[str, Any]], Awaitable[Any]]
+# fallback_node(node, inputs) -> output, or None when the node has no fallback
+NodeFallback = Callable[[PipelineNode, Dict[str, Any]], Optional[Any]]
+# on_node_done(node, output, pipeline_run) is called as soon as a node's output is ready
+NodeDoneCallback = Callable[[PipelineNode, Any, "PipelineRun"], None]
+
+
+class PipelineGraph:
+    """
+    Small DAG engine for the agent pipeline.
+
+    Nodes are added with their dependencies; execute() launches one task per
+    node and each task waits only for the nodes it declared, so the pipeline
+    finishes when its critical path does instead of after the sum of all agents.
+
+    One graph serves every concurrent request: execute() returns each run to
+    its caller, and finished runs are only kept in a bounded history for status.
+    """
+
+    def __init__(self, recent_runs: int = 10):
+        self.nodes: Dict[str, PipelineNode] = {}
+        self.recent_runs: Deque[PipelineRun] = deque(maxlen=recent_runs)
+
+    def add_node(self, name: str, agent: Any, depends_on: Optional[List[str]] = None,
+                 label: Optional[str] = None, budget_weight: float = 1.0) -> "PipelineGraph":
+        """Declare a node and the upstream outputs it consumes"""
+
+        if name in self.nodes:
+            raise ValueError(f"Pipeline node '{name}' already declared")
+
+        self.nodes[name] = PipelineNode(name, agent, depends_on, label, budget_weight)
+        return self
+
+    def get_agent(self, name: str) -> Any:
+        """Agent bound to a node, or None if the node is missing"""
+        node = self.nodes.get(name)
+        return node.agent if node else None
+
+    def topological_order(self) -> List[str]:
+        """Node names ordered so every node follows its dependencies"""
+
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                cycle = " → ".join(path + [name])
+                raise ValueError(f"Pipeline graph has a cycle: {cycle}")
+            if name not in self.nodes:
+                raise ValueError(f"Pipeline node '{path[-1]}' depends on unknown node '{name}'")
+
+            state[name] = "visiting"
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name, [])
+
+        return order
+
+    def deadline_plan(self, budget_s: float) -> Dict[str, float]:
+        """
+        Split a latency budget into per-node deadlines.
+
+        The heaviest weighted path is scaled to fill the budget, so each node's
+        share is budget * weight / heaviest_path_weight. Deadlines are then the
+        latest finish times (seconds from pipeline start) that still leave every
+        downstream node its share, which gives off-critical-path nodes their slack.
+        """
+
+        order = self.topological_order()
+
+        path_weight: Dict[str, float] = {}
+        for name in order:
+            node = self.nodes[name]
+            upstream = max((path_weight[dep] for dep in node.depends_on), default=0.0)
+            path_weight[name] = upstream + max(node.budget_weight, 0.0)
+
+        heaviest = max(path_weight.values(), default=0.0)
+        if heaviest <= 0:
+            return {name: budget_s for name in order}
+
+        def share(name: str) -> float:
+            return budget_s * max(self.nodes[name].budget_weight, 0.0) / heaviest
+
+        latest_finish: Dict[str, float] = {}
+        for name in reversed(order):
+            dependents = [other for other in order if name in self.nodes[other].depends_on]
+            latest_finish[name] = min(
+                (latest_finish[other] - share(other) for other in dependents),
+                default=budget_s
+            )
+
+        return latest_finish
+
+    def describe(self) -> Dict[str, List[str]]:
+        """Dependency map for status endpoints"""
+        return {name: node.depends_on for name, node in self.nodes.items()}
+
+    async def execute(self, run_node: NodeRunner,
+                      fallback_node: Optional[NodeFallback] = None,
+                      budget_s: Optional[float] = None,
+                      on_node_done: Optional[NodeDoneCallback] = None) -> PipelineRun:
+        """
+        Execute every node as soon as its inputs are ready.
+
+        Args:
+            run_node: Coroutine that runs a node given its upstream outputs
+            fallback_node: Builds a substitute output when a node fails
+            budget_s: Optional end-to-end latency budget in seconds; each node
+                      is cancelled at its deadline from deadline_plan()
+            on_node_done: Called with each node's output as soon as it is ready
+                          (errors raised by the callback are logged, not propagated)
+
+        Returns:
+            PipelineRun with outputs and per-node timings
+
+        Raises:
+            PipelineNodeError: A node failed and had no fallback
+        """
+
+        order = self.topological_order()
+        pipeline_run = PipelineRun()
+        deadlines = self.deadline_plan(budget_s) if budget_s else {}
+        if budget_s:
+            pipeline_run.budget_ms = round(budget_s * 1000, 1)
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - started) * 1000
+
+        async def run_one(node: PipelineNode) -> Any:
+            if node.depends_on:
+                await asyncio.gather(*(tasks[name] for name in node.depends_on))
+
+            inputs = {name: pipeline_run.outputs[name] for name in node.depends_on}
+            start_ms = elapsed_ms()
+            status = NODE_COMPLETED
+            error = None
+            timed_out = False
+            deadline_ms = deadlines[node.name] * 1000 if node.name in deadlines else None
+
+            logger.info(f"▶️ Node {node.name} ({node.label}) started at {start_ms:.0f}ms")
+
+            try:
+                if deadline_ms is None:
+                    output = await run_node(node, inputs)
+                elif deadline_ms - start_ms <= 0:
+                    raise asyncio.TimeoutError()
+                else:
+                    with deadline_scope((deadline_ms - start_ms) / 1000):
+                        output = await asyncio.wait_for(run_node(node, inputs),
+                                                        timeout=(deadline_ms - start_ms) / 1000)
+            except asyncio.TimeoutError:
+                logger.warning(f"⏰ Node {node.name} ({node.label}) missed its {deadline_ms:.0f}ms deadline")
+                output = None
+                timed_out = True
+                error = f"deadline of {deadline_ms:.0f}ms exceeded"
+            except Exception as e:
+                logger.error(f"❌ Node {node.name} ({node.label}) raised: {e}")
+                output = None
+                error = str(e)
+
+            if not output:
+                output = fallback_node(node, inputs) if fallback_node else None
+                status = NODE_FALLBACK if output else NODE_FAILED
+                if output:
+                    logger.warning(f"⚠️ Node {node.name} ({node.label}) failed, using fallback")
+
+            finish_ms = elapsed_ms()
+            pipeline_run.timings[node.name] = {
+                "start_ms": round(start_ms, 1),
+                "finish_ms": round(finish_ms, 1),
+                "duration_ms": round(finish_ms - start_ms, 1),
+                "status": status,
+                "depends_on": node.depends_on
+            }
+            if deadline_ms is not None:
+                pipeline_run.timings[node.name]["deadline_ms"] = round(deadline_ms, 1)
+            if timed_out:
+                pipeline_run.timings[node.name]["timed_out"] = True
+            if error:
+                pipeline_run.timings[node.name]["error"] = error
+
+            if status == NODE_FAILED:
+                raise PipelineNodeError(node.name, f"{node.label} failed")
+
+            logger.info(f"✅ Node {node.name} ({node.label}) finished at {finish_ms:.0f}ms")
+            pipeline_run.outputs[node.name] = output
+
+            if on_node_done:
+                try:
+                    on_node_done(node, output, pipeline_run)
+                except Exception as e:
+                    logger.error(f"❌ on_node_done callback failed for {node.name}: {e}")
+
+            return output
+
+        for name in order:
+            tasks[name] = asyncio.create_task(run_one(self.nodes[name]))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            pipeline_run.total_ms = elapsed_ms()
+            self.recent_runs.append(pipeline_run)
+
+        return pipeline_run
+
+
+# Export the main classes
+__all__ = ["PipelineGraph", "PipelineNode", "PipelineRun", "PipelineNodeError",
+           "NODE_COMPLETED", "NODE_FALLBACK", "NODE_FAILED"]
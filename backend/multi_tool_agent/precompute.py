@@ -0,0 +1,275 @@
+"""
+Dashboard Pre-Generation - Off-Peak Precompute of Next-Day Dashboards
+File: backend/multi_tool_agent/precompute.py
+
+The theme rotation is deterministic and the known profiles are held by the
+demo patient manager, so tomorrow's dashboard inputs are known today. The
+scheduler generates them overnight and /api/dashboard serves them from a
+persistent store, turning the morning spike into store reads instead of
+Gemini, Qloo and YouTube calls.
+
+Features:
+- SQLite-backed store keyed exactly like the dashboard cache
+  (anonymized profile fields + theme id + date); entries expire at the end of their day
+- Background asyncio task that runs at a configured off-peak hour
+- Every known profile x every upcoming theme (the rotation advances per
+  request, so any theme may be selected tomorrow)
+- Bounded concurrency; upstream calls shared across profiles within one run
+- Only complete, non-degraded dashboards are stored
+- Manual trigger and status for /api/status
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+from .caching import SQLiteKVStore, end_of_day_timestamp
+from .dashboard_cache import dashboard_cache_key
+from .single_flight import shared_call_scope
+
+logger = logging.getLogger(__name__)
+
+
+class PrecomputedDashboardStore:
+    """
+    Persistent store of pre-generated dashboards.
+
+    Keys come from dashboard_cache_key(), so a request for the same
+    anonymized profile, theme and day finds the stored dashboard.
+    """
+
+    def __init__(self, path: str, enabled: bool = True):
+        self.enabled = enabled
+        self.skipped_degraded = 0
+        self.store = SQLiteKVStore(path, table="dashboards", name="precomputed_dashboards") if enabled else None
+        logger.info(f"🌙 Precomputed dashboard store initialized (enabled={enabled})")
+
+    def make_key(self, patient_profile: Dict[str, Any], theme_id: str, day: Optional[date] = None) -> str:
+        """Store key for a profile/theme/day combination"""
+        return dashboard_cache_key(patient_profile, theme_id, day)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored dashboard or None"""
+        if not self.enabled:
+            return None
+
+        dashboard = self.store.get(key)
+        if dashboard is not None:
+            logger.info(f"🌙 Precomputed dashboard hit ({key[:12]})")
+        return dashboard
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """get() for the event loop (the SQLite read runs in a worker thread)"""
+        if not self.enabled:
+            return None
+
+        dashboard = await self.store.aget(key)
+        if dashboard is not None:
+            logger.info(f"🌙 Precomputed dashboard hit ({key[:12]})")
+        return dashboard
+
+    def contains(self, key: str) -> bool:
+        """True if a dashboard is already stored for this key"""
+        return self.enabled and self.store.contains(key)
+
+    def put(self, key: str, dashboard: Dict[str, Any], day: date) -> bool:
+        """Store a successful, non-degraded dashboard until the end of its day"""
+        if not self.enabled or not dashboard or dashboard.get("success") is False:
+            return False
+
+        degraded_sections: List[str] = dashboard.get("metadata", {}).get("degraded_sections", [])
+        if degraded_sections:
+            self.skipped_degraded += 1
+            logger.info(f"⏭️ Not storing degraded precomputed dashboard ({', '.join(degraded_sections)})")
+            return False
+
+        return self.store.put(key, dashboard, end_of_day_timestamp(day))
+
+    def purge_expired(self) -> int:
+        """Drop dashboards for past days"""
+        return self.store.purge_expired() if self.enabled else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for /api/status"""
+        if not self.enabled:
+            return {"enabled": False}
+
+        return {
+            "enabled": True,
+            **self.store.get_stats(),
+            "skipped_degraded": self.skipped_degraded
+        }
+
+
+class PrecomputeScheduler:
+    """
+    Background task that pre-generates dashboards during off-peak hours.
+
+    Usage:
+        scheduler = PrecomputeScheduler(store, generate, profiles_provider, themes_provider)
+        scheduler.start()                  # nightly at run_hour
+        await scheduler.run_once()         # or on demand
+    """
+
+    def __init__(self,
+                 store: PrecomputedDashboardStore,
+                 generate: Callable[[Dict[str, Any], str, date], Awaitable[Dict[str, Any]]],
+                 profiles_provider: Callable[[], List[Dict[str, Any]]],
+                 themes_provider: Callable[[], List[Dict[str, Any]]],
+                 run_hour: int = 22,
+                 days_ahead: int = 1,
+                 concurrency: int = 2):
+        """
+        Args:
+            store: Where finished dashboards are written
+            generate: generate(profile, theme_id, day) runs the pipeline for a pinned theme and date
+            profiles_provider: Returns the known anonymized profiles
+            themes_provider: Returns the upcoming themes (rotation order)
+            run_hour: Local hour the nightly run starts
+            days_ahead: Which day to generate for, relative to the run date
+            concurrency: Pipelines running at the same time
+        """
+        self.store = store
+        self.generate = generate
+        self.profiles_provider = profiles_provider
+        self.themes_provider = themes_provider
+        self.run_hour = run_hour
+        self.days_ahead = days_ahead
+        self.concurrency = max(1, concurrency)
+        self.running = False
+        self.last_run: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the nightly loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"🌙 Precompute scheduler started (next run {self.next_run_at().isoformat()})")
+
+    async def stop(self) -> None:
+        """Cancel the nightly loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def next_run_at(self, now: Optional[datetime] = None) -> datetime:
+        """Next local time the nightly run starts"""
+        now = now or datetime.now()
+        run_at = now.replace(hour=self.run_hour, minute=0, second=0, microsecond=0)
+        return run_at if run_at > now else run_at + timedelta(days=1)
+
+    async def _loop(self) -> None:
+        while True:
+            delay = (self.next_run_at() - datetime.now()).total_seconds()
+            await asyncio.sleep(max(delay, 1.0))
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"❌ Precompute run failed: {e}")
+
+    async def run_once(self, day: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Generate dashboards for every known profile and upcoming theme.
+
+        Args:
+            day: Day to generate for (defaults to today + days_ahead)
+
+        Returns:
+            Run summary (also kept as last_run)
+        """
+
+        if self.running:
+            return {"status": "already_running"}
+
+        self.running = True
+        started = time.perf_counter()
+        day = day or date.today() + timedelta(days=self.days_ahead)
+        summary: Dict[str, Any] = {
+            "status": "completed",
+            "target_date": day.isoformat(),
+            "started_at": datetime.now().isoformat(),
+            "jobs": 0,
+            "generated": 0,
+            "already_stored": 0,
+            "degraded": 0,
+            "failed": 0
+        }
+
+        try:
+            await asyncio.to_thread(self.store.purge_expired)
+
+            # Distinct anonymized inputs only: profiles that share every field share a dashboard
+            jobs: Dict[str, Dict[str, Any]] = {}
+            for theme in self.themes_provider():
+                for profile in self.profiles_provider():
+                    key = self.store.make_key(profile, theme.get("id"), day)
+                    jobs.setdefault(key, {"profile": profile, "theme": theme})
+            summary["jobs"] = len(jobs)
+
+            logger.info(f"🌙 Precomputing {len(jobs)} dashboards for {day.isoformat()} "
+                        f"(concurrency {self.concurrency})")
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def run_job(key: str, job: Dict[str, Any]) -> str:
+                if await asyncio.to_thread(self.store.contains, key):
+                    return "already_stored"
+
+                theme = job["theme"]
+                async with semaphore:
+                    try:
+                        dashboard = await self.generate(job["profile"], theme.get("id"), day)
+                    except Exception as e:
+                        logger.error(f"❌ Precompute failed for theme {theme.get('id')}: {e}")
+                        return "failed"
+
+                if dashboard.get("success") is False:
+                    return "failed"
+
+                # Agent fallbacks may substitute a different theme; never store those
+                if dashboard.get("metadata", {}).get("theme") != theme.get("name"):
+                    return "degraded"
+
+                return "generated" if self.store.put(key, dashboard, day) else "degraded"
+
+            with shared_call_scope():
+                tasks = [asyncio.create_task(run_job(key, job)) for key, job in jobs.items()]
+
+            for outcome in await asyncio.gather(*tasks):
+                summary[outcome] += 1
+
+        except asyncio.CancelledError:
+            summary["status"] = "cancelled"
+            raise
+        finally:
+            summary["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self.last_run = summary
+            self.running = False
+
+        logger.info(f"🌙 Precompute finished: {summary['generated']} generated, "
+                    f"{summary['already_stored']} already stored, {summary['degraded']} degraded, "
+                    f"{summary['failed']} failed in {summary['elapsed_ms']:.0f}ms")
+        return summary
+
+    def get_status(self) -> Dict[str, Any]:
+        """Scheduler and store state for /api/status"""
+        return {
+            "scheduled": self._task is not None and not self._task.done(),
+            "run_hour": self.run_hour,
+            "days_ahead": self.days_ahead,
+            "concurrency": self.concurrency,
+            "next_run_at": self.next_run_at().isoformat(),
+            "running": self.running,
+            "last_run": self.last_run,
+            "store": self.store.get_stats()
+        }
+
+
+# Export the main classes
+__all__ = ["PrecomputedDashboardStore", "PrecomputeScheduler"]
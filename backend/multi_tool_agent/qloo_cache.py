@@ -0,0 +1,116 @@
+"""
+Qloo Insights Cache - Two-Tier Cache of /v2/insights Responses
+File: backend/multi_tool_agent/qloo_cache.py
+
+Qloo insights responses are fully determined by filter.type,
+signal.interests.tags, signal.demographics.age and take. Heritage is mapped
+to tags before the call (nearly every heritage becomes "classical", cuisine
+becomes about ten tags), so "Italian", "Italian-American" and "italy" all
+produce the same parameters and share one entry.
+
+Features:
+- Canonical key from the sorted, normalized parameter set (+ base URL)
+- In-process byte-bounded LRU in front of an optional SQLite store
+- Disk hits are promoted to memory with their remaining TTL
+- Configurable TTL; only non-empty successful responses are cached
+- Hit counters per tier for /api/status
+"""
+
+import logging
+from typing import Dict, Any, Optional
+
+from .caching import TwoTierCache, canonical_hash
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_insights_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize insights parameters so equivalent requests compare equal"""
+
+    canonical = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if name == "take":
+            canonical[name] = int(value)
+        else:
+            canonical[name] = str(value).strip().lower()
+    return canonical
+
+
+def qloo_insights_cache_key(base_url: str, params: Dict[str, Any]) -> str:
+    """Cache key for an insights request"""
+    return canonical_hash({"url": f"{base_url.rstrip('/')}/v2/insights", "params": canonical_insights_params(params)})
+
+
+class QlooInsightsCache:
+    """
+    Memory + optional SQLite cache for Qloo insights responses.
+
+    Usage:
+        cache = QlooInsightsCache(ttl_seconds=86400, db_path="data/qloo_insights_cache.sqlite3")
+        data = cache.get(base_url, params)
+        if data is None:
+            data = await fetch(params)
+            cache.put(base_url, params, data)
+    """
+
+    def __init__(self, ttl_seconds: float = 24 * 3600, max_bytes: int = 4 * 1024 * 1024,
+                 db_path: Optional[str] = None, enabled: bool = True):
+        """
+        Args:
+            ttl_seconds: How long a response is reused
+            max_bytes: Size bound of the in-process tier
+            db_path: SQLite file for the persistent tier (None/empty = memory only)
+            enabled: False turns the cache into a no-op
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.tiers = TwoTierCache(max_bytes, db_path=db_path if enabled else None,
+                                  table="qloo_insights", name="qloo_insights_cache")
+        self.skipped_empty = 0
+        logger.info(f"🗃️ Qloo insights cache initialized (enabled={enabled}, ttl={ttl_seconds}s, "
+                    f"persistent={self.tiers.disk is not None})")
+
+    def get(self, base_url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached response (a fresh copy) or None"""
+        if not self.enabled:
+            return None
+        return self.tiers.get(qloo_insights_cache_key(base_url, params))
+
+    async def aget(self, base_url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """get() for the event loop (disk reads run in a worker thread)"""
+        if not self.enabled:
+            return None
+        return await self.tiers.aget(qloo_insights_cache_key(base_url, params))
+
+    def put(self, base_url: str, params: Dict[str, Any], data: Optional[Dict[str, Any]]) -> bool:
+        """Store a successful response; empty result lists are not cached"""
+        if not self.enabled or not data:
+            return False
+
+        if not data.get("results"):
+            self.skipped_empty += 1
+            return False
+
+        return self.tiers.put(qloo_insights_cache_key(base_url, params), data, self.ttl_seconds)
+
+    def close(self) -> None:
+        """Close the persistent tier"""
+        self.tiers.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tier counters for /api/status"""
+        if not self.enabled:
+            return {"enabled": False}
+
+        return {
+            "enabled": True,
+            "ttl_seconds": self.ttl_seconds,
+            "skipped_empty": self.skipped_empty,
+            **self.tiers.get_stats()
+        }
+
+
+# Export the main helpers
+__all__ = ["QlooInsightsCache", "qloo_insights_cache_key", "canonical_insights_params"]
@@ -0,0 +1,170 @@
+"""
+Qloo Insights Prefetch - Cache Warm-Up at Startup and on a Schedule
+File: backend/multi_tool_agent/qloo_prefetch.py
+
+Qloo insights requests come from a small, known vocabulary: two music tags
+and about ten cuisine tags, per age demographic. Fetching all of them ahead
+of time fills the Qloo insights cache, so the first dashboard after a deploy
+does not pay cold-call latency.
+
+Features:
+- Every distinct (tag, age group, entity type) request, deduplicated
+- Bounded concurrency
+- Runs once at startup, then every interval (before cache entries expire)
+- "warming" state until the first run finishes, for readiness reporting
+- Run summaries for /api/status
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+from .qloo_cache import qloo_insights_cache_key
+
+logger = logging.getLogger(__name__)
+
+STATE_IDLE = "idle"
+STATE_WARMING = "warming"
+STATE_READY = "ready"
+
+
+class QlooPrefetcher:
+    """
+    Background warm-up of the Qloo insights cache.
+
+    Usage:
+        prefetcher = QlooPrefetcher(qloo_tool, age_groups=["55_and_older"])
+        prefetcher.start()                 # now, then every interval_seconds
+        await prefetcher.run_once()        # or on demand
+    """
+
+    def __init__(self, qloo_tool, age_groups: List[str], concurrency: int = 4,
+                 interval_seconds: float = 6 * 3600):
+        """
+        Args:
+            qloo_tool: QlooInsightsAPI with an insights cache
+            age_groups: Qloo age demographics to prefetch
+            concurrency: Insights calls running at the same time
+            interval_seconds: Time between scheduled runs (keep below the cache TTL)
+        """
+        self.qloo_tool = qloo_tool
+        self.age_groups = age_groups
+        self.concurrency = max(1, concurrency)
+        self.interval_seconds = interval_seconds
+        self.state = STATE_IDLE
+        self.running = False
+        self.runs = 0
+        self.last_run: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def warming(self) -> bool:
+        """True until the first prefetch run has finished"""
+        return self.state == STATE_WARMING
+
+    def start(self) -> None:
+        """Start warming now and refresh on the schedule"""
+        if self._task is None or self._task.done():
+            self.state = STATE_WARMING
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"🔥 Qloo prefetch started (every {self.interval_seconds:.0f}s, "
+                        f"age groups: {', '.join(self.age_groups)})")
+
+    async def stop(self) -> None:
+        """Cancel the prefetch loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"❌ Qloo prefetch run failed: {e}")
+            finally:
+                # A failed first run must not leave readiness stuck on warming
+                if self.state == STATE_WARMING:
+                    self.state = STATE_READY
+            await asyncio.sleep(self.interval_seconds)
+
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        Fetch every distinct insights request live and cache it.
+
+        Returns:
+            Run summary (also kept as last_run)
+        """
+
+        if self.running:
+            return {"status": "already_running"}
+
+        self.running = True
+        started = time.perf_counter()
+        summary: Dict[str, Any] = {
+            "status": "completed",
+            "started_at": datetime.now().isoformat(),
+            "requests": 0,
+            "cached": 0,
+            "failed": 0
+        }
+
+        try:
+            # Distinct requests only (age groups may share parameter sets)
+            requests: Dict[str, Dict[str, Any]] = {}
+            for params in self.qloo_tool.get_prefetch_requests(self.age_groups):
+                requests.setdefault(qloo_insights_cache_key(self.qloo_tool.base_url, params), params)
+            summary["requests"] = len(requests)
+
+            logger.info(f"🔥 Prefetching {len(requests)} Qloo insights requests (concurrency {self.concurrency})")
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def prefetch(params: Dict[str, Any]) -> str:
+                async with semaphore:
+                    try:
+                        return "cached" if await self.qloo_tool.prefetch_insights(params) else "failed"
+                    except Exception as e:
+                        logger.warning(f"⚠️ Qloo prefetch failed for {params.get('signal.interests.tags')}: {e}")
+                        return "failed"
+
+            for outcome in await asyncio.gather(*(prefetch(params) for params in requests.values())):
+                summary[outcome] += 1
+
+        except asyncio.CancelledError:
+            summary["status"] = "cancelled"
+            raise
+        finally:
+            summary["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self.last_run = summary
+            self.running = False
+            self.runs += 1
+
+        self.state = STATE_READY
+        logger.info(f"🔥 Qloo prefetch finished: {summary['cached']}/{summary['requests']} cached, "
+                    f"{summary['failed']} failed in {summary['elapsed_ms']:.0f}ms")
+        return summary
+
+    def get_status(self) -> Dict[str, Any]:
+        """Prefetch state for /api/status"""
+        return {
+            "enabled": True,
+            "state": self.state,
+            "scheduled": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval_seconds,
+            "age_groups": self.age_groups,
+            "concurrency": self.concurrency,
+            "running": self.running,
+            "runs": self.runs,
+            "last_run": self.last_run
+        }
+
+
+# Export the main class
+__all__ = ["QlooPrefetcher", "STATE_IDLE", "STATE_WARMING", "STATE_READY"]
@@ -0,0 +1,308 @@
+"""
+Upstream Rate Limiting and Retry
+File: backend/multi_tool_agent/rate_limiting.py
+
+Qloo, Gemini, YouTube and Vision all enforce per-minute request limits. A
+burst of dashboards should queue briefly for capacity instead of tripping a
+429, and a transient 429/5xx should be retried instead of going straight to
+fallback content.
+
+Features:
+- Token bucket per upstream (requests per minute + burst), FIFO reservations
+- Exponential backoff with full jitter; Retry-After (seconds or HTTP date) is honored
+- Retries on 429/500/502/503/504 and transport errors
+- Total retry budget per call, capped by the request deadline (deadline_scope)
+- Waiting for a token past the deadline fails fast with RateLimitExceeded
+- Throttle, retry and give-up counters per upstream for /api/status
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Callable, Awaitable, Optional, Iterator
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Monotonic time by which the current request must finish (None = no deadline)
+_deadline: contextvars.ContextVar = contextvars.ContextVar("upstream_request_deadline", default=None)
+
+# All upstream limiters by name, for status reporting
+_limiters: Dict[str, "UpstreamLimiter"] = {}
+
+
+class RateLimitExceeded(Exception):
+    """No request capacity before the request deadline"""
+
+    def __init__(self, upstream: str, wait_s: float):
+        super().__init__(f"{upstream} rate limit: next slot in {wait_s:.2f}s is past the request deadline")
+        self.upstream = upstream
+        self.wait_s = wait_s
+
+
+@contextlib.contextmanager
+def deadline_scope(timeout_s: Optional[float]) -> Iterator[None]:
+    """
+    Limit upstream waits and retries inside this block to timeout_s from now.
+
+    Nested scopes keep the earlier deadline. Tasks created inside the block
+    inherit it.
+    """
+
+    if timeout_s is None:
+        yield
+        return
+
+    deadline = time.monotonic() + max(0.0, timeout_s)
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_deadline() -> Optional[float]:
+    """Seconds left before the current request deadline (None = no deadline)"""
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header as seconds (delta-seconds or HTTP date), or None"""
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket with FIFO reservations.
+
+    A caller reserves a token immediately (the balance may go negative) and
+    sleeps until its token has accrued, so waiters are served in order.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, max_wait_s: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve one token.
+
+        Returns:
+            Seconds to wait before using it, or None if that would exceed max_wait_s
+            (nothing is reserved in that case)
+        """
+
+        self._refill()
+        wait_s = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        if max_wait_s is not None and wait_s > max_wait_s:
+            return None
+        self.tokens -= 1
+        return wait_s
+
+
+class UpstreamLimiter:
+    """
+    Token-bucket pacing plus jittered retries for one upstream.
+
+    Usage:
+        limiter = UpstreamLimiter("gemini", requests_per_minute=60, burst=5)
+        response = await limiter.request(lambda: client.post(url, json=payload))
+    """
+
+    def __init__(self, name: str, requests_per_minute: Optional[float] = None, burst: int = 1,
+                 max_attempts: int = 3, base_delay_s: float = 0.5, max_delay_s: float = 8.0,
+                 retry_budget_s: float = 20.0):
+        """
+        Args:
+            name: Upstream name for metrics
+            requests_per_minute: Sustained rate (None/0 = no pacing, retries only)
+            burst: Requests allowed back to back
+            max_attempts: Attempts per call including the first
+            base_delay_s: First backoff ceiling (doubles per attempt, full jitter)
+            max_delay_s: Backoff ceiling
+            retry_budget_s: Total time a call may spend retrying (also capped by the deadline)
+        """
+        self.name = name
+        self.bucket = TokenBucket(requests_per_minute, burst) if requests_per_minute else None
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self.retry_budget_s = retry_budget_s
+        self.stats = {
+            "requests": 0,
+            "attempts": 0,
+            "throttled": 0,
+            "throttle_wait_ms": 0.0,
+            "rejected": 0,
+            "retries": 0,
+            "retry_after_honored": 0,
+            "gave_up": 0,
+            "retried_statuses": {}
+        }
+        _limiters[name] = self
+
+    async def acquire(self) -> None:
+        """
+        Wait for request capacity.
+
+        Raises:
+            RateLimitExceeded: The next token arrives after the request deadline
+        """
+
+        if self.bucket is None:
+            return
+
+        remaining = remaining_deadline()
+        wait_s = self.bucket.reserve(max_wait_s=remaining)
+        if wait_s is None:
+            self.stats["rejected"] += 1
+            raise RateLimitExceeded(self.name, remaining or 0.0)
+
+        if wait_s > 0:
+            self.stats["throttled"] += 1
+            self.stats["throttle_wait_ms"] += wait_s * 1000
+            logger.info(f"🚦 {self.name} throttled for {wait_s * 1000:.0f}ms")
+            await asyncio.sleep(wait_s)
+
+    def backoff_delay(self, attempt: int, retry_after_s: Optional[float] = None) -> float:
+        """Delay before retry number attempt (1-based): Retry-After, else full-jitter exponential"""
+        if retry_after_s is not None:
+            return retry_after_s
+        return random.uniform(0, min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1))))
+
+    def _retry_delay(self, attempt: int, started: float, retry_after_s: Optional[float]) -> Optional[float]:
+        """Delay before the next attempt, or None when attempts or budget are used up"""
+
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.backoff_delay(attempt, retry_after_s)
+        budget = self.retry_budget_s - (time.monotonic() - started)
+        remaining = remaining_deadline()
+        if remaining is not None:
+            budget = min(budget, remaining)
+        if delay > budget:
+            return None
+        return delay
+
+    async def request(self, send: Callable[[], Awaitable["httpx.Response"]]) -> "httpx.Response":
+        """
+        Send a request with pacing and retries.
+
+        Returns:
+            The first non-retryable response, or the last response once retries
+            are exhausted (callers keep their own status handling and fallbacks)
+
+        Raises:
+            RateLimitExceeded: No capacity before the deadline
+            httpx.TransportError: The last attempt failed at the transport level
+        """
+
+        self.stats["requests"] += 1
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            await self.acquire()
+            self.stats["attempts"] += 1
+
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                delay = self._retry_delay(attempt, started, None)
+                if delay is None:
+                    self.stats["gave_up"] += 1
+                    raise
+                logger.warning(f"🔁 {self.name} transport error ({type(e).__name__}), retry {attempt} in {delay:.2f}s")
+                self._count_retry("transport_error")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+
+            retry_after_s = parse_retry_after(response.headers.get("retry-after"))
+            delay = self._retry_delay(attempt, started, retry_after_s)
+            if delay is None:
+                self.stats["gave_up"] += 1
+                logger.warning(f"⚠️ {self.name} returned {response.status_code}, not retrying "
+                               f"(attempt {attempt}/{self.max_attempts})")
+                return response
+
+            if retry_after_s is not None:
+                self.stats["retry_after_honored"] += 1
+            logger.warning(f"🔁 {self.name} returned {response.status_code}, retry {attempt} in {delay:.2f}s")
+            self._count_retry(str(response.status_code))
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    def _count_retry(self, reason: str) -> None:
+        self.stats["retries"] += 1
+        statuses = self.stats["retried_statuses"]
+        statuses[reason] = statuses.get(reason, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pacing and retry counters for /api/status"""
+        return {
+            "requests_per_minute": self.bucket.rate * 60 if self.bucket else None,
+            "burst": self.bucket.capacity if self.bucket else None,
+            "max_attempts": self.max_attempts,
+            "retry_budget_s": self.retry_budget_s,
+            **self.stats,
+            "throttle_wait_ms": round(self.stats["throttle_wait_ms"], 1)
+        }
+
+
+async def limited_request(limiter: Optional[UpstreamLimiter],
+                          send: Callable[[], Awaitable["httpx.Response"]]) -> "httpx.Response":
+    """Send through the limiter, or directly when the tool has none"""
+    if limiter is None:
+        return await send()
+    return await limiter.request(send)
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every upstream limiter created in this process"""
+    return {name: limiter.get_stats() for name, limiter in _limiters.items()}
+
+
+# Export the main helpers
+__all__ = ["UpstreamLimiter", "TokenBucket", "RateLimitExceeded", "deadline_scope", "remaining_deadline",
+           "parse_retry_after", "limited_request", "get_rate_limit_stats", "RETRYABLE_STATUS_CODES"]
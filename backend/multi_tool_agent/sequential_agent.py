@@ -9,50 +9,200 @@ CRITICAL FIXES FOR PII COMPLIANCE:
 - Added anonymized profile validation
 - Maintains full functionality with privacy compliance
 - FIXED: Removed age calculation method that was causing AttributeError
+
+SCHEDULING:
+- Agents run as nodes of a PipelineGraph and start as soon as their declared inputs are ready
+- Per-node start/finish times are reported in pipeline_metadata
+- Optional latency budget: each node gets a deadline and overdue nodes fall back,
+  with the affected sections listed in metadata.degraded_sections
+- run_stream() yields dashboard sections as soon as the producing agent finishes,
+  and Nostalgia News parts while Gemini is still streaming them
+- Every agent run is traced (duration, outcome, payload size) under one pipeline span
+- Optional Agent 4D generates the photo and Nostalgia News text in one Gemini call;
+  Agents 4C and 5 use its sections and keep their own calls as the fallback
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from datetime import datetime, date
+from typing import Dict, Any, Optional, List, Callable, AsyncIterator
+
+from .pipeline_graph import PipelineGraph, PipelineNode, PipelineRun, PipelineNodeError, NODE_FALLBACK
+from .agents.dashboard_synthesizer import DashboardSynthesizer
+from .tracing import tracer, KIND_AGENT, KIND_PIPELINE, OUTCOME_FALLBACK
 
 logger = logging.getLogger(__name__)
 
+# Node ids and labels for the dashboard pipeline
+DASHBOARD_NODE_LABELS = {
+    "agent1": "Agent 1 (Information Consolidator)",
+    "agent2": "Agent 2 (Simple Photo Analysis)",
+    "agent3": "Agent 3 (Qloo Cultural Intelligence)",
+    "agent4a": "Agent 4A (Music Curation)",
+    "agent4b": "Agent 4B (Recipe Selection)",
+    "agent4c": "Agent 4C (Photo Description)",
+    "agent4d": "Agent 4D (Combined Content Generation)",
+    "agent5": "Agent 5 (Nostalgia News Generator)",
+    "agent6": "Agent 6 (Dashboard Synthesizer)"
+}
+
+# Nodes the pipeline runs without (combined generation is opt-in)
+DASHBOARD_OPTIONAL_NODES = {"agent4d"}
+
+# Relative share of the latency budget per node, roughly proportional to the
+# expected latency of its upstream calls (Gemini nodes get the most)
+DASHBOARD_NODE_BUDGET_WEIGHTS = {
+    "agent1": 0.25,
+    "agent2": 1.0,
+    "agent3": 2.0,
+    "agent4a": 2.0,
+    "agent4b": 0.25,
+    "agent4c": 4.0,
+    "agent4d": 5.0,
+    "agent5": 5.0,
+    "agent6": 0.25
+}
+
+# With Agent 4D, Agents 4C and 5 only read its sections (their own Gemini calls are the fallback)
+DASHBOARD_COMBINED_BUDGET_WEIGHTS = {
+    "agent4c": 0.5,
+    "agent5": 0.5
+}
+
+# Dashboard section produced by each node that has a fallback
+DASHBOARD_NODE_SECTIONS = {
+    "agent2": "photo_analysis",
+    "agent3": "cultural_intelligence",
+    "agent4a": "music",
+    "agent4b": "recipe",
+    "agent4c": "photo",
+    "agent5": "nostalgia_news"
+}
+
+
+def build_dashboard_graph(agent1=None, agent2=None, agent3=None,
+                          agent4a=None, agent4b=None, agent4c=None,
+                          agent5=None, agent6=None, agent4d=None) -> PipelineGraph:
+    """
+    Build the default dashboard graph with the inputs each agent actually reads.
+    
+    - Agent 2 only needs theme_info and Agent 3 only needs patient_info, so both follow Agent 1
+    - Music (4A) and recipe selection (4B) only read patient_info/theme_info from Agent 1
+    - Photo description (4C) also reads Qloo intelligence from Agent 3
+    - Nostalgia News (5) reads the music and recipe selections, not the photo
+    - With combined generation (4D), 4C and 5 also wait for its single Gemini call
+    """
+    
+    # Agents 4C and 5 read the combined sections when Agent 4D is present
+    combined_inputs = ["agent4d"] if agent4d is not None else []
+    weights = dict(DASHBOARD_NODE_BUDGET_WEIGHTS)
+    if agent4d is not None:
+        weights.update(DASHBOARD_COMBINED_BUDGET_WEIGHTS)
+    
+    graph = PipelineGraph()
+    graph.add_node("agent1", agent1, label=DASHBOARD_NODE_LABELS["agent1"],
+                   budget_weight=weights["agent1"])
+    graph.add_node("agent2", agent2, depends_on=["agent1"], label=DASHBOARD_NODE_LABELS["agent2"],
+                   budget_weight=weights["agent2"])
+    graph.add_node("agent3", agent3, depends_on=["agent1"], label=DASHBOARD_NODE_LABELS["agent3"],
+                   budget_weight=weights["agent3"])
+    graph.add_node("agent4a", agent4a, depends_on=["agent1"], label=DASHBOARD_NODE_LABELS["agent4a"],
+                   budget_weight=weights["agent4a"])
+    graph.add_node("agent4b", agent4b, depends_on=["agent1"], label=DASHBOARD_NODE_LABELS["agent4b"],
+                   budget_weight=weights["agent4b"])
+    if agent4d is not None:
+        graph.add_node("agent4d", agent4d, depends_on=["agent1", "agent3", "agent4a", "agent4b"],
+                       label=DASHBOARD_NODE_LABELS["agent4d"],
+                       budget_weight=weights["agent4d"])
+    graph.add_node("agent4c", agent4c, depends_on=["agent1", "agent3"] + combined_inputs,
+                   label=DASHBOARD_NODE_LABELS["agent4c"],
+                   budget_weight=weights["agent4c"])
+    graph.add_node("agent5", agent5, depends_on=["agent1", "agent4a", "agent4b"] + combined_inputs,
+                   label=DASHBOARD_NODE_LABELS["agent5"],
+                   budget_weight=weights["agent5"])
+    graph.add_node("agent6", agent6,
+                   depends_on=["agent1", "agent2", "agent3", "agent4a", "agent4b", "agent4c", "agent5"],
+                   label=DASHBOARD_NODE_LABELS["agent6"],
+                   budget_weight=weights["agent6"])
+    return graph
+
+
 class SequentialAgent:
     """
     Enhanced Sequential Agent with 6-Agent Pipeline - PII COMPLIANT
     
     UPDATED: Works with anonymized profiles only - no names, no location data
+    UPDATED: Executes agents through a dependency graph instead of a fixed chain
     """
     
     def __init__(self, agent1=None, agent2=None, agent3=None, 
                  agent4a=None, agent4b=None, agent4c=None, 
-                 agent5=None, agent6=None):
+                 agent5=None, agent6=None, graph: Optional[PipelineGraph] = None,
+                 agent4d=None):
+        
+        # Prefer an explicitly built graph; keep the per-agent keywords for scripts and tests
+        if graph is None:
+            graph = build_dashboard_graph(
+                agent1=agent1, agent2=agent2, agent3=agent3,
+                agent4a=agent4a, agent4b=agent4b, agent4c=agent4c,
+                agent5=agent5, agent6=agent6, agent4d=agent4d
+            )
+        self.graph = graph
         
         # Store all agents
-        self.agent1 = agent1  # Information Consolidator
-        self.agent2 = agent2  # Simple Photo Analysis
-        self.agent3 = agent3  # Qloo Cultural Intelligence
-        self.agent4a = agent4a  # Music Curation
-        self.agent4b = agent4b  # Recipe Selection
-        self.agent4c = agent4c  # Photo Description
-        self.agent5 = agent5  # Nostalgia News Generator
-        self.agent6 = agent6  # Dashboard Synthesizer
+        self.agent1 = graph.get_agent("agent1")  # Information Consolidator
+        self.agent2 = graph.get_agent("agent2")  # Simple Photo Analysis
+        self.agent3 = graph.get_agent("agent3")  # Qloo Cultural Intelligence
+        self.agent4a = graph.get_agent("agent4a")  # Music Curation
+        self.agent4b = graph.get_agent("agent4b")  # Recipe Selection
+        self.agent4c = graph.get_agent("agent4c")  # Photo Description
+        self.agent4d = graph.get_agent("agent4d")  # Combined Content Generation (optional)
+        self.agent5 = graph.get_agent("agent5")  # Nostalgia News Generator
+        self.agent6 = graph.get_agent("agent6")  # Dashboard Synthesizer
         
         # Track available agents
         self.agents_available = [
             agent for agent in [self.agent1, self.agent2, self.agent3, 
                               self.agent4a, self.agent4b, self.agent4c,
-                              self.agent5, self.agent6] 
+                              self.agent4d, self.agent5, self.agent6] 
             if agent is not None
         ]
         
-        logger.info(f"🤖 PII-Compliant Sequential Agent initialized with {len(self.agents_available)}/8 agents")
+        # Node runners and fallbacks keyed by node id
+        self._node_runners = {
+            "agent1": self._run_information_consolidator,
+            "agent2": self._run_photo_analysis,
+            "agent3": self._run_cultural_intelligence,
+            "agent4a": self._run_content_agent,
+            "agent4b": self._run_content_agent,
+            "agent4c": self._run_content_agent,
+            "agent4d": self._run_combined_content,
+            "agent5": self._run_nostalgia_news,
+            "agent6": self._run_dashboard_synthesizer
+        }
+        self._node_fallbacks = {
+            "agent2": lambda inputs: {"photo_analysis": {"analysis_method": "fallback", "success": False}},
+            "agent3": lambda inputs: {"qloo_intelligence": {"cultural_recommendations": {}, "metadata": {"fallback_used": True}}},
+            "agent4a": lambda inputs: self._create_fallback_music(),
+            "agent4b": lambda inputs: self._create_fallback_recipe(),
+            "agent4c": lambda inputs: self._create_fallback_photo_description(inputs["agent1"]),
+            "agent4d": lambda inputs: {"combined_content": None, "metadata": {"fallback_used": True}},
+            "agent5": lambda inputs: self._create_fallback_nostalgia_news(inputs["agent1"])
+        }
+        
+        logger.info(f"🤖 PII-Compliant Sequential Agent initialized with {len(self.agents_available)}/{len(self.graph.nodes)} agents")
+        logger.info(f"🕸️ Pipeline graph: {self.graph.describe()}")
     
     async def run(self, 
                   patient_profile: Dict[str, Any],
                   request_type: str = "dashboard",
                   session_id: Optional[str] = None,
-                  feedback_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                  feedback_data: Optional[Dict[str, Any]] = None,
+                  latency_budget_ms: Optional[float] = None,
+                  on_section: Optional[Callable[[str, Dict[str, Any], bool], None]] = None,
+                  theme_id: Optional[str] = None,
+                  dashboard_date: Optional[date] = None,
+                  on_partial: Optional[Callable[[str, str, Any], None]] = None) -> Dict[str, Any]:
         """
         Execute the complete 6-agent pipeline with anonymized profile
         
@@ -61,147 +211,82 @@ class SequentialAgent:
             request_type: Type of request
             session_id: Session identifier
             feedback_data: User feedback data
+            latency_budget_ms: End-to-end budget split into per-agent deadlines (None = unbounded)
+            on_section: Called as on_section(name, data, degraded) when theme, recipe,
+                        photo, music or nostalgia_news is ready (same shapes as Agent 6)
+            theme_id: Generate for this theme without advancing the rotation (the request
+                      path selects it up front so it matches the cache key; pre-generation pins it)
+            dashboard_date: Day the dashboard is for (defaults to today)
+            on_partial: Called as on_partial(section, part, value) for parts of a section
+                        that stream in before the section is complete (nostalgia_news)
             
         Returns:
             Complete dashboard with Nostalgia News (PII-compliant)
         """
         
         logger.info("🚀 Starting PII-compliant 6-agent pipeline with Nostalgia News")
-        logger.info(f"📋 Pipeline: Info → Photo → Qloo → Content(4A/4B/4C) → Nostalgia News → Dashboard")
+        logger.info(f"📋 Pipeline graph: Info → (Photo ∥ Qloo) → Content(4A/4B/4C) → Nostalgia News → Dashboard")
         
         # VALIDATE ANONYMIZED PROFILE
         if not self._validate_anonymized_profile(patient_profile):
             logger.error("🚨 Profile validation failed - contains PII or invalid format")
             return {"success": False, "error": "Profile contains PII or invalid format"}
         
+        # Every pipeline node must be bound to an agent
+        for node_name, label in DASHBOARD_NODE_LABELS.items():
+            if node_name in DASHBOARD_OPTIONAL_NODES and node_name not in self.graph.nodes:
+                continue
+            if self.graph.get_agent(node_name) is None:
+                return {"success": False, "error": f"{label} not available"}
+        
+        request_context = {
+            "patient_profile": patient_profile,
+            "request_type": request_type,
+            "session_id": session_id,
+            "feedback_data": feedback_data,
+            "theme_id": theme_id,
+            "dashboard_date": dashboard_date,
+            "on_partial": on_partial
+        }
+        
+        async def run_node(node: PipelineNode, inputs: Dict[str, Any]) -> Any:
+            async with tracer.span(node.name, KIND_AGENT, label=node.label) as span:
+                output = await self._node_runners[node.name](node, inputs, request_context)
+                span.set_payload(output)
+                return output
+        
+        def fallback_node(node: PipelineNode, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            fallback_builder = self._node_fallbacks.get(node.name)
+            return fallback_builder(inputs) if fallback_builder else None
+        
         try:
-            # ===== AGENT 1: Information Consolidator =====
-            if not self.agent1:
-                return {"success": False, "error": "Agent 1 (Information Consolidator) not available"}
-            
-            logger.info("📋 Running Agent 1: Information Consolidator (PII-compliant)")
-            agent1_output = await self.agent1.run(
-                patient_profile=patient_profile,
-                request_type=request_type,
-                session_id=session_id,
-                feedback_data=feedback_data
-            )
-            
-            if not agent1_output:
-                return {"success": False, "error": "Information consolidation failed"}
-            
-            logger.info("✅ Agent 1 completed")
-            
-            # ===== AGENT 2: Simple Photo Analysis =====
-            if not self.agent2:
-                return {"success": False, "error": "Agent 2 (Simple Photo Analysis) not available"}
-            
-            logger.info("📸 Running Agent 2: Simple Photo Analysis")
-            agent2_output = await self.agent2.run(agent1_output)
-            
-            if not agent2_output:
-                logger.warning("⚠️ Agent 2 failed, using fallback photo analysis")
-                agent2_output = {"photo_analysis": {"analysis_method": "fallback", "success": False}}
-            
-            logger.info("✅ Agent 2 completed")
-            
-            # ===== AGENT 3: Qloo Cultural Intelligence =====
-            if not self.agent3:
-                return {"success": False, "error": "Agent 3 (Qloo Cultural Intelligence) not available"}
-            
-            logger.info("🎯 Running Agent 3: Qloo Cultural Intelligence (PII-compliant)")
-            agent3_output = await self.agent3.run(agent1_output, agent2_output)
-            
-            if not agent3_output:
-                logger.warning("⚠️ Agent 3 failed, using fallback cultural data")
-                agent3_output = {"qloo_intelligence": {"cultural_recommendations": {}, "metadata": {"fallback_used": True}}}
-            
-            logger.info("✅ Agent 3 completed")
-            
-            # ===== AGENTS 4A, 4B, 4C: Content Generation (Parallel) =====
-            logger.info("🎨 Running Agents 4A/4B/4C: Content Generation (parallel, PII-compliant)")
-            
-            # Create enhanced profile for content agents
-            enhanced_profile = self._create_enhanced_profile(agent1_output, agent2_output, agent3_output)
-            
-            # Agent 4A: Music Curation
-            if not self.agent4a:
-                return {"success": False, "error": "Agent 4A (Music Curation) not available"}
-            
-            logger.info("🎵 Running Agent 4A: Music Curation")
-            agent4a_output = await self.agent4a.run(enhanced_profile)
-            
-            if not agent4a_output:
-                agent4a_output = self._create_fallback_music()
-                logger.warning("⚠️ Agent 4A failed, using music fallback")
-            
-            # Agent 4B: Recipe Selection
-            if not self.agent4b:
-                return {"success": False, "error": "Agent 4B (Recipe Selection) not available"}
-            
-            logger.info("🍽️ Running Agent 4B: Recipe Selection")
-            agent4b_output = await self.agent4b.run(enhanced_profile)
-            
-            if not agent4b_output:
-                agent4b_output = self._create_fallback_recipe()
-                logger.warning("⚠️ Agent 4B failed, using recipe fallback")
-            
-            # Agent 4C: Photo Description
-            if not self.agent4c:
-                return {"success": False, "error": "Agent 4C (Photo Description) not available"}
-            
-            logger.info("📷 Running Agent 4C: Photo Description")
-            agent4c_output = await self.agent4c.run(enhanced_profile)
-            
-            if not agent4c_output:
-                agent4c_output = self._create_fallback_photo_description(agent1_output)
-                logger.warning("⚠️ Agent 4C failed, using photo description fallback")
-            
-            logger.info("✅ Agents 4A/4B/4C completed")
-            
-            # ===== AGENT 5: Nostalgia News Generator =====
-            if not self.agent5:
-                return {"success": False, "error": "Agent 5 (Nostalgia News Generator) not available"}
-            
-            logger.info("📰 Running Agent 5: Nostalgia News Generator (STAR FEATURE, PII-compliant)")
-            agent5_output = await self.agent5.run(
-                agent1_output=agent1_output,
-                agent2_output=agent2_output,
-                agent3_output=agent3_output,
-                agent4a_output=agent4a_output,
-                agent4b_output=agent4b_output,
-                agent4c_output=agent4c_output
-            )
-            
-            if not agent5_output:
-                agent5_output = self._create_fallback_nostalgia_news(agent1_output)
-                logger.warning("⚠️ Agent 5 failed, using nostalgia news fallback")
-            
-            logger.info("✅ Agent 5 completed - PII-compliant Nostalgia News generated!")
-            
-            # ===== AGENT 6: Dashboard Synthesizer =====
-            if not self.agent6:
-                return {"success": False, "error": "Agent 6 (Dashboard Synthesizer) not available"}
-            
-            logger.info("🎨 Running Agent 6: Dashboard Synthesizer (Final Assembly, PII-compliant)")
-            
-            # Create final enhanced profile that combines ALL agent outputs
-            final_enhanced_profile = self._create_final_enhanced_profile(
-                agent1_output, agent2_output, agent3_output,
-                agent4a_output, agent4b_output, agent4c_output, agent5_output
-            )
-            
-            # Call Agent 6 with single enhanced profile parameter
-            final_dashboard = await self.agent6.run(final_enhanced_profile)
-            
-            if not final_dashboard:
-                return {"success": False, "error": "Dashboard synthesis failed"}
-            
-            logger.info("✅ Agent 6 completed - PII-compliant final dashboard assembled!")
+            budget_s = latency_budget_ms / 1000 if latency_budget_ms else None
+            on_node_done = None
+            if on_section:
+                def on_node_done(node: PipelineNode, output: Any, pipeline_run: PipelineRun) -> None:
+                    self._emit_section(node.name, output, pipeline_run, on_section)
+            
+            async with tracer.span("dashboard_pipeline", KIND_PIPELINE, request_type=request_type) as pipeline_span:
+                pipeline_run = await self.graph.execute(run_node, fallback_node, budget_s=budget_s,
+                                                        on_node_done=on_node_done)
+                final_dashboard = pipeline_run.outputs["agent6"]
+                
+                # Record which sections were replaced by fallbacks (timeouts or errors)
+                degraded_sections = [
+                    DASHBOARD_NODE_SECTIONS[name] for name in pipeline_run.nodes_with_status(NODE_FALLBACK)
+                    if name in DASHBOARD_NODE_SECTIONS
+                ]
+                if degraded_sections:
+                    pipeline_span.set_outcome(OUTCOME_FALLBACK)
+                    pipeline_span.set_attribute("degraded_sections", ",".join(degraded_sections))
+            final_dashboard.setdefault("metadata", {})["degraded_sections"] = degraded_sections
+            if degraded_sections:
+                logger.warning(f"⚠️ Degraded dashboard sections: {', '.join(degraded_sections)}")
             
             # ===== PIPELINE SUCCESS =====
             logger.info("🎉 Complete PII-compliant 6-agent pipeline executed successfully!")
             logger.info("📰 Dashboard includes personalized Nostalgia News (no PII)!")
+            logger.info(f"⏱️ Pipeline finished in {pipeline_run.total_ms:.0f}ms")
             
             # Add pipeline metadata
             final_dashboard["pipeline_metadata"] = {
@@ -214,6 +299,9 @@ class SequentialAgent:
                 "personalization": "gemini_enhanced",
                 "pii_compliant": True,
                 "anonymized_profile": True,
+                "scheduling": "dependency_graph",
+                "degraded_sections": degraded_sections,
+                **pipeline_run.to_metadata(),
                 "agents_summary": {
                     "agent1": "Information consolidation with theme selection (anonymized)",
                     "agent2": "Simple photo analysis (theme-based)",
@@ -221,12 +309,23 @@ class SequentialAgent:
                     "agent4a": "Music curation with YouTube integration",
                     "agent4b": "Recipe selection (microwave-safe)",
                     "agent4c": "Photo description with cultural context",
+                    **({"agent4d": "Combined photo + Nostalgia News generation (one Gemini call)"}
+                       if self.agent4d else {}),
                     "agent5": "Nostalgia News generation (Gemini AI, PII-compliant)",
                     "agent6": "Dashboard synthesis and final assembly"
                 }
             }
             
             return final_dashboard
+        
+        except PipelineNodeError as e:
+            logger.error(f"❌ Pipeline node {e.node_name} failed without fallback: {e}")
+            return {
+                "success": False,
+                "error": f"{e}",
+                "pipeline_stage": e.node_name,
+                "timestamp": datetime.now().isoformat()
+            }
             
         except Exception as e:
             logger.error(f"❌ Sequential agent pipeline failed: {e}")
@@ -240,6 +339,208 @@ class SequentialAgent:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def run_stream(self,
+                         patient_profile: Dict[str, Any],
+                         request_type: str = "dashboard",
+                         session_id: Optional[str] = None,
+                         feedback_data: Optional[Dict[str, Any]] = None,
+                         latency_budget_ms: Optional[float] = None,
+                         theme_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the pipeline and yield events as sections become available.
+        
+        Yields:
+            {"event": "section", "section": name, "data": {...}, "degraded": bool}
+            for theme, recipe, photo, music and nostalgia_news (in completion order),
+            {"event": "partial", "section": "nostalgia_news", "part": name, "data": value}
+            for each newsletter section as Gemini streams it (provisional, before its section event),
+            then {"event": "dashboard", "data": final_dashboard} with the full envelope
+            (or {"event": "error", "data": {...}} if the pipeline failed)
+        """
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def on_section(name: str, data: Dict[str, Any], degraded: bool) -> None:
+            queue.put_nowait({"event": "section", "section": name, "data": data, "degraded": degraded})
+        
+        def on_partial(section: str, part: str, data: Any) -> None:
+            queue.put_nowait({"event": "partial", "section": section, "part": part, "data": data})
+        
+        pipeline_task = asyncio.create_task(self.run(
+            patient_profile=patient_profile,
+            request_type=request_type,
+            session_id=session_id,
+            feedback_data=feedback_data,
+            latency_budget_ms=latency_budget_ms,
+            on_section=on_section,
+            theme_id=theme_id,
+            on_partial=on_partial
+        ))
+        pipeline_task.add_done_callback(lambda task: queue.put_nowait(None))
+        
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            
+            final_dashboard = pipeline_task.result()
+            if final_dashboard.get("success", True):
+                yield {"event": "dashboard", "data": final_dashboard}
+            else:
+                yield {"event": "error", "data": final_dashboard}
+        finally:
+            # Client went away: stop the pipeline
+            if not pipeline_task.done():
+                pipeline_task.cancel()
+    
+    def get_agent_status(self) -> Dict[str, Any]:
+        """Report pipeline nodes, their dependencies and the node timings of recent runs (newest first)"""
+        
+        return {
+            "agents_available": len(self.agents_available),
+            "agents_total": len(self.graph.nodes),
+            "nodes": {
+                name: {
+                    "label": node.label,
+                    "available": node.agent is not None,
+                    "depends_on": node.depends_on
+                }
+                for name, node in self.graph.nodes.items()
+            },
+            "recent_runs": [pipeline_run.to_metadata() for pipeline_run in reversed(self.graph.recent_runs)],
+            "star_feature": "nostalgia_news_generator" if self.agent5 else None
+        }
+    
+    # ===== STREAMED SECTIONS =====
+    
+    def _emit_section(self, node_name: str, output: Dict[str, Any], pipeline_run: PipelineRun,
+                      on_section: Callable[[str, Dict[str, Any], bool], None]) -> None:
+        """Map a finished node to the dashboard section it produces (same shape as Agent 6)"""
+        
+        degraded = pipeline_run.timings.get(node_name, {}).get("status") == NODE_FALLBACK
+        agent1_output = pipeline_run.outputs.get("agent1", {})
+        
+        if node_name == "agent1":
+            patient_info = output.get("patient_info", {})
+            theme_info = output.get("theme_info", {})
+            section = "theme"
+            data = DashboardSynthesizer.build_patient_info(
+                patient_info.get("cultural_heritage", "American"),
+                patient_info.get("age_group", "senior"),
+                theme_info.get("name", "Universal")
+            )
+        elif node_name == "agent4a":
+            section = "music"
+            data = DashboardSynthesizer.build_music_section(output.get("music_content", {}))
+        elif node_name == "agent4b":
+            section = "recipe"
+            data = DashboardSynthesizer.build_recipe_section(output.get("recipe_content", {}))
+        elif node_name == "agent4c":
+            section = "photo"
+            data = DashboardSynthesizer.build_photo_section(self._map_photo_content(agent1_output, output))
+        elif node_name == "agent5":
+            section = "nostalgia_news"
+            data = output.get("nostalgia_news") or self._create_empty_nostalgia_sections()
+        else:
+            return
+        
+        on_section(section, data, degraded)
+    
+    # ===== NODE RUNNERS =====
+    
+    async def _run_information_consolidator(self, node: PipelineNode, inputs: Dict[str, Any],
+                                            request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 1: Information Consolidator (PII-compliant)"""
+        
+        logger.info("📋 Running Agent 1: Information Consolidator (PII-compliant)")
+        return await node.agent.run(
+            patient_profile=request_context["patient_profile"],
+            request_type=request_context["request_type"],
+            session_id=request_context["session_id"],
+            feedback_data=request_context["feedback_data"],
+            theme_id=request_context.get("theme_id"),
+            dashboard_date=request_context.get("dashboard_date")
+        )
+    
+    async def _run_photo_analysis(self, node: PipelineNode, inputs: Dict[str, Any],
+                                  request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 2: Simple Photo Analysis (needs theme_info only)"""
+        
+        logger.info("📸 Running Agent 2: Simple Photo Analysis")
+        return await node.agent.run(inputs["agent1"])
+    
+    async def _run_cultural_intelligence(self, node: PipelineNode, inputs: Dict[str, Any],
+                                         request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 3: Qloo Cultural Intelligence (needs patient_info only)"""
+        
+        logger.info("🎯 Running Agent 3: Qloo Cultural Intelligence (PII-compliant)")
+        return await node.agent.run(inputs["agent1"])
+    
+    async def _run_content_agent(self, node: PipelineNode, inputs: Dict[str, Any],
+                                 request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agents 4A/4B/4C: content generation on an enhanced profile built from declared inputs"""
+        
+        logger.info(f"🎨 Running {node.label}")
+        enhanced_profile = self._create_enhanced_profile(
+            inputs["agent1"], inputs.get("agent2", {}), inputs.get("agent3", {})
+        )
+        if "agent4d" in inputs:
+            enhanced_profile["combined_content"] = inputs["agent4d"].get("combined_content")
+        return await node.agent.run(enhanced_profile)
+    
+    async def _run_combined_content(self, node: PipelineNode, inputs: Dict[str, Any],
+                                    request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 4D: one Gemini call for the photo and Nostalgia News sections"""
+        
+        logger.info("🧩 Running Agent 4D: Combined Content Generation")
+        enhanced_profile = self._create_enhanced_profile(
+            inputs["agent1"], inputs.get("agent2", {}), inputs.get("agent3", {})
+        )
+        return await node.agent.run(enhanced_profile, inputs.get("agent4a", {}), inputs.get("agent4b", {}),
+                                    **self._partial_news_callback(request_context))
+    
+    async def _run_nostalgia_news(self, node: PipelineNode, inputs: Dict[str, Any],
+                                  request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 5: Nostalgia News Generator (STAR FEATURE)"""
+        
+        logger.info("📰 Running Agent 5: Nostalgia News Generator (STAR FEATURE, PII-compliant)")
+        combined = {"combined_content": inputs["agent4d"].get("combined_content")} if "agent4d" in inputs else {}
+        combined.update(self._partial_news_callback(request_context))
+        return await node.agent.run(
+            agent1_output=inputs["agent1"],
+            agent2_output=inputs.get("agent2", {}),
+            agent3_output=inputs.get("agent3", {}),
+            agent4a_output=inputs.get("agent4a", {}),
+            agent4b_output=inputs.get("agent4b", {}),
+            agent4c_output=inputs.get("agent4c", {}),
+            **combined
+        )
+    
+    def _partial_news_callback(self, request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """on_partial_section keyword for the Nostalgia News producers (only when streaming)"""
+        
+        on_partial = request_context.get("on_partial")
+        if not on_partial:
+            return {}
+        return {"on_partial_section": lambda part, value: on_partial("nostalgia_news", part, value)}
+    
+    async def _run_dashboard_synthesizer(self, node: PipelineNode, inputs: Dict[str, Any],
+                                         request_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 6: Dashboard Synthesizer (final assembly)"""
+        
+        logger.info("🎨 Running Agent 6: Dashboard Synthesizer (Final Assembly, PII-compliant)")
+        
+        # Create final enhanced profile that combines ALL agent outputs
+        final_enhanced_profile = self._create_final_enhanced_profile(
+            inputs["agent1"], inputs["agent2"], inputs["agent3"],
+            inputs["agent4a"], inputs["agent4b"], inputs["agent4c"], inputs["agent5"]
+        )
+        
+        # Call Agent 6 with single enhanced profile parameter
+        return await node.agent.run(final_enhanced_profile)
+    
     def _validate_anonymized_profile(self, patient_profile: Dict[str, Any]) -> bool:
         """
         Validate that profile is properly anonymized and contains no PII
@@ -286,6 +587,7 @@ class SequentialAgent:
         
         # Ensure patient_info has complete anonymized info with all possible field names
         if "patient_info" in enhanced_profile:
+            enhanced_profile["patient_info"] = dict(patient_info)
             enhanced_profile["patient_info"]["heritage"] = cultural_heritage
             enhanced_profile["patient_info"]["cultural_background"] = cultural_heritage
             enhanced_profile["patient_info"]["cultural_heritage"] = cultural_heritage
@@ -313,6 +615,42 @@ class SequentialAgent:
         
         return enhanced_profile
     
+    def _map_photo_content(self, agent1_output: Dict[str, Any],
+                           agent4c_output: Dict[str, Any]) -> Dict[str, Any]:
+        """Map Agent 4C photo content for the dashboard, preferring the theme's photo filename"""
+        
+        theme_info = agent1_output.get("theme_info", {})
+        daily_theme = theme_info.get("name", "Universal")
+        
+        agent4c_photo_data = agent4c_output.get("photo_content", {})
+        
+        # Ensure theme photo filename is preserved for UI
+        theme_photo_filename = theme_info.get("photo_filename", "")
+        agent_photo_filename = agent4c_photo_data.get("image_name", agent4c_photo_data.get("filename", ""))
+        
+        # Priority: Theme photo filename (for UI consistency) > Agent photo filename
+        correct_filename = theme_photo_filename if theme_photo_filename else agent_photo_filename
+        
+        photo_data = {
+            "filename": correct_filename,
+            "description": agent4c_photo_data.get("description", ""),
+            "cultural_context": agent4c_photo_data.get("cultural_context", agent4c_photo_data.get("heritage_connection", "")),
+            "conversation_starters": agent4c_photo_data.get("conversation_starters", [])
+        }
+        
+        # Debug logging for photo filename (no PII)
+        logger.info(f"📷 Photo filename mapping:")
+        logger.info(f"   Theme photo: {theme_photo_filename}")
+        logger.info(f"   Agent photo: {agent_photo_filename}")
+        logger.info(f"   Final photo: {correct_filename}")
+        
+        # Final fallback if still empty
+        if not photo_data["filename"]:
+            photo_data["filename"] = f"{daily_theme.lower().replace(' ', '_')}.png"
+            logger.warning(f"⚠️ Using theme-based fallback filename: {photo_data['filename']}")
+        
+        return photo_data
+    
     def _create_final_enhanced_profile(self, 
                                      agent1_output: Dict[str, Any],
                                      agent2_output: Dict[str, Any], 
@@ -348,32 +686,7 @@ class SequentialAgent:
         recipe_data = agent4b_output.get("recipe_content", {})
         
         # Map photo content fields correctly with theme filename priority
-        agent4c_photo_data = agent4c_output.get("photo_content", {})
-        
-        # Ensure theme photo filename is preserved for UI
-        theme_photo_filename = theme_info.get("photo_filename", "")
-        agent_photo_filename = agent4c_photo_data.get("image_name", agent4c_photo_data.get("filename", ""))
-        
-        # Priority: Theme photo filename (for UI consistency) > Agent photo filename
-        correct_filename = theme_photo_filename if theme_photo_filename else agent_photo_filename
-        
-        photo_data = {
-            "filename": correct_filename,
-            "description": agent4c_photo_data.get("description", ""),
-            "cultural_context": agent4c_photo_data.get("cultural_context", agent4c_photo_data.get("heritage_connection", "")),
-            "conversation_starters": agent4c_photo_data.get("conversation_starters", [])
-        }
-        
-        # Debug logging for photo filename (no PII)
-        logger.info(f"📷 Photo filename mapping:")
-        logger.info(f"   Theme photo: {theme_photo_filename}")
-        logger.info(f"   Agent photo: {agent_photo_filename}")
-        logger.info(f"   Final photo: {correct_filename}")
-        
-        # Final fallback if still empty
-        if not photo_data["filename"]:
-            photo_data["filename"] = f"{daily_theme.lower().replace(' ', '_')}.png"
-            logger.warning(f"⚠️ Using theme-based fallback filename: {photo_data['filename']}")
+        photo_data = self._map_photo_content(agent1_output, agent4c_output)
         
         # Extract nostalgia news data structure (PASS THROUGH SECTIONS)
         agent5_nostalgia_raw = agent5_output.get("nostalgia_news", {})
@@ -649,4 +962,6 @@ class SequentialAgent:
         }
 
 # Export the main class
-__all__ = ["SequentialAgent"]
\ No newline at end of file
+__all__ = ["SequentialAgent", "build_dashboard_graph", "DASHBOARD_NODE_LABELS",
+           "DASHBOARD_NODE_BUDGET_WEIGHTS", "DASHBOARD_COMBINED_BUDGET_WEIGHTS",
+           "DASHBOARD_NODE_SECTIONS", "DASHBOARD_OPTIONAL_NODES"]
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Single-Flight Request Coalescing
+File: backend/multi_tool_agent/single_flight.py
+
+Features:
+- Identical concurrent calls (same canonical key) share one execution
+- The first caller starts the work; later callers await the same task
+- Followers get a deep copy of the result so callers never share mutable state
+- A caller being cancelled (e.g. a pipeline deadline) does not cancel the
+  shared work while other callers are still waiting for it
+- Optional shared-call scope (e.g. one batch request): successful results are
+  remembered for the rest of the scope, so repeated calls that are not
+  concurrent still run once; failures and empty results are retried
+- Per-group counters for /api/status
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import copy
+import logging
+from typing import Dict, Any, Callable, Awaitable, Optional, Iterator
+
+logger = logging.getLogger(__name__)
+
+# All single-flight groups by name, for status reporting
+_groups: Dict[str, "SingleFlight"] = {}
+
+# Results remembered for the active shared-call scope, keyed by "<group>:<key>"
+_call_scope: contextvars.ContextVar = contextvars.ContextVar("single_flight_call_scope", default=None)
+
+
+def is_successful_result(result: Any) -> bool:
+    """Default scope filter: not None/empty and not an explicit {"success": False}"""
+    if not result:
+        return False
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+@contextlib.contextmanager
+def shared_call_scope() -> Iterator[Dict[str, Any]]:
+    """
+    Remember completed call results for tasks created inside this block.
+
+    Tasks copy the current context when they are created, so every task
+    spawned inside the block shares the same result store even after the
+    block exits.
+    """
+
+    scope: Dict[str, Any] = {}
+    token = _call_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _call_scope.reset(token)
+
+
+class SingleFlight:
+    """
+    Coalesce identical in-flight coroutine executions.
+
+    Usage:
+        flight = SingleFlight("qloo")
+        result = await flight.do(key, lambda: fetch(params))
+
+    Args:
+        name: Group name used in scope keys and status reporting
+        should_remember: Whether a result may be reused for the rest of a
+                         shared-call scope (a transient failure must not pin
+                         fallback content for a whole batch)
+    """
+
+    def __init__(self, name: str, should_remember: Callable[[Any], bool] = is_successful_result):
+        self.name = name
+        self.should_remember = should_remember
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.scope_hits = 0
+        _groups[name] = self
+
+    async def do(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run work() once per key at a time and share its result.
+
+        Args:
+            key: Canonical key identifying identical calls
+            work: Zero-argument coroutine factory, only called by the first caller
+        """
+
+        scope = _call_scope.get()
+        scope_key = f"{self.name}:{key}"
+        if scope is not None and scope_key in scope:
+            self.scope_hits += 1
+            return copy.deepcopy(scope[scope_key])
+
+        task = self._inflight.get(key)
+        leader = task is None
+
+        if leader:
+            self.executions += 1
+            task = asyncio.ensure_future(work())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            logger.info(f"🔗 {self.name}: joined in-flight call ({key[:12]})")
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Only abandon the shared work when nobody else is waiting for it
+            if self._release(key) == 0 and not task.done():
+                task.cancel()
+            raise
+        else:
+            self._release(key)
+
+        if scope is not None and scope_key not in scope and self.should_remember(result):
+            scope[scope_key] = copy.deepcopy(result)
+
+        return result if leader else copy.deepcopy(result)
+
+    def _release(self, key: str) -> int:
+        remaining = self._waiters.get(key, 1) - 1
+        if key in self._waiters:
+            self._waiters[key] = remaining
+        return remaining
+
+    def _forget(self, key: str, done: asyncio.Task) -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for status endpoints"""
+        calls = self.executions + self.coalesced
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "scope_hits": self.scope_hits,
+            "in_flight": len(self._inflight),
+            "coalesced_rate": round(self.coalesced / calls, 3) if calls else 0.0
+        }
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every single-flight group created in this process"""
+    return {name: group.get_stats() for name, group in _groups.items()}
+
+
+def get_single_flight(name: str) -> Optional[SingleFlight]:
+    """Look up a single-flight group by name"""
+    return _groups.get(name)
+
+
+# Export the main class
+__all__ = ["SingleFlight", "shared_call_scope", "is_successful_result", "get_single_flight_stats",
+           "get_single_flight"]
@@ -0,0 +1,236 @@
+"""
+State Store - Shared Rotation and Recency State
+File: backend/multi_tool_agent/state_store.py
+
+Small JSON documents that carry over from one dashboard request to the next:
+the theme rotation index, the current theme and the most recent music pick.
+They used to be rewritten as JSON files in config/ on every request, which
+blocked the event loop and raced between uvicorn workers.
+
+Backends:
+- memory (default): a dict guarded by a lock; no syscalls, state is per process
+- sqlite: one WAL-mode SQLite file shared by every worker on the host;
+  read-modify-write updates run in a BEGIN IMMEDIATE transaction, so two
+  workers advancing the theme rotation never select the same index
+
+The sqlite backend blocks on disk and on other workers' transactions, so
+async callers go through aget()/aput()/aupdate() or run_io(), which move
+the call to a worker thread when the backend does blocking I/O.
+
+Usage:
+    store = create_state_store("sqlite", "data/state.sqlite3")
+    state = store.update(STATE_THEME_ROTATION, lambda state: {"current_index": 1})
+    recent = await store.aget(STATE_RECENT_MUSIC)
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Keys of the documents kept in the store
+STATE_THEME_ROTATION = "theme_rotation"
+STATE_CURRENT_THEME = "current_theme"
+STATE_RECENT_MUSIC = "recent_music"
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+STATE_BACKENDS = [BACKEND_MEMORY, BACKEND_SQLITE]
+
+StateMutator = Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]
+T = TypeVar("T")
+
+
+class StateStore:
+    """
+    Interface of the rotation/recency state backends.
+
+    Values are JSON-serializable dicts; callers always get their own copy.
+    """
+
+    backend = "base"
+    blocking_io = False  # True when calls wait on disk or other processes
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored document, or None"""
+        raise NotImplementedError
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Replace a document"""
+        raise NotImplementedError
+
+    def update(self, key: str, mutate: StateMutator) -> Dict[str, Any]:
+        """
+        Atomically replace a document with mutate(current) and return the new value.
+
+        mutate receives None when the key has no document yet.
+        """
+        raise NotImplementedError
+
+    async def run_io(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call func (which uses this store) from the event loop without blocking it"""
+        if self.blocking_io:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """get() for the event loop"""
+        return await self.run_io(self.get, key)
+
+    async def aput(self, key: str, value: Dict[str, Any]) -> None:
+        """put() for the event loop"""
+        await self.run_io(self.put, key, value)
+
+    async def aupdate(self, key: str, mutate: StateMutator) -> Dict[str, Any]:
+        """update() for the event loop (mutate runs in the worker thread for blocking backends)"""
+        return await self.run_io(self.update, key, mutate)
+
+    def close(self) -> None:
+        """Release backend resources"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend and counters for /api/status"""
+        return {"backend": self.backend, "reads": self.reads, "writes": self.writes}
+
+
+class InMemoryStateStore(StateStore):
+    """Process-local state (each worker keeps its own rotation)"""
+
+    backend = BACKEND_MEMORY
+
+    def __init__(self):
+        super().__init__()
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self.reads += 1
+            value = self._documents.get(key)
+            return copy.deepcopy(value) if value is not None else None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self.writes += 1
+            self._documents[key] = copy.deepcopy(value)
+
+    def update(self, key: str, mutate: StateMutator) -> Dict[str, Any]:
+        with self._lock:
+            current = self._documents.get(key)
+            value = mutate(copy.deepcopy(current) if current is not None else None)
+            self.reads += 1
+            self.writes += 1
+            self._documents[key] = copy.deepcopy(value)
+            return copy.deepcopy(value)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**super().get_stats(), "documents": len(self._documents)}
+
+
+class SQLiteStateStore(StateStore):
+    """
+    State shared by every worker process through one SQLite file.
+
+    WAL mode lets readers proceed while a writer commits; updates take the
+    database write lock up front (BEGIN IMMEDIATE) and wait up to busy_timeout
+    for another worker's update to finish.
+    """
+
+    backend = BACKEND_SQLITE
+    blocking_io = True
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Autocommit mode: transactions are opened explicitly in update()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+        logger.info(f"🗃️ State store: SQLite at {path}")
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        self.reads += 1
+        return json.loads(row[0]) if row else None
+
+    def _write(self, key: str, value: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO state (key, value, updated_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False, default=str), time.time())
+        )
+        self.writes += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._read(key)
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._write(key, value)
+
+    def update(self, key: str, mutate: StateMutator) -> Dict[str, Any]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                value = mutate(self._read(key))
+                self._write(key, value)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return value
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**super().get_stats(), "path": self.path}
+
+
+def create_state_store(backend: str = BACKEND_MEMORY, path: Optional[str] = None) -> StateStore:
+    """
+    Build the configured backend.
+
+    Raises:
+        ValueError: Unknown backend, or sqlite without a path
+    """
+
+    if backend == BACKEND_MEMORY:
+        return InMemoryStateStore()
+    if backend == BACKEND_SQLITE:
+        if not path:
+            raise ValueError("The sqlite state store needs a database path")
+        return SQLiteStateStore(path)
+    raise ValueError(f"Unknown state store backend: {backend} (expected one of {', '.join(STATE_BACKENDS)})")
+
+
+# Shared by components built without an explicit store (scripts, tests)
+default_state_store = InMemoryStateStore()
+
+
+# Export the main helpers
+__all__ = ["StateStore", "InMemoryStateStore", "SQLiteStateStore", "create_state_store", "default_state_store",
+           "STATE_THEME_ROTATION", "STATE_CURRENT_THEME", "STATE_RECENT_MUSIC", "STATE_BACKENDS"]
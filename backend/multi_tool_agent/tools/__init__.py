@@ -24,6 +24,7 @@ VisionAIAnalyzer = None
 VisionAITool = None
 GeminiRecipeGenerator = None
 SimpleGeminiTool = None
+StreamingGeminiTool = None
 
 # Import core tools with proper error handling
 try:
@@ -53,7 +54,7 @@ except ImportError as e:
 # Handle Gemini imports - support both old and new versions
 # Try new SimpleGeminiTool first, then fall back to old GeminiRecipeGenerator
 try:
-    from .simple_gemini_tools import SimpleGeminiTool
+    from .simple_gemini_tools import SimpleGeminiTool, StreamingGeminiTool
     # Also try to import GeminiRecipeGenerator from the same file for compatibility
     try:
         from .simple_gemini_tools import GeminiRecipeGenerator
@@ -76,10 +77,30 @@ except ImportError as e1:
         logger.warning(f"⚠️ GeminiRecipeGenerator not available: {e2}")
         GeminiRecipeGenerator = None
 
-def initialize_all_tools() -> Dict[str, Any]:
+def initialize_all_tools(http_clients: Optional[Any] = None,
+                         youtube_search_cache: Optional[Any] = None,
+                         qloo_call_deadline_s: Optional[float] = None,
+                         qloo_insights_cache: Optional[Any] = None,
+                         gemini_response_cache: Optional[Any] = None,
+                         gemini_streaming: bool = False,
+                         rate_limiters: Optional[Dict[str, Any]] = None,
+                         circuit_breakers: Optional[Dict[str, Any]] = None,
+                         base_urls: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """
     Initialize all tools with graceful degradation for missing API keys.
     
+    Args:
+        http_clients: Optional HTTPClientRegistry; tools then share its pooled
+                      keep-alive clients instead of opening a client per call
+        youtube_search_cache: Optional YouTubeSearchCache for YouTube searches
+        qloo_call_deadline_s: Per-call deadline for Qloo's concurrent cultural calls
+        qloo_insights_cache: Optional QlooInsightsCache for Qloo insights responses
+        gemini_response_cache: Optional GeminiResponseCache for generated text
+        gemini_streaming: Use StreamingGeminiTool (streamGenerateContent for streamed dashboards)
+        rate_limiters: Optional UpstreamLimiter per upstream ("qloo", "gemini", "youtube", "vision")
+        circuit_breakers: Optional CircuitBreaker per upstream (same keys)
+        base_urls: Optional base-URL override per upstream (same keys), e.g. local fake services
+    
     Returns:
         Dictionary containing all successfully initialized tools
     """
@@ -87,6 +108,18 @@ def initialize_all_tools() -> Dict[str, Any]:
     
     tools = {}
     
+    def shared_client(name: str):
+        return http_clients.get(name) if http_clients else None
+    
+    def rate_limiter(name: str):
+        return rate_limiters.get(name) if rate_limiters else None
+    
+    def circuit_breaker(name: str):
+        return circuit_breakers.get(name) if circuit_breakers else None
+    
+    def base_url(name: str):
+        return base_urls.get(name) if base_urls else None
+    
     try:
         # Get API keys from environment
         qloo_api_key = os.getenv("QLOO_API_KEY")
@@ -97,7 +130,12 @@ def initialize_all_tools() -> Dict[str, Any]:
         # Initialize Qloo tool
         if qloo_api_key and QlooInsightsAPI:
             try:
-                tools["qloo_tool"] = QlooInsightsAPI(qloo_api_key)
+                tools["qloo_tool"] = QlooInsightsAPI(qloo_api_key, http_client=shared_client("qloo"),
+                                                  call_deadline_s=qloo_call_deadline_s,
+                                                  insights_cache=qloo_insights_cache,
+                                                  rate_limiter=rate_limiter("qloo"),
+                                                  circuit_breaker=circuit_breaker("qloo"),
+                                                  base_url=base_url("qloo"))
                 logger.info("✅ Qloo API tool initialized")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize Qloo tool: {e}")
@@ -109,7 +147,11 @@ def initialize_all_tools() -> Dict[str, Any]:
         # Initialize YouTube tool
         if youtube_api_key and YouTubeAPI:
             try:
-                tools["youtube_tool"] = YouTubeAPI(youtube_api_key)
+                tools["youtube_tool"] = YouTubeAPI(youtube_api_key, http_client=shared_client("youtube"),
+                                                   search_cache=youtube_search_cache,
+                                                   rate_limiter=rate_limiter("youtube"),
+                                                   circuit_breaker=circuit_breaker("youtube"),
+                                                   base_url=base_url("youtube"))
                 logger.info("✅ YouTube API tool initialized")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize YouTube tool: {e}")
@@ -121,7 +163,10 @@ def initialize_all_tools() -> Dict[str, Any]:
         # Initialize Vision AI tool
         if google_cloud_api_key and VisionAIAnalyzer:
             try:
-                tools["vision_ai_tool"] = VisionAIAnalyzer(google_cloud_api_key)
+                tools["vision_ai_tool"] = VisionAIAnalyzer(google_cloud_api_key, http_client=shared_client("vision"),
+                                                            rate_limiter=rate_limiter("vision"),
+                                                            circuit_breaker=circuit_breaker("vision"),
+                                                            base_url=base_url("vision"))
                 logger.info("✅ Vision AI tool initialized")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize Vision AI tool: {e}")
@@ -132,10 +177,16 @@ def initialize_all_tools() -> Dict[str, Any]:
         
         # Initialize Gemini tool - try both SimpleGeminiTool and GeminiRecipeGenerator
         gemini_tool_class = SimpleGeminiTool or GeminiRecipeGenerator
+        if gemini_streaming and StreamingGeminiTool:
+            gemini_tool_class = StreamingGeminiTool
         
         if gemini_api_key and gemini_tool_class:
             try:
-                tools["gemini_tool"] = gemini_tool_class(gemini_api_key)
+                tools["gemini_tool"] = gemini_tool_class(gemini_api_key, http_client=shared_client("gemini"),
+                                                         response_cache=gemini_response_cache,
+                                                         rate_limiter=rate_limiter("gemini"),
+                                                         circuit_breaker=circuit_breaker("gemini"),
+                                                         base_url=base_url("gemini"))
                 tool_name = gemini_tool_class.__name__
                 logger.info(f"✅ Gemini tool initialized ({tool_name})")
             except Exception as e:
@@ -296,6 +347,7 @@ __all__ = [
     "YouTubeAPI", 
     "VisionAIAnalyzer",
     "SimpleGeminiTool",
+    "StreamingGeminiTool",
     "GeminiRecipeGenerator",
     # Utility functions
     "initialize_tools",
@@ -8,19 +8,71 @@ PII COMPLIANCE:
 - All API calls use only demographic and cultural signals
 - Safe fallbacks ensure no PII exposure
 
+PERFORMANCE:
+- Artist and place insights calls run concurrently, each with its own deadline
+- A call that misses its deadline falls back on its own; the other keeps its live result
+- Optional two-tier insights cache (heritage maps to a handful of tags, so
+  most dashboards need no live Qloo call)
+
 """
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Awaitable, Callable
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
+from ..caching import canonical_hash
+from ..single_flight import SingleFlight
+from ..tracing import tracer, KIND_UPSTREAM, OUTCOME_FALLBACK
+from ..http_clients import pooled_client
+from ..rate_limiting import deadline_scope
+from ..circuit_breaker import guarded_request, CircuitOpenError
+
 logger = logging.getLogger(__name__)
 
+# Identical concurrent insights requests share one HTTP call (empty results are not reused in a scope)
+_insights_flight = SingleFlight("qloo", should_remember=lambda data: bool(data and data.get("results")))
+
+# Heritage keyword → tag tables, checked in order (PII-compliant: heritage only)
+HERITAGE_MUSIC_TAGS = [
+    (("italian", "italy"), "classical"),
+    (("german", "germany", "austrian", "austria"), "classical"),
+    (("french", "france"), "classical"),
+    (("russian", "russia"), "classical"),
+    (("polish", "poland"), "classical"),
+    (("irish", "ireland"), "folk"),
+    (("scottish", "scotland"), "folk"),
+    (("spanish", "spain"), "classical")
+]
+DEFAULT_MUSIC_TAG = "classical"  # Default to classical for seniors
+
+HERITAGE_CUISINE_TAGS = [
+    (("italian", "italy"), "italian"),
+    (("irish", "ireland"), "irish"),
+    (("german", "germany"), "german"),
+    (("french", "france"), "french"),
+    (("chinese", "china"), "chinese"),
+    (("mexican", "mexico"), "mexican"),
+    (("jewish",), "jewish"),
+    (("polish", "poland"), "polish"),
+    (("greek", "greece"), "greek"),
+    (("spanish", "spain"), "spanish")
+]
+DEFAULT_CUISINE_TAG = "american"  # Default fallback
+
+
+def _match_heritage_tag(cultural_heritage: str, table: List[Tuple[Tuple[str, ...], str]], default: str) -> str:
+    heritage_lower = cultural_heritage.lower()
+    for terms, tag in table:
+        if any(term in heritage_lower for term in terms):
+            return tag
+    return default
+
+
 class QlooInsightsAPI:
     """
     Complete Qloo API tool with increased timeouts and PII compliance.
@@ -28,9 +80,19 @@ class QlooInsightsAPI:
     PRIVACY: Only processes anonymized cultural_heritage and age_group data.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://hackathon.api.qloo.com"):
+    def __init__(self, api_key: str, base_url: Optional[str] = None,
+                 http_client: Optional["httpx.AsyncClient"] = None,
+                 call_deadline_s: Optional[float] = None,
+                 insights_cache: Optional[Any] = None,
+                 rate_limiter: Optional[Any] = None,
+                 circuit_breaker: Optional[Any] = None):
         self.api_key = api_key
-        self.base_url = base_url
+        self.base_url = base_url or "https://hackathon.api.qloo.com"
+        self.http_client = http_client  # Shared keep-alive pool (None = client per call)
+        self.call_deadline_s = call_deadline_s  # Per-call deadline in make_cultural_calls (None = HTTP timeout only)
+        self.insights_cache = insights_cache  # QlooInsightsCache (None = always call the API)
+        self.rate_limiter = rate_limiter  # UpstreamLimiter (None = no pacing or retries)
+        self.circuit_breaker = circuit_breaker  # CircuitBreaker (None = always call the API)
         self.headers = {
             "x-api-key": api_key,
             "Content-Type": "application/json"
@@ -56,45 +118,28 @@ class QlooInsightsAPI:
             return self._get_classical_fallback(cultural_heritage)
         
         try:
-            # PII-COMPLIANT PARAMETERS: Only cultural tags and age demographics
-            params = {
-                "filter.type": "urn:entity:artist",
-                "signal.interests.tags": music_tag,
-                "signal.demographics.age": age_group,
-                "take": take
-            }
+            params = self._classical_music_params(music_tag, age_group, gender, take)
+            data = await self._get_insights(params)
             
-            # Add gender demographic if provided (still PII-compliant)
-            if gender:
-                params["signal.demographics.gender"] = gender
-            
-            # TIMEOUT FIX: Increased from 15.0 to 60.0 seconds
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/v2/insights",
-                    params=params,
-                    headers=self.headers
-                )
-                
-                logger.info(f"HTTP Request: GET {self.base_url}/v2/insights?{response.url.query} \"{response.status_code} {response.reason_phrase}\"")
+            if data is not None:
+                entities = data.get("results", [])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    entities = data.get("results", [])
-                    
-                    logger.info(f"✅ PII-compliant safe classical music: {len(entities)} results")
-                    return {
-                        "success": True,
-                        "entities": entities,
-                        "entity_count": len(entities),
-                        "content_type": "classical_music",
-                        "heritage": cultural_heritage,
-                        "pii_compliant": True
-                    }
-                else:
-                    logger.error(f"❌ Qloo safe music error: {response.status_code}")
-                    return self._get_classical_fallback(cultural_heritage)
+                logger.info(f"✅ PII-compliant safe classical music: {len(entities)} results")
+                return {
+                    "success": True,
+                    "entities": entities,
+                    "entity_count": len(entities),
+                    "content_type": "classical_music",
+                    "heritage": cultural_heritage,
+                    "pii_compliant": True
+                }
+            else:
+                logger.error("❌ Qloo safe music error, using fallback")
+                return self._get_classical_fallback(cultural_heritage)
                     
+        except CircuitOpenError as e:
+            logger.warning(f"🔴 {e}, using PII-compliant fallback")
+            return self._get_classical_fallback(cultural_heritage)
         except Exception as e:
             logger.error(f"❌ Qloo safe music exception: {e}")
             return self._get_classical_fallback(cultural_heritage)
@@ -117,51 +162,103 @@ class QlooInsightsAPI:
             return self._get_tag_fallback(entity_type, tag)
         
         try:
-            # PII-COMPLIANT PARAMETERS: Only cultural tags and demographics
-            params = {
-                "filter.type": entity_type,
-                "signal.interests.tags": tag,
-                "signal.demographics.age": age_demographic,
-                "take": take
-            }
+            params = self._tag_insights_params(entity_type, tag, age_demographic, take)
+            data = await self._get_insights(params)
             
-            # TIMEOUT FIX: Increased from 15.0 to 60.0 seconds
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/v2/insights",
-                    params=params,
-                    headers=self.headers
-                )
+            if data is not None:
+                entities = data.get("results", [])
                 
-                logger.info(f"HTTP Request: GET {self.base_url}/v2/insights?{response.url.query} \"{response.status_code} {response.reason_phrase}\"")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    entities = data.get("results", [])
-                    
-                    logger.info(f"✅ PII-compliant tag insights success: {len(entities)} results")
-                    return {
-                        "success": True,
-                        "entities": entities,
-                        "entity_count": len(entities),
-                        "tag": tag,
-                        "entity_type": entity_type,
-                        "content_type": f"{entity_type}_{tag}",
-                        "pii_compliant": True
-                    }
-                else:
-                    logger.error(f"❌ Tag insights error: {response.status_code}")
-                    return self._get_tag_fallback(entity_type, tag)
+                logger.info(f"✅ PII-compliant tag insights success: {len(entities)} results")
+                return {
+                    "success": True,
+                    "entities": entities,
+                    "entity_count": len(entities),
+                    "tag": tag,
+                    "entity_type": entity_type,
+                    "content_type": f"{entity_type}_{tag}",
+                    "pii_compliant": True
+                }
+            else:
+                logger.error("❌ Tag insights error, using fallback")
+                return self._get_tag_fallback(entity_type, tag)
                     
+        except CircuitOpenError as e:
+            logger.warning(f"🔴 {e}, using PII-compliant fallback")
+            return self._get_tag_fallback(entity_type, tag)
         except Exception as e:
             logger.error(f"❌ Tag insights exception: {e}")
             return self._get_tag_fallback(entity_type, tag)
     
+    async def prefetch_insights(self, params: Dict[str, Any]) -> bool:
+        """
+        Fetch one insights request live and store it in the insights cache.
+        
+        Returns:
+            True if a response was fetched and cached
+        """
+        
+        data = await self._get_insights(params, refresh=True)
+        return data is not None and bool(data.get("results"))
+    
+    async def _get_insights(self, params: Dict[str, Any], refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        GET /v2/insights through the insights cache, coalescing identical
+        concurrent requests.
+        
+        Args:
+            params: Insights query parameters
+            refresh: Skip the cache read (still stores the fresh response)
+        
+        Returns:
+            Parsed response JSON, or None on a non-200 response
+        """
+        
+        if self.insights_cache is not None and not refresh:
+            cached = await self.insights_cache.aget(self.base_url, params)
+            if cached is not None:
+                logger.info(f"🗃️ Qloo insights cache hit: {params.get('filter.type')} / {params.get('signal.interests.tags')}")
+                return cached
+        
+        key = canonical_hash({"url": f"{self.base_url}/v2/insights", "params": params})
+        data = await _insights_flight.do(key, lambda: self._fetch_insights(params))
+        
+        if self.insights_cache is not None:
+            self.insights_cache.put(self.base_url, params, data)
+        return data
+    
+    async def _fetch_insights(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Single HTTP call to the insights endpoint"""
+        
+        async with tracer.span("qloo.insights", KIND_UPSTREAM, entity_type=params.get("filter.type", "")) as span:
+            # TIMEOUT FIX: Increased from 15.0 to 60.0 seconds
+            async with pooled_client(self.http_client) as client:
+                response = await guarded_request(self.circuit_breaker, self.rate_limiter, lambda: client.get(
+                    f"{self.base_url}/v2/insights",
+                    params=params,
+                    headers=self.headers,
+                    timeout=60.0
+                ))
+            
+            logger.info(f"HTTP Request: GET {self.base_url}/v2/insights?{response.url.query} \"{response.status_code} {response.reason_phrase}\"")
+            span.set_attribute("http.status_code", response.status_code)
+            span.set_payload(response.content)
+            
+            if response.status_code == 200:
+                return response.json()
+            
+            logger.error(f"❌ Qloo insights error: {response.status_code}")
+            span.set_outcome(OUTCOME_FALLBACK)
+            return None
+    
     async def make_cultural_calls(self, cultural_heritage: str, age_group: str = "55_and_older") -> Dict[str, Any]:
         """
         Make both cultural calls (artists + places) for Agent 3.
         PII-COMPLIANT: Only uses anonymized cultural_heritage and age_group data.
         Core method that Agent 3 relies on.
+        
+        The calls run concurrently, so latency is the slower call rather than
+        the sum. Calls past call_deadline_s fall back individually and are
+        listed in "timed_out_calls".
         """
         
         logger.info(f"🎯 Making PII-compliant cultural calls for: {cultural_heritage} (age group: {age_group})")
@@ -172,73 +269,71 @@ class QlooInsightsAPI:
             "total_results": 0,
             "heritage": cultural_heritage,
             "age_group": age_group,
+            "timed_out_calls": [],
             "pii_compliant": True
         }
         
+        # Artists and places are independent: issue both at once, each with its own deadline
+        cuisine_tag = self._get_heritage_cuisine_tag(cultural_heritage)
+        artists_outcome, places_outcome = await asyncio.gather(
+            self._with_deadline(self.get_safe_classical_music(cultural_heritage, age_group=age_group, take=10)),
+            self._with_deadline(self.get_tag_based_insights("urn:entity:place", cuisine_tag, age_demographic=age_group, take=10)),
+            return_exceptions=True
+        )
+        
         # Get classical music artists (PII-compliant)
-        try:
-            artists_result = await self.get_safe_classical_music(cultural_heritage, age_group=age_group, take=10)
-            if artists_result.get("success"):
-                results["cultural_recommendations"]["artists"] = artists_result
-                results["successful_calls"] += 1
-                results["total_results"] += artists_result.get("entity_count", 0)
-                logger.info(f"✅ PII-compliant artists call: {artists_result.get('entity_count')} results")
-            else:
-                logger.warning("⚠️ Artists call failed, using PII-compliant fallback")
-        except Exception as e:
-            logger.error(f"❌ Artists call exception: {e}")
-            # Add PII-compliant fallback
-            fallback_artists = self._get_classical_fallback(cultural_heritage)
-            results["cultural_recommendations"]["artists"] = fallback_artists
+        self._merge_call_result(results, "artists", artists_outcome,
+                                lambda: self._get_classical_fallback(cultural_heritage))
         
         # Get cuisine places (PII-compliant)
-        try:
-            cuisine_tag = self._get_heritage_cuisine_tag(cultural_heritage)
-            places_result = await self.get_tag_based_insights("urn:entity:place", cuisine_tag, age_demographic=age_group, take=10)
-            if places_result.get("success"):
-                results["cultural_recommendations"]["places"] = places_result
-                results["successful_calls"] += 1
-                results["total_results"] += places_result.get("entity_count", 0)
-                logger.info(f"✅ PII-compliant places call: {places_result.get('entity_count')} results")
-            else:
-                logger.warning("⚠️ Places call failed, using PII-compliant fallback")
-        except Exception as e:
-            logger.error(f"❌ Places call exception: {e}")
-            # Add PII-compliant fallback
-            cuisine_tag = self._get_heritage_cuisine_tag(cultural_heritage)
-            fallback_places = self._get_cuisine_fallback(cuisine_tag)
-            results["cultural_recommendations"]["places"] = fallback_places
+        self._merge_call_result(results, "places", places_outcome,
+                                lambda: self._get_cuisine_fallback(cuisine_tag))
         
         logger.info(f"🎯 PII-compliant cultural calls completed: {results['successful_calls']}/2 successful")
         return results
     
+    async def _with_deadline(self, call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Await one insights call, raising asyncio.TimeoutError past call_deadline_s"""
+        
+        if not self.call_deadline_s:
+            return await call
+        # Rate-limit waits and retries inside the call stop at the same deadline
+        with deadline_scope(self.call_deadline_s):
+            return await asyncio.wait_for(call, timeout=self.call_deadline_s)
+    
+    def _merge_call_result(self, results: Dict[str, Any], name: str, outcome: Any,
+                           fallback: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Add one call's outcome to the make_cultural_calls() results.
+        
+        A call that raised or missed its deadline gets its PII-compliant
+        fallback, so the other call's live result is still used.
+        """
+        
+        if isinstance(outcome, BaseException):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"⏱️ {name.title()} call missed its {self.call_deadline_s}s deadline, using PII-compliant fallback")
+                results["timed_out_calls"].append(name)
+            else:
+                logger.error(f"❌ {name.title()} call exception: {outcome}")
+            results["cultural_recommendations"][name] = fallback()
+            return
+        
+        if outcome.get("success"):
+            results["cultural_recommendations"][name] = outcome
+            results["successful_calls"] += 1
+            results["total_results"] += outcome.get("entity_count", 0)
+            logger.info(f"✅ PII-compliant {name} call: {outcome.get('entity_count')} results")
+        else:
+            logger.warning(f"⚠️ {name.title()} call failed, using PII-compliant fallback")
+    
     def _get_heritage_music_tag(self, cultural_heritage: str) -> str:
         """
         Map cultural heritage to music tag.
         PII-COMPLIANT: Only processes cultural heritage (anonymized field).
         """
         
-        heritage_lower = cultural_heritage.lower()
-        
-        # Heritage-based mappings for classical music (PII-compliant)
-        if any(term in heritage_lower for term in ["italian", "italy"]):
-            return "classical"
-        elif any(term in heritage_lower for term in ["german", "germany", "austrian", "austria"]):
-            return "classical"
-        elif any(term in heritage_lower for term in ["french", "france"]):
-            return "classical"
-        elif any(term in heritage_lower for term in ["russian", "russia"]):
-            return "classical"
-        elif any(term in heritage_lower for term in ["polish", "poland"]):
-            return "classical"
-        elif any(term in heritage_lower for term in ["irish", "ireland"]):
-            return "folk"
-        elif any(term in heritage_lower for term in ["scottish", "scotland"]):
-            return "folk"
-        elif any(term in heritage_lower for term in ["spanish", "spain"]):
-            return "classical"
-        else:
-            return "classical"  # Default to classical for seniors
+        return _match_heritage_tag(cultural_heritage, HERITAGE_MUSIC_TAGS, DEFAULT_MUSIC_TAG)
     
     def _get_heritage_cuisine_tag(self, cultural_heritage: str) -> str:
         """
@@ -246,30 +341,53 @@ class QlooInsightsAPI:
         PII-COMPLIANT: Only processes cultural heritage (anonymized field).
         """
         
-        heritage_lower = cultural_heritage.lower()
+        return _match_heritage_tag(cultural_heritage, HERITAGE_CUISINE_TAGS, DEFAULT_CUISINE_TAG)
+    
+    def get_prefetch_requests(self, age_groups: List[str]) -> List[Dict[str, Any]]:
+        """
+        Every distinct insights parameter set make_cultural_calls() can send.
         
-        if any(term in heritage_lower for term in ["italian", "italy"]):
-            return "italian"
-        elif any(term in heritage_lower for term in ["irish", "ireland"]):
-            return "irish"
-        elif any(term in heritage_lower for term in ["german", "germany"]):
-            return "german"
-        elif any(term in heritage_lower for term in ["french", "france"]):
-            return "french"
-        elif any(term in heritage_lower for term in ["chinese", "china"]):
-            return "chinese"
-        elif any(term in heritage_lower for term in ["mexican", "mexico"]):
-            return "mexican"
-        elif any(term in heritage_lower for term in ["jewish"]):
-            return "jewish"
-        elif any(term in heritage_lower for term in ["polish", "poland"]):
-            return "polish"
-        elif any(term in heritage_lower for term in ["greek", "greece"]):
-            return "greek"
-        elif any(term in heritage_lower for term in ["spanish", "spain"]):
-            return "spanish"
-        else:
-            return "american"  # Default fallback
+        Covers the full music and cuisine tag vocabulary for each age group,
+        so prefetching these warms the cache for any heritage.
+        """
+        
+        music_tags = sorted({tag for _, tag in HERITAGE_MUSIC_TAGS} | {DEFAULT_MUSIC_TAG})
+        cuisine_tags = sorted({tag for _, tag in HERITAGE_CUISINE_TAGS} | {DEFAULT_CUISINE_TAG})
+        
+        requests = []
+        for age_group in age_groups:
+            requests.extend(self._classical_music_params(tag, age_group) for tag in music_tags)
+            requests.extend(self._tag_insights_params("urn:entity:place", tag, age_group) for tag in cuisine_tags)
+        return requests
+    
+    def _classical_music_params(self, music_tag: str, age_group: str, gender: Optional[str] = None,
+                                take: int = 10) -> Dict[str, Any]:
+        """Insights parameters of get_safe_classical_music()"""
+        
+        # PII-COMPLIANT PARAMETERS: Only cultural tags and age demographics
+        params = {
+            "filter.type": "urn:entity:artist",
+            "signal.interests.tags": music_tag,
+            "signal.demographics.age": age_group,
+            "take": take
+        }
+        
+        # Add gender demographic if provided (still PII-compliant)
+        if gender:
+            params["signal.demographics.gender"] = gender
+        return params
+    
+    def _tag_insights_params(self, entity_type: str, tag: str, age_demographic: str,
+                             take: int = 10) -> Dict[str, Any]:
+        """Insights parameters of get_tag_based_insights()"""
+        
+        # PII-COMPLIANT PARAMETERS: Only cultural tags and demographics
+        return {
+            "filter.type": entity_type,
+            "signal.interests.tags": tag,
+            "signal.demographics.age": age_demographic,
+            "take": take
+        }
     
     def _get_classical_fallback(self, cultural_heritage: str) -> Dict[str, Any]:
         """
@@ -6,20 +6,43 @@ Features:
 - Enhanced generate_nostalgia_newsletter method with PII compliance
 - Clear guidelines for dementia care content without personal information
 - Returns FLAT content structure that frontend expects
+- Optional content-addressed response cache (per-method TTLs, fresh=True opts out)
+- Combined dashboard generation: photo description, photo starters and all
+  nostalgia sections in one call (one guidelines preamble instead of three)
+- StreamingGeminiTool: streamGenerateContent variant that yields text chunks
+  and reports structured JSON sections as soon as each one is complete
 """
 
 import asyncio
 import logging
 import json
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Callable, AsyncIterator
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
+from ..caching import canonical_hash
+from ..single_flight import SingleFlight
+from ..tracing import tracer, KIND_UPSTREAM, OUTCOME_FALLBACK
+from ..http_clients import pooled_client
+from ..circuit_breaker import guarded_request
+from ..json_stream import IncrementalJSONSections
+from ..gemini_cache import (
+    gemini_cache_key, METHOD_GENERATE_CONTENT, METHOD_STRUCTURED_JSON, METHOD_NEWSLETTER,
+    METHOD_DASHBOARD_CONTENT
+)
+
 logger = logging.getLogger(__name__)
 
+# Identical concurrent generateContent requests share one HTTP call
+_generate_flight = SingleFlight("gemini")
+
+# Called as on_section(name, value) when a top-level JSON section is complete
+SectionCallback = Callable[[str, Any], None]
+
 class SimpleGeminiTool:
     """
     Simple Gemini AI tool for content generation.
@@ -27,9 +50,16 @@ class SimpleGeminiTool:
     FIXED: Added PII-compliant newsletter tone guidance for nostalgia content.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional["httpx.AsyncClient"] = None,
+                 response_cache: Optional[Any] = None, rate_limiter: Optional[Any] = None,
+                 circuit_breaker: Optional[Any] = None, base_url: Optional[str] = None):
         self.api_key = api_key
-        self.base_url = "https://generativelanguage.googleapis.com/v1beta"
+        self.base_url = base_url or "https://generativelanguage.googleapis.com/v1beta"
+        self.http_client = http_client  # Shared keep-alive pool (None = client per call)
+        self.response_cache = response_cache  # GeminiResponseCache (None = always call the API)
+        self.rate_limiter = rate_limiter  # UpstreamLimiter (None = no pacing or retries)
+        self.circuit_breaker = circuit_breaker  # CircuitBreaker (None = always call the API)
+        self.model = "gemini-1.5-flash"
         
         # Bias prevention for dementia care with PII compliance
         self.bias_prevention_rules = """
@@ -71,9 +101,14 @@ class SimpleGeminiTool:
         
         logger.info("Simple Gemini tool initialized with PII-compliant newsletter tone guidance")
     
-    async def generate_content(self, prompt: str, max_tokens: int = 800) -> Optional[str]:
+    async def generate_content(self, prompt: str, max_tokens: int = 800, fresh: bool = False) -> Optional[str]:
         """
         Generate content using Gemini with bias prevention and PII compliance.
+        
+        Args:
+            prompt: Task prompt
+            max_tokens: maxOutputTokens
+            fresh: Skip the response cache read and generate new text
         """
         
         if not httpx:
@@ -81,51 +116,9 @@ class SimpleGeminiTool:
             return None
         
         try:
-            # Add bias prevention and PII compliance to every prompt
-            full_prompt = f"{self.bias_prevention_rules}\n\nTASK:\n{prompt}"
-            
-            payload = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "text": full_prompt
-                            }
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": 0.7,
-                    "topK": 40,
-                    "topP": 0.95,
-                    "maxOutputTokens": max_tokens,
-                    "candidateCount": 1
-                }
-            }
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            url = f"{self.base_url}/models/gemini-1.5-flash:generateContent?key={self.api_key}"
+            payload = self._content_payload(prompt, max_tokens)
             
-            # Increased timeout for reliability
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if "candidates" in result and len(result["candidates"]) > 0:
-                        content = result["candidates"][0]["content"]["parts"][0]["text"]
-                        logger.info("✅ Gemini content generated successfully")
-                        return content.strip()
-                    else:
-                        logger.error("❌ No content in Gemini response")
-                        return None
-                else:
-                    logger.error(f"❌ Gemini API error: {response.status_code}")
-                    return None
+            return await self._cached_generate(METHOD_GENERATE_CONTENT, payload, fresh, self._parse_text)
                     
         except httpx.TimeoutException:
             logger.error("❌ Gemini API timeout")
@@ -134,10 +127,12 @@ class SimpleGeminiTool:
             logger.error(f"❌ Gemini content generation failed: {e}")
             return None
     
-    async def generate_structured_json(self, prompt: str, json_schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def generate_structured_json(self, prompt: str, json_schema: Dict[str, Any],
+                                       fresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Generate structured JSON response using Gemini with PII compliance.
         Enhanced for better parsing and error handling.
+        Pass fresh=True to skip the response cache read.
         """
         
         if not httpx:
@@ -190,64 +185,7 @@ class SimpleGeminiTool:
                 }
             }
             
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            url = f"{self.base_url}/models/gemini-1.5-flash:generateContent?key={self.api_key}"
-            
-            # Increased timeout for reliability
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if "candidates" in result and len(result["candidates"]) > 0:
-                        content = result["candidates"][0]["content"]["parts"][0]["text"]
-                        
-                        # Enhanced JSON parsing
-                        try:
-                            # Clean up the response more thoroughly
-                            content = content.strip()
-                            
-                            # Remove markdown code blocks
-                            if content.startswith("```json"):
-                                content = content[7:]
-                            elif content.startswith("```"):
-                                content = content[3:]
-                            
-                            if content.endswith("```"):
-                                content = content[:-3]
-                            
-                            # Remove any leading/trailing whitespace again
-                            content = content.strip()
-                            
-                            # Try to find JSON boundaries if mixed with other text
-                            if not content.startswith('{'):
-                                start_idx = content.find('{')
-                                if start_idx != -1:
-                                    content = content[start_idx:]
-                            
-                            if not content.endswith('}'):
-                                end_idx = content.rfind('}')
-                                if end_idx != -1:
-                                    content = content[:end_idx + 1]
-                            
-                            parsed_json = json.loads(content)
-                            logger.info("✅ Gemini structured JSON generated successfully")
-                            return parsed_json
-                            
-                        except json.JSONDecodeError as e:
-                            logger.error(f"❌ Failed to parse Gemini JSON: {e}")
-                            logger.error(f"Raw response: {content[:500]}...")
-                            return None
-                    else:
-                        logger.error("❌ No content in Gemini response")
-                        return None
-                else:
-                    logger.error(f"❌ Gemini API error: {response.status_code}")
-                    return None
+            return await self._cached_generate(METHOD_STRUCTURED_JSON, payload, fresh, self._parse_structured_json)
                     
         except httpx.TimeoutException:
             logger.error("❌ Gemini structured generation timeout")
@@ -256,10 +194,12 @@ class SimpleGeminiTool:
             logger.error(f"❌ Gemini structured generation failed: {e}")
             return None
     
-    async def generate_nostalgia_newsletter(self, prompt: str, json_schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def generate_nostalgia_newsletter(self, prompt: str, json_schema: Dict[str, Any],
+                                            fresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Generate nostalgia newsletter content with PII-compliant tone guidance.
         This method provides specific guidance for newsletter-style content.
+        Pass fresh=True to skip the response cache read.
         
         CRITICAL: Returns FLAT content structure that frontend expects.
         """
@@ -270,146 +210,375 @@ class SimpleGeminiTool:
         
         try:
             # Create newsletter-specific prompt with PII-compliant tone guidance
-            schema_str = json.dumps(json_schema, indent=2)
-            full_prompt = f"""
-            {self.bias_prevention_rules}
+            payload = self._newsletter_payload(prompt, json_schema)
             
-            {self.newsletter_tone_rules}
+            return await self._cached_generate(METHOD_NEWSLETTER, payload, fresh, self._parse_newsletter_json)
+                    
+        except httpx.TimeoutException:
+            logger.error("❌ Gemini newsletter generation timeout")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Gemini newsletter generation failed: {e}")
+            return None
+    
+    async def generate_dashboard_content(self, prompt: str, json_schema: Dict[str, Any],
+                                         fresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Generate every Gemini-written dashboard section in one structured response.
+        
+        The photo description, photo conversation starters and the nostalgia
+        newsletter sections share one guidelines preamble. Callers split the
+        result back into the per-agent outputs and keep the per-agent methods
+        as the fallback. Pass fresh=True to skip the response cache read.
+        """
+        
+        if not httpx:
+            logger.warning("⚠️ httpx not available for Gemini API")
+            return None
+        
+        try:
+            payload = self._dashboard_content_payload(prompt, json_schema)
             
-            TASK: {prompt}
+            return await self._cached_generate(METHOD_DASHBOARD_CONTENT, payload, fresh, self._parse_dashboard_json)
+                    
+        except httpx.TimeoutException:
+            logger.error("❌ Gemini combined dashboard generation timeout")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Gemini combined dashboard generation failed: {e}")
+            return None
+    
+    def _content_payload(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """generateContent payload for generate_content()"""
+        
+        # Add bias prevention and PII compliance to every prompt
+        full_prompt = f"{self.bias_prevention_rules}\n\nTASK:\n{prompt}"
+        
+        payload = {
+            "contents": [
+                {
+                    "parts": [
+                        {
+                            "text": full_prompt
+                        }
+                    ]
+                }
+            ],
+            "generationConfig": {
+                "temperature": 0.7,
+                "topK": 40,
+                "topP": 0.95,
+                "maxOutputTokens": max_tokens,
+                "candidateCount": 1
+            }
+        }
+        
+        return payload
+    
+    def _newsletter_payload(self, prompt: str, json_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """generateContent payload for generate_nostalgia_newsletter()"""
+        
+        schema_str = json.dumps(json_schema, indent=2)
+        full_prompt = f"""
+        {self.bias_prevention_rules}
+        
+        {self.newsletter_tone_rules}
+        
+        TASK: {prompt}
+        
+        NEWSLETTER CONTENT REQUIREMENTS (PII-COMPLIANT):
+        - Write in friendly newsletter style for caregivers to read aloud to patients
+        - ABSOLUTELY NEVER use patient names anywhere in the content
+        - ABSOLUTELY NEVER use Friend as a substitute for patient names anywhere in the content
+        - NEVER use personal pronouns like "you" or "your" - use general terms
+        - Use simple, warm language that flows naturally when spoken
+        - Include interesting historical facts with specific years when appropriate
+        - Use engaging phrases like "Remember when..." or "In those days..." or "Back in [year]..."
+        - Make it sound like friendly news from the past
+        - Focus on positive cultural memories and traditions
+        - Each section should be 2-3 sentences that sound conversational
+        - Include specific historical details that are accurate and interesting
+        - Create content that any caregiver could read to any patient
+        - Avoid assumptions about the listener's personal experiences
+        
+        SECTION REQUIREMENTS:
+        - For memory spotlight: include historical facts that would resonate with seniors (no war, killing, or negative topics)
+        - For era highlights: focus on positive cultural moments from the 1940s-1960s
+        - For heritage traditions: include information about both American and the identified culture
+        - For conversation starters: create open-ended questions that don't assume personal experiences
+        
+        FLAT CONTENT STRUCTURE CRITICAL:
+        - Each section should return a simple STRING, not nested objects
+        - Do NOT create nested content structures
+        - The frontend expects flat string content for each section
+        
+        TONE EXAMPLES:
+        - "Back in 1947, Percy Spencer discovered the microwave oven by accident while working with radar technology. It took until the 1970s for these amazing appliances to become common in American kitchens!"
+        - "Remember those wonderful Sunday afternoon drives? In the 1950s, families would pile into their cars just to see the countryside and stop for ice cream along the way."
+        
+        RESPONSE FORMAT: Return ONLY valid JSON that matches this exact schema:
+        {schema_str}
+        
+        CRITICAL: 
+        - Return ONLY the JSON, no additional text
+        - Each section must be a FLAT STRING (not nested objects)
+        - Content should sound natural when read aloud
+        - Use warm, conversational tone throughout
+        - Include cultural and historical context where appropriate
+        - NEVER use personal names or specific personal references
+        """
+        
+        payload = {
+            "contents": [
+                {
+                    "parts": [
+                        {
+                            "text": full_prompt
+                        }
+                    ]
+                }
+            ],
+            "generationConfig": {
+                "temperature": 0.4,  # Slightly higher for creative newsletter tone
+                "topK": 25,
+                "topP": 0.85,
+                "maxOutputTokens": 1600,  # More tokens for rich newsletter content
+                "candidateCount": 1
+            }
+        }
+        
+        return payload
+    
+    def _dashboard_content_payload(self, prompt: str, json_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """generateContent payload for generate_dashboard_content()"""
+        
+        schema_str = json.dumps(json_schema, indent=2)
+        full_prompt = f"""
+        {self.bias_prevention_rules}
+        
+        {self.newsletter_tone_rules}
+        
+        TASK: {prompt}
+        
+        PHOTO DESCRIPTION REQUIREMENTS:
+        - Convert the technical photo description into 3-4 short, warm sentences
+        - Use very simple, everyday words; mention colors, people and familiar things
+        - Avoid technical photography terms and prefacing text like "Here's a description"
+        
+        PHOTO CONVERSATION STARTER REQUIREMENTS:
+        - 3 simple, positive, memory-focused questions connected to the photo
+        - Culturally sensitive to the stated heritage
+        - Use inclusive language ("families enjoyed" rather than "you enjoyed")
+        
+        NEWSLETTER SECTION REQUIREMENTS:
+        - For memory spotlight: include historical facts that would resonate with seniors (no war, killing, or negative topics)
+        - For era highlights: focus on positive cultural moments from the 1940s-1960s
+        - For heritage traditions: include information about both American and the identified culture
+        - For conversation starters: create open-ended questions that don't assume personal experiences
+        - Each section should be 2-3 sentences that sound conversational
+        
+        RESPONSE FORMAT: Return ONLY valid JSON that matches this exact schema:
+        {schema_str}
+        
+        CRITICAL:
+        - Return ONLY the JSON, no additional text
+        - Every text section must be a FLAT STRING (not nested objects)
+        - NEVER use personal names or specific personal references
+        """
+        
+        payload = {
+            "contents": [
+                {
+                    "parts": [
+                        {
+                            "text": full_prompt
+                        }
+                    ]
+                }
+            ],
+            "generationConfig": {
+                "temperature": 0.4,
+                "topK": 25,
+                "topP": 0.85,
+                "maxOutputTokens": 2200,  # Room for the photo and newsletter sections together
+                "candidateCount": 1
+            }
+        }
+        
+        return payload
+    
+    async def _cached_generate(self, method: str, payload: Dict[str, Any], fresh: bool,
+                               parse: Callable[[str], Optional[Any]]) -> Optional[Any]:
+        """
+        Generate and parse a response through the response cache.
+        
+        Only successfully parsed results are stored, so a malformed response
+        is never replayed. fresh=True skips the read but refreshes the entry.
+        """
+        
+        key = gemini_cache_key(self.model, payload)
+        
+        if self.response_cache is not None:
+            if fresh:
+                self.response_cache.record_fresh(method)
+            else:
+                cached = await self.response_cache.aget(method, key)
+                if cached is not None:
+                    logger.info(f"🧠 Gemini cache hit ({method})")
+                    return cached
+        
+        content = await self._generate(payload)
+        if content is None:
+            return None
+        
+        result = parse(content)
+        if result is not None and self.response_cache is not None:
+            self.response_cache.put(method, key, result)
+        return result
+    
+    def _parse_text(self, content: str) -> Optional[str]:
+        """Plain text result of generate_content()"""
+        
+        logger.info("✅ Gemini content generated successfully")
+        return content.strip()
+    
+    def _parse_structured_json(self, content: str) -> Optional[Dict[str, Any]]:
+        """JSON result of generate_structured_json()"""
+        
+        try:
+            parsed_json = self._extract_json(content)
+            logger.info("✅ Gemini structured JSON generated successfully")
+            return parsed_json
             
-            NEWSLETTER CONTENT REQUIREMENTS (PII-COMPLIANT):
-            - Write in friendly newsletter style for caregivers to read aloud to patients
-            - ABSOLUTELY NEVER use patient names anywhere in the content
-            - ABSOLUTELY NEVER use Friend as a substitute for patient names anywhere in the content
-            - NEVER use personal pronouns like "you" or "your" - use general terms
-            - Use simple, warm language that flows naturally when spoken
-            - Include interesting historical facts with specific years when appropriate
-            - Use engaging phrases like "Remember when..." or "In those days..." or "Back in [year]..."
-            - Make it sound like friendly news from the past
-            - Focus on positive cultural memories and traditions
-            - Each section should be 2-3 sentences that sound conversational
-            - Include specific historical details that are accurate and interesting
-            - Create content that any caregiver could read to any patient
-            - Avoid assumptions about the listener's personal experiences
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse Gemini JSON: {e}")
+            logger.error(f"Raw response: {content[:500]}...")
+            return None
+    
+    def _parse_newsletter_json(self, content: str) -> Optional[Dict[str, Any]]:
+        """Flat JSON result of generate_nostalgia_newsletter()"""
+        
+        try:
+            parsed_json = self._extract_json(content)
             
-            SECTION REQUIREMENTS:
-            - For memory spotlight: include historical facts that would resonate with seniors (no war, killing, or negative topics)
-            - For era highlights: focus on positive cultural moments from the 1940s-1960s
-            - For heritage traditions: include information about both American and the identified culture
-            - For conversation starters: create open-ended questions that don't assume personal experiences
+            # Validate that we have flat content structure
+            for key, value in parsed_json.items():
+                if key != "conversation_starters" and isinstance(value, dict):
+                    logger.warning(f"⚠️ Section {key} has nested structure, should be flat string")
+                    return None
             
-            FLAT CONTENT STRUCTURE CRITICAL:
-            - Each section should return a simple STRING, not nested objects
-            - Do NOT create nested content structures
-            - The frontend expects flat string content for each section
+            logger.info("✅ Gemini newsletter content generated successfully with flat structure")
+            return parsed_json
             
-            TONE EXAMPLES:
-            - "Back in 1947, Percy Spencer discovered the microwave oven by accident while working with radar technology. It took until the 1970s for these amazing appliances to become common in American kitchens!"
-            - "Remember those wonderful Sunday afternoon drives? In the 1950s, families would pile into their cars just to see the countryside and stop for ice cream along the way."
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse Gemini newsletter JSON: {e}")
+            logger.error(f"Raw response: {content[:500]}...")
+            return None
+    
+    def _parse_dashboard_json(self, content: str) -> Optional[Dict[str, Any]]:
+        """Flat JSON result of generate_dashboard_content()"""
+        
+        try:
+            parsed_json = self._extract_json(content)
+            if not isinstance(parsed_json, dict):
+                logger.warning("⚠️ Combined dashboard response is not a JSON object")
+                return None
             
-            RESPONSE FORMAT: Return ONLY valid JSON that matches this exact schema:
-            {schema_str}
+            for key, value in parsed_json.items():
+                if isinstance(value, dict):
+                    logger.warning(f"⚠️ Section {key} has nested structure, should be flat")
+                    return None
             
-            CRITICAL: 
-            - Return ONLY the JSON, no additional text
-            - Each section must be a FLAT STRING (not nested objects)
-            - Content should sound natural when read aloud
-            - Use warm, conversational tone throughout
-            - Include cultural and historical context where appropriate
-            - NEVER use personal names or specific personal references
-            """
+            if parsed_json.get("photo_description"):
+                parsed_json["photo_description"] = self._clean_description(parsed_json["photo_description"])
             
-            payload = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "text": full_prompt
-                            }
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": 0.4,  # Slightly higher for creative newsletter tone
-                    "topK": 25,
-                    "topP": 0.85,
-                    "maxOutputTokens": 1600,  # More tokens for rich newsletter content
-                    "candidateCount": 1
-                }
-            }
+            logger.info("✅ Gemini combined dashboard content generated successfully")
+            return parsed_json
             
-            headers = {
-                "Content-Type": "application/json"
-            }
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse Gemini combined dashboard JSON: {e}")
+            logger.error(f"Raw response: {content[:500]}...")
+            return None
+    
+    def _extract_json(self, content: str) -> Any:
+        """
+        Enhanced JSON parsing: strip markdown fences and surrounding text.
+        
+        Raises:
+            json.JSONDecodeError: If no valid JSON remains
+        """
+        
+        # Clean up the response more thoroughly
+        content = content.strip()
+        
+        # Remove markdown code blocks
+        if content.startswith("```json"):
+            content = content[7:]
+        elif content.startswith("```"):
+            content = content[3:]
+        
+        if content.endswith("```"):
+            content = content[:-3]
+        
+        # Remove any leading/trailing whitespace again
+        content = content.strip()
+        
+        # Try to find JSON boundaries if mixed with other text
+        if not content.startswith('{'):
+            start_idx = content.find('{')
+            if start_idx != -1:
+                content = content[start_idx:]
+        
+        if not content.endswith('}'):
+            end_idx = content.rfind('}')
+            if end_idx != -1:
+                content = content[:end_idx + 1]
+        
+        return json.loads(content)
+    
+    async def _generate(self, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        POST generateContent, coalescing identical concurrent requests.
+        
+        Returns:
+            Text of the first candidate, or None on an error response / empty result
+        """
+        
+        key = canonical_hash({"model": self.model, "payload": payload})
+        return await _generate_flight.do(key, lambda: self._post_generate(payload))
+    
+    async def _post_generate(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Single HTTP call to the generateContent endpoint"""
+        
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        url = f"{self.base_url}/models/{self.model}:generateContent?key={self.api_key}"
+        
+        async with tracer.span("gemini.generate_content", KIND_UPSTREAM, model=self.model) as span:
+            # Increased timeout for reliability
+            async with pooled_client(self.http_client) as client:
+                response = await guarded_request(
+                    self.circuit_breaker, self.rate_limiter,
+                    lambda: client.post(url, json=payload, headers=headers, timeout=90.0)
+                )
             
-            url = f"{self.base_url}/models/gemini-1.5-flash:generateContent?key={self.api_key}"
+            span.set_attribute("http.status_code", response.status_code)
+            span.set_payload(response.content)
             
-            # Increased timeout for reliability
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if "candidates" in result and len(result["candidates"]) > 0:
-                        content = result["candidates"][0]["content"]["parts"][0]["text"]
-                        
-                        # Enhanced JSON parsing
-                        try:
-                            # Clean up the response more thoroughly
-                            content = content.strip()
-                            
-                            # Remove markdown code blocks
-                            if content.startswith("```json"):
-                                content = content[7:]
-                            elif content.startswith("```"):
-                                content = content[3:]
-                            
-                            if content.endswith("```"):
-                                content = content[:-3]
-                            
-                            # Remove any leading/trailing whitespace again
-                            content = content.strip()
-                            
-                            # Try to find JSON boundaries if mixed with other text
-                            if not content.startswith('{'):
-                                start_idx = content.find('{')
-                                if start_idx != -1:
-                                    content = content[start_idx:]
-                            
-                            if not content.endswith('}'):
-                                end_idx = content.rfind('}')
-                                if end_idx != -1:
-                                    content = content[:end_idx + 1]
-                            
-                            parsed_json = json.loads(content)
-                            
-                            # Validate that we have flat content structure
-                            for key, value in parsed_json.items():
-                                if key != "conversation_starters" and isinstance(value, dict):
-                                    logger.warning(f"⚠️ Section {key} has nested structure, should be flat string")
-                                    return None
-                            
-                            logger.info("✅ Gemini newsletter content generated successfully with flat structure")
-                            return parsed_json
-                            
-                        except json.JSONDecodeError as e:
-                            logger.error(f"❌ Failed to parse Gemini newsletter JSON: {e}")
-                            logger.error(f"Raw response: {content[:500]}...")
-                            return None
-                    else:
-                        logger.error("❌ No content in Gemini newsletter response")
-                        return None
-                else:
-                    logger.error(f"❌ Gemini newsletter API error: {response.status_code}")
-                    return None
-                    
-        except httpx.TimeoutException:
-            logger.error("❌ Gemini newsletter generation timeout")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Gemini newsletter generation failed: {e}")
+            if response.status_code != 200:
+                logger.error(f"❌ Gemini API error: {response.status_code}")
+                span.set_outcome(OUTCOME_FALLBACK)
+                return None
+            
+            result = response.json()
+            
+            if "candidates" in result and len(result["candidates"]) > 0:
+                return result["candidates"][0]["content"]["parts"][0]["text"]
+            
+            logger.error("❌ No content in Gemini response")
+            span.set_outcome(OUTCOME_FALLBACK)
             return None
     
     async def generate_dementia_friendly_description(self, 
@@ -447,30 +616,234 @@ class SimpleGeminiTool:
         result = await self.generate_content(prompt, max_tokens=200)
         
         if result:
-            # Clean up the description and ensure PII compliance
-            description = result.strip()
-            # Remove any potential personal references
-            description = description.replace("you", "someone").replace("your", "their")
-            # Remove any unwanted prefacing text that might slip through
-            description = description.replace("Here's a description", "").replace("This is a description", "")
-            description = description.replace("Here is a description", "").replace("Below is a description", "")
-            # Clean up any remaining artifacts
-            description = description.strip(' :"')
-            # Ensure proper sentence structure
-            if not description.endswith('.'):
-                description += '.'
-            return description
+            return self._clean_description(result)
         
         return None
     
+    def _clean_description(self, result: str) -> str:
+        """Strip personal references and prefacing text from a generated photo description"""
+        
+        # Clean up the description and ensure PII compliance
+        description = result.strip()
+        # Remove any potential personal references
+        description = description.replace("you", "someone").replace("your", "their")
+        # Remove any unwanted prefacing text that might slip through
+        description = description.replace("Here's a description", "").replace("This is a description", "")
+        description = description.replace("Here is a description", "").replace("Below is a description", "")
+        # Clean up any remaining artifacts
+        description = description.strip(' :"')
+        # Ensure proper sentence structure
+        if not description.endswith('.'):
+            description += '.'
+        return description
+    
     async def test_connection(self) -> bool:
         """Test Gemini API connection"""
         try:
-            test_result = await self.generate_content("Hello, this is a test.", max_tokens=50)
+            test_result = await self.generate_content("Hello, this is a test.", max_tokens=50, fresh=True)
             return test_result is not None
         except Exception as e:
             logger.error(f"Gemini connection test failed: {e}")
             return False
 
-# Export the main class
-__all__ = ["SimpleGeminiTool"]
\ No newline at end of file
+
+class StreamingGeminiTool(SimpleGeminiTool):
+    """
+    SimpleGeminiTool variant that consumes streamGenerateContent incrementally.
+    
+    - stream_content() yields text chunks as the model produces them
+    - generate_nostalgia_newsletter() and generate_dashboard_content() accept
+      on_section and report each JSON section as soon as it is complete; the
+      return value is the same parsed result as the blocking call
+    - Without on_section every method behaves exactly like SimpleGeminiTool
+    
+    Streamed responses are cached like blocking ones (a cache hit reports all
+    sections at once) but are not coalesced by the single-flight group.
+    """
+    
+    supports_streaming = True
+    
+    async def stream_content(self, prompt: str, max_tokens: int = 800) -> AsyncIterator[str]:
+        """Text chunks for a generate_content() prompt, as Gemini produces them (not cached)"""
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        # The reader runs in its own task so its trace span never wraps the consumer
+        reader = asyncio.create_task(self._read_stream(self._content_payload(prompt, max_tokens), queue.put_nowait))
+        reader.add_done_callback(lambda task: queue.put_nowait(None))
+        
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+            reader.result()
+        finally:
+            if not reader.done():
+                reader.cancel()
+    
+    async def generate_nostalgia_newsletter(self, prompt: str, json_schema: Dict[str, Any],
+                                            fresh: bool = False,
+                                            on_section: Optional[SectionCallback] = None) -> Optional[Dict[str, Any]]:
+        """
+        Newsletter generation; with on_section, each section is reported as it streams in.
+        """
+        
+        if on_section is None:
+            return await super().generate_nostalgia_newsletter(prompt, json_schema, fresh=fresh)
+        
+        try:
+            return await self._streamed_generate(METHOD_NEWSLETTER, self._newsletter_payload(prompt, json_schema),
+                                                 fresh, self._parse_newsletter_json, on_section)
+        except httpx.TimeoutException:
+            logger.error("❌ Gemini streamed newsletter generation timeout")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Gemini streamed newsletter generation failed: {e}")
+            return None
+    
+    async def generate_dashboard_content(self, prompt: str, json_schema: Dict[str, Any],
+                                         fresh: bool = False,
+                                         on_section: Optional[SectionCallback] = None) -> Optional[Dict[str, Any]]:
+        """
+        Combined dashboard generation; with on_section, each section is reported as it streams in.
+        """
+        
+        if on_section is None:
+            return await super().generate_dashboard_content(prompt, json_schema, fresh=fresh)
+        
+        try:
+            return await self._streamed_generate(METHOD_DASHBOARD_CONTENT,
+                                                 self._dashboard_content_payload(prompt, json_schema),
+                                                 fresh, self._parse_dashboard_json, on_section)
+        except httpx.TimeoutException:
+            logger.error("❌ Gemini streamed dashboard generation timeout")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Gemini streamed dashboard generation failed: {e}")
+            return None
+    
+    async def _streamed_generate(self, method: str, payload: Dict[str, Any], fresh: bool,
+                                 parse: Callable[[str], Optional[Any]],
+                                 on_section: SectionCallback) -> Optional[Any]:
+        """
+        Streaming counterpart of _cached_generate().
+        
+        Sections reported early are provisional: the caller still validates
+        the full parsed result, which is the only thing that is cached.
+        """
+        
+        key = gemini_cache_key(self.model, payload)
+        
+        if self.response_cache is not None:
+            if fresh:
+                self.response_cache.record_fresh(method)
+            else:
+                cached = await self.response_cache.aget(method, key)
+                if cached is not None:
+                    logger.info(f"🧠 Gemini cache hit ({method})")
+                    for name, value in cached.items():
+                        on_section(name, value)
+                    return cached
+        
+        sections = IncrementalJSONSections()
+        
+        def on_chunk(text: str) -> None:
+            for name, value in sections.feed(text):
+                on_section(name, value)
+        
+        content = await self._read_stream(payload, on_chunk)
+        if content is None:
+            return None
+        
+        result = parse(content)
+        if result is not None and self.response_cache is not None:
+            self.response_cache.put(method, key, result)
+        return result
+    
+    async def _read_stream(self, payload: Dict[str, Any], on_chunk: Callable[[str], None]) -> Optional[str]:
+        """
+        POST streamGenerateContent (server-sent events) and report each text chunk.
+        
+        Returns:
+            The full text, or None on an error response / empty stream
+        """
+        
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        url = f"{self.base_url}/models/{self.model}:streamGenerateContent?alt=sse&key={self.api_key}"
+        started = time.perf_counter()
+        chunks: List[str] = []
+        
+        async with tracer.span("gemini.stream_generate_content", KIND_UPSTREAM, model=self.model) as span:
+            async with pooled_client(self.http_client) as client:
+                # send(stream=True) so 429/5xx responses can be retried before the body is read
+                response = await guarded_request(self.circuit_breaker, self.rate_limiter, lambda: client.send(
+                    client.build_request("POST", url, json=payload, headers=headers, timeout=90.0), stream=True
+                ))
+                try:
+                    span.set_attribute("http.status_code", response.status_code)
+                    
+                    if response.status_code != 200:
+                        logger.error(f"❌ Gemini streaming API error: {response.status_code}")
+                        span.set_outcome(OUTCOME_FALLBACK)
+                        return None
+                    
+                    # The breaker counted the 200 headers as a success; a body that dies or
+                    # arrives corrupt is reported to it separately
+                    malformed_lines = 0
+                    try:
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            
+                            try:
+                                event = json.loads(line[len("data:"):].strip())
+                            except ValueError:
+                                malformed_lines += 1
+                                continue
+                            
+                            for candidate in event.get("candidates", [])[:1]:
+                                for part in candidate.get("content", {}).get("parts", []):
+                                    text = part.get("text")
+                                    if not text:
+                                        continue
+                                    if not chunks:
+                                        first_chunk_ms = round((time.perf_counter() - started) * 1000, 1)
+                                        span.set_attribute("first_chunk_ms", first_chunk_ms)
+                                        logger.info(f"📡 First Gemini chunk after {first_chunk_ms:.0f}ms")
+                                    chunks.append(text)
+                                    on_chunk(text)
+                    except httpx.TransportError as e:
+                        logger.error(f"❌ Gemini stream broke after {len(chunks)} chunks: {e}")
+                        self._record_stream_failure()
+                        raise
+                    
+                    if malformed_lines:
+                        logger.warning(f"⚠️ Skipped {malformed_lines} malformed Gemini stream events")
+                        span.set_attribute("malformed_events", malformed_lines)
+                        self._record_stream_failure()
+                finally:
+                    await response.aclose()
+            
+            content = "".join(chunks)
+            span.set_attribute("chunks", len(chunks))
+            span.set_payload(content)
+            
+            if not content:
+                logger.error("❌ No content in Gemini stream")
+                span.set_outcome(OUTCOME_FALLBACK)
+                return None
+            
+            return content
+
+    def _record_stream_failure(self) -> None:
+        """Count a stream body that failed after a 200 as an upstream failure"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+
+# Export the main classes
+__all__ = ["SimpleGeminiTool", "StreamingGeminiTool", "SectionCallback"]
\ No newline at end of file
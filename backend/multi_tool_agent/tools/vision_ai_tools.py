@@ -10,6 +10,10 @@ import logging
 import base64
 from typing import Dict, Any, Optional, List
 
+from ..tracing import tracer, KIND_UPSTREAM, OUTCOME_FALLBACK
+from ..http_clients import pooled_client
+from ..circuit_breaker import guarded_request
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -21,9 +25,14 @@ class VisionAIAnalyzer:
     This is the MAIN class that should be imported.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None,
+                 rate_limiter: Optional[Any] = None, circuit_breaker: Optional[Any] = None,
+                 base_url: Optional[str] = None):
         self.api_key = api_key
-        self.base_url = "https://vision.googleapis.com/v1"
+        self.base_url = base_url or "https://vision.googleapis.com/v1"
+        self.http_client = http_client  # Shared keep-alive pool (None = client per call)
+        self.rate_limiter = rate_limiter  # UpstreamLimiter (None = no pacing or retries)
+        self.circuit_breaker = circuit_breaker  # CircuitBreaker (None = always call the API)
         logger.info("VisionAIAnalyzer initialized")
         
     async def analyze_photo(self, photo_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -173,8 +182,15 @@ class VisionAIAnalyzer:
             
             headers = {"Content-Type": "application/json"}
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
+            async with tracer.span("vision.annotate", KIND_UPSTREAM) as span:
+                async with pooled_client(self.http_client) as client:
+                    response = await guarded_request(
+                        self.circuit_breaker, self.rate_limiter,
+                        lambda: client.post(url, json=payload, headers=headers, timeout=30.0)
+                    )
+                
+                span.set_attribute("http.status_code", response.status_code)
+                span.set_payload(response.content)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -182,6 +198,7 @@ class VisionAIAnalyzer:
                     return self._process_vision_results(data)
                 else:
                     logger.error(f"Google Vision AI error: {response.status_code} - {response.text}")
+                    span.set_outcome(OUTCOME_FALLBACK)
                     return None
                     
         except Exception as e:
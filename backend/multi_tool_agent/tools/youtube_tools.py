@@ -7,24 +7,48 @@ FEATURES:
 - Expands composer pool for better variety
 - Better fallback system with cultural + American options
 - Filters for Creative Commons content
+- Non-blocking httpx client (shared keep-alive pool when injected)
+- Heritage classical, American classical and folk searches run concurrently,
+  deduplicated by videoId as results arrive
+- Optional persistent search cache (saves search.list quota across restarts)
 """
 
-import requests
+import asyncio
 import json
 import logging
 import random
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ..caching import canonical_hash
+from ..single_flight import SingleFlight
+from ..tracing import tracer, KIND_UPSTREAM
+from ..http_clients import pooled_client
+from ..circuit_breaker import guarded_request
 
 logger = logging.getLogger(__name__)
 
+# Identical concurrent search requests share one HTTP call (empty results are not reused in a scope)
+_search_flight = SingleFlight("youtube", should_remember=lambda data: bool(data and data.get("items")))
+
 class YouTubeAPI:
     """
     Enhanced YouTube Data API tool with cultural heritage + American search.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional["httpx.AsyncClient"] = None,
+                 search_cache: Optional[Any] = None, rate_limiter: Optional[Any] = None,
+                 circuit_breaker: Optional[Any] = None, base_url: Optional[str] = None):
         self.api_key = api_key
-        self.base_url = "https://www.googleapis.com/youtube/v3/search"
+        self.base_url = base_url or "https://www.googleapis.com/youtube/v3/search"
+        self.http_client = http_client  # Shared keep-alive pool (None = client per call)
+        self.search_cache = search_cache  # YouTubeSearchCache (None = always call the API)
+        self.rate_limiter = rate_limiter  # UpstreamLimiter (None = no pacing or retries)
+        self.circuit_breaker = circuit_breaker  # CircuitBreaker (None = always call the API)
         
         # Load expanded fallback content
         self.fallback_content = self._load_expanded_fallback_content()
@@ -86,37 +110,37 @@ class YouTubeAPI:
             logger.warning("⚠️ Invalid YouTube API key, using Creative Commons fallbacks")
             return self._get_enhanced_fallback_results(query, cultural_heritage)
         
-        all_results = []
-        results_per_search = max(1, max_results // 3)  # Divide among 3 search types
+        if not httpx:
+            logger.warning("⚠️ httpx not available, using Creative Commons fallbacks")
+            return self._get_enhanced_fallback_results(query, cultural_heritage)
         
+        tasks: List[asyncio.Task] = []
         try:
-            # SEARCH 1: Heritage-specific classical (original query)
-            logger.info(f"🔍 Heritage classical (CC only): {query}")
-            classical_results = await self._single_search(query, results_per_search, "classical")
-            all_results.extend(classical_results)
-            
-            # SEARCH 2: American classical composers (if heritage is not American)
-            if cultural_heritage != "American" and len(all_results) < max_results:
-                american_composers = ["Copland", "Gershwin", "Barber", "Ives"]
-                american_query = random.choice(american_composers)
-                logger.info(f"🔍 American classical (CC only): {american_query}")
-                american_results = await self._single_search(american_query, results_per_search, "classical")
-                all_results.extend(american_results)
+            searches = self._plan_searches(query, cultural_heritage, max_results)
             
-            # SEARCH 3: Heritage-appropriate folk music
-            if len(all_results) < max_results:
-                folk_query = self._get_folk_search_term(cultural_heritage)
-                logger.info(f"🔍 Folk music (CC only): {folk_query}")
-                folk_results = await self._single_search(folk_query, max_results - len(all_results), "folk")
-                all_results.extend(folk_results)
+            # All searches run at once; one slow response no longer delays the others
+            tasks = [
+                asyncio.create_task(self._labelled_search(label, search_query, count, music_type))
+                for label, search_query, count, music_type in searches
+            ]
             
-            # Remove duplicates by videoId
+            # Remove duplicates by videoId as each search completes
             seen_ids = set()
-            unique_results = []
-            for video in all_results:
-                if video["videoId"] not in seen_ids:
-                    seen_ids.add(video["videoId"])
-                    unique_results.append(video)
+            results_by_search: Dict[str, List[Dict[str, Any]]] = {label: [] for label, _, _, _ in searches}
+            for finished in asyncio.as_completed(tasks):
+                try:
+                    label, videos = await finished
+                except Exception as e:
+                    logger.warning(f"⚠️ Creative Commons search failed: {e}")
+                    continue
+                
+                for video in videos:
+                    if video["videoId"] not in seen_ids:
+                        seen_ids.add(video["videoId"])
+                        results_by_search[label].append(video)
+            
+            # Keep the heritage → American → folk order in the final list
+            unique_results = [video for label, _, _, _ in searches for video in results_by_search[label]]
             
             if unique_results:
                 final_results = unique_results[:max_results]  # Limit to exactly 5
@@ -129,6 +153,45 @@ class YouTubeAPI:
         except Exception as e:
             logger.error(f"❌ Creative Commons search failed: {e}")
             return self._get_enhanced_fallback_results(query, cultural_heritage)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _plan_searches(self, query: str, cultural_heritage: str,
+                       max_results: int) -> List[Tuple[str, str, int, str]]:
+        """
+        Searches to run concurrently as (label, query, max_results, music_type).
+        
+        Result counts match the sequential plan: one share each for heritage and
+        American classical, folk fills the rest.
+        """
+        
+        results_per_search = max(1, max_results // 3)  # Divide among 3 search types
+        
+        # SEARCH 1: Heritage-specific classical (original query)
+        logger.info(f"🔍 Heritage classical (CC only): {query}")
+        searches = [("heritage_classical", query, results_per_search, "classical")]
+        
+        # SEARCH 2: American classical composers (if heritage is not American)
+        if cultural_heritage != "American" and max_results > results_per_search:
+            american_composers = ["Copland", "Gershwin", "Barber", "Ives"]
+            american_query = random.choice(american_composers)
+            logger.info(f"🔍 American classical (CC only): {american_query}")
+            searches.append(("american_classical", american_query, results_per_search, "classical"))
+        
+        # SEARCH 3: Heritage-appropriate folk music
+        remaining = max_results - results_per_search * len(searches)
+        if remaining > 0:
+            folk_query = self._get_folk_search_term(cultural_heritage)
+            logger.info(f"🔍 Folk music (CC only): {folk_query}")
+            searches.append(("folk", folk_query, remaining, "folk"))
+        
+        return searches
+    
+    async def _labelled_search(self, label: str, query: str, max_results: int,
+                               music_type: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """_single_search() result tagged with its search label"""
+        return label, await self._single_search(query, max_results, music_type)
     
     async def _single_search(self, query: str, max_results: int, music_type: str = "classical") -> List[Dict[str, Any]]:
         """
@@ -159,10 +222,7 @@ class YouTubeAPI:
         
         logger.info(f"🔒 CREATIVE COMMONS ONLY search: {search_query}")
         
-        response = requests.get(self.base_url, params=params, timeout=15.0)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = await self._search(params)
         videos = []
         
         if "items" in data:
@@ -182,6 +242,37 @@ class YouTubeAPI:
         
         return videos
     
+    async def _search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a search request through the cache, coalescing identical concurrent requests"""
+        
+        # The API key is not part of the result, so leave it out of the key
+        key = canonical_hash({k: v for k, v in params.items() if k != "key"})
+        
+        def fetch():
+            return _search_flight.do(key, lambda: self._fetch_search(params))
+        
+        if self.search_cache is not None:
+            return await self.search_cache.get_or_fetch(params, fetch)
+        return await fetch()
+    
+    async def _fetch_search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Single non-blocking HTTP call to the search endpoint"""
+        
+        async with tracer.span("youtube.search", KIND_UPSTREAM) as span:
+            async with pooled_client(self.http_client) as client:
+                response = await guarded_request(
+                    self.circuit_breaker, self.rate_limiter,
+                    lambda: client.get(self.base_url, params=params, timeout=15.0)
+                )
+            
+            span.set_attribute("http.status_code", response.status_code)
+            span.set_payload(response.content)
+            response.raise_for_status()
+            
+            data = response.json()
+            span.set_attribute("result_count", len(data.get("items", [])))
+            return data
+    
     def _get_folk_search_term(self, cultural_heritage: str) -> str:
         """
         Get appropriate folk music search term based on cultural heritage.
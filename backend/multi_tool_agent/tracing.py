@@ -0,0 +1,341 @@
+"""
+Tracing - Spans Around Agents and Upstream Calls
+File: backend/multi_tool_agent/tracing.py
+
+Features:
+- Async span context manager recording duration, outcome and payload size
+- Outcomes: "live" (upstream/agent result used), "fallback" (built-in fallback
+  served instead) and "error" (exception raised)
+- Parent/child linking through a context variable, so the agent spans of one
+  dashboard and the upstream calls they make share a trace id
+- Rolling latency window per span name with p50/p95/p99 for /api/status
+- Optional export of finished spans to a local file as OTLP/JSON lines
+  (one ExportTraceServiceRequest per line, as written by the OpenTelemetry
+  collector file exporter), flushed when a root span ends and written by a
+  background thread so exporting never adds disk latency to requests
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import math
+import os
+import queue
+import secrets
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_LIVE = "live"
+OUTCOME_FALLBACK = "fallback"
+OUTCOME_ERROR = "error"
+
+# Span kinds (histograms are grouped by kind in status output)
+KIND_PIPELINE = "pipeline"
+KIND_AGENT = "agent"
+KIND_UPSTREAM = "upstream"
+
+# OTLP span kinds: INTERNAL for pipeline/agents, CLIENT for upstream calls
+_OTLP_SPAN_KIND = {KIND_PIPELINE: 1, KIND_AGENT: 1, KIND_UPSTREAM: 3}
+
+# Buffered spans are written at least this often
+EXPORT_BATCH_SIZE = 64
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("tracing_current_span", default=None)
+
+
+def payload_size(payload: Any) -> int:
+    """Approximate payload size in bytes (serialized JSON for structured data)"""
+    if payload is None:
+        return 0
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    try:
+        return len(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+class Span:
+    """One timed operation"""
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.outcome = OUTCOME_LIVE
+        self.payload_bytes = 0
+        self.error: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self._started = time.perf_counter()
+        self.duration_ms = 0.0
+
+    def set_outcome(self, outcome: str) -> None:
+        """Mark the span as live, fallback or error"""
+        self.outcome = outcome
+
+    def set_payload(self, payload: Any) -> None:
+        """Record the size of the payload produced by this span"""
+        self.payload_bytes = payload_size(payload)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def finish(self) -> None:
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        self.end_ns = self.start_ns + int(self.duration_ms * 1_000_000)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Span in OTLP/JSON form"""
+        attributes = {
+            **self.attributes,
+            "careconnect.kind": self.kind,
+            "careconnect.outcome": self.outcome,
+            "careconnect.payload_bytes": self.payload_bytes
+        }
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _OTLP_SPAN_KIND.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in attributes.items()],
+            "status": {"code": 2, "message": self.error or ""} if self.outcome == OUTCOME_ERROR else {"code": 1}
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+class LatencyHistogram:
+    """Rolling window of durations with outcome counters"""
+
+    def __init__(self, window_size: int = 1024):
+        self.durations: deque = deque(maxlen=window_size)
+        self.outcomes: Dict[str, int] = {OUTCOME_LIVE: 0, OUTCOME_FALLBACK: 0, OUTCOME_ERROR: 0}
+        self.count = 0
+        self.payload_bytes = 0
+
+    def record(self, span: Span) -> None:
+        self.durations.append(span.duration_ms)
+        self.outcomes[span.outcome] = self.outcomes.get(span.outcome, 0) + 1
+        self.count += 1
+        self.payload_bytes += span.payload_bytes
+
+    def percentile(self, quantile: float) -> float:
+        """Nearest-rank percentile over the rolling window"""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        index = min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))
+        return round(ordered[index], 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "window": len(self.durations),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(max(self.durations), 1) if self.durations else 0.0,
+            "outcomes": dict(self.outcomes),
+            "avg_payload_bytes": round(self.payload_bytes / self.count) if self.count else 0
+        }
+
+
+class OTLPFileExporter:
+    """
+    Append finished traces to a local file as OTLP/JSON lines.
+
+    export() only queues the batch; a writer thread serializes queued batches
+    and appends them with one file open per wake-up.
+    """
+
+    def __init__(self, path: str, service_name: str = "careconnect-api"):
+        self.path = path
+        self.service_name = service_name
+        self.exported_spans = 0
+        self.failed_exports = 0
+        self._queue: "queue.Queue[Optional[List[Span]]]" = queue.Queue()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._writer = threading.Thread(target=self._write_loop, name="otlp-file-exporter", daemon=True)
+        self._writer.start()
+
+    def export(self, spans: List[Span]) -> None:
+        """Queue a batch of finished spans for the writer thread"""
+        self._queue.put(list(spans))
+
+    def flush(self) -> None:
+        """Block until every queued batch is written"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write queued batches and stop the writer thread"""
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_loop(self) -> None:
+        while True:
+            batches = [self._queue.get()]
+            while True:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = None in batches
+            self._write([batch for batch in batches if batch])
+            for _ in batches:
+                self._queue.task_done()
+            if closing:
+                return
+
+    def _write(self, batches: List[List[Span]]) -> None:
+        if not batches:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for spans in batches:
+                    f.write(json.dumps(self._request(spans), ensure_ascii=False) + "\n")
+            self.exported_spans += sum(len(spans) for spans in batches)
+        except OSError as e:
+            self.failed_exports += 1
+            logger.warning(f"⚠️ Trace export failed: {e}")
+
+    def _request(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "careconnect.tracing"},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "exported_spans": self.exported_spans, "failed_exports": self.failed_exports,
+                "queued_batches": self._queue.qsize()}
+
+
+class Tracer:
+    """
+    Records spans into per-name histograms and optionally exports them.
+
+    Usage:
+        async with tracer.span("qloo.insights", KIND_UPSTREAM) as span:
+            ...
+            span.set_payload(response.content)
+    """
+
+    def __init__(self, window_size: int = 1024):
+        self.window_size = window_size
+        self.exporter: Optional[OTLPFileExporter] = None
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._pending: List[Span] = []
+
+    def configure(self, window_size: Optional[int] = None, export_path: Optional[str] = None) -> None:
+        """Set the rolling window size and enable file export (None/empty = disabled)"""
+        if window_size:
+            self.window_size = window_size
+        if self.exporter is not None:
+            self.close()
+        self.exporter = OTLPFileExporter(export_path) if export_path else None
+        logger.info(f"🔭 Tracing configured (window={self.window_size}, export={export_path or 'disabled'})")
+
+    @contextlib.asynccontextmanager
+    async def span(self, name: str, kind: str = KIND_UPSTREAM, **attributes: Any) -> AsyncIterator[Span]:
+        """Time the enclosed block as a child of the current span"""
+
+        span = Span(name, kind, parent=_current_span.get(), attributes=attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            # Cancellation (e.g. a pipeline deadline) also counts as an error for this span
+            span.set_outcome(OUTCOME_ERROR)
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.finish()
+            self._record(span)
+
+    def _record(self, span: Span) -> None:
+        group = self._histograms.setdefault(span.kind, {})
+        histogram = group.get(span.name)
+        if histogram is None:
+            histogram = group[span.name] = LatencyHistogram(self.window_size)
+        histogram.record(span)
+
+        if self.exporter is None:
+            return
+
+        # Export in batches: whenever a root span finishes or the buffer fills up
+        self._pending.append(span)
+        if span.parent_span_id is None or len(self._pending) >= EXPORT_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand buffered spans to the exporter's writer thread (does not wait for the write)"""
+        if self.exporter is not None and self._pending:
+            spans, self._pending = self._pending, []
+            self.exporter.export(spans)
+
+    def close(self) -> None:
+        """Export buffered spans and wait for the writer (at shutdown)"""
+        self.flush()
+        if self.exporter is not None:
+            self.exporter.close()
+
+    def reset(self) -> None:
+        """Drop all recorded latencies (for tests)"""
+        self._histograms.clear()
+        self._pending.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-agent and per-upstream latency percentiles for /api/status"""
+        stats: Dict[str, Any] = {
+            f"{kind}s": {name: histogram.get_stats() for name, histogram in sorted(group.items())}
+            for kind, group in self._histograms.items()
+        }
+        stats["export"] = self.exporter.get_stats() if self.exporter else {"enabled": False}
+        return stats
+
+
+# Process-wide tracer used by agents and tools
+tracer = Tracer()
+
+
+def current_span() -> Optional[Span]:
+    """Span currently active in this task, if any"""
+    return _current_span.get()
+
+
+# Export the main helpers
+__all__ = ["tracer", "Tracer", "Span", "LatencyHistogram", "OTLPFileExporter", "current_span", "payload_size",
+           "OUTCOME_LIVE", "OUTCOME_FALLBACK", "OUTCOME_ERROR", "KIND_PIPELINE", "KIND_AGENT", "KIND_UPSTREAM"]
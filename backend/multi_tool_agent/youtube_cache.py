@@ -0,0 +1,115 @@
+"""
+YouTube Search Cache - Persistent Cache of Creative Commons Search Results
+File: backend/multi_tool_agent/youtube_cache.py
+
+Every search.list call costs 100 units of the daily YouTube Data API quota,
+and the same composer/heritage searches repeat across patients and days.
+The cache keeps search responses on disk so they survive restarts.
+
+Features:
+- SQLite-backed, keyed by the normalized query plus the license/embeddable
+  filters and result count (the API key is never part of the key)
+- Configurable TTL; stale entries are served immediately and refreshed in
+  the background (stale-while-revalidate)
+- Max-entries eviction of the least recently used searches
+- Only successful responses are cached
+- Hit rate and quota units saved for /api/status
+"""
+
+import logging
+import re
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+from .caching import SQLiteKVStore, StaleWhileRevalidateCache, canonical_hash
+
+logger = logging.getLogger(__name__)
+
+# Quota cost of one search.list request
+SEARCH_QUOTA_UNITS = 100
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query"""
+    return re.sub(r"\s+", " ", str(query)).strip().lower()
+
+
+def youtube_search_cache_key(params: Dict[str, Any]) -> str:
+    """Cache key for search params: normalized query + license filter + shape of the request"""
+    return canonical_hash({
+        "q": normalize_query(params.get("q", "")),
+        "videoLicense": params.get("videoLicense", "any"),
+        "videoEmbeddable": str(params.get("videoEmbeddable", "any")).lower(),
+        "type": params.get("type", ""),
+        "part": params.get("part", ""),
+        "maxResults": int(params.get("maxResults", 5))
+    })
+
+
+def _is_successful_response(data: Any) -> bool:
+    return isinstance(data, dict) and isinstance(data.get("items"), list)
+
+
+class YouTubeSearchCache:
+    """
+    Persistent stale-while-revalidate cache for YouTube search responses.
+
+    Usage:
+        cache = YouTubeSearchCache("data/youtube_search_cache.sqlite3", ttl_seconds=7 * 86400)
+        data = await cache.get_or_fetch(params, lambda: fetch(params))
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600, stale_seconds: float = 24 * 3600,
+                 max_entries: int = 5000, enabled: bool = True):
+        """
+        Args:
+            path: SQLite database file
+            ttl_seconds: How long a response is served as fresh
+            stale_seconds: How long after that it is still served while refreshing
+            max_entries: Least recently used searches beyond this are evicted
+            enabled: False turns the cache into a pass-through
+        """
+        self.enabled = enabled
+        self.cache = None
+        if enabled:
+            store = SQLiteKVStore(path, table="youtube_searches", name="youtube_search_cache",
+                                  max_entries=max_entries)
+            self.cache = StaleWhileRevalidateCache(store, ttl_seconds, stale_seconds, name="youtube_search_cache")
+        logger.info(f"📼 YouTube search cache initialized (enabled={enabled}, ttl={ttl_seconds}s, "
+                    f"stale={stale_seconds}s, max_entries={max_entries})")
+
+    async def get_or_fetch(self, params: Dict[str, Any],
+                           fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Cached search response for params, calling fetch() on a miss"""
+        if not self.enabled:
+            return await fetch()
+
+        return await self.cache.get_or_fetch(youtube_search_cache_key(params), fetch, _is_successful_response)
+
+    def flush(self) -> None:
+        """Wait until queued writes are on disk"""
+        if self.cache:
+            self.cache.store.flush()
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        if self.cache:
+            self.cache.store.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate, quota units saved and store counters for /api/status"""
+        if not self.enabled:
+            return {"enabled": False}
+
+        stats = self.cache.get_stats()
+        served_from_cache = stats["hits"] + stats["stale_hits"]
+        fetches = stats["misses"] + stats["background_refreshes"] + stats["refresh_failures"]
+        return {
+            "enabled": True,
+            **stats,
+            "quota_units_saved": served_from_cache * SEARCH_QUOTA_UNITS,
+            "quota_units_spent": fetches * SEARCH_QUOTA_UNITS
+        }
+
+
+# Export the main helpers
+__all__ = ["YouTubeSearchCache", "youtube_search_cache_key", "normalize_query", "SEARCH_QUOTA_UNITS"]
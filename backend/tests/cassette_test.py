@@ -0,0 +1,150 @@
+"""
+Record/Replay Cassette Test Script
+File: backend/tests/cassette_test.py
+
+PURPOSE:
+- Verify pooled clients record upstream traffic to a compact cassette without API keys
+- Verify replay serves identical results offline, instantly or with the recorded latency
+- Verify unrecorded requests miss like a transport error, so tools use their fallbacks
+- Verify streamed Gemini responses replay section by section
+"""
+
+import asyncio
+import gzip
+import sys
+import os
+import tempfile
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.fake_upstreams import FakeUpstreams, FaultProfile, FakeUpstreamServer, upstream_base_urls
+from multi_tool_agent.cassette import Cassette, CassetteMiss, MODE_RECORD, MODE_REPLAY, MODE_AUTO
+from multi_tool_agent.http_clients import HTTPClientRegistry
+from multi_tool_agent.tools.qloo_tools import QlooInsightsAPI
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool, StreamingGeminiTool
+
+NEWSLETTER_SCHEMA = {"memory_spotlight": "string", "era_highlights": "string", "heritage_traditions": "string",
+                     "conversation_starters": ["string", "string", "string"]}
+
+
+def make_tools(registry: HTTPClientRegistry, base_urls: dict):
+    qloo = QlooInsightsAPI("secret-qloo-key", http_client=registry.get("qloo"), base_url=base_urls["qloo"])
+    gemini = SimpleGeminiTool("secret-gemini-key", http_client=registry.get("gemini"), base_url=base_urls["gemini"])
+    return qloo, gemini
+
+
+async def dashboard_calls(qloo: QlooInsightsAPI, gemini: SimpleGeminiTool):
+    music = await qloo.get_safe_classical_music("Italian-American")
+    text = await gemini.generate_content("Describe a Sunday dinner")
+    return music, text
+
+
+def record_cassette(path: str, latency_ms: float = 0.0):
+    """Record one dashboard's Qloo and Gemini calls against a loopback fake server"""
+
+    async def run():
+        upstreams = FakeUpstreams(faults={"qloo": FaultProfile(latency_ms=latency_ms),
+                                          "gemini": FaultProfile(latency_ms=latency_ms)})
+        async with FakeUpstreamServer(upstreams) as server:
+            base_urls = upstream_base_urls(server.url)
+            registry = HTTPClientRegistry(cassette=Cassette(path, mode=MODE_RECORD))
+            results = await dashboard_calls(*make_tools(registry, base_urls))
+            await registry.aclose()
+            return base_urls, results
+
+    return asyncio.run(run())
+
+
+def replay(path: str, base_urls: dict, **options):
+    async def run():
+        cassette = Cassette(path, mode=MODE_REPLAY, **options)
+        registry = HTTPClientRegistry(cassette=cassette)
+        started = time.perf_counter()
+        results = await dashboard_calls(*make_tools(registry, base_urls))
+        elapsed = time.perf_counter() - started
+        await registry.aclose()
+        return results, elapsed, cassette
+
+    return asyncio.run(run())
+
+
+def test_record_then_replay_offline():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "upstreams.jsonl.gz")
+        base_urls, recorded = record_cassette(path, latency_ms=80)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            contents = f.read()
+        assert contents.count("\n") == 2
+        assert "secret-" not in contents and '"first_byte_ms"' in contents
+
+        # The fake server is gone: everything comes from the cassette
+        instant, instant_s, cassette = replay(path, base_urls, replay_latency=False)
+        timed, timed_s, _ = replay(path, base_urls, replay_latency=True)
+
+    assert instant == recorded and timed == recorded
+    assert "method" not in recorded[0]
+    assert cassette.get_stats()["replayed"] == 2 and cassette.get_stats()["misses"] == 0
+    assert timed_s >= 0.16
+    assert instant_s < timed_s - 0.1
+
+
+def test_unrecorded_request_misses_to_fallback():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "upstreams.jsonl")
+        base_urls, _ = record_cassette(path)
+
+        async def run():
+            cassette = Cassette(path, mode=MODE_REPLAY, replay_latency=False)
+            registry = HTTPClientRegistry(cassette=cassette)
+            qloo, _ = make_tools(registry, base_urls)
+            music = await qloo.get_safe_classical_music("German-American", take=3)
+            try:
+                await registry.get("qloo").get(f"{base_urls['qloo']}/v2/insights", params={"take": 1})
+                assert False, "expected CassetteMiss"
+            except CassetteMiss:
+                pass
+            await registry.aclose()
+            return music, cassette
+
+        music, cassette = asyncio.run(run())
+
+    assert music["method"] == "fallback"
+    assert cassette.stats["misses"] == 2
+
+
+def test_streamed_gemini_replays_sections():
+    upstreams = FakeUpstreams(stream_chunk_chars=40, stream_chunk_delay_ms=0)
+    base_url = upstream_base_urls("http://fake-upstreams")["gemini"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gemini.jsonl")
+
+        async def run(mode: str, inner=None):
+            cassette = Cassette(path, mode=mode, replay_latency=False)
+            client = httpx.AsyncClient(transport=cassette.transport("gemini", inner))
+            gemini = StreamingGeminiTool("secret-key", http_client=client, base_url=base_url)
+            sections = []
+            result = await gemini.generate_nostalgia_newsletter(
+                "Garden theme newsletter", NEWSLETTER_SCHEMA, on_section=lambda name, value: sections.append(name))
+            await client.aclose()
+            cassette.save()
+            return result, sections, cassette
+
+        recorded, _, _ = asyncio.run(run(MODE_AUTO, httpx.ASGITransport(app=upstreams.app)))
+        replayed, sections, cassette = asyncio.run(run(MODE_REPLAY))
+
+    assert replayed == recorded
+    assert sections == list(NEWSLETTER_SCHEMA)
+    assert cassette.stats["replayed"] == 1 and upstreams.stats["gemini"]["requests"] == 1
+
+
+if __name__ == "__main__":
+    for test in [test_record_then_replay_offline, test_unrecorded_request_misses_to_fallback,
+                 test_streamed_gemini_replays_sections]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Cassette tests passed")
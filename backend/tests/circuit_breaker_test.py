@@ -0,0 +1,168 @@
+"""
+Circuit Breaker Test Script
+File: backend/tests/circuit_breaker_test.py
+
+PURPOSE:
+- Verify a failing upstream opens its breaker and Qloo goes straight to its fallback
+- Verify calls that miss the Qloo call deadline count as failures (hung upstream)
+- Verify time lost to rate-limiter throttling never opens the breaker
+- Verify other cancellations record no outcome and give back the half-open probe slot
+- Verify half-open probes close the breaker on success and reopen it on failure
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.circuit_breaker import (
+    CircuitBreaker, CircuitOpenError, get_circuit_breaker_stats, STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN
+)
+from multi_tool_agent.rate_limiting import UpstreamLimiter
+from upstream_mocks import make_mock_qloo
+
+
+def test_failing_upstream_opens_breaker():
+    requests = []
+    breaker = CircuitBreaker("test_qloo_5xx", failure_rate_threshold=0.5, minimum_calls=4, open_seconds=60)
+    qloo = make_mock_qloo(requests=requests, status_code=503, results=[], circuit_breaker=breaker)
+
+    async def run():
+        return [await qloo.get_safe_classical_music("Irish-American", take=n) for n in range(1, 6)]
+
+    results = asyncio.run(run())
+
+    assert len(requests) == 4
+    assert breaker.state == STATE_OPEN
+    assert breaker.stats["short_circuited"] == 1
+    assert results[-1] == qloo._get_classical_fallback("Irish-American")
+    stats = get_circuit_breaker_stats()["test_qloo_5xx"]
+    assert stats["state"] == STATE_OPEN and stats["times_opened"] == 1 and stats["retry_in_s"] > 0
+
+
+def test_hung_upstream_fails_fast_once_open():
+    requests = []
+    breaker = CircuitBreaker("test_qloo_hung", minimum_calls=2, open_seconds=60)
+    qloo = make_mock_qloo(requests=requests, delay_s=5.0, call_deadline_s=0.05, circuit_breaker=breaker)
+
+    async def run():
+        first = await qloo.make_cultural_calls("Italian-American")
+        started = time.perf_counter()
+        second = await qloo.make_cultural_calls("Mexican-American")
+        return first, second, time.perf_counter() - started
+
+    first, second, second_s = asyncio.run(run())
+
+    assert sorted(first["timed_out_calls"]) == ["artists", "places"]
+    assert breaker.state == STATE_OPEN
+    assert len(requests) == 2
+    assert second_s < 0.05
+    assert second["cultural_recommendations"]["artists"] == qloo._get_classical_fallback("Mexican-American")
+
+
+class SlowLimiter(UpstreamLimiter):
+    """Limiter whose pacing wait outlasts the call deadline"""
+
+    async def acquire(self) -> None:
+        await asyncio.sleep(5.0)
+
+
+def test_throttled_call_does_not_open_breaker():
+    requests = []
+    breaker = CircuitBreaker("test_qloo_throttled", minimum_calls=2, open_seconds=60)
+    qloo = make_mock_qloo(requests=requests, call_deadline_s=0.05, circuit_breaker=breaker,
+                          rate_limiter=SlowLimiter("test_qloo_throttled"))
+
+    async def run():
+        return [await qloo.make_cultural_calls("Italian-American") for _ in range(2)]
+
+    results = asyncio.run(run())
+
+    assert all(sorted(result["timed_out_calls"]) == ["artists", "places"] for result in results)
+    assert requests == []
+    assert breaker.state == STATE_CLOSED
+    assert breaker.stats["failures"] == 0
+
+
+def test_half_open_probe_closes_or_reopens():
+    statuses = [503, 503, 503, 200]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    breaker = CircuitBreaker("test_half_open", minimum_calls=2, open_seconds=0.05)
+
+    async def call():
+        return await breaker.call(lambda: client.get("https://upstream.test/"))
+
+    async def run():
+        await call()
+        await call()
+        assert breaker.state == STATE_OPEN
+        try:
+            await call()
+            assert False, "expected CircuitOpenError"
+        except CircuitOpenError as e:
+            assert e.upstream == "test_half_open"
+
+        # Failed probe reopens
+        await asyncio.sleep(0.06)
+        assert breaker.state == STATE_HALF_OPEN
+        await call()
+        assert breaker.state == STATE_OPEN
+
+        # Successful probe closes
+        await asyncio.sleep(0.06)
+        response = await call()
+        assert response.status_code == 200
+        assert breaker.state == STATE_CLOSED
+
+    asyncio.run(run())
+    assert breaker.stats["times_opened"] == 2
+
+
+def test_cancelled_call_records_no_outcome():
+    async def hang():
+        await asyncio.sleep(5)
+
+    breaker = CircuitBreaker("test_cancelled", minimum_calls=1, open_seconds=0.05)
+
+    async def cancel_call():
+        task = asyncio.create_task(breaker.call(hang))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+            assert False, "expected CancelledError"
+        except asyncio.CancelledError:
+            pass
+
+    async def run():
+        await cancel_call()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.stats["failures"] == 0 and not breaker.outcomes
+
+        # A cancelled probe frees its slot instead of holding the breaker half open
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        await asyncio.sleep(0.06)
+        assert breaker.state == STATE_HALF_OPEN
+        await cancel_call()
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow_request()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for test in [test_failing_upstream_opens_breaker, test_hung_upstream_fails_fast_once_open,
+                 test_throttled_call_does_not_open_breaker,
+                 test_half_open_probe_closes_or_reopens, test_cancelled_call_records_no_outcome]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Circuit breaker tests passed")
@@ -0,0 +1,112 @@
+"""
+Combined Dashboard Generation Test Script
+File: backend/tests/combined_generation_test.py
+
+PURPOSE:
+- Verify one Gemini call produces the photo and Nostalgia News sections for Agents 4C and 5
+- Verify a failed combined call falls back to the per-agent Gemini calls
+- Verify Agent 4D is wired before 4C and 5 only when it is configured
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool
+from multi_tool_agent.agents.combined_content_generator import CombinedContentGenerator
+from multi_tool_agent.agents.photo_description_agent import PhotoDescriptionAgent
+from multi_tool_agent.agents.nostalgia_news_generator import NostalgiaNewsGenerator
+from multi_tool_agent.sequential_agent import build_dashboard_graph
+from upstream_mocks import make_mock_gemini
+
+SECTION = "Back in the 1950s, families gathered around the table for long Sunday dinners full of laughter and stories."
+
+COMBINED_RESPONSE = {
+    "photo_description": "A happy family sits together on a sunny afternoon. Everyone is smiling.",
+    "photo_conversation_starters": [
+        "What did families enjoy doing together on sunny afternoons?",
+        "Which family gatherings were the most fun?",
+        "What games did children play at family picnics?"
+    ],
+    "memory_spotlight": SECTION,
+    "era_highlights": SECTION,
+    "heritage_traditions": SECTION,
+    "conversation_starters": ["What was served at Sunday dinner?", "Who told the best stories?",
+                              "What songs did families sing together?"]
+}
+
+AGENT1_OUTPUT = {
+    "patient_info": {"cultural_heritage": "Italian-American", "age_group": "oldest_senior"},
+    "theme_info": {"id": "family", "name": "Family"}
+}
+
+
+def make_gemini(requests: list, status_code: int = 200) -> SimpleGeminiTool:
+    return make_mock_gemini([json.dumps(COMBINED_RESPONSE)], requests, status_code=status_code)
+
+
+def run_agents(gemini: SimpleGeminiTool):
+    photo_agent = PhotoDescriptionAgent(gemini_tool=gemini)
+    news_agent = NostalgiaNewsGenerator(gemini_tool=gemini)
+    combined_agent = CombinedContentGenerator(gemini, photo_agent, news_agent)
+    music = {"music_content": {"artist": "Puccini", "piece_title": "O mio babbino caro"}}
+    recipe = {"recipe_content": {"name": "Minestrone"}}
+
+    async def run():
+        combined = await combined_agent.run(dict(AGENT1_OUTPUT), music, recipe)
+        photo = await photo_agent.run({**AGENT1_OUTPUT, "combined_content": combined["combined_content"]})
+        news = await news_agent.run(AGENT1_OUTPUT, {}, {}, music, recipe, photo,
+                                    combined_content=combined["combined_content"])
+        return combined, photo, news
+
+    return asyncio.run(run())
+
+
+def test_one_call_feeds_photo_and_nostalgia_news():
+    requests = []
+    combined, photo, news = run_agents(make_gemini(requests))
+
+    assert len(requests) == 1
+    prompt = json.loads(requests[0].content)["contents"][0]["parts"][0]["text"]
+    assert "Puccini" in prompt and "Minestrone" in prompt
+    assert prompt.count("CRITICAL DEMENTIA CARE GUIDELINES") == 1
+
+    assert combined["metadata"]["sections"] == ["photo", "nostalgia_news"]
+    assert photo["photo_content"]["description"] == COMBINED_RESPONSE["photo_description"]
+    assert photo["photo_content"]["conversation_starters"] == COMBINED_RESPONSE["photo_conversation_starters"]
+    assert photo["metadata"]["description_source"] == "gemini_combined_pii_compliant"
+    assert news["nostalgia_news"]["sections"]["memory_spotlight"]["content"] == SECTION
+    assert news["nostalgia_news"]["metadata"]["generated_by"] == "gemini_combined"
+
+
+def test_failed_combined_call_uses_per_agent_calls():
+    requests = []
+    combined, photo, news = run_agents(make_gemini(requests, status_code=503))
+
+    assert combined["combined_content"] is None
+    # Combined call + photo description + photo starters + newsletter + structured JSON
+    assert len(requests) == 5
+    assert photo["metadata"]["description_source"] == "json_fallback"
+    assert news["nostalgia_news"]["metadata"]["generated_by"] == "guaranteed_newsletter_fallback"
+
+
+def test_graph_wiring():
+    plain = build_dashboard_graph().describe()
+    assert "agent4d" not in plain
+    assert plain["agent4c"] == ["agent1", "agent3"]
+
+    combined = build_dashboard_graph(agent4d=object()).describe()
+    assert combined["agent4d"] == ["agent1", "agent3", "agent4a", "agent4b"]
+    assert combined["agent4c"] == ["agent1", "agent3", "agent4d"]
+    assert combined["agent5"] == ["agent1", "agent4a", "agent4b", "agent4d"]
+
+
+if __name__ == "__main__":
+    for test in [test_one_call_feeds_photo_and_nostalgia_news, test_failed_combined_call_uses_per_agent_calls,
+                 test_graph_wiring]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Combined generation tests passed")
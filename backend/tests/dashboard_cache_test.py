@@ -0,0 +1,124 @@
+"""
+Dashboard Cache Test Script
+File: backend/tests/dashboard_cache_test.py
+
+PURPOSE:
+- Verify canonical keys ignore dict ordering and PII-free extra fields
+- Verify byte-bounded LRU eviction and expiry
+- Verify degraded dashboards are never cached
+- Verify each request advances the theme rotation once and its dashboard is
+  cached under the theme it was generated for
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.caching import ByteBoundedLRU
+from multi_tool_agent.dashboard_cache import DashboardCache, dashboard_cache_key
+from multi_tool_agent.state_store import InMemoryStateStore, STATE_THEME_ROTATION
+from multi_tool_agent.agents.information_consolidator_agent import InformationConsolidatorAgent
+from sequential_agent_test import make_sequential_agent
+
+
+def test_key_is_canonical():
+    profile_a = {"cultural_heritage": "Italian-American", "age_group": "senior", "interests": ["music"]}
+    profile_b = {"interests": ["music "], "age_group": "senior", "cultural_heritage": " Italian-American",
+                 "profile_complete": True}
+
+    assert dashboard_cache_key(profile_a, "family") == dashboard_cache_key(profile_b, "family")
+    assert dashboard_cache_key(profile_a, "family") != dashboard_cache_key(profile_a, "music")
+
+
+def test_lru_evicts_by_bytes():
+    lru = ByteBoundedLRU(max_bytes=70)
+    lru.put("a", {"value": "x" * 20}, ttl_seconds=60)
+    lru.put("b", {"value": "y" * 20}, ttl_seconds=60)
+    lru.get("a")
+    lru.put("c", {"value": "z" * 20}, ttl_seconds=60)
+
+    # "b" was least recently used
+    assert lru.get("b") is None
+    assert lru.get("a") == {"value": "x" * 20}
+    assert lru.current_bytes <= 70
+    assert lru.evictions == 1
+
+
+def test_lru_expiry():
+    lru = ByteBoundedLRU(max_bytes=1024)
+    lru.put("a", {"value": 1}, ttl_seconds=0.05)
+    time.sleep(0.1)
+
+    assert lru.get("a") is None
+    assert lru.expirations == 1
+
+
+def test_degraded_dashboards_are_not_cached():
+    cache = DashboardCache(max_bytes=1024 * 1024)
+    key = cache.make_key({"cultural_heritage": "Irish"}, "seasons")
+
+    assert not cache.put(key, {"content": {}, "metadata": {"degraded_sections": ["music"]}})
+    assert cache.get(key) is None
+
+    assert cache.put(key, {"content": {}, "metadata": {"degraded_sections": []}})
+    cached = cache.get(key)
+    cached["content"]["mutated"] = True
+    assert cache.get(key) == {"content": {}, "metadata": {"degraded_sections": []}}
+    assert cache.get_stats()["hits"] == 2
+
+
+def test_concurrent_misses_keep_their_own_theme():
+    import main
+
+    store = InMemoryStateStore()
+    theme_manager = main.simplified_theme_manager
+    previous = (theme_manager.state_store, main.sequential_agent, main.dashboard_cache)
+    theme_manager.use_state_store(store)
+    main.dashboard_cache = DashboardCache(max_bytes=1024 * 1024)
+    main.sequential_agent = make_sequential_agent(
+        content_delay=0.05,
+        agent1=InformationConsolidatorAgent(theme_manager=theme_manager, state_store=store)
+    )
+    themes = theme_manager.get_all_themes()
+    profile_a = {"cultural_heritage": "Italian-American", "age_group": "oldest_senior"}
+    profile_b = {"cultural_heritage": "Irish-American", "age_group": "senior"}
+
+    def rotation_index():
+        return store.get(STATE_THEME_ROTATION)["current_index"]
+
+    async def run():
+        return await asyncio.gather(main.run_dashboard_pipeline(profile_a),
+                                    main.run_dashboard_pipeline(profile_b))
+
+    try:
+        dashboard_a, dashboard_b = asyncio.run(run())
+
+        # Two requests advance the rotation twice and get consecutive themes
+        assert rotation_index() == 2
+        assert dashboard_a["metadata"]["theme"] == themes[0]["name"]
+        assert dashboard_b["metadata"]["theme"] == themes[1]["name"]
+
+        # Each dashboard is cached under the theme it was generated for
+        cached_b = main.dashboard_cache.get(main.dashboard_cache.make_key(profile_b, themes[1]["id"]))
+        assert cached_b["metadata"]["theme"] == themes[1]["name"]
+        assert main.dashboard_cache.get(main.dashboard_cache.make_key(profile_b, themes[0]["id"])) is None
+
+        # A cache hit advances the rotation like any other request
+        store.put(STATE_THEME_ROTATION, {"current_index": 1})
+        hit = asyncio.run(main.run_dashboard_pipeline(profile_b))
+        assert hit["pipeline_metadata"]["dashboard_cache"] == "hit"
+        assert rotation_index() == 2
+    finally:
+        theme_manager.use_state_store(previous[0])
+        main.sequential_agent, main.dashboard_cache = previous[1], previous[2]
+
+
+if __name__ == "__main__":
+    for test in [test_key_is_canonical, test_lru_evicts_by_bytes, test_lru_expiry,
+                 test_degraded_dashboards_are_not_cached, test_concurrent_misses_keep_their_own_theme]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Dashboard cache tests passed")
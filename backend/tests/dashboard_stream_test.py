@@ -0,0 +1,138 @@
+"""
+Streaming Dashboard Endpoint Test Script
+File: backend/tests/dashboard_stream_test.py
+
+PURPOSE:
+- Verify /api/dashboard/stream emits sections in completion order, then the full dashboard
+- Verify a cached dashboard is replayed section by section
+- Verify pipeline failures and exceptions mid-stream end with an error event
+- Verify Server-Sent Events framing when the client asks for text/event-stream
+"""
+
+import json
+import sys
+import os
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fastapi.testclient import TestClient
+
+import main
+from multi_tool_agent.dashboard_cache import DashboardCache
+from multi_tool_agent.state_store import InMemoryStateStore, STATE_THEME_ROTATION
+from sequential_agent_test import StubAgent, make_sequential_agent, PROFILE
+
+
+@contextmanager
+def stub_app(**agent_overrides):
+    """main.app backed by stub agents, a fresh dashboard cache and an in-memory rotation"""
+
+    store = InMemoryStateStore()
+    theme_manager = main.simplified_theme_manager
+    previous = (theme_manager.state_store, main.sequential_agent, main.dashboard_cache)
+    theme_manager.use_state_store(store)
+    main.dashboard_cache = DashboardCache(max_bytes=1024 * 1024)
+    main.sequential_agent = make_sequential_agent(**agent_overrides)
+    try:
+        yield TestClient(main.app), store
+    finally:
+        theme_manager.use_state_store(previous[0])
+        main.sequential_agent, main.dashboard_cache = previous[1], previous[2]
+
+
+def stream_events(client: TestClient):
+    response = client.post("/api/dashboard/stream", json={"patient_profile": PROFILE})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def staggered_content_agents():
+    """Recipe finishes first, then photo, then music"""
+    return {
+        "agent4a": StubAgent({"music_content": {"artist": "Puccini"}}, 0.15),
+        "agent4b": StubAgent({"recipe_content": {"name": "Minestrone"}}, 0.0),
+        "agent4c": StubAgent({"photo_content": {"description": "A family dinner"}}, 0.05)
+    }
+
+
+def test_sections_arrive_in_completion_order():
+    with stub_app(**staggered_content_agents()) as (client, _):
+        events = stream_events(client)
+
+    sections = [event["section"] for event in events if event["event"] == "section"]
+    assert sections == ["theme", "recipe", "photo", "music", "nostalgia_news"]
+    assert [event["event"] for event in events][-1] == "dashboard"
+
+    by_section = {event["section"]: event["data"] for event in events if event["event"] == "section"}
+    dashboard = events[-1]["data"]
+    assert dashboard["content"]["music"] == by_section["music"]
+    assert dashboard["content"]["recipe"] == by_section["recipe"]
+    assert dashboard["content"]["photo"] == by_section["photo"]
+    assert dashboard["content"]["nostalgia_news"] == by_section["nostalgia_news"]
+    assert dashboard["patient_info"] == by_section["theme"]
+    assert dashboard["pipeline_metadata"]["dashboard_cache"] == "miss"
+
+
+def test_cached_dashboard_is_replayed():
+    with stub_app() as (client, store):
+        fresh = stream_events(client)
+        # Same theme again: the second request is served from the dashboard cache
+        store.put(STATE_THEME_ROTATION, {"current_index": 0})
+        replayed = stream_events(client)
+
+    sections = [event["section"] for event in replayed if event["event"] == "section"]
+    assert sections == ["theme", "recipe", "photo", "music", "nostalgia_news"]
+    assert all(not event["degraded"] for event in replayed if event["event"] == "section")
+
+    dashboard = replayed[-1]["data"]
+    assert replayed[-1]["event"] == "dashboard"
+    assert dashboard["pipeline_metadata"]["dashboard_cache"] == "hit"
+    assert dashboard["content"] == fresh[-1]["data"]["content"]
+
+
+def test_pipeline_failure_ends_with_error_event():
+    # Agent 6 has no fallback, so its failure fails the whole pipeline after the sections
+    with stub_app(agent6=StubAgent({}, fail=True)) as (client, _):
+        events = stream_events(client)
+
+    assert any(event["event"] == "section" for event in events)
+    assert events[-1]["event"] == "error"
+    assert events[-1]["data"]["success"] is False
+    assert events[-1]["data"]["pipeline_stage"] == "agent6"
+
+
+def test_exception_mid_stream_ends_with_error_event():
+    with stub_app() as (client, _):
+        async def broken_stream(**kwargs):
+            yield {"event": "section", "section": "theme", "data": {}, "degraded": False}
+            raise RuntimeError("upstream exploded")
+
+        main.sequential_agent.run_stream = broken_stream
+        events = stream_events(client)
+
+    assert [event["event"] for event in events] == ["section", "error"]
+    assert events[-1]["data"] == {"success": False, "error": "upstream exploded"}
+
+
+def test_server_sent_events_framing():
+    with stub_app() as (client, _):
+        response = client.post("/api/dashboard/stream", json={"patient_profile": PROFILE},
+                               headers={"Accept": "text/event-stream"})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = [frame for frame in response.text.split("\n\n") if frame]
+    names = [frame.splitlines()[0] for frame in frames]
+    assert names[0] == "event: theme"
+    assert names[-1] == "event: dashboard"
+    assert json.loads(frames[-1].splitlines()[1][len("data: "):])["event"] == "dashboard"
+
+
+if __name__ == "__main__":
+    for test in [test_sections_arrive_in_completion_order, test_cached_dashboard_is_replayed,
+                 test_pipeline_failure_ends_with_error_event, test_exception_mid_stream_ends_with_error_event,
+                 test_server_sent_events_framing]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Dashboard stream tests passed")
@@ -0,0 +1,146 @@
+"""
+Fake Upstream Services Test Script
+File: backend/tests/fake_upstreams_test.py
+
+PURPOSE:
+- Verify every tool gets live (non-fallback) results from the fake services via its base-URL override
+- Verify fake Gemini answers JSON prompts with the requested schema, streamed or not
+- Verify injected 429s and errors reach the tools (Retry-After, fallbacks)
+- Verify initialize_all_tools wires base URLs so tools run against a loopback fake server
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.fake_upstreams import FakeUpstreams, FaultProfile, FakeUpstreamServer, upstream_base_urls
+from multi_tool_agent.rate_limiting import UpstreamLimiter
+from multi_tool_agent.tools import initialize_all_tools
+from multi_tool_agent.tools.qloo_tools import QlooInsightsAPI
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool, StreamingGeminiTool
+from multi_tool_agent.tools.youtube_tools import YouTubeAPI
+from multi_tool_agent.tools.vision_ai_tools import VisionAIAnalyzer
+
+BASE_URLS = upstream_base_urls("http://fake-upstreams")
+
+NEWSLETTER_SCHEMA = {"memory_spotlight": "string", "era_highlights": "string", "heritage_traditions": "string",
+                     "conversation_starters": ["string", "string", "string"]}
+
+
+def asgi_client(upstreams: FakeUpstreams) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=upstreams.app))
+
+
+def test_tools_get_live_results_from_fakes():
+    upstreams = FakeUpstreams(seed=1)
+    client = asgi_client(upstreams)
+    qloo = QlooInsightsAPI("fake-key", http_client=client, base_url=BASE_URLS["qloo"])
+    youtube = YouTubeAPI("fake-key", http_client=client, base_url=BASE_URLS["youtube"])
+    vision = VisionAIAnalyzer("fake-key", http_client=client, base_url=BASE_URLS["vision"])
+    gemini = SimpleGeminiTool("fake-key", http_client=client, base_url=BASE_URLS["gemini"])
+
+    async def run():
+        return await asyncio.gather(
+            qloo.make_cultural_calls("Italian-American"),
+            youtube.search_videos_enhanced("Verdi", "Italian-American"),
+            vision.analyze_with_google_vision("aGVsbG8="),
+            gemini.generate_content("Describe a Sunday dinner")
+        )
+
+    cultural, videos, vision_result, text = asyncio.run(run())
+
+    artists = cultural["cultural_recommendations"]["artists"]
+    assert "method" not in artists and artists["entities"][0]["name"] == "Giuseppe Verdi"
+    assert "Italian" in cultural["cultural_recommendations"]["places"]["entities"][0]["name"]
+    assert len(videos) == 5 and all(video["license"] == "Creative Commons" for video in videos)
+    assert vision_result["success"] and "Family" in vision_result["labels"] and len(vision_result["people"]) == 2
+    assert text and len(text.split()) > 20
+    assert {service: counts["requests"] for service, counts in upstreams.get_stats().items()} == \
+        {"qloo": 2, "gemini": 1, "youtube": 3, "vision": 1}
+
+
+def test_gemini_json_follows_prompt_schema():
+    upstreams = FakeUpstreams(stream_chunk_chars=40, stream_chunk_delay_ms=0)
+    gemini = StreamingGeminiTool("fake-key", http_client=asgi_client(upstreams), base_url=BASE_URLS["gemini"])
+    sections = []
+
+    async def run():
+        plain = await SimpleGeminiTool("fake-key", http_client=asgi_client(upstreams),
+                                       base_url=BASE_URLS["gemini"]).generate_nostalgia_newsletter(
+            "Music theme newsletter", NEWSLETTER_SCHEMA)
+        streamed = await gemini.generate_nostalgia_newsletter(
+            "Family theme newsletter", NEWSLETTER_SCHEMA, on_section=lambda name, value: sections.append(name))
+        return plain, streamed
+
+    plain, streamed = asyncio.run(run())
+
+    for result in (plain, streamed):
+        assert set(result) == set(NEWSLETTER_SCHEMA)
+        assert len(result["memory_spotlight"].split()) >= 10
+        assert len(result["conversation_starters"]) == 3 and result["conversation_starters"][0].endswith("?")
+    assert sections == list(NEWSLETTER_SCHEMA)
+
+
+def test_injected_faults_reach_tools():
+    upstreams = FakeUpstreams(faults={
+        "qloo": FaultProfile(error_rate=1.0),
+        "gemini": FaultProfile(rate_limit_rate=1.0, retry_after_s=0.05),
+        "youtube": FaultProfile(latency_ms=50)
+    })
+    client = asgi_client(upstreams)
+    qloo = QlooInsightsAPI("fake-key", http_client=client, base_url=BASE_URLS["qloo"])
+    limiter = UpstreamLimiter("test_fake_gemini", max_attempts=2)
+    gemini = SimpleGeminiTool("fake-key", http_client=client, base_url=BASE_URLS["gemini"], rate_limiter=limiter)
+
+    async def run():
+        music = await qloo.get_safe_classical_music("German-American")
+        text = await gemini.generate_content("Describe a picnic")
+        response = await client.post("http://fake-upstreams/_fake/faults", json={"gemini": {"rate_limit_rate": 0}})
+        started = time.perf_counter()
+        await client.get(f"{BASE_URLS['youtube']}", params={"q": "Bach", "maxResults": 1})
+        return music, text, response, time.perf_counter() - started
+
+    music, text, response, youtube_s = asyncio.run(run())
+
+    assert music["method"] == "fallback"
+    assert text is None
+    assert limiter.stats["retry_after_honored"] == 1 and limiter.stats["gave_up"] == 1
+    assert response.json()["gemini"]["rate_limit_rate"] == 0
+    assert youtube_s >= 0.05
+    assert upstreams.stats["qloo"]["errors_injected"] == 1 and upstreams.stats["gemini"]["rate_limited"] == 2
+
+
+def test_initialize_all_tools_against_loopback_server():
+    async def run():
+        async with FakeUpstreamServer(FakeUpstreams()) as server:
+            os.environ.update({"QLOO_API_KEY": "fake", "YOUTUBE_API_KEY": "fake", "GOOGLE_CLOUD_API_KEY": "fake"})
+            try:
+                tools = initialize_all_tools(base_urls=upstream_base_urls(server.url))
+            finally:
+                for name in ["QLOO_API_KEY", "YOUTUBE_API_KEY", "GOOGLE_CLOUD_API_KEY"]:
+                    os.environ.pop(name, None)
+
+            music = await tools["qloo_tool"].get_safe_classical_music("Irish-American")
+            text = await tools["gemini_tool"].generate_content("Describe a garden")
+            return tools, music, text, server.upstreams.get_stats()
+
+    tools, music, text, stats = asyncio.run(run())
+
+    assert tools["youtube_tool"].base_url.endswith("/youtube/v3/search")
+    assert tools["vision_ai_tool"].base_url.endswith("/v1")
+    assert music["success"] and "method" not in music
+    assert text
+    assert stats["qloo"]["requests"] == 1 and stats["gemini"]["requests"] == 1
+
+
+if __name__ == "__main__":
+    for test in [test_tools_get_live_results_from_fakes, test_gemini_json_follows_prompt_schema,
+                 test_injected_faults_reach_tools, test_initialize_all_tools_against_loopback_server]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Fake upstream tests passed")
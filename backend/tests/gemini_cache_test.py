@@ -0,0 +1,107 @@
+"""
+Gemini Response Cache Test Script
+File: backend/tests/gemini_cache_test.py
+
+PURPOSE:
+- Verify identical prompts/model/generationConfig are served from the cache
+- Verify whitespace-only prompt differences share a key, config changes do not
+- Verify unparseable responses are not cached and fresh=True bypasses the read
+- Verify per-method TTLs and the SQLite tier across restarts
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.gemini_cache import (
+    GeminiResponseCache, gemini_cache_key, METHOD_GENERATE_CONTENT, METHOD_STRUCTURED_JSON
+)
+from upstream_mocks import make_mock_gemini
+
+SCHEMA = {"title": "string", "body": "string"}
+
+
+def payload(text: str, temperature: float = 0.7) -> dict:
+    return {"contents": [{"parts": [{"text": text}]}], "generationConfig": {"temperature": temperature}}
+
+
+def test_repeated_prompt_served_from_cache():
+    cache = GeminiResponseCache()
+    requests = []
+    gemini = make_mock_gemini(["Back in 1955, families gathered for Sunday dinner."], requests, response_cache=cache)
+
+    async def run():
+        first = await gemini.generate_content("Describe Sunday dinner for the Family theme")
+        second = await gemini.generate_content("Describe Sunday dinner for the Family theme")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert len(requests) == 1
+    assert cache.get_stats()["methods"][METHOD_GENERATE_CONTENT] == {"hits": 1, "misses": 1, "fresh_requests": 0}
+
+
+def test_key_normalization():
+    assert gemini_cache_key("gemini-1.5-flash", payload("Theme:  Family\n  Heritage: Italian")) == \
+        gemini_cache_key("gemini-1.5-flash", payload("Theme: Family Heritage: Italian"))
+    assert gemini_cache_key("gemini-1.5-flash", payload("Theme: Family")) != \
+        gemini_cache_key("gemini-1.5-flash", payload("Theme: Family", temperature=0.3))
+    assert gemini_cache_key("gemini-1.5-flash", payload("Theme: Family")) != \
+        gemini_cache_key("gemini-1.5-pro", payload("Theme: Family"))
+
+
+def test_invalid_json_not_cached_and_fresh_bypasses_read():
+    cache = GeminiResponseCache()
+    requests = []
+    gemini = make_mock_gemini(["not json", '{"title": "Music", "body": "Swing"}',
+                               '{"title": "Music", "body": "Jazz"}'], requests, response_cache=cache)
+
+    async def run():
+        invalid = await gemini.generate_structured_json("Music newsletter", SCHEMA)
+        parsed = await gemini.generate_structured_json("Music newsletter", SCHEMA)
+        cached = await gemini.generate_structured_json("Music newsletter", SCHEMA)
+        fresh = await gemini.generate_structured_json("Music newsletter", SCHEMA, fresh=True)
+        refreshed = await gemini.generate_structured_json("Music newsletter", SCHEMA)
+        return invalid, parsed, cached, fresh, refreshed
+
+    invalid, parsed, cached, fresh, refreshed = asyncio.run(run())
+
+    assert invalid is None
+    assert parsed == cached == {"title": "Music", "body": "Swing"}
+    assert fresh == refreshed == {"title": "Music", "body": "Jazz"}
+    assert len(requests) == 3
+    assert cache.get_stats()["methods"][METHOD_STRUCTURED_JSON]["fresh_requests"] == 1
+
+
+def test_per_method_ttls_and_disk_tier():
+    path = os.path.join(tempfile.mkdtemp(), "gemini.sqlite3")
+    ttls = {METHOD_GENERATE_CONTENT: 3600, METHOD_STRUCTURED_JSON: 0}
+
+    cache = GeminiResponseCache(ttls=ttls, db_path=path)
+    assert cache.put(METHOD_GENERATE_CONTENT, "text-key", "Remember those Sunday drives?")
+    assert not cache.put(METHOD_STRUCTURED_JSON, "json-key", {"title": "Music"})
+    cache.close()
+
+    restarted = GeminiResponseCache(ttls=ttls, db_path=path)
+    assert restarted.get(METHOD_GENERATE_CONTENT, "text-key") == "Remember those Sunday drives?"
+    assert restarted.get(METHOD_STRUCTURED_JSON, "json-key") is None
+    assert restarted.get_stats()["disk_hits"] == 1
+    restarted.close()
+
+    # Event-loop reads reach the disk tier through a worker thread
+    reopened = GeminiResponseCache(ttls=ttls, db_path=path)
+    assert asyncio.run(reopened.aget(METHOD_GENERATE_CONTENT, "text-key")) == "Remember those Sunday drives?"
+    assert reopened.get_stats()["disk_hits"] == 1
+    reopened.close()
+
+
+if __name__ == "__main__":
+    for test in [test_repeated_prompt_served_from_cache, test_key_normalization,
+                 test_invalid_json_not_cached_and_fresh_bypasses_read, test_per_method_ttls_and_disk_tier]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Gemini response cache tests passed")
@@ -0,0 +1,178 @@
+"""
+Streaming Gemini Test Script
+File: backend/tests/gemini_streaming_test.py
+
+PURPOSE:
+- Verify top-level JSON sections are parsed as soon as they complete, across chunk splits
+- Verify stream_content() yields streamGenerateContent chunks incrementally
+- Verify the newsletter reports sections before the stream finishes, and cache hits replay them
+- Verify Agent 5 forwards streamed sections without changing its final output
+- Verify streams that break or carry malformed events after the 200 count as breaker failures
+"""
+
+import asyncio
+import json
+import sys
+import os
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.json_stream import IncrementalJSONSections
+from multi_tool_agent.circuit_breaker import CircuitBreaker, STATE_OPEN
+from multi_tool_agent.gemini_cache import GeminiResponseCache
+from multi_tool_agent.tools.simple_gemini_tools import StreamingGeminiTool
+from multi_tool_agent.agents.nostalgia_news_generator import NostalgiaNewsGenerator
+
+SECTION = "Back in the 1950s, families gathered around the radio for evening programs full of music and laughter."
+
+NEWSLETTER = {
+    "memory_spotlight": SECTION,
+    "era_highlights": SECTION,
+    "heritage_traditions": SECTION,
+    "conversation_starters": ["What radio programs were popular?", "Which songs were favorites?",
+                              "Who gathered around the radio?"]
+}
+
+SCHEMA = {"memory_spotlight": "string", "era_highlights": "string", "heritage_traditions": "string",
+          "conversation_starters": ["string", "string", "string"]}
+
+
+def sse_chunks(text: str, size: int) -> list:
+    return [
+        f"data: {json.dumps({'candidates': [{'content': {'parts': [{'text': text[i:i + size]}]}}]})}\r\n\r\n"
+        for i in range(0, len(text), size)
+    ]
+
+
+def make_streaming_gemini(text: str, requests: list, delay_s: float = 0.0,
+                          cache: GeminiResponseCache = None) -> StreamingGeminiTool:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        async def body():
+            for chunk in sse_chunks(text, 40):
+                await asyncio.sleep(delay_s)
+                yield chunk.encode()
+
+        return httpx.Response(200, content=body(), headers={"Content-Type": "text/event-stream"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return StreamingGeminiTool("test-key", http_client=client, response_cache=cache)
+
+
+def test_incremental_sections_across_chunk_splits():
+    text = '```json\n{"a": "one, \\"two\\" }", "b": ["x", "y"], "c": {"d": 1}}\n```'
+    sections = IncrementalJSONSections()
+    completed = []
+    for i in range(len(text)):
+        completed.extend(sections.feed(text[i]))
+
+    assert completed == [("a", 'one, "two" }'), ("b", ["x", "y"]), ("c", {"d": 1})]
+
+
+def test_stream_content_yields_chunks():
+    requests = []
+    gemini = make_streaming_gemini("Remember those Sunday drives in the countryside?", requests)
+
+    async def run():
+        return [chunk async for chunk in gemini.stream_content("Describe Sunday drives")]
+
+    chunks = asyncio.run(run())
+
+    assert len(chunks) == 2
+    assert "".join(chunks) == "Remember those Sunday drives in the countryside?"
+    assert ":streamGenerateContent" in str(requests[0].url) and "alt=sse" in str(requests[0].url)
+
+
+def test_newsletter_sections_arrive_before_stream_finishes():
+    requests = []
+    cache = GeminiResponseCache()
+    gemini = make_streaming_gemini(json.dumps(NEWSLETTER), requests, delay_s=0.01, cache=cache)
+    arrivals = []
+
+    async def run():
+        started = time.perf_counter()
+        result = await gemini.generate_nostalgia_newsletter(
+            "Radio days", SCHEMA, on_section=lambda name, value: arrivals.append((name, time.perf_counter() - started))
+        )
+        return result, time.perf_counter() - started
+
+    result, total_s = asyncio.run(run())
+
+    assert result == NEWSLETTER
+    assert [name for name, _ in arrivals] == list(NEWSLETTER)
+    assert arrivals[0][1] < total_s / 2
+
+    # A cache hit reports every section at once, without a request
+    replayed = []
+    again = asyncio.run(gemini.generate_nostalgia_newsletter("Radio days", SCHEMA,
+                                                             on_section=lambda name, value: replayed.append(name)))
+    assert again == NEWSLETTER
+    assert replayed == list(NEWSLETTER)
+    assert len(requests) == 1
+
+
+def test_agent5_forwards_streamed_sections():
+    requests = []
+    gemini = make_streaming_gemini(json.dumps(NEWSLETTER), requests)
+    partials = []
+    agent1_output = {"patient_info": {"cultural_heritage": "Irish-American"}, "theme_info": {"id": "music", "name": "Music"}}
+
+    result = asyncio.run(NostalgiaNewsGenerator(gemini_tool=gemini).run(
+        agent1_output, {}, {}, {}, {}, {}, on_partial_section=lambda part, value: partials.append(part)
+    ))
+
+    assert partials == list(NEWSLETTER)
+    assert result["nostalgia_news"]["sections"]["memory_spotlight"]["content"] == SECTION
+    assert result["nostalgia_news"]["metadata"]["generated_by"] == "gemini_newsletter"
+
+
+def test_broken_and_malformed_streams_reach_the_breaker():
+    text = "Remember those Sunday drives in the countryside?"
+
+    def make_gemini(breaker, body_chunks):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            async def body():
+                for chunk in body_chunks():
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    yield chunk.encode()
+            return httpx.Response(200, content=body(), headers={"Content-Type": "text/event-stream"})
+
+        return StreamingGeminiTool("test-key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                   circuit_breaker=breaker)
+
+    async def collect(gemini):
+        return "".join([chunk async for chunk in gemini.stream_content("Describe Sunday drives")])
+
+    # A malformed event is skipped, the rest of the stream is still used
+    breaker = CircuitBreaker("test_gemini_malformed", minimum_calls=10)
+    chunks = sse_chunks(text, 20)
+    gemini = make_gemini(breaker, lambda: chunks[:1] + ["data: {not json\r\n\r\n"] + chunks[1:])
+    assert asyncio.run(collect(gemini)) == text
+    assert breaker.stats["failures"] == 1
+
+    # Streams that keep dying mid-body open the breaker
+    # (each broken stream records the 200 headers as a success, then the body as a failure)
+    breaker = CircuitBreaker("test_gemini_broken", minimum_calls=4, open_seconds=60)
+    gemini = make_gemini(breaker, lambda: chunks[:1] + [httpx.ReadError("connection reset")])
+    for _ in range(2):
+        try:
+            asyncio.run(collect(gemini))
+        except httpx.ReadError:
+            pass
+        else:
+            raise AssertionError("expected httpx.ReadError")
+    assert breaker.state == STATE_OPEN
+
+
+if __name__ == "__main__":
+    for test in [test_incremental_sections_across_chunk_splits, test_stream_content_yields_chunks,
+                 test_newsletter_sections_arrive_before_stream_finishes, test_agent5_forwards_streamed_sections,
+                 test_broken_and_malformed_streams_reach_the_breaker]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Streaming Gemini tests passed")
@@ -0,0 +1,82 @@
+"""
+Shared HTTP Client Test Script
+File: backend/tests/http_clients_test.py
+
+PURPOSE:
+- Verify the registry hands out one pooled client per upstream
+- Verify pooled_client() uses the injected client and only closes temporary ones
+- Verify tools receive the pooled clients from initialize_all_tools()
+"""
+
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.http_clients import HTTPClientRegistry, pooled_client
+
+
+def test_registry_reuses_one_client_per_upstream():
+    async def run():
+        registry = HTTPClientRegistry(max_connections=10, max_keepalive_connections=5)
+        qloo = registry.get("qloo")
+        assert registry.get("qloo") is qloo
+        assert registry.get("gemini") is not qloo
+
+        await registry.aclose()
+        assert qloo.is_closed
+        return registry.get_stats()
+
+    stats = asyncio.run(run())
+    assert set(stats["clients"]) == {"qloo", "gemini"}
+    assert stats["max_connections"] == 10
+
+
+def test_pooled_client_only_closes_temporary_clients():
+    async def run():
+        registry = HTTPClientRegistry()
+        shared = registry.get("vision")
+
+        async with pooled_client(shared) as client:
+            assert client is shared
+        assert not shared.is_closed
+
+        async with pooled_client(None) as temporary:
+            assert temporary is not shared
+        assert temporary.is_closed
+
+        await registry.aclose()
+
+    asyncio.run(run())
+
+
+def test_tools_receive_pooled_clients():
+    from multi_tool_agent.tools import initialize_all_tools
+
+    saved_env = {name: os.environ.get(name) for name in ["QLOO_API_KEY", "GEMINI_API_KEY"]}
+    os.environ.update({name: value or "test-key" for name, value in saved_env.items()})
+
+    async def run():
+        registry = HTTPClientRegistry()
+        tools = initialize_all_tools(http_clients=registry)
+        assert tools["qloo_tool"].http_client is registry.get("qloo")
+        assert tools["gemini_tool"].http_client is registry.get("gemini")
+        await registry.aclose()
+
+    try:
+        asyncio.run(run())
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+if __name__ == "__main__":
+    for test in [test_registry_reuses_one_client_per_upstream, test_pooled_client_only_closes_temporary_clients,
+                 test_tools_receive_pooled_clients]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Shared HTTP client tests passed")
@@ -0,0 +1,79 @@
+"""
+Dashboard Load Generator Test Script
+File: backend/tests/load_generator_test.py
+
+PURPOSE:
+- Verify the steady scenario drives main:app in-process and over loopback against the stand-in upstreams
+- Verify the morning burst sends one dashboard per caregiver and reports upstream failures as fallbacks
+- Verify load runs never write theme or music state into config/
+"""
+
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.fake_upstreams import FaultProfile
+from benchmarks.load_generator import (
+    run_load_test, fallback_sections, SCENARIO_STEADY, SCENARIO_MORNING_BURST, TARGET_ASGI, TARGET_LOOPBACK
+)
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config")
+STATE_FILES = ["current_theme.json", "recent_music.json", "theme_state.json"]
+
+
+def state_files_written():
+    return [name for name in STATE_FILES if os.path.exists(os.path.join(CONFIG_DIR, name))]
+
+
+def test_steady_load_in_process_and_over_loopback():
+    reports = [
+        asyncio.run(run_load_test(SCENARIO_STEADY, target=target, faults={}, rate_limits=False,
+                                  users=3, ramp_s=0.2, duration_s=0.8, think_ms=50, seed=7))
+        for target in [TARGET_ASGI, TARGET_LOOPBACK]
+    ]
+
+    for report in reports:
+        latency = report["latency_ms"]
+        assert report["requests"] >= 3 and report["errors"] == 0
+        assert report["status_codes"] == {"200": report["requests"]}
+        assert report["fallback_rate"] == 0.0
+        assert report["requests_per_second"] > 0
+        assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert [report["target"] for report in reports] == ["asgi", "loopback"]
+    assert state_files_written() == []
+
+
+def test_morning_burst_reports_fallbacks():
+    report = asyncio.run(run_load_test(
+        SCENARIO_MORNING_BURST, faults={"gemini": FaultProfile(error_rate=1.0)}, caches=False, rate_limits=False,
+        facility_size=8, burst_window_s=0.3, refreshes=1, seed=3
+    ))
+
+    assert report["requests"] == 8 and report["errors"] == 0
+    assert report["peak_in_flight"] >= 2
+    assert report["fallback_rate"] == 1.0
+    assert report["fallback_sections"]["nostalgia_news"] == 8
+
+
+def test_fallback_sections_detection():
+    dashboard = {
+        "metadata": {"degraded_sections": ["music"]},
+        "content": {
+            "nostalgia_news": {"metadata": {"generated_by": "guaranteed_newsletter_fallback"}},
+            "photo": {"description": "A garden", "metadata": {"generated_by": "gemini"}},
+            "recipe": {"selection": {"fallback_used": True}}
+        }
+    }
+
+    assert fallback_sections(dashboard) == ["music", "nostalgia_news", "recipe"]
+    assert fallback_sections({"content": {"photo": {"description": "fallback garden"}}}) == []
+
+
+if __name__ == "__main__":
+    for test in [test_steady_load_in_process_and_over_loopback, test_morning_burst_reports_fallbacks,
+                 test_fallback_sections_detection]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Load generator tests passed")
@@ -0,0 +1,86 @@
+"""
+Pipeline Benchmark Test Script
+File: backend/tests/pipeline_benchmark_test.py
+
+PURPOSE:
+- Verify the benchmark times the full pipeline and every agent in isolation with stub tools
+- Verify the loop monitor catches synchronous work holding the event loop
+- Verify baseline comparison flags only regressions past both the relative and absolute thresholds
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.pipeline_benchmark import (
+    LoopBlockMonitor, run_benchmark, measure_stage, compare_to_baseline, PIPELINE_STAGE
+)
+
+
+def test_benchmark_covers_pipeline_and_every_agent():
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config")
+    state_files = ["current_theme.json", "recent_music.json", "theme_state.json"]
+
+    results = asyncio.run(run_benchmark(iterations=2, combined=True, streaming=True))
+
+    assert list(results["stages"])[0] == PIPELINE_STAGE
+    assert {"agent1", "agent2", "agent3", "agent4a", "agent4b", "agent4c", "agent4d", "agent5",
+            "agent6"} <= set(results["stages"])
+    assert results["degraded_sections"] == []
+    for metrics in results["stages"].values():
+        assert metrics["wall_ms_p50"] > 0 and metrics["peak_kb"] > 0 and "blocking_ms" in metrics
+    assert results["upstream_requests"]["misses"] == 0 and results["upstream_requests"]["replayed"] > 0
+    assert not any(os.path.exists(os.path.join(config_dir, name)) for name in state_files)
+
+
+def test_loop_monitor_catches_blocking_work():
+    async def blocking_stage():
+        await asyncio.sleep(0.005)
+        time.sleep(0.03)
+
+    async def polite_stage():
+        await asyncio.sleep(0.03)
+
+    blocking = asyncio.run(measure_stage(blocking_stage, iterations=2, trace_allocations=False))
+    polite = asyncio.run(measure_stage(polite_stage, iterations=2, trace_allocations=False))
+
+    assert blocking["blocking_ms"] >= 25 and blocking["max_block_ms"] >= 25
+    assert polite["blocking_ms"] < 10 and polite["wall_ms_p50"] >= 30
+
+    async def monitored():
+        async with LoopBlockMonitor() as monitor:
+            time.sleep(0.02)
+            await asyncio.sleep(0.005)
+        return monitor
+
+    monitor = asyncio.run(monitored())
+    assert monitor.stalls >= 1 and monitor.max_block_s >= 0.018
+
+
+def test_regressions_need_relative_and_absolute_growth():
+    baseline = {"stages": {
+        "agent3": {"wall_ms_p50": 10.0, "blocking_ms": 0.2, "peak_kb": 40.0},
+        "agent6": {"wall_ms_p50": 0.4, "blocking_ms": 0.0, "peak_kb": 20.0}
+    }}
+    current = {"stages": {
+        "agent3": {"wall_ms_p50": 14.0, "blocking_ms": 0.6, "peak_kb": 400.0},
+        "agent6": {"wall_ms_p50": 0.9, "blocking_ms": 0.0, "peak_kb": 21.0},
+        "agent4d": {"wall_ms_p50": 50.0, "blocking_ms": 9.0, "peak_kb": 900.0}
+    }}
+
+    regressions = compare_to_baseline(current, baseline, threshold=0.25)
+
+    assert [(r["stage"], r["metric"]) for r in regressions] == [("agent3", "wall_ms_p50"), ("agent3", "peak_kb")]
+    assert regressions[0]["change"] == 0.4
+    assert [r["metric"] for r in compare_to_baseline(current, baseline, threshold=0.5)] == ["peak_kb"]
+
+
+if __name__ == "__main__":
+    for test in [test_benchmark_covers_pipeline_and_every_agent, test_loop_monitor_catches_blocking_work,
+                 test_regressions_need_relative_and_absolute_growth]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Pipeline benchmark tests passed")
@@ -0,0 +1,231 @@
+"""
+Pipeline Graph Test Script
+File: backend/tests/pipeline_graph_test.py
+
+PURPOSE:
+- Verify nodes start as soon as their declared inputs are ready
+- Verify independent nodes overlap (Agent 2 ∥ Agent 3)
+- Verify fallbacks, failures and cycle detection
+- Verify concurrent runs of one graph each get their own run, with a bounded history
+- Verify latency budgets cancel overdue nodes and substitute fallbacks
+- Verify off-critical-path nodes get their slack and late starters fall back at once
+- Verify the default dashboard weights leave Gemini nodes a realistic share of the budget
+- Verify requests with negative, NaN or too small latency budgets are rejected with a 400
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config.settings import Config
+from multi_tool_agent.pipeline_graph import (
+    PipelineGraph, PipelineNodeError, NODE_COMPLETED, NODE_FALLBACK
+)
+from multi_tool_agent.sequential_agent import build_dashboard_graph
+
+
+class SleepyAgent:
+    """Agent stand-in that sleeps, then echoes its inputs"""
+
+    def __init__(self, delay: float, fail: bool = False, blocking: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.blocking = blocking
+        self.calls = 0
+
+    async def run(self, inputs):
+        self.calls += 1
+        if self.blocking:
+            time.sleep(self.delay)
+        else:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("simulated failure")
+        return {"seen": sorted(inputs)}
+
+
+async def run_node(node, inputs):
+    return await node.agent.run(inputs)
+
+
+def build_graph(**overrides):
+    agents = {
+        "a": SleepyAgent(0.01), "b": SleepyAgent(0.1), "c": SleepyAgent(0.1),
+        "d": SleepyAgent(0.01)
+    }
+    agents.update(overrides)
+    graph = PipelineGraph()
+    graph.add_node("a", agents["a"])
+    graph.add_node("b", agents["b"], depends_on=["a"])
+    graph.add_node("c", agents["c"], depends_on=["a"])
+    graph.add_node("d", agents["d"], depends_on=["b", "c"])
+    return graph
+
+
+def test_independent_nodes_overlap():
+    pipeline_run = asyncio.run(build_graph().execute(run_node))
+    timings = pipeline_run.timings
+
+    assert pipeline_run.outputs["d"] == {"seen": ["b", "c"]}
+    assert all(timing["status"] == NODE_COMPLETED for timing in timings.values())
+    # b and c both start once a finishes, so they run side by side
+    assert timings["c"]["start_ms"] < timings["b"]["finish_ms"]
+    assert timings["d"]["start_ms"] >= max(timings["b"]["finish_ms"], timings["c"]["finish_ms"])
+    assert pipeline_run.total_ms < 190
+
+
+def test_fallback_replaces_failed_node():
+    graph = build_graph(b=SleepyAgent(0.01, fail=True))
+    pipeline_run = asyncio.run(graph.execute(run_node, lambda node, inputs: {"fallback": node.name}))
+
+    assert pipeline_run.outputs["b"] == {"fallback": "b"}
+    assert pipeline_run.timings["b"]["status"] == NODE_FALLBACK
+    assert pipeline_run.to_metadata()["fallback_nodes"] == ["b"]
+    assert list(graph.recent_runs) == [pipeline_run]
+
+
+def test_concurrent_runs_keep_their_own_results():
+    graph = build_graph()
+
+    async def run_tagged(tag):
+        async def tagged_node(node, inputs):
+            return {"tag": tag, **await node.agent.run(inputs)}
+        return await graph.execute(tagged_node)
+
+    async def run():
+        return await asyncio.gather(*(run_tagged(tag) for tag in range(12)))
+
+    runs = asyncio.run(run())
+
+    assert [pipeline_run.outputs["d"]["tag"] for pipeline_run in runs] == list(range(12))
+    assert len(graph.recent_runs) == graph.recent_runs.maxlen == 10
+    assert all(any(pipeline_run is recent for pipeline_run in runs) for recent in graph.recent_runs)
+
+
+def test_failure_without_fallback_raises():
+    graph = build_graph(c=SleepyAgent(0.01, fail=True))
+    try:
+        asyncio.run(graph.execute(run_node, lambda node, inputs: None))
+    except PipelineNodeError as e:
+        assert e.node_name == "c"
+    else:
+        raise AssertionError("expected PipelineNodeError")
+
+
+def test_deadline_plan_scales_heaviest_path_to_budget():
+    plan = build_graph().deadline_plan(2.0)
+
+    # a → b → d has weight 3, so each unit-weight hop gets a third of the budget
+    assert abs(plan["a"] - 2.0 / 3) < 1e-9
+    assert abs(plan["b"] - plan["c"]) < 1e-9
+    assert abs(plan["d"] - 2.0) < 1e-9
+
+
+def test_overdue_node_is_cancelled_and_replaced():
+    graph = build_graph(c=SleepyAgent(5.0))
+    pipeline_run = asyncio.run(graph.execute(run_node, lambda node, inputs: {"fallback": node.name},
+                                             budget_s=0.6))
+
+    assert pipeline_run.outputs["c"] == {"fallback": "c"}
+    assert pipeline_run.timed_out_nodes() == ["c"]
+    assert pipeline_run.outputs["d"] == {"seen": ["b", "c"]}
+    assert pipeline_run.total_ms < 1000
+
+
+def test_off_critical_path_node_gets_slack():
+    graph = PipelineGraph()
+    graph.add_node("a", None)
+    graph.add_node("b", None, depends_on=["a"])
+    graph.add_node("c", None, depends_on=["a"], budget_weight=3.0)
+    graph.add_node("d", None, depends_on=["b", "c"])
+    plan = graph.deadline_plan(5.0)
+
+    # a → c → d weighs 5, so one weight unit is one second
+    assert abs(plan["a"] - 1.0) < 1e-9
+    assert abs(plan["c"] - 4.0) < 1e-9
+    assert abs(plan["d"] - 5.0) < 1e-9
+    # b only needs 1s but may run until d has to start
+    assert abs(plan["b"] - plan["c"]) < 1e-9
+    assert plan["b"] - plan["a"] > 1.0
+
+
+def test_node_without_time_left_falls_back_immediately():
+    # a blocks the event loop past b's deadline, so b starts with no time left
+    late = SleepyAgent(0.3)
+    graph = PipelineGraph()
+    graph.add_node("a", SleepyAgent(0.5, blocking=True))
+    graph.add_node("b", late, depends_on=["a"])
+    pipeline_run = asyncio.run(graph.execute(run_node, lambda node, inputs: {"fallback": node.name},
+                                             budget_s=0.4))
+
+    assert late.calls == 0
+    assert pipeline_run.outputs["b"] == {"fallback": "b"}
+    assert pipeline_run.timed_out_nodes() == ["b"]
+    assert pipeline_run.timings["b"]["duration_ms"] < 50
+
+
+def test_default_weights_leave_gemini_nodes_enough_time():
+    budget_s = Config.DASHBOARD_LATENCY_BUDGET_MS / 1000
+
+    def window(graph, plan, name):
+        # Time a node still has if every upstream node uses its whole deadline
+        upstream = max(plan[dep] for dep in graph.nodes[name].depends_on)
+        return plan[name] - upstream
+
+    per_agent = build_dashboard_graph()
+    plan = per_agent.deadline_plan(budget_s)
+    assert window(per_agent, plan, "agent5") >= 0.6 * budget_s
+    assert window(per_agent, plan, "agent4c") >= 0.5 * budget_s
+
+    combined = build_dashboard_graph(agent4d=object())
+    plan = combined.deadline_plan(budget_s)
+    assert window(combined, plan, "agent4d") >= 0.6 * budget_s
+    assert window(combined, plan, "agent3") >= 0.2 * budget_s
+    assert window(combined, plan, "agent4a") >= 0.2 * budget_s
+
+
+def test_cycle_detection():
+    graph = PipelineGraph()
+    graph.add_node("x", None, depends_on=["y"])
+    graph.add_node("y", None, depends_on=["x"])
+    try:
+        graph.topological_order()
+    except ValueError as e:
+        assert "cycle" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_invalid_latency_budgets_are_rejected():
+    from fastapi import HTTPException
+    from main import resolve_dashboard_request
+
+    profile = {"cultural_heritage": "Italian-American", "age_group": "oldest_senior"}
+    for budget in [-1000, float("nan"), "nan", float("inf"), 0, Config.DASHBOARD_MIN_LATENCY_BUDGET_MS - 1, "fast"]:
+        try:
+            resolve_dashboard_request({"patient_profile": profile, "latency_budget_ms": budget})
+        except HTTPException as e:
+            assert e.status_code == 400
+        else:
+            raise AssertionError(f"expected a 400 for latency_budget_ms={budget!r}")
+
+    accepted = resolve_dashboard_request({"patient_profile": profile, "latency_budget_ms": "2500"})
+    assert accepted["latency_budget_ms"] == 2500.0
+    default = resolve_dashboard_request({"patient_profile": profile})
+    assert default["latency_budget_ms"] == (Config.DASHBOARD_LATENCY_BUDGET_MS or None)
+
+
+if __name__ == "__main__":
+    for test in [test_independent_nodes_overlap, test_fallback_replaces_failed_node,
+                 test_concurrent_runs_keep_their_own_results,
+                 test_failure_without_fallback_raises, test_deadline_plan_scales_heaviest_path_to_budget,
+                 test_overdue_node_is_cancelled_and_replaced, test_off_critical_path_node_gets_slack,
+                 test_node_without_time_left_falls_back_immediately,
+                 test_default_weights_leave_gemini_nodes_enough_time, test_cycle_detection,
+                 test_invalid_latency_budgets_are_rejected]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Pipeline graph tests passed")
@@ -0,0 +1,107 @@
+"""
+Dashboard Pre-Generation Test Script
+File: backend/tests/precompute_test.py
+
+PURPOSE:
+- Verify the SQLite store persists dashboards keyed like the dashboard cache
+- Verify degraded dashboards and past days are never stored
+- Verify a run covers every distinct profile x theme once and skips stored ones
+- Verify the nightly schedule time
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.dashboard_cache import dashboard_cache_key
+from multi_tool_agent.precompute import PrecomputedDashboardStore, PrecomputeScheduler
+
+THEMES = [{"id": "music", "name": "Music"}, {"id": "family", "name": "Family"}]
+PROFILES = [
+    {"cultural_heritage": "Italian-American", "age_group": "senior", "interests": ["music"]},
+    {"cultural_heritage": "Irish", "age_group": "senior", "interests": []},
+    # Same anonymized inputs as the first profile
+    {"cultural_heritage": "Italian-American", "age_group": "senior", "interests": ["music"], "patient_id": "x"}
+]
+
+
+def make_store() -> PrecomputedDashboardStore:
+    path = os.path.join(tempfile.mkdtemp(), "precomputed.sqlite3")
+    return PrecomputedDashboardStore(path)
+
+
+def test_store_round_trip_and_persistence():
+    store = make_store()
+    tomorrow = date.today() + timedelta(days=1)
+    key = store.make_key(PROFILES[0], "music", tomorrow)
+    dashboard = {"content": {"music": {"artist": "Verdi"}}, "metadata": {"theme": "Music", "degraded_sections": []}}
+
+    assert key == dashboard_cache_key(PROFILES[0], "music", tomorrow)
+    assert store.put(key, dashboard, tomorrow)
+    assert store.get(key) == dashboard
+
+    # A new store on the same file sees the dashboard once it is committed (survives restarts)
+    store.store.flush()
+    reopened = PrecomputedDashboardStore(store.store.path)
+    assert reopened.get(key) == dashboard
+    assert asyncio.run(reopened.aget(key)) == dashboard
+
+
+def test_degraded_and_past_dashboards_are_not_stored():
+    store = make_store()
+    tomorrow = date.today() + timedelta(days=1)
+    key = store.make_key(PROFILES[1], "family", tomorrow)
+
+    assert not store.put(key, {"metadata": {"degraded_sections": ["music"]}}, tomorrow)
+    assert not store.put(key, {"success": False, "error": "boom"}, tomorrow)
+    assert not store.put(key, {"metadata": {"degraded_sections": []}}, date.today() - timedelta(days=1))
+    assert store.get(key) is None
+    assert store.get_stats()["skipped_degraded"] == 1
+
+
+def test_run_covers_distinct_profiles_and_themes_once():
+    store = make_store()
+    calls = []
+
+    async def generate(profile, theme_id, day):
+        calls.append((profile["cultural_heritage"], theme_id))
+        await asyncio.sleep(0.01)
+        # The Irish "family" run falls back to another theme and must not be stored
+        theme_name = "Memory Lane" if (profile["cultural_heritage"], theme_id) == ("Irish", "family") else theme_id.title()
+        return {"content": {}, "metadata": {"theme": theme_name, "degraded_sections": []}}
+
+    scheduler = PrecomputeScheduler(store, generate, lambda: PROFILES, lambda: THEMES, concurrency=2)
+    tomorrow = date.today() + timedelta(days=1)
+
+    summary = asyncio.run(scheduler.run_once(tomorrow))
+
+    assert summary["jobs"] == 4
+    assert summary["generated"] == 3
+    assert summary["degraded"] == 1
+    assert len(calls) == 4
+    assert store.get(store.make_key(PROFILES[2], "music", tomorrow)) is not None
+
+    # Stored dashboards are not generated again
+    summary = asyncio.run(scheduler.run_once(tomorrow))
+    assert summary["already_stored"] == 3
+    assert len(calls) == 5
+
+
+def test_next_run_is_the_next_occurrence_of_run_hour():
+    scheduler = PrecomputeScheduler(make_store(), None, list, list, run_hour=22)
+
+    assert scheduler.next_run_at(datetime(2024, 5, 1, 9, 30)) == datetime(2024, 5, 1, 22, 0)
+    assert scheduler.next_run_at(datetime(2024, 5, 1, 23, 0)) == datetime(2024, 5, 2, 22, 0)
+
+
+if __name__ == "__main__":
+    for test in [test_store_round_trip_and_persistence, test_degraded_and_past_dashboards_are_not_stored,
+                 test_run_covers_distinct_profiles_and_themes_once,
+                 test_next_run_is_the_next_occurrence_of_run_hour]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Precompute tests passed")
@@ -0,0 +1,92 @@
+"""
+Qloo Insights Cache Test Script
+File: backend/tests/qloo_cache_test.py
+
+PURPOSE:
+- Verify "Italian", "Italian-American" and "italy" share one cached entry per call
+- Verify parameter order/case/type do not change the key
+- Verify the SQLite tier survives a restart and promotes hits to memory
+- Verify failed and empty responses are not cached
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.qloo_cache import QlooInsightsCache, qloo_insights_cache_key
+from upstream_mocks import make_mock_qloo
+
+
+def test_heritage_variants_share_entries():
+    cache = QlooInsightsCache()
+    requests = []
+    qloo = make_mock_qloo("http://qloo.heritage", requests, insights_cache=cache)
+
+    async def run():
+        return [await qloo.make_cultural_calls(heritage) for heritage in ["Italian", "Italian-American", "italy"]]
+
+    results = asyncio.run(run())
+
+    # One artists call + one places call; the other two dashboards are cache hits
+    assert len(requests) == 2
+    assert [result["heritage"] for result in results] == ["Italian", "Italian-American", "italy"]
+    assert all(result["successful_calls"] == 2 for result in results)
+    stats = cache.get_stats()
+    assert (stats["memory_hits"], stats["misses"]) == (4, 2)
+
+
+def test_canonical_parameter_keys():
+    params = {"filter.type": "urn:entity:artist", "signal.interests.tags": "classical",
+              "signal.demographics.age": "55_and_older", "take": 10}
+    reordered = {"take": "10", "signal.demographics.age": "55_and_older",
+                 "signal.interests.tags": " Classical ", "filter.type": "urn:entity:artist"}
+
+    assert qloo_insights_cache_key("http://qloo", params) == qloo_insights_cache_key("http://qloo/", reordered)
+    assert qloo_insights_cache_key("http://qloo", params) != qloo_insights_cache_key("http://qloo", {**params, "take": 5})
+
+
+def test_sqlite_tier_survives_restart():
+    path = os.path.join(tempfile.mkdtemp(), "qloo.sqlite3")
+    requests = []
+
+    first = QlooInsightsCache(db_path=path)
+    asyncio.run(make_mock_qloo("http://qloo.restart", requests, insights_cache=first).get_safe_classical_music("Italian-American"))
+    first.close()
+
+    restarted = QlooInsightsCache(db_path=path)
+    qloo = make_mock_qloo("http://qloo.restart", requests, insights_cache=restarted)
+    result = asyncio.run(qloo.get_safe_classical_music("Italian"))
+    asyncio.run(qloo.get_safe_classical_music("Italian"))
+
+    assert len(requests) == 1
+    assert result["entities"] == [{"name": "Giuseppe Verdi"}]
+    stats = restarted.get_stats()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+
+
+def test_failed_and_empty_responses_not_cached():
+    cache = QlooInsightsCache()
+    requests = []
+    qloo = make_mock_qloo("http://qloo.failing", requests, status_code=503, insights_cache=cache)
+
+    async def run():
+        await qloo.get_safe_classical_music("Italian")
+        return await qloo.get_safe_classical_music("Italian")
+
+    result = asyncio.run(run())
+
+    assert len(requests) == 2
+    assert result["method"] == "fallback"
+    assert not cache.put("http://qloo.failing", {"take": 1}, {"results": []})
+    assert len(cache.tiers.memory) == 0
+
+
+if __name__ == "__main__":
+    for test in [test_heritage_variants_share_entries, test_canonical_parameter_keys,
+                 test_sqlite_tier_survives_restart, test_failed_and_empty_responses_not_cached]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Qloo insights cache tests passed")
@@ -0,0 +1,75 @@
+"""
+Qloo Cultural Calls Concurrency Test Script
+File: backend/tests/qloo_cultural_calls_test.py
+
+PURPOSE:
+- Verify the artists and places calls run concurrently (slower call, not the sum)
+- Verify a call past its deadline falls back while the other keeps its live result
+- Verify the merged cultural_recommendations shape Agent 3 consumes
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.tools.qloo_tools import QlooInsightsAPI
+from upstream_mocks import make_mock_qloo
+
+CALL_DELAY = 0.2
+
+
+def make_qloo(base_url: str, places_delay: float = CALL_DELAY, call_deadline_s: float = None) -> QlooInsightsAPI:
+    # Distinct base URLs keep the tests from sharing single-flight calls
+    return make_mock_qloo(base_url, results=[{"name": "Giuseppe Verdi"}, {"name": "Giacomo Puccini"}],
+                          delay_s=CALL_DELAY, place_results=[{"name": "Trattoria Roma"}], place_delay_s=places_delay,
+                          call_deadline_s=call_deadline_s)
+
+
+def test_calls_run_concurrently():
+    qloo = make_qloo("http://qloo.concurrent")
+
+    async def run():
+        started = time.perf_counter()
+        results = await qloo.make_cultural_calls("Italian-American")
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+
+    # Two calls of CALL_DELAY each finish in about one delay, not two
+    assert elapsed < CALL_DELAY * 1.8
+    assert results["successful_calls"] == 2
+    assert results["total_results"] == 3
+    assert results["timed_out_calls"] == []
+    recommendations = results["cultural_recommendations"]
+    assert [entity["name"] for entity in recommendations["artists"]["entities"]] == ["Giuseppe Verdi", "Giacomo Puccini"]
+    assert recommendations["places"]["tag"] == "italian"
+
+
+def test_slow_call_falls_back_after_deadline():
+    qloo = make_qloo("http://qloo.deadline", places_delay=5.0, call_deadline_s=CALL_DELAY * 2)
+
+    async def run():
+        started = time.perf_counter()
+        results = await qloo.make_cultural_calls("Italian-American")
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+
+    assert elapsed < CALL_DELAY * 3
+    assert results["timed_out_calls"] == ["places"]
+    assert results["successful_calls"] == 1
+    recommendations = results["cultural_recommendations"]
+    assert recommendations["artists"]["entity_count"] == 2
+    assert "method" not in recommendations["artists"]
+    assert recommendations["places"]["method"] == "fallback"
+    assert recommendations["places"]["content_type"] == "cuisine_italian_fallback"
+
+
+if __name__ == "__main__":
+    for test in [test_calls_run_concurrently, test_slow_call_falls_back_after_deadline]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Qloo cultural calls tests passed")
@@ -0,0 +1,102 @@
+"""
+Qloo Prefetch Test Script
+File: backend/tests/qloo_prefetch_test.py
+
+PURPOSE:
+- Verify the prefetch covers every distinct tag/age group/entity type once
+- Verify concurrency stays within the configured bound
+- Verify a prefetched cache serves make_cultural_calls() with no live calls
+- Verify the warming → ready state transition
+"""
+
+import asyncio
+import sys
+import os
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.qloo_cache import QlooInsightsCache
+from multi_tool_agent.qloo_prefetch import QlooPrefetcher, STATE_READY
+from config.cultural_mappings import get_qloo_age_demographics
+from upstream_mocks import make_mock_qloo
+
+
+class RecordingTransport:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(dict(request.url.params))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return httpx.Response(200, json={"results": [{"name": request.url.params["signal.interests.tags"]}]})
+
+
+def test_prefetch_covers_vocabulary_with_bounded_concurrency():
+    transport = RecordingTransport(delay=0.01)
+    qloo = make_mock_qloo("http://qloo.prefetch", handler=transport.handler, insights_cache=QlooInsightsCache())
+    prefetcher = QlooPrefetcher(qloo, age_groups=get_qloo_age_demographics(), concurrency=3)
+
+    summary = asyncio.run(prefetcher.run_once())
+
+    # 2 music tags + 11 cuisine tags, for each of the 3 Qloo age bands
+    assert summary["requests"] == 39
+    assert summary["cached"] == 39
+    assert len(transport.requests) == 39
+    assert transport.max_in_flight <= 3
+    assert {params["signal.interests.tags"] for params in transport.requests
+            if params["filter.type"] == "urn:entity:artist"} == {"classical", "folk"}
+
+
+def test_prefetched_cache_needs_no_live_calls():
+    transport = RecordingTransport()
+    qloo = make_mock_qloo("http://qloo.warm", handler=transport.handler, insights_cache=QlooInsightsCache())
+    asyncio.run(QlooPrefetcher(qloo, age_groups=["55_and_older"]).run_once())
+    prefetched = len(transport.requests)
+
+    async def run():
+        return [await qloo.make_cultural_calls(heritage)
+                for heritage in ["Italian-American", "Irish", "Mexican-American", "Korean-American", "french"]]
+
+    results = asyncio.run(run())
+
+    assert len(transport.requests) == prefetched
+    assert all(result["successful_calls"] == 2 for result in results)
+
+
+def test_warming_until_first_run_finishes():
+    transport = RecordingTransport(delay=0.05)
+    qloo = make_mock_qloo("http://qloo.readiness", handler=transport.handler, insights_cache=QlooInsightsCache())
+    prefetcher = QlooPrefetcher(qloo, age_groups=["55_and_older"], interval_seconds=3600)
+
+    async def run():
+        prefetcher.start()
+        await asyncio.sleep(0)
+        warming = prefetcher.warming
+        while prefetcher.runs == 0:
+            await asyncio.sleep(0.01)
+        status = prefetcher.get_status()
+        await prefetcher.stop()
+        return warming, status
+
+    warming, status = asyncio.run(run())
+
+    assert warming
+    assert status["state"] == STATE_READY
+    assert status["scheduled"]
+    assert status["last_run"]["cached"] == 13
+
+
+if __name__ == "__main__":
+    for test in [test_prefetch_covers_vocabulary_with_bounded_concurrency, test_prefetched_cache_needs_no_live_calls,
+                 test_warming_until_first_run_finishes]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Qloo prefetch tests passed")
@@ -0,0 +1,155 @@
+"""
+Upstream Rate Limiting Test Script
+File: backend/tests/rate_limiting_test.py
+
+PURPOSE:
+- Verify 429 responses are retried after their Retry-After delay
+- Verify 5xx responses and transport errors get jittered exponential retries
+- Verify retries stop when the request deadline would be exceeded
+- Verify the token bucket paces bursts and rejects waits past the deadline
+- Verify Gemini streaming requests are retried before the body is read
+"""
+
+import asyncio
+import json
+import random
+import sys
+import os
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.rate_limiting import (
+    UpstreamLimiter, RateLimitExceeded, deadline_scope, parse_retry_after, get_rate_limit_stats
+)
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool, StreamingGeminiTool
+
+
+def scripted_client(responses: list, requests: list) -> httpx.AsyncClient:
+    """Client whose MockTransport returns (or raises) the scripted responses in order"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def gemini_ok(text: str) -> httpx.Response:
+    return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+
+def test_retry_after_is_honored():
+    requests = []
+    client = scripted_client([httpx.Response(429, headers={"Retry-After": "0.1"}), gemini_ok("Sunny picnic")],
+                             requests)
+    limiter = UpstreamLimiter("test_retry_after", max_attempts=3)
+    gemini = SimpleGeminiTool("test-key", http_client=client, rate_limiter=limiter)
+
+    started = time.perf_counter()
+    text = asyncio.run(gemini.generate_content("Describe a picnic"))
+
+    assert text == "Sunny picnic"
+    assert len(requests) == 2
+    assert time.perf_counter() - started >= 0.1
+    assert limiter.stats["retry_after_honored"] == 1
+    assert limiter.stats["retried_statuses"] == {"429": 1}
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_jittered_retries_on_5xx_and_transport_errors():
+    requests = []
+    client = scripted_client([httpx.Response(503), httpx.ConnectError("reset"), httpx.Response(200, json={})],
+                             requests)
+    limiter = UpstreamLimiter("test_jitter", max_attempts=3, base_delay_s=0.05, max_delay_s=0.2)
+
+    response = asyncio.run(limiter.request(lambda: client.get("https://upstream.test/v2/insights")))
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert limiter.stats["retried_statuses"] == {"503": 1, "transport_error": 1}
+    assert limiter.stats["gave_up"] == 0
+
+    # Full jitter: uniform between 0 and the exponential ceiling
+    random.seed(7)
+    delays = [limiter.backoff_delay(attempt) for attempt in (1, 2, 3, 4) for _ in range(50)]
+    assert all(0 <= delay <= 0.2 for delay in delays)
+    assert max(delays[:50]) <= 0.05 and max(delays[150:]) > 0.1
+
+
+def test_retries_stop_at_deadline():
+    requests = []
+    client = scripted_client([httpx.Response(429, headers={"Retry-After": "5"}), gemini_ok("unused")], requests)
+    limiter = UpstreamLimiter("test_deadline", max_attempts=3)
+
+    async def run():
+        with deadline_scope(0.5):
+            return await limiter.request(lambda: client.get("https://upstream.test/search"))
+
+    started = time.perf_counter()
+    response = asyncio.run(run())
+
+    assert response.status_code == 429
+    assert len(requests) == 1
+    assert time.perf_counter() - started < 0.5
+    assert limiter.stats["gave_up"] == 1
+
+
+def test_token_bucket_paces_bursts():
+    requests = []
+    client = scripted_client([httpx.Response(200) for _ in range(4)], requests)
+    limiter = UpstreamLimiter("test_bucket", requests_per_minute=600, burst=2)
+
+    async def burst():
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.request(lambda: client.get("https://upstream.test/")) for _ in range(4)))
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(burst())
+
+    # Two immediately, then one every 100ms
+    assert 0.18 <= elapsed < 0.6
+    assert limiter.stats["throttled"] == 2
+
+    async def past_deadline():
+        with deadline_scope(0.01):
+            await limiter.acquire()
+            await limiter.acquire()
+            await limiter.acquire()
+
+    try:
+        asyncio.run(past_deadline())
+        assert False, "expected RateLimitExceeded"
+    except RateLimitExceeded as e:
+        assert e.upstream == "test_bucket"
+    assert limiter.stats["rejected"] == 1
+    assert get_rate_limit_stats()["test_bucket"]["requests"] == 4
+
+
+def test_streaming_request_is_retried():
+    requests = []
+    body = f"data: {json.dumps({'candidates': [{'content': {'parts': [{'text': 'Radio days'}]}}]})}\r\n\r\n"
+    client = scripted_client([httpx.Response(503), httpx.Response(200, content=body.encode())], requests)
+    limiter = UpstreamLimiter("test_stream", max_attempts=2, base_delay_s=0.01)
+    gemini = StreamingGeminiTool("test-key", http_client=client, rate_limiter=limiter)
+
+    async def run():
+        return [chunk async for chunk in gemini.stream_content("Describe radio days")]
+
+    assert asyncio.run(run()) == ["Radio days"]
+    assert len(requests) == 2
+    assert limiter.stats["retries"] == 1
+
+
+if __name__ == "__main__":
+    for test in [test_retry_after_is_honored, test_jittered_retries_on_5xx_and_transport_errors,
+                 test_retries_stop_at_deadline, test_token_bucket_paces_bursts, test_streaming_request_is_retried]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Rate limiting tests passed")
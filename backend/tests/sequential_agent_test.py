@@ -0,0 +1,117 @@
+"""
+Sequential Agent Test Script
+File: backend/tests/sequential_agent_test.py
+
+PURPOSE:
+- Verify content agents 4A/4B/4C run concurrently in SequentialAgent.run
+- Verify the assembled dashboard still carries every content section
+- Verify music curation (4A) does not wait for Qloo (Agent 3)
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.sequential_agent import SequentialAgent
+from multi_tool_agent.agents.dashboard_synthesizer import DashboardSynthesizer
+from multi_tool_agent.state_store import InMemoryStateStore
+
+PROFILE = {"cultural_heritage": "Italian-American", "age_group": "oldest_senior", "interests": ["music"]}
+
+
+class StubConsolidator:
+    """Agent 1 stand-in: fixed patient and theme info"""
+
+    def __init__(self):
+        self.theme_ids = []
+
+    async def run(self, patient_profile, request_type, session_id, feedback_data, theme_id=None,
+                  dashboard_date=None):
+        self.theme_ids.append(theme_id)
+        theme_id = theme_id or "family"
+        return {
+            "patient_info": {"cultural_heritage": patient_profile["cultural_heritage"],
+                             "age_group": patient_profile["age_group"]},
+            "theme_info": {"id": theme_id, "name": theme_id.title(), "photo_filename": f"{theme_id}.png"}
+        }
+
+
+class StubAgent:
+    """Agent stand-in that sleeps, records when it ran, then returns a fixed output"""
+
+    def __init__(self, output, delay: float = 0.0, log=None, name: str = "", fail: bool = False):
+        self.output = output
+        self.delay = delay
+        self.log = log if log is not None else []
+        self.name = name
+        self.fail = fail
+
+    async def run(self, *args, **kwargs):
+        started = time.perf_counter()
+        await asyncio.sleep(self.delay)
+        self.log.append((self.name, started, time.perf_counter()))
+        if self.fail:
+            raise RuntimeError("simulated failure")
+        return dict(self.output)
+
+
+def make_sequential_agent(content_delay: float = 0.0, log=None, **overrides) -> SequentialAgent:
+    """SequentialAgent wired to stub agents (Agent 6 is the real synthesizer)"""
+
+    agents = {
+        "agent1": StubConsolidator(),
+        "agent2": StubAgent({"photo_analysis": {"success": True}}),
+        "agent3": StubAgent({"qloo_intelligence": {"cultural_recommendations": {}}}),
+        "agent4a": StubAgent({"music_content": {"artist": "Puccini", "piece_title": "O mio babbino caro"}},
+                             content_delay, log, "agent4a"),
+        "agent4b": StubAgent({"recipe_content": {"name": "Minestrone"}}, content_delay, log, "agent4b"),
+        "agent4c": StubAgent({"photo_content": {"description": "A family dinner"}}, content_delay, log, "agent4c"),
+        "agent5": StubAgent({"nostalgia_news": {"title": "Nostalgia News", "sections": {}}}),
+        "agent6": DashboardSynthesizer(state_store=InMemoryStateStore())
+    }
+    agents.update(overrides)
+    return SequentialAgent(**agents)
+
+
+def test_content_agents_run_concurrently():
+    log = []
+    agent = make_sequential_agent(content_delay=0.2, log=log)
+
+    started = time.perf_counter()
+    dashboard = asyncio.run(agent.run(PROFILE))
+    elapsed = time.perf_counter() - started
+
+    # Run one after another, 4A/4B/4C alone would take 0.6s
+    assert elapsed < 0.45
+    assert sorted(name for name, _, _ in log) == ["agent4a", "agent4b", "agent4c"]
+    latest_start = max(start for _, start, _ in log)
+    earliest_finish = min(finish for _, _, finish in log)
+    assert latest_start < earliest_finish
+
+    content = dashboard["content"]
+    assert content["music"]["artist"] == "Puccini"
+    assert content["recipe"]["name"] == "Minestrone"
+    assert content["photo"]["description"] == "A family dinner"
+
+
+def test_music_does_not_wait_for_qloo():
+    log = []
+    slow_qloo = StubAgent({"qloo_intelligence": {"cultural_recommendations": {}}}, 0.3, log, "agent3")
+    agent = make_sequential_agent(content_delay=0.05, log=log, agent3=slow_qloo)
+
+    assert "agent3" not in agent.graph.nodes["agent4a"].depends_on
+    asyncio.run(agent.run(PROFILE))
+
+    finished = {name: finish for name, _, finish in log}
+    assert finished["agent4a"] < finished["agent3"]
+    assert finished["agent4c"] > finished["agent3"]
+
+
+if __name__ == "__main__":
+    for test in [test_content_agents_run_concurrently, test_music_does_not_wait_for_qloo]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Sequential agent tests passed")
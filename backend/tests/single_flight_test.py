@@ -0,0 +1,157 @@
+"""
+Single-Flight Test Script
+File: backend/tests/single_flight_test.py
+
+PURPOSE:
+- Verify a burst of identical calls executes the work once
+- Verify followers get independent copies of the result
+- Verify one cancelled caller does not cancel the shared work
+- Verify a shared-call scope runs sequential repeats once (batch deduplication)
+- Verify failed or empty results are retried instead of reused for the whole scope
+"""
+
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.single_flight import SingleFlight, shared_call_scope
+
+
+def test_burst_of_identical_calls_runs_once():
+    flight = SingleFlight("test_burst")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"entities": ["Verdi"]}
+
+    async def burst():
+        return await asyncio.gather(*(flight.do("same", work) for _ in range(50)))
+
+    results = asyncio.run(burst())
+
+    assert len(calls) == 1
+    assert all(result == {"entities": ["Verdi"]} for result in results)
+    assert flight.get_stats()["executions"] == 1
+    assert flight.get_stats()["coalesced"] == 49
+
+    # Followers receive copies, so mutating one result leaves the others intact
+    results[1]["entities"].append("Puccini")
+    assert results[0]["entities"] == ["Verdi"]
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight("test_keys")
+
+    async def run():
+        return await asyncio.gather(flight.do("a", lambda: asyncio.sleep(0.01, result="a")),
+                                    flight.do("b", lambda: asyncio.sleep(0.01, result="b")))
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert flight.get_stats()["executions"] == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_work():
+    flight = SingleFlight("test_cancel")
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.05, result="done")))
+        second = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.05, result="unused")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "done"
+    assert flight.get_stats()["in_flight"] == 0
+
+
+def test_shared_call_scope_deduplicates_sequential_calls():
+    flight = SingleFlight("test_scope")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        return {"tag": "urn:tag:genre:music:italian"}
+
+    async def patient():
+        # Each patient repeats the same upstream call after the previous one finished
+        return await flight.do("italian", work)
+
+    async def batch():
+        with shared_call_scope() as scope:
+            tasks = [asyncio.create_task(patient()) for _ in range(5)]
+        results = []
+        for task in tasks:
+            results.append(await task)
+        return scope, results
+
+    scope, results = asyncio.run(batch())
+
+    assert len(calls) == 1
+    assert len(scope) == 1
+    assert all(result == {"tag": "urn:tag:genre:music:italian"} for result in results)
+
+    # Outside the scope, sequential calls run again
+    asyncio.run(patient())
+    assert len(calls) == 2
+
+
+def test_shared_call_scope_retries_failed_results():
+    flight = SingleFlight("test_scope_failures")
+    outcomes = [RuntimeError("timeout"), None, {}, {"success": False}, {"tag": "urn:tag:genre:music:irish"}]
+    calls = []
+
+    async def work():
+        outcome = outcomes[len(calls)]
+        calls.append(1)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def batch():
+        results = []
+        with shared_call_scope() as scope:
+            for _ in range(len(outcomes) + 2):
+                try:
+                    results.append(await flight.do("irish", work))
+                except RuntimeError:
+                    results.append("error")
+        return scope, results
+
+    scope, results = asyncio.run(batch())
+
+    # Each failure is retried by the next patient; the first success is reused
+    assert len(calls) == len(outcomes)
+    assert results == ["error", None, {}, {"success": False}] + [{"tag": "urn:tag:genre:music:irish"}] * 3
+    assert list(scope.values()) == [{"tag": "urn:tag:genre:music:irish"}]
+    assert flight.get_stats()["scope_hits"] == 2
+
+
+def test_custom_should_remember():
+    flight = SingleFlight("test_scope_empty_search", should_remember=lambda data: bool(data.get("items")))
+    responses = [{"items": []}, {"items": [{"id": "abc"}]}]
+    calls = []
+
+    async def work():
+        calls.append(1)
+        return responses[len(calls) - 1]
+
+    async def batch():
+        with shared_call_scope():
+            return [await flight.do("q", work) for _ in range(3)]
+
+    assert asyncio.run(batch()) == [{"items": []}, {"items": [{"id": "abc"}]}, {"items": [{"id": "abc"}]}]
+    assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    for test in [test_burst_of_identical_calls_runs_once, test_different_keys_run_separately,
+                 test_cancelled_caller_does_not_cancel_shared_work,
+                 test_shared_call_scope_deduplicates_sequential_calls,
+                 test_shared_call_scope_retries_failed_results, test_custom_should_remember]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Single-flight tests passed")
@@ -0,0 +1,152 @@
+"""
+State Store Test Script
+File: backend/tests/state_store_test.py
+
+PURPOSE:
+- Verify the memory and SQLite backends return copies and update atomically
+- Verify workers sharing one SQLite file never read the same rotation index
+- Verify theme rotation and recent-music avoidance run through the store without writing config/
+- Verify async access runs SQLite I/O in a worker thread and memory access inline
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+import threading
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config.theme_config import SimplifiedThemeManager
+from multi_tool_agent.agents.dashboard_synthesizer import DashboardSynthesizer
+from multi_tool_agent.agents.music_curation_agent import MusicCurationAgent
+from multi_tool_agent.state_store import (
+    InMemoryStateStore, SQLiteStateStore, create_state_store, STATE_RECENT_MUSIC, STATE_THEME_ROTATION
+)
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config")
+
+
+def increment(state):
+    return {"count": (state or {}).get("count", 0) + 1}
+
+
+def test_backends_store_copies_and_update_atomically():
+    with tempfile.TemporaryDirectory() as state_dir:
+        for store in [InMemoryStateStore(), create_state_store("sqlite", os.path.join(state_dir, "state.sqlite3"))]:
+            assert store.get("missing") is None
+
+            document = {"artist": "Frank Sinatra", "tags": ["swing"]}
+            store.put(STATE_RECENT_MUSIC, document)
+            document["tags"].append("changed")
+            assert store.get(STATE_RECENT_MUSIC) == {"artist": "Frank Sinatra", "tags": ["swing"]}
+
+            assert store.update("counter", increment) == {"count": 1}
+            assert store.update("counter", increment) == {"count": 2}
+
+            def fail(state):
+                raise RuntimeError("mutation failed")
+
+            try:
+                store.update("counter", fail)
+                assert False, "update should re-raise"
+            except RuntimeError:
+                pass
+            assert store.get("counter") == {"count": 2}
+
+            stats = store.get_stats()
+            assert stats["backend"] in ["memory", "sqlite"] and stats["writes"] >= 3
+            store.close()
+
+    try:
+        create_state_store("redis")
+        assert False, "unknown backends should be rejected"
+    except ValueError:
+        pass
+
+
+def test_sqlite_workers_never_share_an_index():
+    with tempfile.TemporaryDirectory() as state_dir:
+        path = os.path.join(state_dir, "state.sqlite3")
+        # One store per "worker", each with its own connection to the shared file
+        stores = [SQLiteStateStore(path) for _ in range(4)]
+        seen = []
+
+        def worker(store):
+            for _ in range(25):
+                seen.append(store.update("counter", increment)["count"])
+
+        threads = [threading.Thread(target=worker, args=(store,)) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(seen) == list(range(1, 101))
+        assert stores[0].get("counter") == {"count": 100}
+        for store in stores:
+            store.close()
+
+
+def test_theme_rotation_and_recent_music_use_the_store():
+    with tempfile.TemporaryDirectory() as state_dir:
+        path = os.path.join(state_dir, "state.sqlite3")
+        managers = [SimplifiedThemeManager(state_store=SQLiteStateStore(path)) for _ in range(2)]
+        theme_count = len(managers[0].themes_list)
+        picks = []
+
+        def serve(manager):
+            for _ in range(theme_count):
+                picks.append(manager.get_daily_theme()["theme_of_the_day"]["id"])
+
+        threads = [threading.Thread(target=serve, args=(manager,)) for manager in managers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Two full rotations across both workers: every theme served exactly twice
+        assert set(Counter(picks).values()) == {2} and len(Counter(picks)) == theme_count
+        assert managers[1].state_store.get(STATE_THEME_ROTATION)["current_index"] == 0
+        for manager in managers:
+            manager.state_store.close()
+
+    store = InMemoryStateStore()
+    DashboardSynthesizer(state_store=store)._save_recent_music({"artist": "Glenn Miller", "piece_title": "Moonlight Serenade"})
+    recent = MusicCurationAgent(youtube_tool=None, gemini_tool=None, state_store=store)._load_recent_music()
+
+    assert recent["artist"] == "Glenn Miller" and recent["piece_title"] == "Moonlight Serenade"
+    assert not any(os.path.exists(os.path.join(CONFIG_DIR, name))
+                   for name in ["current_theme.json", "recent_music.json", "theme_state.json"])
+
+
+def test_async_access_keeps_sqlite_off_the_event_loop():
+    def io_thread(store):
+        return store.get("probe"), threading.current_thread()
+
+    async def run(store, manager):
+        await store.aput(STATE_RECENT_MUSIC, {"artist": "Duke Ellington"})
+        updated = await store.aupdate("counter", increment)
+        selection = await manager.aget_daily_theme()
+        _, thread = await store.run_io(io_thread, store)
+        return await store.aget(STATE_RECENT_MUSIC), updated, selection, thread
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        for store in [InMemoryStateStore(), SQLiteStateStore(os.path.join(state_dir, "state.sqlite3"))]:
+            manager = SimplifiedThemeManager(state_store=store)
+            recent, updated, selection, thread = asyncio.run(run(store, manager))
+
+            assert recent == {"artist": "Duke Ellington"} and updated == {"count": 1}
+            assert selection["theme_of_the_day"]["id"] == manager.themes_list[0]["id"]
+            assert store.get(STATE_THEME_ROTATION)["current_index"] == 1
+            assert (thread is threading.main_thread()) == (not store.blocking_io)
+            store.close()
+
+
+if __name__ == "__main__":
+    for test in [test_backends_store_copies_and_update_atomically, test_sqlite_workers_never_share_an_index,
+                 test_theme_rotation_and_recent_music_use_the_store, test_async_access_keeps_sqlite_off_the_event_loop]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 State store tests passed")
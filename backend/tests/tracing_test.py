@@ -0,0 +1,145 @@
+"""
+Tracing Test Script
+File: backend/tests/tracing_test.py
+
+PURPOSE:
+- Verify spans record duration, outcome and payload size per name
+- Verify child spans (including tasks) share the parent's trace id
+- Verify p50/p95/p99 over the rolling window
+- Verify the OTLP/JSON file export
+- Verify a slow export file never delays the request that ends a trace
+"""
+
+import asyncio
+import json
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.tracing import (
+    Tracer, LatencyHistogram, Span, KIND_AGENT, KIND_UPSTREAM, KIND_PIPELINE, OUTCOME_FALLBACK
+)
+
+
+def test_outcomes_and_payload_sizes():
+    tracer = Tracer()
+
+    async def run():
+        async with tracer.span("qloo.insights", KIND_UPSTREAM) as span:
+            span.set_payload(b"x" * 120)
+        async with tracer.span("qloo.insights", KIND_UPSTREAM) as span:
+            span.set_outcome(OUTCOME_FALLBACK)
+        try:
+            async with tracer.span("qloo.insights", KIND_UPSTREAM):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+    asyncio.run(run())
+    stats = tracer.get_stats()["upstreams"]["qloo.insights"]
+
+    assert stats["count"] == 3
+    assert stats["outcomes"] == {"live": 1, "fallback": 1, "error": 1}
+    assert stats["avg_payload_bytes"] == 40
+
+
+def test_children_share_the_trace():
+    tracer = Tracer()
+    spans = {}
+
+    async def agent(name):
+        async with tracer.span(name, KIND_AGENT) as span:
+            spans[name] = span
+            async with tracer.span("gemini.generate_content", KIND_UPSTREAM) as upstream:
+                spans[f"{name}.upstream"] = upstream
+
+    async def run():
+        async with tracer.span("dashboard_pipeline", KIND_PIPELINE) as root:
+            spans["root"] = root
+            await asyncio.gather(asyncio.create_task(agent("agent4a")), asyncio.create_task(agent("agent5")))
+
+    asyncio.run(run())
+
+    assert {span.trace_id for span in spans.values()} == {spans["root"].trace_id}
+    assert spans["agent5"].parent_span_id == spans["root"].span_id
+    assert spans["agent5.upstream"].parent_span_id == spans["agent5"].span_id
+    assert set(tracer.get_stats()["agents"]) == {"agent4a", "agent5"}
+
+
+def test_percentiles_over_rolling_window():
+    histogram = LatencyHistogram(window_size=100)
+    for duration in range(1, 201):
+        span = Span("agent3", KIND_AGENT)
+        span.duration_ms = float(duration)
+        histogram.record(span)
+
+    stats = histogram.get_stats()
+    # Only the last 100 durations (101..200) are in the window
+    assert stats["window"] == 100
+    assert stats["p50_ms"] == 150.0
+    assert stats["p95_ms"] == 195.0
+    assert stats["p99_ms"] == 199.0
+    assert stats["count"] == 200
+
+
+def test_otlp_file_export():
+    path = os.path.join(tempfile.mkdtemp(), "traces.jsonl")
+    tracer = Tracer()
+    tracer.configure(export_path=path)
+
+    async def run():
+        async with tracer.span("dashboard_pipeline", KIND_PIPELINE):
+            async with tracer.span("youtube.search", KIND_UPSTREAM) as span:
+                span.set_attribute("result_count", 3)
+
+    asyncio.run(run())
+    tracer.exporter.flush()
+
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+
+    assert len(lines) == 1
+    spans = lines[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["youtube.search", "dashboard_pipeline"]
+    assert spans[0]["kind"] == 3
+    assert spans[0]["parentSpanId"] == spans[1]["spanId"]
+    assert {"key": "result_count", "value": {"intValue": "3"}} in spans[0]["attributes"]
+    assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
+
+
+def test_export_writes_off_the_request_path():
+    path = os.path.join(tempfile.mkdtemp(), "traces.jsonl")
+    tracer = Tracer()
+    tracer.configure(export_path=path)
+    write = tracer.exporter._write
+
+    def slow_write(batches):
+        time.sleep(0.3)  # Stand-in for a slow disk
+        write(batches)
+
+    tracer.exporter._write = slow_write
+
+    async def run():
+        for _ in range(3):
+            async with tracer.span("dashboard_pipeline", KIND_PIPELINE):
+                pass
+
+    started = time.perf_counter()
+    asyncio.run(run())
+    assert time.perf_counter() - started < 0.2
+
+    tracer.close()
+    with open(path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+    assert tracer.get_stats()["export"]["exported_spans"] == 3
+
+
+if __name__ == "__main__":
+    for test in [test_outcomes_and_payload_sizes, test_children_share_the_trace,
+                 test_percentiles_over_rolling_window, test_otlp_file_export, test_export_writes_off_the_request_path]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 Tracing tests passed")
@@ -0,0 +1,84 @@
+"""
+Mock Upstream Clients for Tests
+File: backend/tests/upstream_mocks.py
+
+Qloo and Gemini tools wired to an in-process httpx.MockTransport, shared by
+the cache, breaker, cultural-call, prefetch and combined-generation tests.
+"""
+
+import asyncio
+import sys
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.tools.qloo_tools import QlooInsightsAPI
+from multi_tool_agent.tools.simple_gemini_tools import SimpleGeminiTool
+
+QLOO_RESULTS = [{"name": "Giuseppe Verdi"}]
+
+Handler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+def mock_http_client(handler: Handler) -> httpx.AsyncClient:
+    """AsyncClient whose requests are answered by handler"""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def make_mock_qloo(base_url: str = "https://qloo.test", requests: Optional[List[httpx.Request]] = None,
+                   status_code: int = 200, results: Optional[List[Dict[str, Any]]] = None, delay_s: float = 0.0,
+                   place_results: Optional[List[Dict[str, Any]]] = None, place_delay_s: Optional[float] = None,
+                   handler: Optional[Handler] = None, **api_kwargs: Any) -> QlooInsightsAPI:
+    """
+    QlooInsightsAPI answering every insights call with status_code and results.
+
+    Args:
+        base_url: Distinct per test so single-flight calls and cache keys are not shared
+        requests: Receives every request sent
+        place_results / place_delay_s: Overrides for urn:entity:place calls
+        handler: Replaces the canned responses entirely
+        api_kwargs: Passed to QlooInsightsAPI (cache, deadline, limiter, breaker)
+    """
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        is_place = request.url.params.get("filter.type") == "urn:entity:place"
+        await asyncio.sleep(place_delay_s if is_place and place_delay_s is not None else delay_s)
+        body = place_results if is_place and place_results is not None else results
+        return httpx.Response(status_code, json={"results": QLOO_RESULTS if body is None else body})
+
+    return QlooInsightsAPI("test-key", base_url=base_url, http_client=mock_http_client(handler or respond),
+                           **api_kwargs)
+
+
+def gemini_text_response(text: str) -> httpx.Response:
+    """generateContent response carrying one text part"""
+    return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+
+def make_mock_gemini(texts: Sequence[str] = ("Back in 1955, families gathered for Sunday dinner.",),
+                     requests: Optional[List[httpx.Request]] = None, status_code: int = 200,
+                     **tool_kwargs: Any) -> SimpleGeminiTool:
+    """
+    SimpleGeminiTool answering with texts in order (the last one repeats).
+
+    Args:
+        requests: Receives every request sent
+        status_code: Non-200 answers with an empty error response
+        tool_kwargs: Passed to SimpleGeminiTool (cache, limiter, breaker)
+    """
+
+    remaining = list(texts)
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        if status_code != 200:
+            return httpx.Response(status_code)
+        return gemini_text_response(remaining.pop(0) if len(remaining) > 1 else remaining[0])
+
+    return SimpleGeminiTool("test-key", http_client=mock_http_client(respond), **tool_kwargs)
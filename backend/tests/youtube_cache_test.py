@@ -0,0 +1,183 @@
+"""
+YouTube Search Cache Test Script
+File: backend/tests/youtube_cache_test.py
+
+PURPOSE:
+- Verify cached searches survive reopening the database (restarts)
+- Verify keys ignore query case/whitespace and the API key, but not the license filter
+- Verify stale entries are served and refreshed in the background
+- Verify max-entries eviction drops the least recently used search
+- Verify store writes are committed in batches and queued writes are readable
+- Verify hit rate and quota units saved
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.caching import SQLiteKVStore
+from multi_tool_agent.youtube_cache import YouTubeSearchCache, youtube_search_cache_key
+from multi_tool_agent.tools.youtube_tools import YouTubeAPI
+
+
+def params(query: str, license_filter: str = "creativeCommon") -> dict:
+    return {"part": "snippet", "q": query, "type": "video", "maxResults": 5,
+            "key": "test-key", "videoLicense": license_filter, "videoEmbeddable": "true"}
+
+
+def counting_fetch(calls: list, payload: dict = None):
+    async def fetch():
+        calls.append(1)
+        return payload or {"items": [{"id": {"videoId": f"v{len(calls)}"}}]}
+    return fetch
+
+
+def test_cache_survives_restart():
+    path = os.path.join(tempfile.mkdtemp(), "youtube.sqlite3")
+    calls = []
+
+    cache = YouTubeSearchCache(path)
+    first = asyncio.run(cache.get_or_fetch(params("Vivaldi classical music audio"), counting_fetch(calls)))
+    cache.close()
+
+    reopened = YouTubeSearchCache(path)
+    second = asyncio.run(reopened.get_or_fetch(params("Vivaldi classical music audio"), counting_fetch(calls)))
+
+    assert first == second
+    assert len(calls) == 1
+    stats = reopened.get_stats()
+    assert stats["hits"] == 1
+    assert stats["quota_units_saved"] == 100
+
+
+def test_key_normalization():
+    assert youtube_search_cache_key(params("Vivaldi  Classical music")) == \
+        youtube_search_cache_key({**params("  vivaldi classical MUSIC "), "key": "other-key"})
+    assert youtube_search_cache_key(params("Vivaldi")) != youtube_search_cache_key(params("Vivaldi", "youtube"))
+
+
+def test_stale_entry_served_and_refreshed():
+    cache = YouTubeSearchCache(os.path.join(tempfile.mkdtemp(), "youtube.sqlite3"),
+                               ttl_seconds=0.2, stale_seconds=60)
+    calls = []
+
+    async def run():
+        first = await cache.get_or_fetch(params("Puccini"), counting_fetch(calls))
+        await asyncio.sleep(0.25)
+        stale = await cache.get_or_fetch(params("Puccini"), counting_fetch(calls))
+        await asyncio.sleep(0.02)  # Let the background refresh finish
+        refreshed = await cache.get_or_fetch(params("Puccini"), counting_fetch(calls))
+        return first, stale, refreshed
+
+    first, stale, refreshed = asyncio.run(run())
+
+    assert stale == first
+    assert refreshed["items"][0]["id"]["videoId"] == "v2"
+    assert len(calls) == 2
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["background_refreshes"] == 1
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = YouTubeSearchCache(os.path.join(tempfile.mkdtemp(), "youtube.sqlite3"), max_entries=2)
+    calls = []
+
+    async def run():
+        await cache.get_or_fetch(params("Verdi"), counting_fetch(calls))
+        time.sleep(0.01)
+        await cache.get_or_fetch(params("Rossini"), counting_fetch(calls))
+        time.sleep(0.01)
+        await cache.get_or_fetch(params("Verdi"), counting_fetch(calls))  # Verdi is now most recent
+        time.sleep(0.01)
+        await cache.get_or_fetch(params("Puccini"), counting_fetch(calls))  # Evicts Rossini
+        cache.flush()
+        await cache.get_or_fetch(params("Verdi"), counting_fetch(calls))
+        await cache.get_or_fetch(params("Rossini"), counting_fetch(calls))
+
+    asyncio.run(run())
+
+    assert len(calls) == 4
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 2
+
+
+def test_failed_search_is_not_cached():
+    responses = [httpx.Response(503), httpx.Response(200, json={"items": []})]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    cache = YouTubeSearchCache(os.path.join(tempfile.mkdtemp(), "youtube.sqlite3"))
+    youtube = YouTubeAPI("test-key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                         search_cache=cache)
+
+    async def run():
+        try:
+            await youtube._search(params("Bach"))
+        except httpx.HTTPStatusError:
+            pass
+        await youtube._search(params("Bach"))
+        return await youtube._search(params("Bach"))
+
+    assert asyncio.run(run()) == {"items": []}
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["hits"]) == (2, 1)
+    assert stats["quota_units_spent"] == 200
+
+
+def test_store_batches_writes_and_touches():
+    path = os.path.join(tempfile.mkdtemp(), "store.sqlite3")
+    store = SQLiteKVStore(path, max_entries=10)
+    expires_at = time.time() + 60
+
+    # Holding the connection stands in for a slow disk: the writer cannot commit yet
+    with store._lock:
+        for n in range(5):
+            store.put(f"k{n}", {"n": n}, expires_at)
+        assert store.get("k3") == {"n": 3}
+        assert asyncio.run(store.aget("k4")) == {"n": 4}
+        store.delete("k0")
+        assert store.get("k0") is None and not store.contains("k0")
+
+        # Status polls never wait for the connection
+        stats = []
+        poll = threading.Thread(target=lambda: stats.append(store.get_stats()))
+        poll.start()
+        poll.join(timeout=1)
+        assert stats and stats[0]["pending_writes"] == 5
+
+    assert store.flush(timeout=5)
+    assert store.commits <= 2
+    commits = store.commits
+
+    # Reads queue their LRU touch for the next write instead of committing it
+    for _ in range(10):
+        assert asyncio.run(store.aget("k1")) == {"n": 1}
+    assert store.commits == commits
+
+    store.put("k5", {"n": 5}, expires_at)
+    store.close()
+    assert store.commits == commits + 1
+
+    reopened = SQLiteKVStore(path)
+    assert reopened.get_stats()["entries"] == reopened.count() == 5
+    assert reopened.get("k5") == {"n": 5}
+    reopened.close()
+
+
+if __name__ == "__main__":
+    for test in [test_cache_survives_restart, test_key_normalization, test_stale_entry_served_and_refreshed,
+                 test_max_entries_evicts_least_recently_used, test_failed_search_is_not_cached,
+                 test_store_batches_writes_and_touches]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 YouTube search cache tests passed")
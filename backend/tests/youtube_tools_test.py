@@ -0,0 +1,96 @@
+"""
+YouTube Tool Concurrency Test Script
+File: backend/tests/youtube_tools_test.py
+
+PURPOSE:
+- Verify heritage, American and folk searches run concurrently
+- Verify results are deduplicated by videoId and keep heritage → American → folk order
+- Verify one failing search does not discard the others
+- Verify searches do not block the event loop
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from multi_tool_agent.tools.youtube_tools import YouTubeAPI
+
+SEARCH_DELAY = 0.2
+
+
+def video(video_id: str) -> dict:
+    return {"id": {"kind": "youtube#video", "videoId": video_id},
+            "snippet": {"title": video_id, "channelTitle": "Archive", "description": ""}}
+
+
+def make_youtube(fail_folk: bool = False) -> YouTubeAPI:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        await asyncio.sleep(SEARCH_DELAY)
+        if "folk" in query:
+            if fail_folk:
+                return httpx.Response(503)
+            # "shared" is also returned by the heritage search
+            return httpx.Response(200, json={"items": [video("shared"), video("folk1"), video("folk2")]})
+        if "Vivaldi" in query:
+            return httpx.Response(200, json={"items": [video("shared")]})
+        return httpx.Response(200, json={"items": [video("american1")]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return YouTubeAPI("test-key", http_client=client)
+
+
+def test_searches_run_concurrently_and_deduplicate():
+    youtube = make_youtube()
+
+    async def run():
+        started = time.perf_counter()
+        results = await youtube.search_videos_enhanced("Vivaldi", "Italian-American", max_results=5)
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+
+    # Three searches of SEARCH_DELAY each finish in about one delay, not three
+    assert elapsed < SEARCH_DELAY * 2
+    assert [video["videoId"] for video in results] == ["shared", "american1", "folk1", "folk2"]
+
+
+def test_failed_search_keeps_other_results():
+    youtube = make_youtube(fail_folk=True)
+
+    results = asyncio.run(youtube.search_videos_enhanced("Vivaldi", "Italian-American", max_results=5))
+
+    assert [video["videoId"] for video in results] == ["shared", "american1"]
+
+
+def test_search_does_not_block_event_loop():
+    youtube = make_youtube()
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        ticking = asyncio.create_task(ticker())
+        await youtube.search_videos_enhanced("Vivaldi", "Italian-American", max_results=5)
+        ticking.cancel()
+
+    asyncio.run(run())
+
+    # The loop kept running other work while the searches were in flight
+    assert len(ticks) >= SEARCH_DELAY / 0.01 / 2
+
+
+if __name__ == "__main__":
+    for test in [test_searches_run_concurrently_and_deduplicate, test_failed_search_keeps_other_results,
+                 test_search_does_not_block_event_loop]:
+        test()
+        print(f"✅ {test.__name__}")
+    print("🎉 YouTube tool tests passed")